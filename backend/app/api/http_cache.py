@@ -0,0 +1,159 @@
+"""
+Meridian Ephemeris API - HTTP Caching
+
+Helpers for conditional requests and cacheable responses:
+
+- Strong ETags derived from the canonical request plus the engine and
+  Swiss Ephemeris versions. Calculations are deterministic for a given
+  request and versions, so ``If-None-Match`` is answered with 304 before
+  anything is computed. Diagnostic timing fields in a body may differ
+  between otherwise identical responses and are not part of the identity.
+- Encoded responses with a precompressed gzip variant, which gets its own
+  ETag (``"<tag>-gzip"``) as a distinct representation
+- Static endpoints encoded once on first use and served with a long max-age
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import swisseph as swe
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from ..core.acg.acg_cache import CachedResponse
+from ..core.acg.acg_live import etag_matches
+
+# Bump when calculation output changes for the same request
+ENGINE_VERSION = "1.0.0"
+
+# Freshness of calculated results and of static metadata, in seconds
+RESULT_MAX_AGE = 3600
+STATIC_MAX_AGE = 86400
+
+
+def request_etag(endpoint: str, payload: Dict[str, Any]) -> str:
+    """
+    Strong ETag for a calculation request.
+
+    Args:
+        endpoint: Endpoint namespace, so equal payloads of different endpoints differ
+        payload: JSON-compatible canonical request data
+
+    Returns:
+        Quoted entity tag
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(f"{endpoint}:{ENGINE_VERSION}:{swe.version}:{canonical}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def gzip_etag(etag: str) -> str:
+    """ETag of the gzip-encoded representation."""
+    return etag[:-1] + '-gzip"'
+
+
+def cache_headers(etag: str, max_age: int) -> Dict[str, str]:
+    """Validator and freshness headers."""
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}",
+        "Vary": "Accept-Encoding"
+    }
+
+
+def not_modified(request: Request, etag: str, max_age: int = RESULT_MAX_AGE) -> Optional[Response]:
+    """
+    304 response if ``If-None-Match`` matches either representation's ETag.
+
+    Args:
+        request: Incoming request
+        etag: ETag of the identity representation
+        max_age: Cache-Control max-age to repeat on the 304
+
+    Returns:
+        Response or None if the client's copy is stale or absent
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    for candidate in (etag, gzip_etag(etag)):
+        if etag_matches(header, candidate):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(candidate, max_age))
+    return None
+
+
+def encoded_response(
+    request: Request,
+    encoded: CachedResponse,
+    etag: str,
+    max_age: int = RESULT_MAX_AGE,
+    media_type: str = "application/json",
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Serve an encoded body, picking the variant from ``Accept-Encoding``.
+
+    Args:
+        request: Incoming request
+        encoded: Encoded body and gzip variant
+        etag: ETag of the identity representation
+        max_age: Cache-Control max-age
+        media_type: Response media type
+        headers: Additional response headers
+
+    Returns:
+        Response carrying validator and freshness headers
+    """
+    body, variant_headers = encoded.select(request.headers.get("accept-encoding"))
+    gzipped = "Content-Encoding" in variant_headers
+    variant_headers.update(cache_headers(gzip_etag(etag) if gzipped else etag, max_age))
+    variant_headers.update(headers or {})
+    return Response(content=body, media_type=media_type, headers=variant_headers)
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode a model or JSON-compatible value the way FastAPI responses do."""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode()
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+class StaticResponse:
+    """
+    JSON content that never changes while the process runs.
+
+    Built and encoded on first use; later requests are served from the
+    stored bytes (or answered with 304) with a long max-age.
+    """
+
+    def __init__(self, build: Callable[[], Any], max_age: int = STATIC_MAX_AGE):
+        """
+        Initialize the response.
+
+        Args:
+            build: Callable returning the content (a model or JSON-compatible value)
+            max_age: Cache-Control max-age in seconds
+        """
+        self._build = build
+        self.max_age = max_age
+        self._encoded: Optional[CachedResponse] = None
+        self._etag: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _ensure_encoded(self) -> None:
+        """Build and encode the content once."""
+        if self._encoded is None:
+            with self._lock:
+                if self._encoded is None:
+                    body = encode_json(self._build())
+                    self._etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+                    self._encoded = CachedResponse.from_body(body)
+
+    def respond(self, request: Request) -> Response:
+        """Serve the stored bytes, or 304 if the client's copy is current."""
+        self._ensure_encoded()
+        return not_modified(request, self._etag, self.max_age) or encoded_response(
+            request, self._encoded, self._etag, self.max_age
+        )
@@ -9,36 +9,67 @@ PRPs/contracts/acg-api-contract.md
 
 Endpoints:
 - POST /acg/lines: Calculate ACG lines for a single chart
+- GET /acg/lines: Cacheable query-parameter variant of POST /acg/lines
 - POST /acg/batch: Batch calculation for multiple charts  
 - GET /acg/features: Get supported bodies, line types, and capabilities
 - GET /acg/schema: Get metadata schema
 - POST /acg/animate: Calculate time-based animation frames
+- GET /acg/live: Current-sky ACG, recomputed once per interval
+- GET /acg/live/stream: Server-Sent Events stream of current-sky updates
+- WS /acg/scrub: Interactive time-scrubbing session
 """
 
+import asyncio
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from fastapi import APIRouter, HTTPException, status, Response, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, status, Query, Request, Response, BackgroundTasks, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import ValidationError
 import logging
 
+try:
+    from websockets.exceptions import ConnectionClosed
+except ImportError:  # served without the websockets package
+    ConnectionClosed = WebSocketDisconnect
+
+from ..http_cache import StaticResponse, encoded_response, not_modified, request_etag
+from ...core.acg.acg_canonical import canonical_request
 from ...core.acg.acg_core import ACGCalculationEngine
 from ...core.acg.acg_metadata import ACGMetadataManager
+from ...core.acg.acg_live import ACGLiveSky, etag_matches, format_sse
+from ...core.acg.acg_refresh import ACGRefreshAhead
+from ...core.acg.acg_scrub import ACGScrubSession, LatestSlot
 from ...core.acg.acg_types import (
     ACGRequest, ACGResult, ACGBatchRequest, ACGBatchResponse,
     ACGAnimateRequest, ACGAnimateResponse, ACGFeaturesResponse,
-    ACGErrorResponse, ACGBody, ACGOptions
+    ACGErrorResponse, ACGBody, ACGOptions, ACGNatalData
 )
+from ...core.ephemeris.classes.redis_cache import get_redis_cache
+from ...core.ephemeris.settings import settings
 from ...core.monitoring.metrics import timed_calculation, get_metrics
 
 logger = logging.getLogger(__name__)
 
+# Raised by receives and sends once the WebSocket client has gone away
+_SOCKET_CLOSED = (WebSocketDisconnect, ConnectionClosed, RuntimeError, OSError)
+
 # Create router with ACG prefix
 router = APIRouter(prefix="/acg", tags=["acg"])
 
 # Initialize core components
 acg_engine = ACGCalculationEngine()
 metadata_manager = ACGMetadataManager()
+live_sky = ACGLiveSky(
+    acg_engine, interval_seconds=settings.acg_live_interval, redis_cache=get_redis_cache()
+)
+refresh_ahead = ACGRefreshAhead(
+    acg_engine,
+    interval_seconds=settings.acg_refresh_ahead_interval,
+    min_hits=settings.acg_refresh_ahead_min_hits,
+    window_seconds=settings.acg_refresh_ahead_window
+)
 
 
 # Error handler for ACG-specific errors
@@ -73,6 +104,9 @@ def create_acg_error_response(
     **Performance**: Typically <100ms for standard calculations.
     
     **Caching**: Results are cached based on input parameters for faster subsequent requests.
+    Cache hits are served from the stored encoded body (gzip-compressed when the
+    client accepts it) without re-validating or re-serializing the result.
+    Responses carry a strong `ETag`; send `If-None-Match` to receive 304.
     """,
     responses={
         200: {
@@ -87,41 +121,174 @@ def create_acg_error_response(
 @timed_calculation("acg_lines")
 async def acg_lines_endpoint(
     request: ACGRequest,
-    response: Response
-) -> ACGResult:
+    http_request: Request
+) -> Response:
     """
     Calculate ACG lines for a single chart.
     
     Args:
         request: ACG calculation request with epoch, bodies, and options
-        response: FastAPI response object
+        http_request: Incoming request (for conditional and Accept-Encoding headers)
         
     Returns:
-        ACGResult: GeoJSON FeatureCollection with ACG lines and metadata
+        Response: Encoded GeoJSON FeatureCollection with ACG lines and metadata, or 304
         
     Raises:
         HTTPException: For validation or calculation errors
     """
+    return await _acg_lines_response(request, http_request)
+
+
+@router.get(
+    "/lines",
+    response_model=ACGResult,
+    summary="Calculate ACG lines for a single chart (cacheable GET)",
+    description="""
+    Cacheable GET variant of `POST /acg/lines` for browser and proxy caches.
+    
+    List parameters are comma-separated; body types are looked up from the
+    supported bodies. Responses carry the same strong `ETag` as the equivalent
+    POST request; send `If-None-Match` to receive 304 without recalculation.
+    """,
+    responses={
+        200: {
+            "description": "ACG calculation successful",
+            "content": {"application/geo+json": {}}
+        },
+        304: {"description": "Not modified since the given ETag"},
+        422: {"description": "Request validation failed"}, 
+        500: {"description": "Calculation error"}
+    }
+)
+@timed_calculation("acg_lines")
+async def acg_lines_get_endpoint(
+    http_request: Request,
+    epoch: str = Query(..., description="ISO 8601 UTC timestamp"),
+    jd: Optional[float] = Query(None, description="Optional Julian Day override"),
+    bodies: Optional[str] = Query(None, description="Comma-separated body IDs (defaults to standard set)"),
+    line_types: Optional[str] = Query(None, description="Comma-separated line types"),
+    aspects: Optional[str] = Query(None, description="Comma-separated aspects"),
+    include_parans: bool = Query(True, description="Include paran calculations"),
+    include_fixed_stars: bool = Query(False, description="Include fixed stars"),
+    orb_deg: float = Query(1.0, description="Orb tolerance in degrees"),
+    flags: Optional[int] = Query(None, description="Swiss Ephemeris calculation flags"),
+    natal_lat: Optional[float] = Query(None, description="Birth latitude"),
+    natal_lon: Optional[float] = Query(None, description="Birth longitude"),
+    natal_alt_m: Optional[float] = Query(None, description="Birth altitude in meters"),
+    houses_system: Optional[str] = Query(None, description="House system")
+) -> Response:
+    """
+    Calculate ACG lines for a single chart from query parameters.
+    
+    Returns:
+        Response: Encoded GeoJSON FeatureCollection, or 304
+    """
+    try:
+        body_types = {body["id"]: body["type"] for body in acg_engine.body_registry}
+        body_ids = _split_query_list(bodies)
+        unknown = [body_id for body_id in body_ids or [] if body_id not in body_types]
+        if unknown:
+            raise ValueError(f"Unknown bodies: {', '.join(unknown)}")
+        
+        options = None
+        if any(value is not None for value in (line_types, aspects, flags)) or \
+                not include_parans or include_fixed_stars or orb_deg != 1.0:
+            options = ACGOptions(
+                line_types=_split_query_list(line_types),
+                aspects=_split_query_list(aspects),
+                include_parans=include_parans,
+                include_fixed_stars=include_fixed_stars,
+                orb_deg=orb_deg,
+                flags=flags
+            )
+        
+        natal = None
+        if any(value is not None for value in (natal_lat, natal_lon, natal_alt_m, houses_system)):
+            natal = ACGNatalData(
+                birthplace_lat=natal_lat,
+                birthplace_lon=natal_lon,
+                birthplace_alt_m=natal_alt_m,
+                **({"houses_system": houses_system} if houses_system is not None else {})
+            )
+        
+        request = ACGRequest(
+            epoch=epoch,
+            jd=jd,
+            bodies=[ACGBody(id=body_id, type=body_types[body_id]) for body_id in body_ids] if body_ids else None,
+            options=options,
+            natal=natal
+        )
+    except (ValueError, ValidationError) as e:
+        logger.warning(f"ACG lines query validation error: {e}")
+        error_response = create_acg_error_response(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            "validation_error",
+            str(e),
+            "/api/v1/acg/lines"
+        )
+        return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content={"detail": error_response.model_dump()})
+    
+    return await _acg_lines_response(request, http_request)
+
+
+def _split_query_list(value: Optional[str]) -> Optional[List[str]]:
+    """Split a comma-separated query parameter."""
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+async def _acg_lines_response(request: ACGRequest, http_request: Request) -> Response:
+    """
+    Shared implementation of the POST and GET /acg/lines endpoints.
+    
+    Answers ``If-None-Match`` before any calculation, then serves the stored
+    encoded body on a hit or calculates and encodes once on a miss.
+    """
     calc_start_time = time.time()
     
+    try:
+        etag = request_etag("acg_lines", canonical_request(request))
+    except ValueError as e:
+        error_response = create_acg_error_response(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            "validation_error",
+            str(e),
+            "/api/v1/acg/lines"
+        )
+        return JSONResponse(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content={"detail": error_response.model_dump()})
+    not_modified_response = not_modified(http_request, etag)
+    if not_modified_response is not None:
+        return not_modified_response
+    
     try:
         logger.info(f"ACG lines calculation requested for epoch: {request.epoch}")
         
-        # Perform ACG calculation
-        result = acg_engine.calculate_acg_lines(request)
+        # Serve the stored encoded body on a hit; otherwise calculate and encode once
+        encoded = await acg_engine.cache_manager.aget_cached_response(request)
+        cache_status = "HIT"
+        if encoded is None:
+            # Off the event loop so concurrent identical requests can coalesce; only
+            # the encoded response is stored, not the result as well
+            result = await run_in_threadpool(acg_engine.calculate_acg_lines, request, store_result=False)
+            encoded = await acg_engine.cache_manager.aset_cached_response(request, result)
+            cache_status = "MISS"
         
         # Record metrics
         metrics = get_metrics()
         calc_duration = time.time() - calc_start_time
         metrics.record_calculation("acg_lines", calc_duration, True)
         
-        # Set response headers
-        response.headers["Content-Type"] = "application/geo+json"
-        response.headers["X-Calculation-Time"] = f"{calc_duration * 1000:.2f}ms"
-        response.headers["X-Features-Count"] = str(len(result.features))
-        
-        logger.info(f"ACG lines calculation completed in {calc_duration * 1000:.2f}ms")
-        return result
+        logger.info(f"ACG lines calculation completed in {calc_duration * 1000:.2f}ms ({cache_status})")
+        return encoded_response(
+            http_request, encoded, etag,
+            media_type="application/geo+json",
+            headers={
+                "X-Calculation-Time": f"{calc_duration * 1000:.2f}ms",
+                "X-Features-Count": str(encoded.features_count),
+                "X-Cache": cache_status
+            }
+        )
         
     except ValueError as e:
         logger.warning(f"ACG lines validation error: {e}")
@@ -202,30 +369,29 @@ async def acg_batch_endpoint(
         
         results = []
 
-        # Process each request in the batch
-        for i, acg_request in enumerate(request.requests):
-            try:
-                # Use provided correlation ID or fallback
-                correlation_id = acg_request.correlation_id or f"batch_{i}"
-
-                # Calculate ACG lines
-                acg_result = acg_engine.calculate_acg_lines(acg_request)
+        # Bulk cache lookups and set-backs, off the event loop
+        batch_results = await run_in_threadpool(acg_engine.calculate_acg_batch, request.requests)
 
-                results.append({
-                    "correlation_id": correlation_id,
-                    "response": acg_result.model_dump()
-                })
+        for i, (acg_request, acg_result) in enumerate(zip(request.requests, batch_results)):
+            # Use provided correlation ID or fallback
+            correlation_id = acg_request.correlation_id or f"batch_{i}"
 
-            except Exception as e:
-                logger.error(f"Batch item {i} failed: {e}")
+            if isinstance(acg_result, Exception):
+                logger.error(f"Batch item {i} failed: {acg_result}")
                 # Include error in results rather than failing entire batch
                 results.append({
-                    "correlation_id": acg_request.correlation_id or f"batch_{i}",
+                    "correlation_id": correlation_id,
                     "error": {
-                        "message": str(e),
+                        "message": str(acg_result),
                         "status": "calculation_failed"
                     }
                 })
+                continue
+
+            results.append({
+                "correlation_id": correlation_id,
+                "response": acg_result.model_dump()
+            })
         
         # Record metrics
         calc_duration = time.time() - calc_start_time
@@ -274,47 +440,22 @@ async def acg_batch_endpoint(
     - Metadata schema fields
     
     Use this endpoint to discover capabilities before making calculation requests.
+    Served from pre-serialized bytes with a long `max-age` and an `ETag`.
     """
 )
-async def get_acg_features() -> ACGFeaturesResponse:
+async def get_acg_features(request: Request) -> Response:
     """
     Get supported ACG features and capabilities.
     
+    Args:
+        request: Incoming request (for conditional headers)
+        
     Returns:
-        ACGFeaturesResponse: Complete feature and capability information
+        Response: Pre-serialized ACGFeaturesResponse, or 304
     """
     try:
         logger.debug("ACG features requested")
-        
-        # Get supported bodies
-        bodies = acg_engine.get_supported_bodies()
-        
-        # Define supported line types
-        line_types = [
-            "MC", "IC", "AC", "DC", 
-            "MC_ASPECT", "AC_ASPECT", "PARAN"
-        ]
-        
-        # Define supported aspects
-        aspects = [
-            "conjunction", "sextile", "square", 
-            "trine", "opposition", "quincunx"
-        ]
-        
-        # Get default options
-        defaults = ACGOptions()
-        
-        # Get metadata schema keys
-        schema = metadata_manager.export_metadata_schema()
-        metadata_keys = list(schema['properties'].keys())
-        
-        return ACGFeaturesResponse(
-            bodies=bodies,
-            line_types=line_types,
-            aspects=aspects,
-            defaults=defaults,
-            metadata_keys=metadata_keys
-        )
+        return features_response.respond(request)
         
     except Exception as e:
         logger.error(f"Failed to get ACG features: {e}")
@@ -330,6 +471,44 @@ async def get_acg_features() -> ACGFeaturesResponse:
         )
 
 
+def _build_acg_features() -> ACGFeaturesResponse:
+    """Supported bodies, line types, aspects, defaults and metadata keys."""
+    # Get supported bodies
+    bodies = acg_engine.get_supported_bodies()
+    
+    # Define supported line types
+    line_types = [
+        "MC", "IC", "AC", "DC", 
+        "MC_ASPECT", "AC_ASPECT", "PARAN"
+    ]
+    
+    # Define supported aspects
+    aspects = [
+        "conjunction", "sextile", "square", 
+        "trine", "opposition", "quincunx"
+    ]
+    
+    # Get default options
+    defaults = ACGOptions()
+    
+    # Get metadata schema keys
+    schema = metadata_manager.export_metadata_schema()
+    metadata_keys = list(schema['properties'].keys())
+    
+    return ACGFeaturesResponse(
+        bodies=bodies,
+        line_types=line_types,
+        aspects=aspects,
+        defaults=defaults,
+        metadata_keys=metadata_keys
+    )
+
+
+# Static for the life of the process; encoded once and served with a long max-age
+features_response = StaticResponse(_build_acg_features)
+schema_response = StaticResponse(lambda: metadata_manager.export_metadata_schema())
+
+
 @router.get(
     "/schema",
     summary="Get ACG metadata schema",
@@ -344,17 +523,19 @@ async def get_acg_features() -> ACGFeaturesResponse:
     """,
     response_class=JSONResponse
 )
-async def get_acg_schema() -> Dict[str, Any]:
+async def get_acg_schema(request: Request) -> Response:
     """
     Get ACG metadata schema.
     
+    Args:
+        request: Incoming request (for conditional headers)
+        
     Returns:
-        Dict: JSON Schema for ACG metadata
+        Response: Pre-serialized JSON Schema for ACG metadata, or 304
     """
     try:
         logger.debug("ACG schema requested")
-        schema = metadata_manager.export_metadata_schema()
-        return JSONResponse(content=schema)
+        return schema_response.respond(request)
         
     except Exception as e:
         logger.error(f"Failed to get ACG schema: {e}")
@@ -417,8 +598,9 @@ async def acg_animate_endpoint(
         if start_dt >= end_dt:
             raise ValueError("Start time must be before end time")
         
-        # Calculate frames
-        frames = []
+        # Build the frame requests
+        frame_requests = []
+        frame_times = []
         current_dt = start_dt
         frame_count = 0
         max_frames = 1000  # Limit to prevent excessive computation
@@ -432,33 +614,39 @@ async def acg_animate_endpoint(
             except Exception:
                 # Fallback: strip tzinfo if present
                 frame_epoch = current_dt.replace(tzinfo=None).isoformat() + 'Z'
-            frame_request = ACGRequest(
+            frame_requests.append(ACGRequest(
                 epoch=frame_epoch,
                 bodies=request.bodies,
                 options=request.options,
                 natal=request.natal
-            )
+            ))
+            frame_times.append(current_dt)
             
-            # Calculate ACG lines for frame
-            frame_result = acg_engine.calculate_acg_lines(frame_request)
+            # Advance to next frame
+            from datetime import timedelta
+            current_dt += timedelta(minutes=request.step_minutes)
+            frame_count += 1
+        
+        # Calculate ACG lines for all frames with bulk cache lookups and set-backs
+        frame_results = await run_in_threadpool(acg_engine.calculate_acg_batch, frame_requests)
+        
+        frames = []
+        import swisseph as swe
+        for frame_request, frame_dt, frame_result in zip(frame_requests, frame_times, frame_results):
+            if isinstance(frame_result, Exception):
+                raise frame_result
             
             # Calculate Julian Day for frame
-            import swisseph as swe
             jd = swe.julday(
-                current_dt.year, current_dt.month, current_dt.day,
-                current_dt.hour + current_dt.minute/60.0 + current_dt.second/3600.0
+                frame_dt.year, frame_dt.month, frame_dt.day,
+                frame_dt.hour + frame_dt.minute/60.0 + frame_dt.second/3600.0
             )
             
             frames.append({
-                "epoch": frame_epoch,
+                "epoch": frame_request.epoch,
                 "jd": jd,
                 "data": frame_result.model_dump()
             })
-            
-            # Advance to next frame
-            from datetime import timedelta
-            current_dt += timedelta(minutes=request.step_minutes)
-            frame_count += 1
         
         if frame_count >= max_frames:
             logger.warning(f"Animation truncated at {max_frames} frames")
@@ -501,6 +689,199 @@ async def acg_animate_endpoint(
     return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"detail": error_response.model_dump()})
 
 
+@router.get(
+    "/live",
+    summary="Current-sky ACG lines",
+    description="""
+    Returns ACG lines for the current sky and the default body set.
+    
+    The result is recomputed once per interval (default 60 seconds) on the
+    server and shared by all clients, so it is served from pre-serialized bytes.
+    Responses carry `ETag` and `Cache-Control` headers; send `If-None-Match`
+    to receive 304 until the next refresh.
+    """,
+    responses={
+        200: {
+            "description": "Current-sky ACG lines",
+            "content": {"application/geo+json": {}}
+        },
+        304: {"description": "Not modified since the given ETag"},
+        500: {"description": "Calculation error"}
+    }
+)
+async def acg_live_endpoint(request: Request) -> Response:
+    """
+    Get the current-sky ACG snapshot.
+    
+    Args:
+        request: Incoming request (for conditional headers)
+        
+    Returns:
+        Response: Pre-serialized GeoJSON FeatureCollection or 304
+    """
+    try:
+        snapshot = live_sky.snapshot
+        if snapshot is None or not live_sky.running:
+            snapshot = await run_in_threadpool(live_sky.get_snapshot)
+    except Exception as e:
+        logger.error(f"ACG live calculation failed: {e}")
+        error_response = create_acg_error_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "calculation_error",
+            "ACG live calculation failed",
+            "/api/v1/acg/live",
+            [{"field": "general", "message": str(e)}]
+        )
+        return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"detail": error_response.model_dump()})
+    
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": f"public, max-age={live_sky.max_age(snapshot)}",
+        "X-Epoch": snapshot.epoch,
+        "X-Features-Count": str(snapshot.features_count)
+    }
+    
+    if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=snapshot.body, media_type="application/geo+json", headers=headers)
+
+
+@router.get(
+    "/live/stream",
+    summary="Stream current-sky ACG updates",
+    description="""
+    Server-Sent Events stream of current-sky ACG snapshots.
+    
+    Sends the latest snapshot on connect and a new `acg-live` event after each
+    server-side refresh. Comment lines are sent as keep-alives between updates.
+    """,
+    responses={200: {"content": {"text/event-stream": {}}}}
+)
+async def acg_live_stream_endpoint(request: Request) -> StreamingResponse:
+    """
+    Stream current-sky ACG snapshots as Server-Sent Events.
+    
+    Args:
+        request: Incoming request (used to detect client disconnects)
+        
+    Returns:
+        StreamingResponse: text/event-stream of snapshots
+    """
+    if live_sky.snapshot is None and not live_sky.running:
+        await run_in_threadpool(live_sky.get_snapshot)
+    
+    async def event_stream():
+        async for snapshot in live_sky.subscribe():
+            if await request.is_disconnected():
+                break
+            yield format_sse(snapshot) if snapshot is not None else b": keep-alive\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Keeps GZipMiddleware from buffering events and proxies from batching them
+            "Content-Encoding": "identity",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+@router.websocket("/scrub")
+async def acg_scrub_websocket(websocket: WebSocket) -> None:
+    """
+    Interactive time-scrubbing session.
+    
+    Protocol (JSON messages):
+    - client: ``{"type": "init", "request": <ACGRequest>}`` once; bodies,
+      options and natal context are resolved here and kept for the session
+    - server: ``{"type": "ready", "bodies": [...]}``
+    - client: ``{"type": "epoch", "epoch": "...", "jd": ..., "seq": n}`` per
+      slider position (``jd`` optional and takes precedence)
+    - server: ``{"type": "update", "seq": n, ...}`` with changed geometry only
+    - server: ``{"type": "error", "message": "..."}`` on bad input
+    
+    Epochs arriving while a calculation is running replace each other, so
+    only the newest is calculated next.
+    """
+    await websocket.accept()
+    
+    try:
+        init = await websocket.receive_json()
+        if init.get("type") != "init":
+            raise ValueError("First message must be an init message")
+        session = await run_in_threadpool(
+            ACGScrubSession, acg_engine, ACGRequest.model_validate(init.get("request") or {})
+        )
+    except WebSocketDisconnect:
+        return
+    except Exception as e:
+        try:
+            await websocket.send_json({"type": "error", "message": f"Invalid session request: {e}"})
+            await websocket.close(code=1008)
+        except _SOCKET_CLOSED:
+            pass
+        return
+    
+    try:
+        await websocket.send_json({"type": "ready", "bodies": session.body_ids})
+    except _SOCKET_CLOSED:
+        return
+    
+    pending = LatestSlot()
+    
+    async def receive_epochs():
+        try:
+            while True:
+                message = await websocket.receive_json()
+                if not isinstance(message, dict):
+                    await websocket.send_json({"type": "error", "message": "Messages must be JSON objects"})
+                elif message.get("type") == "epoch":
+                    pending.put(message)
+                else:
+                    await websocket.send_json(
+                        {"type": "error", "message": f"Unsupported message type: {message.get('type')}"}
+                    )
+        except (*_SOCKET_CLOSED, ValueError):
+            pass
+        finally:
+            pending.close()
+    
+    receiver = asyncio.create_task(receive_epochs())
+    metrics = get_metrics()
+    
+    try:
+        while True:
+            message = await pending.get()
+            if message is None:
+                break
+            try:
+                update = await run_in_threadpool(
+                    session.update, message.get("epoch"), message.get("jd")
+                )
+            except ValueError as e:
+                await websocket.send_json({"type": "error", "seq": message.get("seq"), "message": str(e)})
+                continue
+            except Exception as e:
+                logger.error(f"ACG scrub calculation failed: {e}")
+                metrics.record_calculation("acg_scrub", 0.0, False)
+                await websocket.send_json({"type": "error", "seq": message.get("seq"), "message": "Calculation failed"})
+                continue
+            
+            metrics.record_calculation("acg_scrub", update["calculation_time_ms"] / 1000, True)
+            update["seq"] = message.get("seq")
+            update["dropped"] = pending.dropped
+            await websocket.send_json(update)
+    except _SOCKET_CLOSED:
+        pass
+    finally:
+        receiver.cancel()
+        logger.info(f"ACG scrub session closed after {session.updates} updates, "
+                    f"{pending.dropped} epochs dropped")
+
+
 # Cache statistics endpoint
 @router.get(
     "/cache/stats",
@@ -519,8 +900,11 @@ async def get_acg_cache_stats() -> Dict[str, Any]:
         from ...core.acg.acg_cache import get_acg_cache_manager
         
         cache_manager = get_acg_cache_manager()
-        stats = cache_manager.get_cache_statistics()
-        
+        # Off the event loop: statistics ping every Redis node synchronously
+        stats = await run_in_threadpool(cache_manager.get_cache_statistics)
+        stats['single_flight'] = acg_engine.single_flight.stats()
+        stats['refresh_ahead'] = refresh_ahead.stats()
+
         return stats
         
     except Exception as e:
@@ -3,15 +3,23 @@ Meridian Ephemeris API - Ephemeris Routes
 
 FastAPI routes for ephemeris calculations and chart generation.
 Provides standardized REST endpoints with comprehensive input validation.
+
+Chart responses carry strong ETags (see `http_cache`) and the static
+metadata endpoints are served from pre-serialized bytes.
 """
 
-from typing import Union
-from fastapi import APIRouter, HTTPException, status, Depends
+from typing import Optional, Union
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
 
+from ..http_cache import StaticResponse, encode_json, encoded_response, not_modified, request_etag
 from ..models.schemas import (
-    NatalChartRequest, NatalChartResponse, ErrorResponse, HealthResponse
+    NatalChartRequest, NatalChartResponse, ErrorResponse, HealthResponse, HouseSystemEnum
 )
+from ...core.acg.acg_cache import CachedResponse
 from ...services.ephemeris_service import (
     ephemeris_service, EphemerisServiceError, InputValidationError, CalculationError
 )
@@ -71,6 +79,8 @@ async def health_check() -> HealthResponse:
     - All planetary positions with zodiac and house information
     - House system cusps and angles
     - Major aspects with orbs and applying/separating status
+    
+    Responses carry a strong `ETag`; send `If-None-Match` to receive 304.
     """,
     responses={
         200: {
@@ -88,24 +98,108 @@ async def health_check() -> HealthResponse:
     }
 )
 async def calculate_natal_chart(
-    request: NatalChartRequest
-) -> Union[NatalChartResponse, JSONResponse]:
+    request: NatalChartRequest,
+    http_request: Request
+) -> Union[Response, JSONResponse]:
     """
     Calculate natal chart from birth data.
     
     Args:
         request: Natal chart calculation request
+        http_request: Incoming request (for conditional and Accept-Encoding headers)
         
     Returns:
-        Complete natal chart response with all calculated data
+        Complete natal chart response with all calculated data, or 304
         
     Raises:
         HTTPException: For validation or calculation errors
     """
+    return await _natal_chart_response(request, http_request)
+
+
+@router.get(
+    "/natal",
+    response_model=NatalChartResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Calculate Natal Chart (cacheable GET)",
+    description="""
+    Cacheable GET variant of `POST /ephemeris/natal` for browser and proxy caches.
+    
+    Takes decimal coordinates and either an ISO datetime or a Julian Day.
+    Responses carry the same strong `ETag` as the equivalent POST request;
+    send `If-None-Match` to receive 304 without recalculation.
+    """,
+    responses={
+        304: {"description": "Not modified since the given ETag"}
+    }
+)
+async def calculate_natal_chart_get(
+    http_request: Request,
+    latitude: float = Query(..., description="Birth latitude in decimal degrees"),
+    longitude: float = Query(..., description="Birth longitude in decimal degrees"),
+    datetime: Optional[str] = Query(None, description="Birth datetime as an ISO 8601 string"),
+    julian_day: Optional[float] = Query(None, description="Birth datetime as a Julian Day"),
+    name: str = Query("Subject", description="Subject name or identifier"),
+    altitude: float = Query(0.0, description="Altitude in meters above sea level"),
+    timezone: Optional[str] = Query(None, description="IANA timezone name"),
+    utc_offset: Optional[float] = Query(None, description="UTC offset in hours"),
+    house_system: HouseSystemEnum = Query(HouseSystemEnum.PLACIDUS, description="House system code"),
+    include_asteroids: bool = Query(True, description="Include major asteroids"),
+    include_nodes: bool = Query(True, description="Include lunar nodes"),
+    include_lilith: bool = Query(True, description="Include Lilith points")
+) -> Union[Response, JSONResponse]:
+    """
+    Calculate natal chart from query parameters.
+    
+    Returns:
+        Complete natal chart response with all calculated data, or 304
+    """
+    timezone_input = None
+    if timezone is not None:
+        timezone_input = {"name": timezone}
+    elif utc_offset is not None:
+        timezone_input = {"utc_offset": utc_offset}
+    
+    try:
+        request = NatalChartRequest(
+            subject={
+                "name": name,
+                "datetime": {"iso_string": datetime} if datetime is not None else {"julian_day": julian_day},
+                "latitude": {"decimal": latitude},
+                "longitude": {"decimal": longitude},
+                "altitude": altitude,
+                "timezone": timezone_input
+            },
+            configuration={
+                "house_system": house_system,
+                "include_asteroids": include_asteroids,
+                "include_nodes": include_nodes,
+                "include_lilith": include_lilith
+            }
+        )
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    
+    return await _natal_chart_response(request, http_request)
+
+
+async def _natal_chart_response(request: NatalChartRequest, http_request: Request) -> Union[Response, JSONResponse]:
+    """
+    Shared implementation of the POST and GET natal chart endpoints.
+    
+    Answers ``If-None-Match`` before calculating; otherwise calculates and
+    serves the encoded chart with its ETag.
+    """
+    etag = request_etag("natal", request.model_dump(mode="json"))
+    not_modified_response = not_modified(http_request, etag)
+    if not_modified_response is not None:
+        return not_modified_response
+    
     try:
         # Calculate chart using service
-        result = ephemeris_service.calculate_natal_chart(request)
-        return result
+        # Off the event loop so concurrent identical requests can coalesce
+        result = await run_in_threadpool(ephemeris_service.calculate_natal_chart, request)
+        return encoded_response(http_request, CachedResponse.from_body(encode_json(result)), etag)
         
     except InputValidationError as e:
         # Input validation errors (400 Bad Request)
@@ -137,13 +231,21 @@ async def calculate_natal_chart(
     summary="Get Natal Chart Request Schema",
     description="Get the JSON schema for natal chart request format with examples."
 )
-async def get_natal_request_schema():
+async def get_natal_request_schema(request: Request) -> Response:
     """
     Get the JSON schema for natal chart requests.
     
+    Args:
+        request: Incoming request (for conditional headers)
+        
     Returns:
         JSON schema with validation rules and examples
     """
+    return natal_request_schema_response.respond(request)
+
+
+def _natal_request_schema():
+    """Natal chart request schema with examples."""
     return {
         "schema": NatalChartRequest.model_json_schema(),
         "examples": {
@@ -228,17 +330,17 @@ async def get_natal_request_schema():
     summary="Get Natal Chart Response Schema",
     description="Get the JSON schema for natal chart response format."
 )
-async def get_natal_response_schema():
+async def get_natal_response_schema(request: Request) -> Response:
     """
     Get the JSON schema for natal chart responses.
     
+    Args:
+        request: Incoming request (for conditional headers)
+        
     Returns:
         JSON schema describing the response format
     """
-    return {
-        "schema": NatalChartResponse.model_json_schema(),
-        "description": "Complete natal chart data with all calculated positions and relationships"
-    }
+    return natal_response_schema_response.respond(request)
 
 
 # Additional utility endpoints for development/debugging
@@ -248,13 +350,21 @@ async def get_natal_response_schema():
     summary="Get Supported House Systems",
     description="Get list of supported house systems with their codes and names."
 )
-async def get_supported_house_systems():
+async def get_supported_house_systems(request: Request) -> Response:
     """
     Get list of supported house systems.
     
+    Args:
+        request: Incoming request (for conditional headers)
+        
     Returns:
         Dictionary of house system codes and names
     """
+    return house_systems_response.respond(request)
+
+
+def _supported_house_systems():
+    """House system codes and names."""
     return {
         "house_systems": {
             "P": "Placidus",
@@ -275,13 +385,21 @@ async def get_supported_house_systems():
     summary="Get Supported Celestial Objects",
     description="Get list of celestial objects included in chart calculations."
 )
-async def get_supported_objects():
+async def get_supported_objects(request: Request) -> Response:
     """
     Get list of supported celestial objects.
     
+    Args:
+        request: Incoming request (for conditional headers)
+        
     Returns:
         Dictionary of object categories and their members
     """
+    return supported_objects_response.respond(request)
+
+
+def _supported_objects():
+    """Celestial object categories and their members."""
     from ...core.ephemeris.const import MODERN_PLANETS, MAJOR_ASTEROIDS, LUNAR_NODES, LILITH_POINTS, PLANET_NAMES
     
     return {
@@ -312,4 +430,14 @@ async def get_supported_objects():
     }
 
 
+# Static for the life of the process; encoded once and served with a long max-age
+natal_request_schema_response = StaticResponse(_natal_request_schema)
+natal_response_schema_response = StaticResponse(lambda: {
+    "schema": NatalChartResponse.model_json_schema(),
+    "description": "Complete natal chart data with all calculated positions and relationships"
+})
+house_systems_response = StaticResponse(_supported_house_systems)
+supported_objects_response = StaticResponse(_supported_objects)
+
+
 # Note: Exception handlers are defined in main.py for the full application
\ No newline at end of file
@@ -18,7 +18,11 @@ Modules:
 - acg_core: Core calculation engine
 - acg_metadata: Metadata and provenance handling
 - acg_cache: Caching and optimization layer
+- acg_packed: Memory-compact results for the in-memory cache tier
 - acg_utils: Utility functions and helpers
+- acg_reverse: Reverse queries (which stored charts are angular at a place)
+- acg_live: Shared current-sky snapshot, refreshed on a schedule
+- acg_scrub: Stateful time-scrubbing sessions with delta updates
 """
 
 from .acg_types import (
@@ -8,30 +8,108 @@ future scaling capabilities.
 
 This module provides:
 - Redis-based caching for ACG calculations
-- In-memory caching with LRU eviction
+- In-memory caching with LRU eviction, holding results packed (NumPy geometry)
+- Shared memory caching across the worker processes on a host
+- Persistent disk caching of results, surviving restarts
+- Near-cache invalidation of in-memory entries across workers (Redis pub/sub)
+- Pre-serialized response caching (encoded bytes plus gzip variant)
 - Cache key generation and versioning
+- Probabilistic early refresh (XFetch) and popularity tracking for refresh-ahead
 - Performance optimizations and batch processing
 - Cache statistics and monitoring
 - Cache warming and preloading strategies
 """
 
-import hashlib
+import asyncio
+import gzip
+import threading
 import time
 import pickle
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 import logging
 import json
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
+from pydantic import TypeAdapter
+
+from .acg_canonical import canonical_request, canonical_request_hash
+from .acg_packed import PackedACGResult
 from .acg_types import ACGRequest, ACGResult, ACGBodyData, ACGLineData
-from ..ephemeris.classes.cache import get_global_cache
-from ..ephemeris.classes.redis_cache import get_redis_cache
+from ..ephemeris.classes.cache import EphemerisCache, get_global_cache, should_refresh_early
+from ..ephemeris.classes.cache_codec import register_model, register_type
+from ..ephemeris.classes.disk_cache import get_disk_cache
+from ..ephemeris.classes.near_cache import NearCache, evict_matching, get_invalidation_bus
+from ..ephemeris.classes.shared_cache import get_shared_cache
+from ..ephemeris.classes.redis_cache import CachedEntry, get_redis_cache
+from ..ephemeris.settings import settings
 # from ..performance.optimizations import MemoryOptimizations
 
 logger = logging.getLogger(__name__)
 
+# Bodies below this size get no gzip variant (GZipMiddleware's threshold)
+GZIP_MINIMUM_SIZE = 1000
+GZIP_COMPRESS_LEVEL = 6
+
+# Validates the Redis hits of a bulk lookup in one call
+_RESULT_LIST = TypeAdapter(List[ACGResult])
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows a gzip-encoded body."""
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Final encoded response body with a precompressed gzip variant."""
+    body: bytes
+    gzip_body: Optional[bytes]
+    features_count: int
+    
+    @classmethod
+    def encode(cls, result: ACGResult) -> "CachedResponse":
+        """Serialize a result once, compressing it if large enough to matter."""
+        return cls.from_body(result.model_dump_json().encode(), features_count=len(result.features))
+    
+    @classmethod
+    def from_body(cls, body: bytes, features_count: int = 0) -> "CachedResponse":
+        """Wrap an encoded body, adding a gzip variant if large enough to matter."""
+        gzip_body = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL) if len(body) >= GZIP_MINIMUM_SIZE else None
+        return cls(body=body, gzip_body=gzip_body, features_count=features_count)
+    
+    def select(self, accept_encoding: Optional[str]) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Pick the variant for a client.
+        
+        Args:
+            accept_encoding: Request Accept-Encoding header
+            
+        Returns:
+            Tuple of (body, headers); GZipMiddleware passes bodies with a
+            Content-Encoding header through untouched
+        """
+        if self.gzip_body is not None and accepts_gzip(accept_encoding):
+            return self.gzip_body, {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        return self.body, {"Vary": "Accept-Encoding"}
+
+
+# Values stored in Redis by the cache manager and single-flight
+register_type(CachedResponse, "acg.CachedResponse", asdict, lambda state: CachedResponse(**state))
+register_model(ACGResult)
+
 
 class ACGCacheManager:
     """
@@ -56,6 +134,21 @@ class ACGCacheManager:
         # Initialize cache backends
         self.redis_cache = get_redis_cache()
         self.memory_cache = get_global_cache()
+        self.shared_cache = get_shared_cache()
+        self.disk_cache = get_disk_cache()
+        
+        # Line components get their own cache: one result holds hundreds of
+        # them and they would otherwise evict whole results
+        self.line_cache = EphemerisCache(
+            max_size=settings.acg_line_cache_size, default_ttl=self.default_ttl,
+            max_bytes=settings.acg_line_cache_max_bytes, low_water=settings.cache_low_water
+        )
+        
+        # Encoded response bodies, served without validation or serialization
+        self.response_cache = EphemerisCache(
+            max_size=settings.acg_response_cache_size, default_ttl=self.default_ttl,
+            max_bytes=settings.acg_response_cache_max_bytes, low_water=settings.cache_low_water
+        )
         
         # Cache statistics
         self.stats = {
@@ -63,9 +156,32 @@ class ACGCacheManager:
             'misses': 0,
             'sets': 0,
             'errors': 0,
+            'line_hits': 0,
+            'line_misses': 0,
+            'response_hits': 0,
+            'response_misses': 0,
+            'early_refreshes': 0,
             'calculation_time_saved': 0.0
         }
         
+        # Probabilistic early expiration: entries carry their compute cost, and
+        # one reader refreshes a hot entry shortly before it expires
+        self.xfetch_beta = settings.cache_xfetch_beta
+        self._refresh_claims: Dict[str, float] = {}
+        
+        # Result hit counts for the refresh-ahead worker:
+        # cache key -> [request, hits, compute cost, expires_at]
+        self.max_tracked_requests = 1000
+        self._popularity: Dict[str, List[Any]] = {}
+        self._popularity_lock = threading.Lock()
+        
+        # Near cache: memory entries registered against their Redis keys and
+        # evicted on invalidations from any worker
+        self.near_cache: Optional[NearCache] = None
+        bus = get_invalidation_bus()
+        if bus is not None:
+            self.use_near_cache(bus)
+        
         # Optimization settings
         self.enable_batch_optimization = True
         self.enable_position_caching = True
@@ -77,6 +193,9 @@ class ACGCacheManager:
         """
         Generate unique cache key for ACG request.
         
+        Keys derive from `canonical_request`, so equivalent requests
+        (epoch vs jd, reordered bodies, explicit defaults) share an entry.
+        
         Args:
             request: ACG calculation request
             suffix: Optional suffix for specialized caching
@@ -85,23 +204,8 @@ class ACGCacheManager:
             Unique cache key string
         """
         try:
-            # Create deterministic representation of request
-            request_dict = {
-                'epoch': request.epoch,
-                'jd': request.jd,
-                'bodies': [
-                    {'id': body.id, 'type': body.type.value, 'number': body.number}
-                    for body in (request.bodies or [])
-                ] if request.bodies else None,
-                'options': request.options.model_dump() if request.options else None,
-                'natal': request.natal.model_dump() if request.natal else None
-            }
-            
-            # Sort for consistency
-            request_json = json.dumps(request_dict, sort_keys=True)
-            
-            # Generate hash
-            key_hash = hashlib.sha256(request_json.encode()).hexdigest()[:16]
+            # Hash the canonical form shared by every cache tier
+            key_hash = canonical_request_hash(request)[:16]
             
             # Format cache key
             cache_key = f"acg:v{self.cache_version}:{key_hash}"
@@ -114,6 +218,49 @@ class ACGCacheManager:
             self.logger.error(f"Failed to generate cache key: {e}")
             return f"acg:fallback:{int(time.time())}"
     
+    def _redis_key_data(self, request: ACGRequest) -> Dict[str, Any]:
+        """Redis key data: the same canonical form as the memory keys."""
+        return {'version': self.cache_version, 'request': canonical_request(request)}
+    
+    def use_near_cache(self, bus) -> NearCache:
+        """
+        Keep the memory and response caches coherent through an invalidation bus.
+        
+        Entries are registered against their Redis keys and kept for the
+        near-cache L1 TTL; purges and version bumps are broadcast on the bus.
+        
+        Args:
+            bus: LocalInvalidationBus or RedisInvalidationBus
+            
+        Returns:
+            The near cache
+        """
+        if self.near_cache is not None:
+            self.near_cache.close()
+            self.near_cache.bus.unsubscribe(self._on_invalidation)
+        self.near_cache = NearCache(
+            [self.memory_cache, self.response_cache], bus, host_caches=[self.shared_cache, self.disk_cache]
+        )
+        bus.subscribe(self._on_invalidation)
+        return self.near_cache
+    
+    def _l1_ttl(self, ttl: Optional[float]) -> Optional[float]:
+        """TTL for memory entries: near-cache entries are evicted explicitly, so they may outlive ``ttl``."""
+        if self.near_cache is None or ttl is None:
+            return ttl
+        return max(ttl, settings.near_cache_l1_ttl)
+    
+    def _register_l1(self, cache_key: str, prefix: str, request: ACGRequest) -> None:
+        """Register a memory entry against the Redis key it mirrors."""
+        if self.near_cache is not None:
+            self.near_cache.register(cache_key, self.redis_cache.cache_key(prefix, self._redis_key_data(request)))
+    
+    def _on_invalidation(self, message: Dict[str, Any]) -> int:
+        """Apply a broadcast purge to the tiers the near cache does not cover."""
+        if message.get('cache_version'):
+            self.cache_version = message['cache_version']
+        return sum(self._evict_matching(pattern, memory=False) for pattern in message.get('patterns') or ())
+    
     def get_cached_result(self, request: ACGRequest) -> Optional[ACGResult]:
         """
         Get cached ACG calculation result.
@@ -127,20 +274,31 @@ class ACGCacheManager:
         cache_key = self.generate_cache_key(request, "result")
         
         try:
-            # Try Redis first
-            if self.redis_cache.enabled:
-                cached_data = self.redis_cache.get("acg_results", request.model_dump())
-                if cached_data:
-                    self.stats['hits'] += 1
-                    self.logger.debug(f"ACG result cache hit (Redis): {cache_key}")
-                    return ACGResult.model_validate(cached_data)
-            
             # Try memory cache
-            cached_data = self.memory_cache.get(cache_key)
-            if cached_data:
+            entry = self.memory_cache.get_entry(cache_key)
+            if entry is not None and entry.value:
+                if self._should_refresh_early(cache_key, entry.cost, entry.expires_at):
+                    return self._early_refresh_miss(cache_key)
                 self.stats['hits'] += 1
+                self._record_hit(cache_key, request, entry.cost, entry.expires_at)
                 self.logger.debug(f"ACG result cache hit (Memory): {cache_key}")
-                return ACGResult.model_validate(cached_data)
+                return entry.value.to_result()
+            
+            # Try the host's shared memory, then disk (promoting disk hits to memory)
+            found, result = self._get_tier_result(cache_key, request)
+            if found:
+                return result
+            
+            # Try Redis last, promoting hits to memory
+            if self.redis_cache.enabled:
+                cached = self.redis_cache.get_with_refresh(
+                    "acg_results", self._redis_key_data(request), beta=self.xfetch_beta
+                )
+                if cached.value and not cached.refresh:
+                    self.logger.debug(f"ACG result cache hit (Redis): {cache_key}")
+                    return self._adopt_redis_result(cache_key, request, cached, ACGResult.model_validate(cached.value))
+                if cached.value:
+                    return self._early_refresh_miss(cache_key)
             
             # Cache miss
             self.stats['misses'] += 1
@@ -156,7 +314,8 @@ class ACGCacheManager:
         self, 
         request: ACGRequest, 
         result: ACGResult,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        compute_time: Optional[float] = None
     ) -> bool:
         """
         Cache ACG calculation result.
@@ -165,6 +324,7 @@ class ACGCacheManager:
             request: ACG calculation request
             result: ACG calculation result
             ttl: Time-to-live in seconds
+            compute_time: Seconds the result took to calculate; enables early refresh
             
         Returns:
             True if caching successful, False otherwise
@@ -177,12 +337,21 @@ class ACGCacheManager:
             
             # Store in Redis
             if self.redis_cache.enabled:
-                self.redis_cache.set("acg_results", request.model_dump(), result_data, ttl=ttl)
+                self.redis_cache.set(
+                    "acg_results", self._redis_key_data(request), result_data, ttl=ttl, cost=compute_time
+                )
                 self.logger.debug(f"ACG result cached to Redis: {cache_key}")
             
-            # Store in memory cache
-            self.memory_cache.put(cache_key, result_data, ttl=ttl)
+            # Store in memory cache, packed, in shared memory and on disk
+            packed = PackedACGResult.pack(result_data)
+            self.memory_cache.put(cache_key, packed, ttl=self._l1_ttl(ttl), cost=compute_time or 0.0)
+            self._register_l1(cache_key, "acg_results", request)
             self.logger.debug(f"ACG result cached to memory: {cache_key}")
+            for tier_cache in (self.shared_cache, self.disk_cache):
+                if tier_cache.enabled:
+                    tier_cache.put(cache_key, packed, ttl=ttl, cost=compute_time or 0.0, entry_class="acg_results")
+            self._release_refresh_claim(cache_key)
+            self._record_set(cache_key, request, compute_time or 0.0, time.time() + ttl)
             
             self.stats['sets'] += 1
             return True
@@ -192,6 +361,479 @@ class ACGCacheManager:
             self.stats['errors'] += 1
             return False
     
+    def mget_results(self, requests: List[ACGRequest]) -> List[Optional[ACGResult]]:
+        """
+        Get cached results for several requests in bulk.
+        
+        The memory tier is read under one lock acquisition, shared memory and
+        disk per remaining key, and Redis for what is left with chunked MGETs
+        (one round trip per node and chunk instead of one per request). Redis
+        hits are validated together.
+        
+        Args:
+            requests: ACG calculation requests
+            
+        Returns:
+            Cached ACGResult or None per request, in order
+        """
+        results: List[Optional[ACGResult]] = [None] * len(requests)
+        if not requests:
+            return results
+        cache_keys = [self.generate_cache_key(request, "result") for request in requests]
+        
+        try:
+            pending = []
+            for index, entry in enumerate(self.memory_cache.get_entries(cache_keys)):
+                cache_key = cache_keys[index]
+                if entry is None or not entry.value:
+                    pending.append(index)
+                elif self._should_refresh_early(cache_key, entry.cost, entry.expires_at):
+                    self._early_refresh_miss(cache_key)
+                else:
+                    self.stats['hits'] += 1
+                    self._record_hit(cache_key, requests[index], entry.cost, entry.expires_at)
+                    results[index] = entry.value.to_result()
+            
+            remote = []
+            for index in pending:
+                found, result = self._get_tier_result(cache_keys[index], requests[index])
+                if found:
+                    results[index] = result
+                else:
+                    remote.append(index)
+            
+            if remote and self.redis_cache.enabled:
+                cached = self.redis_cache.mget_results(
+                    "acg_results", [self._redis_key_data(requests[index]) for index in remote],
+                    beta=self.xfetch_beta
+                )
+                hits = []
+                for index, entry in zip(remote, cached):
+                    if entry.value and not entry.refresh:
+                        hits.append((index, entry))
+                    elif entry.value:
+                        self._early_refresh_miss(cache_keys[index])
+                    else:
+                        self.stats['misses'] += 1
+                validated = _RESULT_LIST.validate_python([entry.value for _, entry in hits])
+                for (index, entry), result in zip(hits, validated):
+                    results[index] = self._adopt_redis_result(cache_keys[index], requests[index], entry, result)
+            else:
+                self.stats['misses'] += len(remote)
+            
+            self.logger.debug(f"ACG bulk result lookup: {sum(r is not None for r in results)}/{len(requests)} hits")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Bulk cache retrieval error: {e}")
+            self.stats['errors'] += 1
+            return [None] * len(requests)
+    
+    def _get_tier_result(self, cache_key: str, request: ACGRequest) -> Tuple[bool, Optional[ACGResult]]:
+        """
+        Look a result up in shared memory, then on disk.
+        
+        Disk hits are promoted to memory. Shared-memory hits are not: every
+        worker on the host reads the one shared copy instead of keeping its own.
+        
+        Returns:
+            (whether a tier answered, result); an early refresh answers with None
+        """
+        for tier, tier_cache in (("Shared", self.shared_cache), ("Disk", self.disk_cache)):
+            tier_entry = tier_cache.get_entry(cache_key) if tier_cache.enabled else None
+            if tier_entry is None or not isinstance(tier_entry.value, PackedACGResult):
+                continue
+            if self._should_refresh_early(cache_key, tier_entry.cost, tier_entry.expires_at):
+                return True, self._early_refresh_miss(cache_key)
+            if tier_cache is not self.shared_cache:
+                ttl = tier_entry.expires_at - time.time() if tier_entry.expires_at is not None else None
+                self.memory_cache.put(cache_key, tier_entry.value, ttl=self._l1_ttl(ttl), cost=tier_entry.cost or 0.0)
+                self._register_l1(cache_key, "acg_results", request)
+            self.stats['hits'] += 1
+            self._record_hit(cache_key, request, tier_entry.cost, tier_entry.expires_at)
+            self.logger.debug(f"ACG result cache hit ({tier}): {cache_key}")
+            return True, tier_entry.value.to_result()
+        return False, None
+    
+    def _adopt_redis_result(self, cache_key: str, request: ACGRequest, entry: CachedEntry,
+                            result: ACGResult) -> ACGResult:
+        """Count a Redis hit and promote it to memory with its remaining TTL and cost."""
+        self.memory_cache.put(
+            cache_key, PackedACGResult.pack(entry.value), ttl=self._l1_ttl(self._remaining_ttl(entry)),
+            cost=entry.cost or 0.0
+        )
+        self._register_l1(cache_key, "acg_results", request)
+        self.stats['hits'] += 1
+        self._record_hit(cache_key, request, entry.cost, entry.expires_at)
+        return result
+    
+    def _remaining_ttl(self, entry: CachedEntry) -> Optional[float]:
+        """Seconds a Redis entry has left; entries without an expiry get the default TTL."""
+        if entry.expires_at is None:
+            return self.default_ttl
+        return entry.expires_at - time.time()
+    
+    def mset_results(
+        self,
+        items: List[Tuple[ACGRequest, ACGResult, Optional[float]]],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Cache several results in bulk; Redis is written with pipelined,
+        chunked SETEXs (one round trip per node and chunk).
+        
+        Args:
+            items: (request, result, compute seconds or None) triples
+            ttl: Time-to-live in seconds
+            
+        Returns:
+            True if caching successful, False otherwise
+        """
+        if not items:
+            return True
+        ttl = ttl or self.default_ttl
+        
+        try:
+            result_data = [result.model_dump() for _, result, _ in items]
+            if self.redis_cache.enabled:
+                self.redis_cache.mset_results("acg_results", [
+                    (self._redis_key_data(request), data, compute_time)
+                    for (request, _, compute_time), data in zip(items, result_data)
+                ], ttl=ttl)
+            
+            expires_at = time.time() + ttl
+            for (request, _, compute_time), data in zip(items, result_data):
+                cache_key = self.generate_cache_key(request, "result")
+                packed = PackedACGResult.pack(data)
+                self.memory_cache.put(cache_key, packed, ttl=self._l1_ttl(ttl), cost=compute_time or 0.0)
+                self._register_l1(cache_key, "acg_results", request)
+                for tier_cache in (self.shared_cache, self.disk_cache):
+                    if tier_cache.enabled:
+                        tier_cache.put(cache_key, packed, ttl=ttl, cost=compute_time or 0.0, entry_class="acg_results")
+                self._release_refresh_claim(cache_key)
+                self._record_set(cache_key, request, compute_time or 0.0, expires_at)
+            
+            self.stats['sets'] += len(items)
+            self.logger.debug(f"ACG bulk result store: {len(items)} results")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Bulk cache storage error: {e}")
+            self.stats['errors'] += 1
+            return False
+    
+    def get_cached_response(self, request: ACGRequest) -> Optional[CachedResponse]:
+        """
+        Get the pre-serialized response for an ACG request.
+        
+        Args:
+            request: ACG calculation request
+            
+        Returns:
+            CachedResponse or None if not found
+        """
+        cache_key = self.generate_cache_key(request, "response")
+        
+        try:
+            cached, lookup_redis = self._get_local_response(cache_key)
+            if lookup_redis:
+                cached = self._adopt_redis_response(cache_key, request, self.redis_cache.get_with_refresh(
+                    "acg_responses", self._redis_key_data(request), beta=self.xfetch_beta
+                ))
+            return self._response_lookup_result(cache_key, request, cached)
+            
+        except Exception as e:
+            self.logger.error(f"Response cache retrieval error: {e}")
+            self.stats['errors'] += 1
+            return None
+    
+    async def aget_cached_response(self, request: ACGRequest) -> Optional[CachedResponse]:
+        """
+        Asyncio version of `get_cached_response` for async routes.
+        
+        The response tier is read inline. Shared memory is read in a worker
+        thread: the seqlock read takes no lock, but decoding and decompressing
+        a large entry would still hold up the event loop. Redis is read through
+        the asyncio client, so the loop never waits on a socket either.
+        """
+        cache_key = self.generate_cache_key(request, "response")
+        
+        try:
+            cached, lookup_shared = self._get_memory_response(cache_key)
+            lookup_redis = False
+            if lookup_shared and self.shared_cache.enabled:
+                cached, lookup_redis = await asyncio.to_thread(self._get_shared_response, cache_key)
+            elif lookup_shared:
+                lookup_redis = self.redis_cache.enabled
+            if lookup_redis:
+                cached = self._adopt_redis_response(cache_key, request, await self.redis_cache.aget_with_refresh(
+                    "acg_responses", self._redis_key_data(request), beta=self.xfetch_beta
+                ))
+            return self._response_lookup_result(cache_key, request, cached)
+            
+        except Exception as e:
+            self.logger.error(f"Response cache retrieval error: {e}")
+            self.stats['errors'] += 1
+            return None
+    
+    def _get_local_response(self, cache_key: str) -> Tuple[Optional[CachedResponse], bool]:
+        """Look up the response and shared tiers; returns (response, whether to ask Redis)."""
+        cached, lookup_shared = self._get_memory_response(cache_key)
+        if lookup_shared:
+            return self._get_shared_response(cache_key)
+        return cached, False
+    
+    def _get_memory_response(self, cache_key: str) -> Tuple[Optional[CachedResponse], bool]:
+        """Look up the response tier; returns (response, whether to ask the lower tiers)."""
+        entry = self.response_cache.get_entry(cache_key)
+        if entry is None:
+            return None, True
+        if self._should_refresh_early(cache_key, entry.cost, entry.expires_at):
+            self.stats['early_refreshes'] += 1
+            return None, False
+        return entry.value, False
+    
+    def _get_shared_response(self, cache_key: str) -> Tuple[Optional[CachedResponse], bool]:
+        """
+        Look up the shared tier; returns (response, whether to ask Redis).
+        
+        Shared-memory hits are served from the shared copy, not copied into
+        this worker's response tier.
+        """
+        shared_entry = self.shared_cache.get_entry(cache_key) if self.shared_cache.enabled else None
+        if shared_entry is not None:
+            if self._should_refresh_early(cache_key, shared_entry.cost, shared_entry.expires_at):
+                self.stats['early_refreshes'] += 1
+                return None, False
+            return shared_entry.value, False
+        
+        return None, self.redis_cache.enabled
+    
+    def _adopt_redis_response(self, cache_key: str, request: ACGRequest,
+                              entry: CachedEntry) -> Optional[CachedResponse]:
+        """
+        Promote a Redis hit to the response tier with its remaining TTL and
+        cost; an early refresh counts as a miss.
+        """
+        if entry.refresh:
+            self.stats['early_refreshes'] += 1
+            return None
+        if entry.value is not None:
+            self.response_cache.put(
+                cache_key, entry.value, ttl=self._l1_ttl(self._remaining_ttl(entry)), cost=entry.cost or 0.0
+            )
+            self._register_l1(cache_key, "acg_responses", request)
+        return entry.value
+    
+    def _response_lookup_result(self, cache_key: str, request: ACGRequest,
+                                cached: Optional[CachedResponse]) -> Optional[CachedResponse]:
+        """Count a response lookup and record hits for popularity tracking."""
+        if cached is None:
+            self.stats['response_misses'] += 1
+            return None
+        
+        self.stats['response_hits'] += 1
+        self._record_hit(self.generate_cache_key(request, "result"), request)
+        self.logger.debug(f"ACG response cache hit: {cache_key}")
+        return cached
+    
+    def set_cached_response(
+        self,
+        request: ACGRequest,
+        result: ACGResult,
+        ttl: Optional[int] = None
+    ) -> CachedResponse:
+        """
+        Encode a result and cache the encoded response.
+        
+        Args:
+            request: ACG calculation request
+            result: ACG calculation result
+            ttl: Time-to-live in seconds
+            
+        Returns:
+            The encoded response, whether or not caching succeeded
+        """
+        cache_key = self.generate_cache_key(request, "response")
+        ttl = ttl or self.default_ttl
+        encoded, encode_time = self._store_local_response(cache_key, request, result, ttl)
+        
+        try:
+            if self.redis_cache.enabled:
+                self.redis_cache.set(
+                    "acg_responses", self._redis_key_data(request), encoded, ttl=ttl, cost=encode_time
+                )
+            self._release_refresh_claim(cache_key)
+        except Exception as e:
+            self.logger.error(f"Response cache storage error: {e}")
+            self.stats['errors'] += 1
+        
+        return encoded
+    
+    async def aset_cached_response(
+        self,
+        request: ACGRequest,
+        result: ACGResult,
+        ttl: Optional[int] = None
+    ) -> CachedResponse:
+        """
+        Asyncio version of `set_cached_response`.
+        
+        Encoding and the shared-memory write run in a worker thread; Redis is
+        written through the asyncio client.
+        """
+        cache_key = self.generate_cache_key(request, "response")
+        ttl = ttl or self.default_ttl
+        encoded, encode_time = await asyncio.to_thread(self._store_local_response, cache_key, request, result, ttl)
+        
+        try:
+            if self.redis_cache.enabled:
+                await self.redis_cache.aset(
+                    "acg_responses", self._redis_key_data(request), encoded, ttl=ttl, cost=encode_time
+                )
+            self._release_refresh_claim(cache_key)
+        except Exception as e:
+            self.logger.error(f"Response cache storage error: {e}")
+            self.stats['errors'] += 1
+        
+        return encoded
+    
+    @staticmethod
+    def _encode_response(result: ACGResult) -> Tuple[CachedResponse, float]:
+        """Encode a result; returns (response, encode seconds)."""
+        encode_start = time.time()
+        encoded = CachedResponse.encode(result)
+        return encoded, time.time() - encode_start
+    
+    def _store_local_response(self, cache_key: str, request: ACGRequest, result: ACGResult,
+                              ttl: int) -> Tuple[CachedResponse, float]:
+        """Encode a result and store it in the response and shared tiers; returns (response, encode seconds)."""
+        encoded, encode_time = self._encode_response(result)
+        
+        try:
+            self.response_cache.put(cache_key, encoded, ttl=self._l1_ttl(ttl), cost=encode_time)
+            self._register_l1(cache_key, "acg_responses", request)
+            if self.shared_cache.enabled:
+                self.shared_cache.put(cache_key, encoded, ttl=ttl, cost=encode_time, entry_class="acg_responses")
+        except Exception as e:
+            self.logger.error(f"Response cache storage error: {e}")
+            self.stats['errors'] += 1
+        
+        return encoded, encode_time
+    
+    def _should_refresh_early(self, cache_key: str, cost: Optional[float], expires_at: Optional[float]) -> bool:
+        """XFetch draw for a memory entry; only one local caller wins the refresh."""
+        if not should_refresh_early(cost, expires_at, self.xfetch_beta):
+            return False
+        return self._claim_local_refresh(cache_key, max(1.0, 2 * cost))
+    
+    def _claim_local_refresh(self, cache_key: str, hold: float) -> bool:
+        """Claim the refresh of a key in this process for ``hold`` seconds."""
+        now = time.time()
+        with self._popularity_lock:
+            if self._refresh_claims.get(cache_key, 0.0) > now:
+                return False
+            self._refresh_claims[cache_key] = now + hold
+            return True
+    
+    def _release_refresh_claim(self, cache_key: str) -> None:
+        """Drop a local refresh claim once the entry has been rewritten."""
+        with self._popularity_lock:
+            self._refresh_claims.pop(cache_key, None)
+    
+    def _early_refresh_miss(self, cache_key: str) -> None:
+        """Report a still-valid entry as a miss so this caller recomputes it."""
+        self.stats['early_refreshes'] += 1
+        self.stats['misses'] += 1
+        self.logger.debug(f"ACG result early refresh: {cache_key}")
+        return None
+    
+    def _record_hit(
+        self,
+        cache_key: str,
+        request: ACGRequest,
+        cost: Optional[float] = None,
+        expires_at: Optional[float] = None
+    ) -> None:
+        """Count a result hit for the refresh-ahead worker."""
+        with self._popularity_lock:
+            record = self._popularity.get(cache_key)
+            if record is None:
+                if len(self._popularity) >= self.max_tracked_requests:
+                    return
+                record = self._popularity[cache_key] = [request, 0, 0.0, None]
+            record[1] += 1
+            if cost is not None:
+                record[2] = cost
+            if expires_at is not None:
+                record[3] = expires_at
+    
+    def _record_set(self, cache_key: str, request: ACGRequest, cost: float, expires_at: float) -> None:
+        """Track cost and expiry of a result after it is (re)cached."""
+        with self._popularity_lock:
+            record = self._popularity.get(cache_key)
+            if record is None:
+                if len(self._popularity) >= self.max_tracked_requests:
+                    return
+                record = self._popularity[cache_key] = [request, 0, 0.0, None]
+            record[2] = cost
+            record[3] = expires_at
+    
+    def refresh_candidates(self, min_hits: int, window: float) -> List[ACGRequest]:
+        """
+        Popular results that expire within ``window`` seconds.
+        
+        Args:
+            min_hits: Minimum (decayed) hit count
+            window: Seconds before expiry at which a result is refreshed
+            
+        Returns:
+            Requests to recalculate, most popular first
+        """
+        now = time.time()
+        with self._popularity_lock:
+            records = sorted(
+                (record for record in self._popularity.values() if record[1] >= min_hits),
+                key=lambda record: -record[1]
+            )
+        
+        candidates = []
+        for request, _, _, expires_at in records:
+            if self.redis_cache.enabled:
+                # Another worker may already have refreshed the shared entry
+                remaining = self.redis_cache.get_ttl("acg_results", self._redis_key_data(request))
+                expires_at = now + remaining if remaining is not None else expires_at
+            if expires_at is not None and expires_at - now <= window:
+                candidates.append(request)
+        return candidates
+    
+    def claim_refresh(self, request: ACGRequest, hold: float) -> bool:
+        """
+        Claim the refresh of a result so only one worker recalculates it.
+        
+        Args:
+            request: ACG calculation request
+            hold: Seconds the claim lasts
+            
+        Returns:
+            True if this caller should refresh
+        """
+        if self.redis_cache.enabled:
+            return self.redis_cache.claim_refresh("acg_results", self._redis_key_data(request), hold)
+        return self._claim_local_refresh(self.generate_cache_key(request, "result"), hold)
+    
+    def decay_popularity(self) -> None:
+        """Halve hit counts, forgetting expired results that are no longer requested."""
+        now = time.time()
+        with self._popularity_lock:
+            for cache_key in list(self._popularity):
+                record = self._popularity[cache_key]
+                record[1] //= 2
+                if record[1] == 0 and (record[3] is None or record[3] <= now):
+                    del self._popularity[cache_key]
+            for cache_key in [key for key, until in self._refresh_claims.items() if until <= now]:
+                del self._refresh_claims[cache_key]
+    
     def get_cached_body_positions(
         self, 
         bodies: List[str], 
@@ -201,6 +843,9 @@ class ACGCacheManager:
         """
         Get cached celestial body positions.
         
+        Memory is checked first; every body missing there is fetched from
+        Redis in a single MGET round trip.
+        
         Args:
             bodies: List of body IDs
             jd: Julian Day
@@ -213,31 +858,33 @@ class ACGCacheManager:
             return {}
         
         cached_positions = {}
+        missing = []
         
-        for body_id in bodies:
-            position_key = self.generate_position_cache_key(body_id, jd, flags)
-            
-            try:
-                # Try memory cache first (faster for repeated access)
-                cached_pos = self.memory_cache.get(position_key)
-                if cached_pos:
+        try:
+            # Try memory cache first (faster for repeated access)
+            for body_id in bodies:
+                cached_pos = self.memory_cache.get(self.generate_position_cache_key(body_id, jd, flags))
+                if cached_pos is not None:
                     cached_positions[body_id] = cached_pos
-                    continue
-                
-                # Try Redis cache
-                if self.redis_cache.enabled:
-                    cached_pos = self.redis_cache.get("body_positions", {
-                        'body_id': body_id,
-                        'jd': jd,
-                        'flags': flags
-                    })
-                    if cached_pos:
+                else:
+                    missing.append(body_id)
+            
+            # Fetch the rest from Redis in one round trip
+            if missing and self.redis_cache.enabled:
+                values = self.redis_cache.get_many("body_positions", [
+                    {'body_id': body_id, 'jd': jd, 'flags': flags} for body_id in missing
+                ])
+                for body_id, cached_pos in zip(missing, values):
+                    if cached_pos is not None:
                         cached_positions[body_id] = cached_pos
                         # Store in memory for future access
-                        self.memory_cache.put(position_key, cached_pos, ttl=self.short_ttl)
-            
-            except Exception as e:
-                self.logger.warning(f"Position cache error for {body_id}: {e}")
+                        self.memory_cache.put(
+                            self.generate_position_cache_key(body_id, jd, flags),
+                            cached_pos, ttl=self.short_ttl
+                        )
+        
+        except Exception as e:
+            self.logger.warning(f"Position cache error: {e}")
         
         return cached_positions
     
@@ -250,37 +897,105 @@ class ACGCacheManager:
         """
         Cache celestial body positions.
         
+        Redis writes are sent as one pipelined call.
+        
         Args:
             body_positions: Dictionary of body_id -> position data
             jd: Julian Day
             flags: Swiss Ephemeris flags
         """
-        if not self.enable_position_caching:
+        if not self.enable_position_caching or not body_positions:
             return
         
-        for body_id, position_data in body_positions.items():
-            position_key = self.generate_position_cache_key(body_id, jd, flags)
-            
-            try:
-                # Store in memory cache
+        try:
+            # Store in memory cache
+            for body_id, position_data in body_positions.items():
+                position_key = self.generate_position_cache_key(body_id, jd, flags)
                 self.memory_cache.put(position_key, position_data, ttl=self.short_ttl)
-                
-                # Store in Redis cache
-                if self.redis_cache.enabled:
-                    self.redis_cache.set("body_positions", {
-                        'body_id': body_id,
-                        'jd': jd,
-                        'flags': flags
-                    }, position_data, ttl=self.short_ttl)
-            
-            except Exception as e:
-                self.logger.warning(f"Position cache storage error for {body_id}: {e}")
+            
+            # Store in Redis cache
+            if self.redis_cache.enabled:
+                self.redis_cache.set_many("body_positions", [
+                    ({'body_id': body_id, 'jd': jd, 'flags': flags}, position_data)
+                    for body_id, position_data in body_positions.items()
+                ], ttl=self.short_ttl)
+        
+        except Exception as e:
+            self.logger.warning(f"Position cache storage error: {e}")
     
     def generate_position_cache_key(self, body_id: str, jd: float, flags: int = None) -> str:
         """Generate cache key for body position data."""
         flags_str = str(flags) if flags else "default"
         return f"pos:v{self.cache_version}:{body_id}:{jd:.6f}:{flags_str}"
     
+    def generate_line_cache_key(
+        self,
+        jd: float,
+        flags: Optional[int],
+        body_id: str,
+        line_type: str,
+        aspect: Optional[Any] = None,
+        resolution: Optional[Any] = None
+    ) -> str:
+        """
+        Generate cache key for one line component.
+        
+        A component is every line of one type (and aspect) for one body,
+        or for one body pair in the case of parans, at one instant.
+        
+        Args:
+            jd: Julian Day
+            flags: Swiss Ephemeris flags
+            body_id: Body identifier, or "A-B" for a paran pair
+            line_type: Line type (MC, IC, AC, DC, MC_ASPECT, AC_ASPECT, PARAN)
+            aspect: Aspect angle for aspect lines
+            resolution: Sampling resolution of the line geometry
+            
+        Returns:
+            Line component cache key
+        """
+        flags_str = str(flags) if flags else "default"
+        return (f"line:v{self.cache_version}:{jd:.6f}:{flags_str}:{body_id}:"
+                f"{line_type}:{aspect if aspect is not None else '-'}:{resolution}")
+    
+    def get_cached_lines(self, keys: List[str]) -> Optional[List[Any]]:
+        """
+        Get a group of line components, all or nothing.
+        
+        Args:
+            keys: Line component cache keys
+            
+        Returns:
+            List of cached components in key order, or None if any is missing
+        """
+        if not self.enable_line_caching:
+            return None
+        
+        components = []
+        for key in keys:
+            component = self.line_cache.get(key)
+            if component is None:
+                self.stats['line_misses'] += 1
+                return None
+            components.append(component)
+        
+        self.stats['line_hits'] += 1
+        return components
+    
+    def set_cached_lines(self, components: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """
+        Cache line components.
+        
+        Args:
+            components: Dictionary of line component key -> component
+            ttl: Time-to-live in seconds
+        """
+        if not self.enable_line_caching:
+            return
+        
+        for key, component in components.items():
+            self.line_cache.put(key, component, ttl=ttl or self.default_ttl)
+    
     def optimize_batch_calculation(
         self, 
         requests: List[ACGRequest]
@@ -300,8 +1015,7 @@ class ACGCacheManager:
         uncached_requests = []
         cached_results = []
         
-        for i, request in enumerate(requests):
-            cached_result = self.get_cached_result(request)
+        for i, (request, cached_result) in enumerate(zip(requests, self.mget_results(requests))):
             if cached_result:
                 cached_results.append((i, cached_result))
                 self.logger.debug(f"Batch item {i} served from cache")
@@ -370,6 +1084,12 @@ class ACGCacheManager:
         total_requests = self.stats['hits'] + self.stats['misses']
         hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0.0
         
+        total_line_lookups = self.stats['line_hits'] + self.stats['line_misses']
+        line_hit_rate = (self.stats['line_hits'] / total_line_lookups * 100) if total_line_lookups > 0 else 0.0
+        
+        total_response_lookups = self.stats['response_hits'] + self.stats['response_misses']
+        response_hit_rate = (self.stats['response_hits'] / total_response_lookups * 100) if total_response_lookups > 0 else 0.0
+        
         # Get memory cache stats
         memory_stats = {}
         if hasattr(self.memory_cache, 'get_stats'):
@@ -396,10 +1116,30 @@ class ACGCacheManager:
                 'errors': self.stats['errors'],
                 'hit_rate_percent': round(hit_rate, 2),
                 'calculation_time_saved_ms': round(self.stats['calculation_time_saved'], 2),
+                'early_refreshes': self.stats['early_refreshes'],
+                'xfetch_beta': self.xfetch_beta,
+                'tracked_requests': len(self._popularity),
                 'version': self.cache_version
             },
+            'near_cache': self.near_cache.stats() if self.near_cache is not None else {'enabled': False},
+            'line_cache': {
+                'hits': self.stats['line_hits'],
+                'misses': self.stats['line_misses'],
+                'hit_rate_percent': round(line_hit_rate, 2),
+                'size': self.line_cache.size(),
+                'size_bytes': self.line_cache.size_bytes()
+            },
+            'response_cache': {
+                'hits': self.stats['response_hits'],
+                'misses': self.stats['response_misses'],
+                'hit_rate_percent': round(response_hit_rate, 2),
+                'size': self.response_cache.size(),
+                'size_bytes': self.response_cache.size_bytes()
+            },
             'memory_cache': memory_stats,
             'redis_cache': redis_stats,
+            'shared_cache': self.shared_cache.stats(),
+            'disk_cache': self.disk_cache.stats(),
             'optimizations': {
                 'batch_optimization': self.enable_batch_optimization,
                 'position_caching': self.enable_position_caching,
@@ -411,8 +1151,12 @@ class ACGCacheManager:
         """
         Clear cache entries matching pattern.
         
+        With a near cache the purge is broadcast, so every worker evicts its
+        matching memory entries. Redis entries are keyed by request hash and
+        are only deleted for a purge of all ACG entries.
+        
         Args:
-            pattern: Cache key pattern to clear
+            pattern: Glob pattern over memory cache keys
             
         Returns:
             Number of entries cleared
@@ -420,22 +1164,15 @@ class ACGCacheManager:
         cleared = 0
         
         try:
-            # Clear memory cache
-            if hasattr(self.memory_cache, 'clear_pattern'):
-                cleared += self.memory_cache.clear_pattern(pattern)
+            if self.near_cache is not None:
+                cleared += self.near_cache.invalidate(patterns=[pattern])
             else:
-                # Fallback: clear all if pattern matching not available
-                if hasattr(self.memory_cache, 'clear'):
-                    self.memory_cache.clear()
-                    cleared += 1  # Approximate
+                cleared += self._evict_matching(pattern)
             
             # Clear Redis cache
-            if self.redis_cache.enabled:
-                try:
-                    redis_cleared = self.redis_cache.clear_pattern(pattern)
-                    cleared += redis_cleared
-                except Exception as e:
-                    self.logger.warning(f"Redis cache clear failed: {e}")
+            if self.redis_cache.enabled and pattern in ("acg:*", "*"):
+                for prefix in ("acg_results", "acg_responses"):
+                    cleared += self.redis_cache.delete_pattern(f"{prefix}:*")
             
             self.logger.info(f"Cleared {cleared} cache entries matching '{pattern}'")
             
@@ -444,6 +1181,60 @@ class ACGCacheManager:
         
         return cleared
     
+    def bump_cache_version(self, version: str) -> int:
+        """
+        Switch to a new cache version and evict the entries of the old one.
+        
+        With a near cache every worker adopts the version and evicts its
+        old entries; Redis entries of the old version are no longer looked
+        up and expire by TTL.
+        
+        Args:
+            version: New cache version
+            
+        Returns:
+            Number of entries evicted in this process
+        """
+        pattern = f"acg:v{self.cache_version}:*"
+        if self.near_cache is not None:
+            evicted = self.near_cache.invalidate(patterns=[pattern], cache_version=version)
+        else:
+            self.cache_version = version
+            evicted = self._evict_matching(pattern)
+        self.logger.info(f"ACG cache version bumped to {version}, evicted {evicted} entries")
+        return evicted
+    
+    def _evict_matching(self, pattern: str, memory: bool = True) -> int:
+        """
+        Evict entries matching a glob pattern from this process's and host's tiers.
+        
+        Args:
+            pattern: Glob pattern over memory cache keys
+            memory: Whether to include the memory and response caches
+                (the near cache evicts those itself)
+            
+        Returns:
+            Number of entries evicted
+        """
+        # Line components and body positions are derived data; drop them with any clear
+        cleared = self.line_cache.size()
+        self.line_cache.clear()
+        cleared += evict_matching(self.memory_cache, "pos:*")
+        
+        if memory:
+            cleared += evict_matching(self.memory_cache, pattern)
+            cleared += evict_matching(self.response_cache, pattern)
+        
+        # Shared memory holds results and responses only; drop it with any clear
+        if self.shared_cache.enabled:
+            cleared += self.shared_cache.size()
+            self.shared_cache.clear()
+        
+        if self.disk_cache.enabled:
+            cleared += self.disk_cache.invalidate_pattern(pattern)
+        
+        return cleared
+    
     def optimize_memory_usage(self) -> Dict[str, Any]:
         """
         Apply memory optimizations for large datasets.
@@ -0,0 +1,180 @@
+"""
+ACG Canonical Requests
+
+Reduces an ACGRequest to the canonical form every cache tier keys on, so
+requests that describe the same calculation share one cache entry:
+
+- The epoch is resolved to a Julian Day (UT); ``...Z`` and ``...+00:00``,
+  other offsets of the same instant, and an epoch versus its equivalent
+  ``jd`` all agree. With a quantum configured (``ACG_EPOCH_QUANTUM_SECONDS``)
+  the Julian Day is also rounded to it, and the engine calculates at (and
+  labels results with) the rounded instant so a key always maps to one result.
+- Bodies, line types and aspects are treated as sets and sorted.
+- Options and natal fields equal to their defaults are dropped, as are
+  default line types and fields that do not affect the calculation
+  (``correlation_id``).
+
+Natal context is calculated from the epoch itself, so requests with a
+complete natal birthplace keep the exact (unquantized) epoch Julian Day.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+import swisseph as swe
+
+from .acg_types import ACGLineType, ACGNatalData, ACGOptions, ACGRequest
+from ..ephemeris.settings import settings
+
+SECONDS_PER_DAY = 86400.0
+
+# Julian Days are compared to ~1 ms
+JD_DECIMALS = 8
+
+DEFAULT_LINE_TYPES = frozenset(
+    line_type.value for line_type in (ACGLineType.MC, ACGLineType.IC, ACGLineType.AC, ACGLineType.DC)
+)
+
+_DEFAULT_OPTIONS = ACGOptions().model_dump(mode="json")
+_DEFAULT_NATAL = ACGNatalData().model_dump(mode="json")
+
+
+def resolve_epoch_jd(epoch: str) -> float:
+    """
+    Julian Day (UT) of an ISO 8601 timestamp.
+
+    Timestamps with an offset are converted to UTC; naive timestamps are
+    taken as UTC.
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    epoch_dt = datetime.fromisoformat(epoch.replace('Z', '+00:00'))
+    if epoch_dt.tzinfo is not None:
+        epoch_dt = epoch_dt.astimezone(timezone.utc)
+    hour = (
+        epoch_dt.hour + epoch_dt.minute / 60.0
+        + (epoch_dt.second + epoch_dt.microsecond / 1e6) / 3600.0
+    )
+    return swe.julday(epoch_dt.year, epoch_dt.month, epoch_dt.day, hour)
+
+
+def quantize_jd(jd: float, quantum_seconds: Optional[float]) -> float:
+    """Round a Julian Day to a multiple of ``quantum_seconds`` (no-op if unset)."""
+    if not quantum_seconds:
+        return jd
+    quantum_days = quantum_seconds / SECONDS_PER_DAY
+    return round(jd / quantum_days) * quantum_days
+
+
+def jd_epoch(jd: float) -> str:
+    """ISO 8601 UTC timestamp of a Julian Day (UT), to the millisecond."""
+    year, month, day, hour = swe.revjul(jd)
+    epoch_dt = datetime(year, month, day, tzinfo=timezone.utc) + timedelta(
+        milliseconds=round(hour * 3600000.0)
+    )
+    timespec = 'milliseconds' if epoch_dt.microsecond else 'seconds'
+    return epoch_dt.isoformat(timespec=timespec).replace('+00:00', 'Z')
+
+
+def resolve_request_epoch(request: ACGRequest, quantum_seconds: Optional[float] = None) -> str:
+    """
+    Epoch timestamp results for a request are labelled with.
+
+    Without a quantum this is the request's own epoch. With one, it is the
+    rounded instant the request is calculated at, so a cached result does
+    not carry the epoch of whichever request happened to fill the cache.
+
+    Args:
+        request: ACG request
+        quantum_seconds: Epoch quantum (defaults to the configured setting)
+
+    Returns:
+        ISO 8601 timestamp
+    """
+    if quantum_seconds is None:
+        quantum_seconds = settings.acg_epoch_quantum_seconds
+    if not quantum_seconds:
+        return request.epoch
+    return jd_epoch(resolve_request_jd(request, quantum_seconds))
+
+
+def resolve_request_jd(request: ACGRequest, quantum_seconds: Optional[float] = None) -> float:
+    """
+    Julian Day (UT) a request is calculated at.
+
+    Args:
+        request: ACG request; ``jd`` takes precedence over ``epoch``
+        quantum_seconds: Epoch quantum (defaults to the configured setting)
+
+    Returns:
+        Julian Day, quantized if a quantum is configured
+    """
+    if quantum_seconds is None:
+        quantum_seconds = settings.acg_epoch_quantum_seconds
+    jd = request.jd if request.jd else resolve_epoch_jd(request.epoch)
+    return quantize_jd(jd, quantum_seconds)
+
+
+def canonical_request(request: ACGRequest, quantum_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Canonical, JSON-compatible form of an ACG request.
+
+    Args:
+        request: ACG request
+        quantum_seconds: Epoch quantum (defaults to the configured setting)
+
+    Returns:
+        Dictionary with sorted keys and lists and without default values
+    """
+    canonical: Dict[str, Any] = {
+        'jd': round(resolve_request_jd(request, quantum_seconds), JD_DECIMALS)
+    }
+
+    if request.bodies:
+        canonical['bodies'] = sorted({
+            (body.id, body.type.value, body.number if body.number is not None else -1)
+            for body in request.bodies
+        })
+
+    if request.options:
+        options = {
+            key: value for key, value in request.options.model_dump(mode="json").items()
+            if value != _DEFAULT_OPTIONS.get(key)
+        }
+        if 'line_types' in options:
+            # None and [] both mean the default line types
+            line_types = sorted(set(options['line_types'] or []))
+            if not line_types or set(line_types) == DEFAULT_LINE_TYPES:
+                del options['line_types']
+            else:
+                options['line_types'] = line_types
+        if 'aspects' in options:
+            # None and [] both mean no aspect lines
+            aspects = sorted(set(options['aspects'] or []))
+            if aspects:
+                options['aspects'] = aspects
+            else:
+                del options['aspects']
+        if options:
+            canonical['options'] = options
+
+    if request.natal:
+        natal = {
+            key: value for key, value in request.natal.model_dump(mode="json").items()
+            if value != _DEFAULT_NATAL.get(key)
+        }
+        if natal:
+            canonical['natal'] = natal
+            if request.natal.birthplace_lat is not None and request.natal.birthplace_lon is not None:
+                canonical['natal_jd'] = round(resolve_epoch_jd(request.epoch), JD_DECIMALS)
+
+    return canonical
+
+
+def canonical_request_hash(request: ACGRequest, quantum_seconds: Optional[float] = None) -> str:
+    """SHA-256 hex digest of the canonical request."""
+    canonical = json.dumps(canonical_request(request, quantum_seconds), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -29,9 +29,17 @@ from .acg_utils import (
 )
 from .acg_natal_integration import ACGNatalIntegrator
 from .acg_cache import get_acg_cache_manager
+from .acg_canonical import canonical_request_hash, resolve_request_epoch, resolve_request_jd
+from ..ephemeris.classes.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
 
+# Sampling resolution of each line type's geometry; part of the line cache key
+LINE_RESOLUTIONS = {
+    "MC": 721, "IC": 721, "AC": 1441, "DC": 1441,
+    "MC_ASPECT": 721, "AC_ASPECT": "361x181", "PARAN": 0.1
+}
+
 
 class ACGCalculationEngine:
     """
@@ -45,6 +53,7 @@ class ACGCalculationEngine:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.natal_integrator = ACGNatalIntegrator()
         self.cache_manager = get_acg_cache_manager()
+        self.single_flight = get_single_flight("acg_lines")
         
         # Body registry for supported celestial objects
         self.body_registry = self._initialize_body_registry()
@@ -208,6 +217,49 @@ class ACGCalculationEngine:
             self.logger.error(f"Failed to calculate position for {body.id}: {e}")
             return None
     
+    def calculate_body_positions(
+        self,
+        bodies: List[ACGBody],
+        jd_ut1: float
+    ) -> Dict[str, Tuple[ACGCoordinates, float]]:
+        """
+        Calculate positions of several bodies at one instant, via the position cache.
+        
+        Cached positions are fetched in one multi-get, only the misses are
+        calculated, and they are written back in one pipelined call. Cache
+        entries are compact (ra, dec, lambda, beta, distance, speed) tuples.
+        
+        Args:
+            bodies: Bodies to calculate
+            jd_ut1: Julian Day (UT1)
+            
+        Returns:
+            Dictionary of body_id -> (ACGCoordinates, calculation time in ms);
+            bodies whose calculation failed are omitted
+        """
+        cached = self.cache_manager.get_cached_body_positions([body.id for body in bodies], jd_ut1)
+        
+        positions = {}
+        computed = {}
+        for body in bodies:
+            entry = cached.get(body.id)
+            if isinstance(entry, tuple):
+                positions[body.id] = (ACGCoordinates(*entry), 0.0)
+                continue
+            
+            body_calc_start = time.time()
+            coordinates = self.calculate_body_position(body, jd_ut1)
+            body_calc_time = (time.time() - body_calc_start) * 1000
+            if coordinates:
+                positions[body.id] = (coordinates, body_calc_time)
+                computed[body.id] = (
+                    coordinates.ra, coordinates.dec, coordinates.lambda_,
+                    coordinates.beta, coordinates.distance, coordinates.speed
+                )
+        
+        self.cache_manager.set_cached_body_positions(computed, jd_ut1)
+        return positions
+    
     def _ecl_to_eq(self, lambda_deg: float, beta_deg: float, eps_deg: float) -> Tuple[float, float]:
         """Convert ecliptic to equatorial coordinates."""
         from .acg_utils import ecl_to_eq
@@ -585,12 +637,216 @@ class ACGCalculationEngine:
         
         return lines
     
-    def calculate_acg_lines(self, request: ACGRequest) -> ACGResult:
+    def calculate_epoch_lines(
+        self,
+        bodies: List[ACGBody],
+        options: ACGOptions,
+        jd_ut1: float,
+        epoch: str,
+        chart_data: Optional[Any] = None,
+        use_line_cache: bool = True
+    ) -> List[ACGLineData]:
+        """
+        Calculate lines for resolved bodies and options at one instant.
+        
+        This is the per-epoch kernel of `calculate_acg_lines`: body positions
+        plus line generation, with no validation, natal chart construction or
+        result caching. Callers that hold bodies, options and natal context
+        across many epochs (e.g. time scrubbing) call it directly.
+        
+        Line geometry is cached per component (body, line type, aspect) so
+        requests for the same instant with different bodies or options share
+        the lines they have in common.
+        
+        Args:
+            bodies: Bodies to calculate
+            options: Calculation options
+            jd_ut1: Julian Day (UT1)
+            epoch: ISO 8601 UTC timestamp recorded in line metadata
+            chart_data: Natal chart data for context enrichment
+            use_line_cache: Read and fill the line component cache
+            
+        Returns:
+            List of ACGLineData
+        """
+        # Calculate GMST and obliquity
+        gmst_deg = gmst_deg_from_jd_ut1(jd_ut1)
+        obliquity_deg = swe.calc_ut(jd_ut1, swe.ECL_NUT)[0][0]
+        
+        # Calculate body positions
+        positions = self.calculate_body_positions(bodies, jd_ut1)
+        body_data_list = []
+        for body in bodies:
+            if body.id in positions:
+                coordinates, body_calc_time = positions[body.id]
+                body_data = ACGBodyData(
+                    body=body,
+                    coordinates=coordinates,
+                    calculation_time_ms=body_calc_time
+                )
+                body_data_list.append(body_data)
+        
+        if chart_data:
+            body_data_list = self.natal_integrator.enrich_acg_bodies_with_natal_data(
+                body_data_list, chart_data
+            )
+        
+        # Generate all lines, reusing cached line components where possible
+        all_lines = []
+        aspect_degrees = [60, 90, 120, 240, 270, 300]  # Default aspects
+        
+        for body_data in body_data_list:
+            body_id = body_data.body.id
+            
+            # Base metadata for this body
+            metadata_base = {
+                'id': body_id,
+                'type': 'body',
+                'kind': body_data.body.type,
+                'number': body_data.body.number,
+                'epoch': epoch,
+                'jd': jd_ut1,
+                'gmst': gmst_deg,
+                'obliquity': obliquity_deg,
+                'coords': body_data.coordinates,
+                'natal': body_data.natal_info,
+                'flags': options.flags,
+                'se_version': get_swiss_ephemeris_version(),
+                'source': 'Meridian-ACG',
+                'calculation_time_ms': body_data.calculation_time_ms
+            }
+            
+            # Determine which line types to calculate
+            line_types = options.line_types if options.line_types else [
+                ACGLineType.MC, ACGLineType.IC, ACGLineType.AC, ACGLineType.DC
+            ]
+            
+            def group(line_type, aspects=(None,)):
+                return [(body_id, line_type, aspect) for aspect in aspects]
+            
+            # Calculate MC/IC lines
+            if ACGLineType.MC in line_types or ACGLineType.IC in line_types:
+                all_lines.extend(self._cached_line_group(
+                    group("MC") + group("IC"),
+                    lambda: self.calculate_mc_ic_lines(body_data, gmst_deg, metadata_base),
+                    jd_ut1, options.flags, body_data, metadata_base, use_line_cache
+                ))
+            
+            # Calculate AC/DC lines
+            if ACGLineType.AC in line_types or ACGLineType.DC in line_types:
+                all_lines.extend(self._cached_line_group(
+                    group("AC") + group("DC"),
+                    lambda: self.calculate_ac_dc_lines(body_data, gmst_deg, metadata_base),
+                    jd_ut1, options.flags, body_data, metadata_base, use_line_cache
+                ))
+            
+            # Calculate MC aspect lines
+            if options.aspects:
+                all_lines.extend(self._cached_line_group(
+                    group("MC_ASPECT", aspect_degrees),
+                    lambda: self.calculate_mc_aspect_lines(
+                        body_data, gmst_deg, aspect_degrees, metadata_base
+                    ),
+                    jd_ut1, options.flags, body_data, metadata_base, use_line_cache
+                ))
+            
+                # Calculate AC aspect lines
+                all_lines.extend(self._cached_line_group(
+                    group("AC_ASPECT", aspect_degrees),
+                    lambda: self.calculate_ac_aspect_lines(
+                        body_data, gmst_deg, obliquity_deg, aspect_degrees, metadata_base
+                    ),
+                    jd_ut1, options.flags, body_data, metadata_base, use_line_cache
+                ))
+        
+        # Calculate parans if requested, one cached component per body pair
+        if options.include_parans and len(body_data_list) > 1:
+            for i in range(len(body_data_list)):
+                for j in range(i + 1, len(body_data_list)):
+                    pair = [body_data_list[i], body_data_list[j]]
+                    pair_id = f"{pair[0].body.id}-{pair[1].body.id}"
+                    all_lines.extend(self._cached_line_group(
+                        [(pair_id, "PARAN", None)],
+                        lambda: self.calculate_paran_lines(pair, gmst_deg, metadata_base),
+                        jd_ut1, options.flags, pair[0], metadata_base, use_line_cache
+                    ))
+        
+        return all_lines
+    
+    def _cached_line_group(
+        self,
+        components: List[Tuple[str, str, Optional[Any]]],
+        compute,
+        jd_ut1: float,
+        flags: Optional[int],
+        body_data: ACGBodyData,
+        metadata_base: Dict[str, Any],
+        use_line_cache: bool
+    ) -> List[ACGLineData]:
+        """
+        Lines for components that are calculated together, via the line cache.
+        
+        Cached components hold only what depends on the instant (geometry and
+        line info); request-specific metadata such as epoch string and natal
+        context is reattached from ``metadata_base``.
+        
+        Args:
+            components: (body_id, line_type, aspect) tuples produced by ``compute``
+            compute: Callable calculating every line of the group
+            jd_ut1: Julian Day (UT1)
+            flags: Swiss Ephemeris flags from the request options
+            body_data: Body data attached to the lines
+            metadata_base: Request metadata for this body
+            use_line_cache: Read and fill the line component cache
+            
+        Returns:
+            List of ACGLineData
+        """
+        if not use_line_cache or not self.cache_manager.enable_line_caching:
+            return compute()
+        
+        keys = [
+            self.cache_manager.generate_line_cache_key(
+                jd_ut1, flags, body_id, line_type, aspect, LINE_RESOLUTIONS[line_type]
+            )
+            for body_id, line_type, aspect in components
+        ]
+        
+        cached = self.cache_manager.get_cached_lines(keys)
+        if cached is None:
+            lines = compute()
+            buckets = {component: [] for component in components}
+            for line in lines:
+                info = line.metadata.line
+                aspect = info.angle if info.line_type in ("MC_ASPECT", "AC_ASPECT") else None
+                bucket = buckets.get((line.metadata.id, info.line_type, aspect))
+                if bucket is not None:
+                    bucket.append((line.line_type.value, line.geometry, line.metadata.id, line.metadata.type, info))
+            self.cache_manager.set_cached_lines(
+                {key: tuple(buckets[component]) for key, component in zip(keys, components)}
+            )
+            return lines
+        
+        lines = []
+        for component in cached:
+            for line_type, geometry, line_id, line_kind, info in component:
+                lines.append(ACGLineData(
+                    line_type=ACGLineType(line_type),
+                    geometry=geometry,
+                    body_data=body_data,
+                    metadata=ACGMetadata(**{**metadata_base, 'id': line_id, 'type': line_kind}, line=info)
+                ))
+        return lines
+    
+    def calculate_acg_lines(self, request: ACGRequest, store_result: bool = True) -> ACGResult:
         """
         Main ACG calculation method with caching support.
         
         Args:
             request: ACG calculation request
+            store_result: Store a calculated result in the result cache; callers
+                that cache the encoded response themselves pass False so a miss
+                is not stored twice
             
         Returns:
             ACGResult with GeoJSON FeatureCollection
@@ -609,132 +865,13 @@ class ACGCalculationEngine:
                 self.cache_manager.stats['calculation_time_saved'] += calc_duration
                 self.logger.info(f"ACG calculation served from cache in {calc_duration * 1000:.2f}ms")
                 return cached_result
-            # Validate request
-            validation_result = self.natal_integrator.validate_acg_request_natal_compatibility(request)
-            if not validation_result['valid']:
-                raise ValueError(f"Request validation failed: {validation_result['errors']}")
-            
-            # Parse epoch and calculate Julian Day
-            epoch_dt = datetime.fromisoformat(request.epoch.replace('Z', '+00:00'))
-            jd_ut1 = request.jd if request.jd else swe.julday(
-                epoch_dt.year, epoch_dt.month, epoch_dt.day,
-                epoch_dt.hour + epoch_dt.minute/60.0 + epoch_dt.second/3600.0
-            )
-            
-            # Calculate GMST and obliquity
-            gmst_deg = gmst_deg_from_jd_ut1(jd_ut1)
-            obliquity_deg = swe.calc_ut(jd_ut1, swe.ECL_NUT)[0][0]
-            
-            # Determine bodies to calculate
-            bodies = request.bodies if request.bodies else self.get_default_bodies()
-            
-            # Get calculation options
-            options = request.options if request.options else self.default_options
-            
-            # Calculate body positions
-            body_data_list = []
-            for body in bodies:
-                body_calc_start = time.time()
-                coordinates = self.calculate_body_position(body, jd_ut1)
-                body_calc_time = (time.time() - body_calc_start) * 1000
-                
-                if coordinates:
-                    body_data = ACGBodyData(
-                        body=body,
-                        coordinates=coordinates,
-                        calculation_time_ms=body_calc_time
-                    )
-                    body_data_list.append(body_data)
-            
-            # Create natal chart if possible for context enrichment
-            chart_data = None
-            if validation_result['chart_creatable']:
-                chart_data = self.natal_integrator.create_natal_chart_for_acg(request)
-                if chart_data:
-                    body_data_list = self.natal_integrator.enrich_acg_bodies_with_natal_data(
-                        body_data_list, chart_data
-                    )
-            
-            # Generate all lines
-            all_lines = []
-            
-            for body_data in body_data_list:
-                # Base metadata for this body
-                metadata_base = {
-                    'id': body_data.body.id,
-                    'type': 'body',
-                    'kind': body_data.body.type,
-                    'number': body_data.body.number,
-                    'epoch': request.epoch,
-                    'jd': jd_ut1,
-                    'gmst': gmst_deg,
-                    'obliquity': obliquity_deg,
-                    'coords': body_data.coordinates,
-                    'natal': body_data.natal_info,
-                    'flags': options.flags,
-                    'se_version': get_swiss_ephemeris_version(),
-                    'source': 'Meridian-ACG',
-                    'calculation_time_ms': body_data.calculation_time_ms
-                }
-                
-                # Determine which line types to calculate
-                line_types = options.line_types if options.line_types else [
-                    ACGLineType.MC, ACGLineType.IC, ACGLineType.AC, ACGLineType.DC
-                ]
-                
-                # Calculate MC/IC lines
-                if ACGLineType.MC in line_types or ACGLineType.IC in line_types:
-                    mc_ic_lines = self.calculate_mc_ic_lines(body_data, gmst_deg, metadata_base)
-                    all_lines.extend(mc_ic_lines)
-                
-                # Calculate AC/DC lines
-                if ACGLineType.AC in line_types or ACGLineType.DC in line_types:
-                    ac_dc_lines = self.calculate_ac_dc_lines(body_data, gmst_deg, metadata_base)
-                    all_lines.extend(ac_dc_lines)
-                
-                # Calculate MC aspect lines
-                if options.aspects:
-                    aspect_degrees = [60, 90, 120, 240, 270, 300]  # Default aspects
-                    mc_aspect_lines = self.calculate_mc_aspect_lines(
-                        body_data, gmst_deg, aspect_degrees, metadata_base
-                    )
-                    all_lines.extend(mc_aspect_lines)
-                
-                    # Calculate AC aspect lines
-                    ac_aspect_lines = self.calculate_ac_aspect_lines(
-                        body_data, gmst_deg, obliquity_deg, aspect_degrees, metadata_base
-                    )
-                    all_lines.extend(ac_aspect_lines)
-            
-            # Calculate parans if requested
-            if options.include_parans and len(body_data_list) > 1:
-                paran_lines = self.calculate_paran_lines(body_data_list, gmst_deg, metadata_base)
-                all_lines.extend(paran_lines)
-            
-            # Convert to GeoJSON features
-            features = []
-            for line_data in all_lines:
-                feature = {
-                    "type": "Feature",
-                    "geometry": line_data.geometry,
-                    "properties": self._metadata_to_properties(line_data.metadata)
-                }
-                features.append(feature)
-            
-            calc_total_time = (time.time() - calc_start_time) * 1000
-            self.logger.info(f"ACG calculation completed in {calc_total_time:.2f}ms, {len(features)} features generated")
-            
-            # Create result
-            result = ACGResult(
-                type="FeatureCollection",
-                features=features
+            # Concurrent misses for the same canonical request share one calculation
+            calculate = self._calculate_and_cache if store_result else self._calculate
+            return self.single_flight.do(
+                canonical_request_hash(request),
+                lambda: calculate(request, calc_start_time)
             )
             
-            # Cache the result
-            self.cache_manager.set_cached_result(request, result)
-            
-            return result
-            
         except Exception as e:
             # Allow validation errors to propagate for proper 422 handling at API layer
             if isinstance(e, ValueError):
@@ -742,6 +879,145 @@ class ACGCalculationEngine:
             self.logger.error(f"ACG calculation failed: {e}")
             raise RuntimeError(f"ACG calculation failed: {e}")
     
+    def calculate_acg_batch(self, requests: List[ACGRequest]) -> List[Union[ACGResult, Exception]]:
+        """
+        Calculate several ACG requests with bulk cache access.
+        
+        Cached results are fetched with one `mget_results` call and the
+        calculated ones stored with one `mset_results` call, instead of a
+        cache round trip per request in each direction. Requests with the
+        same canonical form are calculated once.
+        
+        Args:
+            requests: ACG calculation requests
+            
+        Returns:
+            ACGResult, or the exception the calculation raised, per request in order
+        """
+        batch_start_time = time.time()
+        results: List[Union[ACGResult, Exception, None]] = list(self.cache_manager.mget_results(requests))
+        cached_count = sum(result is not None for result in results)
+        calculated: Dict[str, Union[ACGResult, Exception]] = {}
+        to_cache = []
+        
+        for index, request in enumerate(requests):
+            if results[index] is not None:
+                continue
+            request_hash = canonical_request_hash(request)
+            if request_hash not in calculated:
+                compute_start_time = time.time()
+                try:
+                    result = self.single_flight.do(
+                        request_hash, lambda: self._calculate(request, compute_start_time)
+                    )
+                    to_cache.append((request, result, time.time() - compute_start_time))
+                    calculated[request_hash] = result
+                except ValueError as e:
+                    calculated[request_hash] = e
+                except Exception as e:
+                    self.logger.error(f"ACG calculation failed: {e}")
+                    calculated[request_hash] = RuntimeError(f"ACG calculation failed: {e}")
+            results[index] = calculated[request_hash]
+        
+        self.cache_manager.mset_results(to_cache)
+        self.logger.info(
+            f"ACG batch of {len(requests)} completed in {(time.time() - batch_start_time) * 1000:.2f}ms, "
+            f"{cached_count} from cache, {len(to_cache)} calculated"
+        )
+        return results
+    
+    def _calculate_and_cache(self, request: ACGRequest, calc_start_time: float) -> ACGResult:
+        """
+        Calculate an ACG result on a cache miss and store it.
+        
+        Args:
+            request: ACG calculation request
+            calc_start_time: Start of the request, for timing logs
+            
+        Returns:
+            ACGResult with GeoJSON FeatureCollection
+        """
+        compute_start_time = time.time()
+        result = self._calculate(request, calc_start_time)
+        
+        # Cache the result with its compute cost (drives early refresh)
+        self.cache_manager.set_cached_result(
+            request, result, compute_time=time.time() - compute_start_time
+        )
+        
+        return result
+    
+    def _calculate(self, request: ACGRequest, calc_start_time: float) -> ACGResult:
+        """
+        Calculate an ACG result without consulting or filling the cache.
+        
+        Args:
+            request: ACG calculation request
+            calc_start_time: Start of the request, for timing logs
+            
+        Returns:
+            ACGResult with GeoJSON FeatureCollection
+        """
+        # Validate request
+        validation_result = self.natal_integrator.validate_acg_request_natal_compatibility(request)
+        if not validation_result['valid']:
+            raise ValueError(f"Request validation failed: {validation_result['errors']}")
+        
+        # Resolve the Julian Day the cache key was derived from (quantized if configured)
+        jd_ut1 = resolve_request_jd(request)
+        epoch = resolve_request_epoch(request)
+        
+        # Determine bodies to calculate
+        bodies = request.bodies if request.bodies else self.get_default_bodies()
+        
+        # Get calculation options
+        options = request.options if request.options else self.default_options
+        
+        # Create natal chart if possible for context enrichment
+        chart_data = None
+        if validation_result['chart_creatable']:
+            chart_data = self.natal_integrator.create_natal_chart_for_acg(request)
+        
+        all_lines = self.calculate_epoch_lines(
+            bodies, options, jd_ut1, epoch, chart_data
+        )
+        
+        # Convert to GeoJSON features
+        features = []
+        for line_data in all_lines:
+            feature = {
+                "type": "Feature",
+                "geometry": line_data.geometry,
+                "properties": self._metadata_to_properties(line_data.metadata)
+            }
+            features.append(feature)
+        
+        calc_total_time = (time.time() - calc_start_time) * 1000
+        self.logger.info(f"ACG calculation completed in {calc_total_time:.2f}ms, {len(features)} features generated")
+        
+        # Create result
+        return ACGResult(
+            type="FeatureCollection",
+            features=features
+        )
+    
+    def refresh_acg_lines(self, request: ACGRequest) -> ACGResult:
+        """
+        Recalculate and re-cache a result regardless of what is cached.
+        
+        Used by the refresh-ahead worker; coalesces with concurrent misses.
+        
+        Args:
+            request: ACG calculation request
+            
+        Returns:
+            Freshly calculated ACGResult
+        """
+        return self.single_flight.do(
+            canonical_request_hash(request),
+            lambda: self._calculate_and_cache(request, time.time())
+        )
+    
     def _metadata_to_properties(self, metadata: ACGMetadata) -> Dict[str, Any]:
         """
         Convert ACGMetadata to GeoJSON properties dict.
@@ -0,0 +1,319 @@
+"""
+ACG Live Sky ("current sky" product)
+
+Recomputes the current-sky ACG for the default body set once per interval on
+a background thread and keeps the latest FeatureCollection as pre-serialized
+bytes. Every client asking for "now" is served the same snapshot, so N
+per-user computations per interval collapse into one.
+
+With Redis enabled the workers share that one computation as well: for each
+interval the worker holding a single-flight lease computes the snapshot and
+stores it in Redis, and the others adopt it. Without Redis (or if the lease
+holder does not deliver in time) a worker computes its own snapshot.
+
+Snapshots are published to async subscribers (the SSE stream) through
+bounded per-subscriber queues; a slow client only ever holds the newest
+snapshot.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Set, Tuple
+import logging
+
+from .acg_types import ACGBody, ACGOptions, ACGRequest
+from ..ephemeris.classes.cache_codec import register_type
+from ..ephemeris.classes.single_flight import RedisLease, SingleFlight
+from ..monitoring.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# Redis prefix of shared snapshots
+SNAPSHOT_PREFIX = "acg_live"
+
+
+@dataclass(frozen=True)
+class LiveSkySnapshot:
+    """Pre-serialized current-sky ACG result."""
+    epoch: str
+    epoch_ts: float
+    body: bytes
+    etag: str
+    features_count: int
+    calculation_time_ms: float
+
+
+register_type(LiveSkySnapshot, "acg.LiveSkySnapshot", asdict, lambda state: LiveSkySnapshot(**state))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header value against an entity tag.
+
+    Uses the weak comparison required for If-None-Match, so ``W/"x"``
+    matches ``"x"``.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
+
+
+def format_sse(snapshot: LiveSkySnapshot, event: str = "acg-live") -> bytes:
+    """Encode a snapshot as a single Server-Sent Events message."""
+    return (
+        f"id: {snapshot.etag.strip(chr(34))}\nevent: {event}\ndata: ".encode()
+        + snapshot.body
+        + b"\n\n"
+    )
+
+
+class ACGLiveSky:
+    """
+    Scheduler and holder for the live current-sky ACG snapshot.
+
+    Epochs are aligned to interval boundaries (e.g. the top of each minute),
+    so every worker refers to the same instants and can share snapshots.
+    """
+
+    def __init__(
+        self,
+        engine,
+        interval_seconds: float = 60.0,
+        bodies: Optional[List[ACGBody]] = None,
+        options: Optional[ACGOptions] = None,
+        redis_cache=None,
+        shared_wait_seconds: float = 30.0
+    ):
+        """
+        Args:
+            engine: ACG calculation engine
+            interval_seconds: Seconds between snapshots
+            bodies: Bodies to calculate (defaults to the engine's set)
+            options: Calculation options (defaults to the engine's)
+            redis_cache: RedisCache shared by the workers; if enabled, one of them
+                computes each snapshot
+            shared_wait_seconds: Longest wait for another worker's snapshot before computing locally
+        """
+        self.engine = engine
+        self.interval_seconds = interval_seconds
+        self.bodies = bodies
+        self.options = options
+        self.redis_cache = redis_cache
+        self.single_flight: Optional[SingleFlight] = None
+        if redis_cache is not None and redis_cache.enabled:
+            self.single_flight = SingleFlight(
+                "acg_live", lease=RedisLease(redis_cache),
+                lease_ttl=shared_wait_seconds, wait_timeout=shared_wait_seconds
+            )
+
+        self._snapshot: Optional[LiveSkySnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._subscribers: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = set()
+        self._subscribers_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> Optional[LiveSkySnapshot]:
+        """Latest snapshot, or None before the first computation."""
+        return self._snapshot
+
+    @property
+    def running(self) -> bool:
+        """Whether the background scheduler is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def current_epoch(self, now: Optional[float] = None) -> float:
+        """Start of the interval containing ``now`` (Unix seconds)."""
+        now = time.time() if now is None else now
+        return now - (now % self.interval_seconds)
+
+    def max_age(self, snapshot: LiveSkySnapshot, now: Optional[float] = None) -> int:
+        """Seconds until the snapshot is superseded by the next refresh."""
+        now = time.time() if now is None else now
+        return max(0, int(snapshot.epoch_ts + self.interval_seconds - now))
+
+    def compute_snapshot(self, epoch_ts: Optional[float] = None) -> LiveSkySnapshot:
+        """
+        Calculate and serialize the ACG for a given instant.
+
+        Args:
+            epoch_ts: Unix timestamp to calculate (defaults to the current interval)
+
+        Returns:
+            LiveSkySnapshot with the encoded FeatureCollection
+        """
+        epoch_ts = self.current_epoch() if epoch_ts is None else epoch_ts
+        epoch = datetime.fromtimestamp(epoch_ts, tz=timezone.utc).replace(tzinfo=None).isoformat() + 'Z'
+
+        calc_start = time.time()
+        request = ACGRequest(epoch=epoch, bodies=self.bodies, options=self.options)
+        result = self.engine.calculate_acg_lines(request)
+        body = result.model_dump_json().encode()
+        calc_duration = time.time() - calc_start
+
+        return LiveSkySnapshot(
+            epoch=epoch,
+            epoch_ts=epoch_ts,
+            body=body,
+            etag='"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+            features_count=len(result.features),
+            calculation_time_ms=calc_duration * 1000
+        )
+
+    def refresh(self, epoch_ts: Optional[float] = None) -> LiveSkySnapshot:
+        """Compute a new snapshot, store it and push it to subscribers."""
+        with self._refresh_lock:
+            snapshot = self._refresh_locked(epoch_ts)
+        self._publish(snapshot)
+        return snapshot
+
+    def get_snapshot(self) -> LiveSkySnapshot:
+        """Return the latest snapshot, computing it if none exists or it is stale."""
+        snapshot = self._snapshot
+        if snapshot is not None and (self.running or snapshot.epoch_ts >= self.current_epoch()):
+            # While the scheduler runs it replaces stale snapshots itself
+            return snapshot
+
+        with self._refresh_lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.epoch_ts >= self.current_epoch():
+                return snapshot
+            snapshot = self._refresh_locked(None)
+        self._publish(snapshot)
+        return snapshot
+
+    def _refresh_locked(self, epoch_ts: Optional[float]) -> LiveSkySnapshot:
+        """Adopt or compute and store a snapshot; caller holds the refresh lock."""
+        epoch_ts = self.current_epoch() if epoch_ts is None else epoch_ts
+        if self.single_flight is None:
+            snapshot = self._compute_recorded(epoch_ts)
+            self._snapshot = snapshot
+            return snapshot
+
+        data = {'epoch_ts': epoch_ts}
+        snapshot = self.redis_cache.get(SNAPSHOT_PREFIX, data)
+        if isinstance(snapshot, LiveSkySnapshot):
+            logger.debug(f"ACG live sky for {snapshot.epoch} shared by another worker")
+            self._snapshot = snapshot
+            return snapshot
+
+        def compute_and_share() -> LiveSkySnapshot:
+            computed = self._compute_recorded(epoch_ts)
+            self.redis_cache.set(SNAPSHOT_PREFIX, data, computed, ttl=int(2 * self.interval_seconds) + 1)
+            return computed
+
+        # One worker computes; the others receive its snapshot through the lease
+        snapshot = self.single_flight.do(f"{SNAPSHOT_PREFIX}:{epoch_ts}", compute_and_share)
+        self._snapshot = snapshot
+        return snapshot
+
+    def _compute_recorded(self, epoch_ts: float) -> LiveSkySnapshot:
+        """Compute a snapshot, recording the calculation in the metrics."""
+        metrics = get_metrics()
+        try:
+            snapshot = self.compute_snapshot(epoch_ts)
+        except Exception:
+            metrics.record_calculation("acg_live", 0.0, False)
+            raise
+
+        metrics.record_calculation("acg_live", snapshot.calculation_time_ms / 1000, True)
+        logger.info(f"ACG live sky refreshed for {snapshot.epoch} "
+                    f"in {snapshot.calculation_time_ms:.2f}ms")
+        return snapshot
+
+    def start(self) -> None:
+        """Start the background refresh thread."""
+        if self.running:
+            return
+        # Fresh event per thread so a previous thread still finishing a
+        # refresh cannot be revived by a restart
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stop_event,), name="acg-live-sky", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"ACG live sky scheduler started (interval {self.interval_seconds}s)")
+
+    def stop(self) -> None:
+        """
+        Stop the background refresh thread.
+
+        Does not wait for an in-flight refresh; the daemon thread exits as
+        soon as it completes.
+        """
+        self._stop_event.set()
+        self._thread = None
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """Refresh at every interval boundary until stopped."""
+        while not stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"ACG live sky refresh failed: {e}")
+
+            next_epoch = self.current_epoch() + self.interval_seconds
+            stop_event.wait(max(0.0, next_epoch - time.time()))
+
+    async def subscribe(self, keepalive_seconds: float = 15.0) -> AsyncIterator[Optional[LiveSkySnapshot]]:
+        """
+        Yield the current snapshot and then every new one.
+
+        Yields None when no update arrived within ``keepalive_seconds`` so
+        that callers can emit a keep-alive.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        entry = (loop, queue)
+        with self._subscribers_lock:
+            self._subscribers.add(entry)
+
+        try:
+            if self._snapshot is not None:
+                yield self._snapshot
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), timeout=keepalive_seconds)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._subscribers_lock:
+                self._subscribers.discard(entry)
+
+    def subscriber_count(self) -> int:
+        """Number of connected stream subscribers."""
+        with self._subscribers_lock:
+            return len(self._subscribers)
+
+    def _publish(self, snapshot: LiveSkySnapshot) -> None:
+        """Hand a snapshot to every subscriber's event loop."""
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer_latest, queue, snapshot)
+            except RuntimeError:
+                # Subscriber's loop has closed
+                with self._subscribers_lock:
+                    self._subscribers.discard((loop, queue))
+
+
+def _offer_latest(queue: asyncio.Queue, snapshot: LiveSkySnapshot) -> None:
+    """Replace any undelivered snapshot with the newest one."""
+    while not queue.empty():
+        queue.get_nowait()
+    queue.put_nowait(snapshot)
@@ -0,0 +1,179 @@
+"""
+ACG Packed Results
+
+Memory-compact, immutable form of an ACG result for the in-memory cache
+tier. A dumped result is a tree of small dicts and lists of float pairs,
+which costs roughly 100 bytes per coordinate in Python objects; packed:
+
+- Float coordinate lists (any rectangular nesting of floats) become
+  read-only float64 NumPy arrays, 8 bytes per value.
+- Dicts become records: a key tuple shared by every dict with the same keys
+  plus a tuple of values, so per-feature properties carry no hash tables.
+- Strings are interned, so body ids, line types and epochs repeated across
+  features and results are stored once.
+
+GeoJSON is only materialized again (`to_dict`/`to_result`) when a cached
+result is actually served, and the materialized tree equals the dumped one.
+"""
+
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .acg_types import ACGResult
+from ..ephemeris.classes.cache_codec import register_type
+
+# Shorter float lists stay as lists: an array header outweighs a few floats
+MIN_ARRAY_VALUES = 4
+
+# Key tuples are shared through a bounded registry; beyond it records keep their own
+_MAX_SHAPES = 4096
+_shapes: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+class _Record:
+    """A packed dict: shared key tuple and a tuple of packed values."""
+
+    __slots__ = ('keys', 'values')
+
+    def __init__(self, keys: Tuple[str, ...], values: Tuple[Any, ...]):
+        self.keys = keys
+        self.values = values
+
+
+_RECORD_SIZE = sys.getsizeof(_Record((), ()))
+
+
+def _shape(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    shared = _shapes.get(keys)
+    if shared is not None:
+        return shared
+    keys = tuple(sys.intern(key) if type(key) is str else key for key in keys)
+    if len(_shapes) < _MAX_SHAPES:
+        _shapes[keys] = keys
+    return keys
+
+
+def _float_shape(value: list) -> Optional[Tuple[int, ...]]:
+    """Shape of a rectangular nesting of lists of Python floats, or None."""
+    if not value:
+        return None
+    first = value[0]
+    if type(first) is float:
+        return (len(value),) if all(type(item) is float for item in value) else None
+    if type(first) is not list:
+        return None
+    inner = _float_shape(first)
+    if inner is None:
+        return None
+    for item in value:
+        if type(item) is not list or _float_shape(item) != inner:
+            return None
+    return (len(value),) + inner
+
+
+class _Packer:
+    """Packs one value tree, counting the bytes it holds."""
+
+    def __init__(self):
+        self.nbytes = 0
+        self._seen_strings = set()
+
+    def pack(self, value: Any) -> Any:
+        kind = type(value)
+        if kind is str:
+            value = sys.intern(value)
+            if id(value) not in self._seen_strings:
+                self._seen_strings.add(id(value))
+                self.nbytes += sys.getsizeof(value)
+            return value
+        if kind is dict:
+            keys = _shape(tuple(value))
+            values = tuple(self.pack(item) for item in value.values())
+            self.nbytes += _RECORD_SIZE + sys.getsizeof(values)
+            return _Record(keys, values)
+        if kind is list:
+            shape = _float_shape(value)
+            if shape is not None and np.prod(shape) >= MIN_ARRAY_VALUES:
+                array = np.array(value, dtype=np.float64)
+                array.flags.writeable = False
+                self.nbytes += sys.getsizeof(array)
+                return array
+            packed = [self.pack(item) for item in value]
+            self.nbytes += sys.getsizeof(packed)
+            return packed
+        if kind is tuple:
+            packed = tuple(self.pack(item) for item in value)
+            self.nbytes += sys.getsizeof(packed)
+            return packed
+        if value is not None and kind is not bool:
+            self.nbytes += sys.getsizeof(value)
+        return value
+
+
+def _unpack(value: Any) -> Any:
+    kind = type(value)
+    if kind is _Record:
+        return dict(zip(value.keys, map(_unpack, value.values)))
+    if kind is np.ndarray:
+        return value.tolist()
+    if kind is list:
+        return [_unpack(item) for item in value]
+    if kind is tuple:
+        return tuple(_unpack(item) for item in value)
+    return value
+
+
+class PackedACGResult:
+    """
+    Immutable packed ACG result.
+
+    ``nbytes`` is the packed footprint, which `estimate_size` reports exactly
+    to the cache's byte budget; interned strings are counted once per result,
+    shared key tuples and singletons not at all.
+    """
+
+    __slots__ = ('_data', 'features_count', 'nbytes')
+
+    def __init__(self, data: _Record, features_count: int, nbytes: int):
+        object.__setattr__(self, '_data', data)
+        object.__setattr__(self, 'features_count', features_count)
+        object.__setattr__(self, 'nbytes', nbytes)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    @classmethod
+    def pack(cls, data: Dict[str, Any]) -> "PackedACGResult":
+        """
+        Pack a dumped result.
+
+        Args:
+            data: ``ACGResult.model_dump()`` output
+
+        Returns:
+            Packed result; the input is not modified
+        """
+        packer = _Packer()
+        packed = packer.pack(data)
+        packed_result = cls(packed, len(data.get('features') or ()), 0)
+        object.__setattr__(packed_result, 'nbytes', packer.nbytes + sys.getsizeof(packed_result))
+        return packed_result
+
+    @classmethod
+    def from_result(cls, result: ACGResult) -> "PackedACGResult":
+        """Pack a result model."""
+        return cls.pack(result.model_dump())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the dumped (GeoJSON) form."""
+        return _unpack(self._data)
+
+    def to_result(self) -> ACGResult:
+        """Materialize a result model."""
+        return ACGResult.model_validate(self.to_dict())
+
+
+# Memory-tier entries snapshotted to and warmed from the disk cache
+register_type(PackedACGResult, "acg.PackedACGResult", PackedACGResult.to_dict, PackedACGResult.pack)
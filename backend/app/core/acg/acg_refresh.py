@@ -0,0 +1,119 @@
+"""
+ACG Refresh-Ahead
+
+Keeps popular ACG results from ever expiring under load. The cache manager
+counts hits per result; on a background thread, every interval, this worker
+recalculates results with at least ``min_hits`` (decayed) hits that are
+within ``window`` seconds of expiring, re-caching both the result and its
+encoded response. A refresh claim (in Redis when enabled) makes sure only
+one worker recalculates a given result.
+
+Less popular results rely on probabilistic early expiration (XFetch) in the
+cache manager instead.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+import logging
+
+from ..monitoring.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ACGRefreshAhead:
+    """Background recalculation of popular ACG results before they expire."""
+
+    def __init__(
+        self,
+        engine,
+        interval_seconds: float = 30.0,
+        min_hits: int = 10,
+        window_seconds: float = 120.0
+    ):
+        self.engine = engine
+        self.interval_seconds = interval_seconds
+        self.min_hits = min_hits
+        self.window_seconds = window_seconds
+
+        self.refreshed = 0
+        self.failed = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background worker is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def run_once(self) -> int:
+        """
+        Refresh every popular result close to expiry, then decay hit counts.
+
+        Returns:
+            Number of results recalculated
+        """
+        cache_manager = self.engine.cache_manager
+        metrics = get_metrics()
+        refreshed = 0
+
+        for request in cache_manager.refresh_candidates(self.min_hits, self.window_seconds):
+            # Hold the claim for a full interval; the refreshed entry outlives it
+            if not cache_manager.claim_refresh(request, self.interval_seconds):
+                continue
+
+            calc_start = time.time()
+            try:
+                result = self.engine.refresh_acg_lines(request)
+                cache_manager.set_cached_response(request, result)
+            except Exception as e:
+                self.failed += 1
+                metrics.record_calculation("acg_refresh_ahead", time.time() - calc_start, False)
+                logger.error(f"ACG refresh-ahead failed for epoch {request.epoch}: {e}")
+                continue
+
+            refreshed += 1
+            metrics.record_calculation("acg_refresh_ahead", time.time() - calc_start, True)
+
+        cache_manager.decay_popularity()
+        self.refreshed += refreshed
+        if refreshed:
+            logger.info(f"ACG refresh-ahead recalculated {refreshed} popular results")
+        return refreshed
+
+    def start(self) -> None:
+        """Start the background refresh thread."""
+        if self.running:
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(self._stop_event,), name="acg-refresh-ahead", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"ACG refresh-ahead started (interval {self.interval_seconds}s, "
+                    f"min hits {self.min_hits})")
+
+    def stop(self) -> None:
+        """Stop the background refresh thread (an in-flight refresh completes)."""
+        self._stop_event.set()
+        self._thread = None
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """Refresh every interval until stopped."""
+        while not stop_event.wait(self.interval_seconds):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"ACG refresh-ahead pass failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Worker configuration and counters."""
+        return {
+            'running': self.running,
+            'interval_seconds': self.interval_seconds,
+            'min_hits': self.min_hits,
+            'window_seconds': self.window_seconds,
+            'refreshed': self.refreshed,
+            'failed': self.failed
+        }
@@ -0,0 +1,270 @@
+"""
+ACG Reverse Query
+
+Answers the inverse of the line calculation: given a place on Earth, which
+stored charts have a body on an angle there?
+
+Right ascension and declination are precomputed once per body per chart into
+a compact columnar store. A query evaluates the hour angle of every body of
+every chart at the query location in one vectorized pass, using the same
+meridian and horizon relations as `mc_ic_longitudes` and `ac_dc_line`:
+
+- MC/IC: the body is on the (anti-)meridian when H = 0 (H = 180°)
+- AC/DC: the body is on the horizon when cos H = -tan φ tan δ
+
+Orbs are measured east-west along the parallel of the query location, which
+is the distance from the corresponding line on the map.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from .acg_types import ACGAngularMatch, ACGBody, ACGLineType
+from .acg_utils import (
+    DEG_TO_RAD, RAD_TO_DEG, gmst_deg_from_jd_ut1, validate_coordinates, wrap_pm180
+)
+
+logger = logging.getLogger(__name__)
+
+STORE_FORMAT_VERSION = 1
+
+ANGULAR_LINE_TYPES = (ACGLineType.MC, ACGLineType.IC, ACGLineType.AC, ACGLineType.DC)
+
+
+class ACGPositionStore:
+    """
+    Columnar store of equatorial body positions for many charts.
+
+    Positions are kept as ``float32`` arrays of shape (n_charts, n_bodies),
+    which is precise to about 1e-5° and keeps 200k charts x 10 bodies
+    under 20 MB. Missing positions are stored as NaN and never match.
+    """
+
+    def __init__(
+        self,
+        chart_ids: Sequence[str],
+        body_ids: Sequence[str],
+        jd: np.ndarray,
+        gmst: np.ndarray,
+        ra: np.ndarray,
+        dec: np.ndarray
+    ):
+        self.chart_ids = np.asarray(chart_ids, dtype=str)
+        self.body_ids = [str(body_id) for body_id in body_ids]
+        self.jd = np.asarray(jd, dtype=np.float64)
+        self.gmst = np.asarray(gmst, dtype=np.float64)
+        self.ra = np.asarray(ra, dtype=np.float32)
+        self.dec = np.asarray(dec, dtype=np.float32)
+
+        n_charts, n_bodies = len(self.chart_ids), len(self.body_ids)
+        if self.jd.shape != (n_charts,) or self.gmst.shape != (n_charts,):
+            raise ValueError("jd and gmst must have one value per chart")
+        if self.ra.shape != (n_charts, n_bodies) or self.dec.shape != (n_charts, n_bodies):
+            raise ValueError("ra and dec must have shape (n_charts, n_bodies)")
+
+    @classmethod
+    def build(
+        cls,
+        charts: Iterable[Tuple[str, float]],
+        bodies: Optional[List[ACGBody]] = None,
+        engine=None
+    ) -> "ACGPositionStore":
+        """
+        Precompute RA/Dec for every body of every chart.
+
+        Args:
+            charts: (chart_id, julian_day_ut1) pairs
+            bodies: Bodies to store (defaults to the engine's default set)
+            engine: ACGCalculationEngine used for positions (created if None)
+
+        Returns:
+            Populated ACGPositionStore
+        """
+        if engine is None:
+            from .acg_core import ACGCalculationEngine
+            engine = ACGCalculationEngine()
+        bodies = bodies or engine.get_default_bodies()
+
+        charts = list(charts)
+        chart_ids = [chart_id for chart_id, _ in charts]
+        jd = np.array([chart_jd for _, chart_jd in charts], dtype=np.float64)
+        gmst = np.array([gmst_deg_from_jd_ut1(chart_jd) for chart_jd in jd], dtype=np.float64)
+        ra = np.full((len(charts), len(bodies)), np.nan, dtype=np.float32)
+        dec = np.full((len(charts), len(bodies)), np.nan, dtype=np.float32)
+
+        for i, chart_jd in enumerate(jd):
+            for j, body in enumerate(bodies):
+                coords = engine.calculate_body_position(body, float(chart_jd))
+                if coords is not None:
+                    ra[i, j] = coords.ra
+                    dec[i, j] = coords.dec
+
+        logger.info(f"Built ACG position store: {len(charts)} charts x {len(bodies)} bodies")
+        return cls(chart_ids, [body.id for body in bodies], jd, gmst, ra, dec)
+
+    def save(self, path: str) -> None:
+        """Write the store to a compressed ``.npz`` file."""
+        np.savez_compressed(
+            path,
+            version=np.array(STORE_FORMAT_VERSION),
+            chart_ids=self.chart_ids,
+            body_ids=np.asarray(self.body_ids, dtype=str),
+            jd=self.jd,
+            gmst=self.gmst,
+            ra=self.ra,
+            dec=self.dec
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "ACGPositionStore":
+        """Load a store previously written with `save`."""
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data["version"])
+            if version != STORE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported position store version: {version}")
+            return cls(
+                data["chart_ids"], data["body_ids"].tolist(),
+                data["jd"], data["gmst"], data["ra"], data["dec"]
+            )
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint of the numeric columns."""
+        return self.jd.nbytes + self.gmst.nbytes + self.ra.nbytes + self.dec.nbytes
+
+    def __len__(self) -> int:
+        return len(self.chart_ids)
+
+
+class ACGReverseQuery:
+    """
+    Vectorized reverse ACG lookup over an ACGPositionStore.
+
+    Examples:
+        >>> store = ACGPositionStore.build([("chart-1", 2451545.0)])
+        >>> query = ACGReverseQuery(store)
+        >>> matches = query.find_angular(48.8566, 2.3522, bodies=["Venus"], orb_deg=2.0)
+    """
+
+    def __init__(self, store: ACGPositionStore):
+        self.store = store
+
+    def angular_offsets(
+        self,
+        latitude: float,
+        longitude: float,
+        body_ids: Optional[List[str]] = None
+    ) -> Dict[ACGLineType, np.ndarray]:
+        """
+        Signed east-west offsets from each angle line at a location.
+
+        Args:
+            latitude: Query latitude in degrees
+            longitude: Query east longitude in degrees
+            body_ids: Restrict to these bodies (defaults to all stored bodies)
+
+        Returns:
+            Mapping of MC/IC/AC/DC to (n_charts, n_bodies) arrays in degrees.
+            AC/DC offsets are NaN where the body never rises or sets.
+        """
+        if not validate_coordinates(longitude, latitude) or abs(latitude) >= 90.0:
+            raise ValueError(f"Invalid query location: lat={latitude}, lon={longitude}")
+
+        columns = self._body_columns(body_ids)
+        ra = self.store.ra[:, columns].astype(np.float64)
+        dec = self.store.dec[:, columns].astype(np.float64)
+
+        # Hour angle of each body at the query location
+        H = wrap_pm180(self.store.gmst[:, None] + longitude - ra)
+
+        # Horizon equation: cos H0 = -tan φ tan δ
+        x = -np.tan(latitude * DEG_TO_RAD) * np.tan(dec * DEG_TO_RAD)
+        with np.errstate(invalid="ignore"):
+            h0 = np.where(np.abs(x) <= 1.0, np.arccos(np.clip(x, -1.0, 1.0)) * RAD_TO_DEG, np.nan)
+
+        return {
+            ACGLineType.MC: H,
+            ACGLineType.IC: wrap_pm180(H - 180.0),
+            ACGLineType.AC: _wrap_pm180_nan(H + h0),
+            ACGLineType.DC: _wrap_pm180_nan(H - h0),
+        }
+
+    def find_angular(
+        self,
+        latitude: float,
+        longitude: float,
+        bodies: Optional[List[str]] = None,
+        angles: Optional[List[ACGLineType]] = None,
+        orb_deg: float = 2.0,
+        limit: Optional[int] = None
+    ) -> List[ACGAngularMatch]:
+        """
+        Find stored charts with a body within orb of an angle at a location.
+
+        Args:
+            latitude: Query latitude in degrees
+            longitude: Query east longitude in degrees
+            bodies: Body identifiers to consider (defaults to all stored bodies)
+            angles: Angles to consider (defaults to MC, IC, AC, DC)
+            orb_deg: Maximum east-west distance from the line in degrees
+            limit: Maximum number of matches to return
+
+        Returns:
+            Matches ranked by ascending orb
+        """
+        if orb_deg < 0:
+            raise ValueError("orb_deg must be non-negative")
+
+        body_ids = bodies or self.store.body_ids
+        angles = [ACGLineType(angle) for angle in (angles or ANGULAR_LINE_TYPES)]
+        offsets = self.angular_offsets(latitude, longitude, body_ids)
+
+        chart_idx, body_idx, angle_idx, orbs = [], [], [], []
+        for k, angle in enumerate(angles):
+            if angle not in offsets:
+                raise ValueError(f"Unsupported angle for reverse query: {angle}")
+            orb = np.abs(offsets[angle])
+            with np.errstate(invalid="ignore"):
+                rows, cols = np.nonzero(orb <= orb_deg)
+            chart_idx.append(rows)
+            body_idx.append(cols)
+            angle_idx.append(np.full(len(rows), k))
+            orbs.append(orb[rows, cols])
+
+        chart_idx = np.concatenate(chart_idx)
+        body_idx = np.concatenate(body_idx)
+        angle_idx = np.concatenate(angle_idx)
+        orbs = np.concatenate(orbs)
+
+        order = np.argsort(orbs, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+
+        return [
+            ACGAngularMatch(
+                chart_id=str(self.store.chart_ids[chart_idx[i]]),
+                body_id=body_ids[body_idx[i]],
+                angle=angles[angle_idx[i]],
+                orb=float(orbs[i])
+            )
+            for i in order
+        ]
+
+    def _body_columns(self, body_ids: Optional[List[str]]) -> List[int]:
+        """Map body identifiers to store column indices."""
+        if body_ids is None:
+            return list(range(len(self.store.body_ids)))
+        columns = []
+        for body_id in body_ids:
+            if body_id not in self.store.body_ids:
+                raise ValueError(f"Body not in position store: {body_id}")
+            columns.append(self.store.body_ids.index(body_id))
+        return columns
+
+
+def _wrap_pm180_nan(x: np.ndarray) -> np.ndarray:
+    """`wrap_pm180` that passes NaN through unchanged."""
+    with np.errstate(invalid="ignore"):
+        return wrap_pm180(x)
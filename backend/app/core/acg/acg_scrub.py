@@ -0,0 +1,221 @@
+"""
+ACG Time-Scrubbing Sessions
+
+Backs the interactive time slider. A session resolves bodies, options and
+natal context once from an initial ACGRequest, then recomputes lines for a
+stream of epochs through `ACGCalculationEngine.calculate_epoch_lines`, so a
+scrub step costs the body positions plus the line kernel and nothing else.
+
+Updates are deltas: a line's static properties are sent once when it first
+appears, after which only its geometry is sent, and only when it changed.
+Lines that disappear (e.g. an AC/DC segment that no longer exists) are
+listed as removed.
+
+`LatestSlot` is the single-slot mailbox used to drop intermediate epochs
+when a client scrubs faster than the server computes.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+import swisseph as swe
+
+from .acg_canonical import resolve_epoch_jd
+from .acg_types import ACGLineData, ACGRequest
+
+logger = logging.getLogger(__name__)
+
+# Per-epoch fields stripped from the properties sent with new lines; they are
+# carried once per update instead of once per line
+EPOCH_PROPERTIES = ('epoch', 'jd', 'gmst', 'obliquity', 'coords', 'calculation_time_ms')
+
+
+class ACGScrubSession:
+    """
+    Resolved ACG request state reused across many epochs.
+
+    Examples:
+        >>> session = ACGScrubSession(engine, ACGRequest(epoch="2000-01-01T12:00:00Z"))
+        >>> first = session.update(epoch="2000-01-01T12:00:00Z")
+        >>> delta = session.update(epoch="2000-01-01T13:00:00Z")
+    """
+
+    def __init__(self, engine, request: ACGRequest):
+        """
+        Resolve bodies, options and natal context for a session.
+
+        Args:
+            engine: ACGCalculationEngine used for calculations
+            request: Initial request; its epoch is the natal reference time
+
+        Raises:
+            ValueError: If request validation fails
+        """
+        self.engine = engine
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        validation_result = engine.natal_integrator.validate_acg_request_natal_compatibility(request)
+        if not validation_result['valid']:
+            raise ValueError(f"Request validation failed: {validation_result['errors']}")
+
+        self.bodies = request.bodies if request.bodies else engine.get_default_bodies()
+        self.options = request.options if request.options else engine.default_options
+
+        self.chart_data = None
+        if validation_result['chart_creatable']:
+            self.chart_data = engine.natal_integrator.create_natal_chart_for_acg(request)
+
+        # Geometry last sent to the client, by line key
+        self._geometries: Dict[str, Dict[str, Any]] = {}
+        self.updates = 0
+
+    @property
+    def body_ids(self) -> List[str]:
+        """Identifiers of the resolved bodies."""
+        return [body.id for body in self.bodies]
+
+    def update(self, epoch: Optional[str] = None, jd: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Calculate lines for a new epoch and diff them against the last update.
+
+        Args:
+            epoch: ISO 8601 UTC timestamp
+            jd: Julian Day (UT1); takes precedence over ``epoch``
+
+        Returns:
+            Update payload with per-epoch parameters, changed geometries,
+            properties of added lines and keys of removed lines
+
+        Raises:
+            ValueError: If neither a valid epoch nor a Julian Day is given
+        """
+        calc_start = time.time()
+        jd_ut1, epoch = _resolve_epoch(epoch, jd)
+
+        lines = self.engine.calculate_epoch_lines(
+            self.bodies, self.options, jd_ut1, epoch, self.chart_data,
+            # Scrubbed instants rarely repeat; keep them out of the line cache
+            use_line_cache=False
+        )
+
+        changed: Dict[str, Dict[str, Any]] = {}
+        added: Dict[str, Dict[str, Any]] = {}
+        geometries: Dict[str, Dict[str, Any]] = {}
+        for key, line in _keyed_lines(lines):
+            geometries[key] = line.geometry
+            previous = self._geometries.get(key)
+            if previous is None:
+                properties = self.engine._metadata_to_properties(line.metadata)
+                added[key] = {k: v for k, v in properties.items() if k not in EPOCH_PROPERTIES}
+            if previous != line.geometry:
+                changed[key] = line.geometry
+
+        removed = [key for key in self._geometries if key not in geometries]
+        self._geometries = geometries
+        self.updates += 1
+
+        bodies: Dict[str, Dict[str, Any]] = {}
+        gmst = obliquity = None
+        for line in lines:
+            metadata = line.metadata
+            gmst, obliquity = metadata.gmst, metadata.obliquity
+            if metadata.type == 'body' and metadata.id not in bodies:
+                coords = metadata.coords
+                bodies[metadata.id] = {
+                    'ra': coords.ra,
+                    'dec': coords.dec,
+                    'lambda': coords.lambda_,
+                    'beta': coords.beta,
+                    'speed': coords.speed
+                }
+
+        return {
+            'type': 'update',
+            'epoch': epoch,
+            'jd': jd_ut1,
+            'gmst': gmst,
+            'obliquity': obliquity,
+            'bodies': bodies,
+            'lines': changed,
+            'added': added,
+            'removed': removed,
+            'calculation_time_ms': (time.time() - calc_start) * 1000
+        }
+
+
+class LatestSlot:
+    """
+    Single-slot asyncio mailbox that keeps only the newest value.
+
+    ``put`` never blocks; a value not yet taken is overwritten and counted
+    as dropped.
+    """
+
+    def __init__(self):
+        self._value: Any = None
+        self._has_value = False
+        self._closed = False
+        self._event = asyncio.Event()
+        self.dropped = 0
+
+    def put(self, value: Any) -> None:
+        """Store a value, replacing any value not yet taken."""
+        if self._has_value:
+            self.dropped += 1
+        self._value = value
+        self._has_value = True
+        self._event.set()
+
+    def close(self) -> None:
+        """Wake the consumer; `get` returns None once the slot is empty."""
+        self._closed = True
+        self._event.set()
+
+    async def get(self) -> Any:
+        """Wait for and take the newest value, or None after `close`."""
+        while not self._has_value:
+            if self._closed:
+                return None
+            self._event.clear()
+            await self._event.wait()
+        value, self._value, self._has_value = self._value, None, False
+        return value
+
+
+def _resolve_epoch(epoch: Optional[str], jd: Optional[float]) -> Tuple[float, str]:
+    """Return (jd_ut1, ISO epoch) from an epoch string and/or Julian Day."""
+    if jd is not None:
+        jd_ut1 = float(jd)
+        if epoch is None:
+            year, month, day, hour = swe.revjul(jd_ut1)
+            seconds = min(round(hour * 3600.0), 86399)
+            epoch = (
+                f"{year:04d}-{month:02d}-{day:02d}T"
+                f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}Z"
+            )
+        return jd_ut1, epoch
+
+    if not epoch:
+        raise ValueError("Either epoch or jd is required")
+    try:
+        jd_ut1 = resolve_epoch_jd(epoch)
+    except ValueError:
+        raise ValueError(f"Invalid epoch format: {epoch}")
+    return jd_ut1, epoch
+
+
+def _keyed_lines(lines: List[ACGLineData]) -> List[Tuple[str, ACGLineData]]:
+    """Assign each line a key that is stable across epochs."""
+    keyed = []
+    seen: Dict[str, int] = {}
+    for line in lines:
+        info = line.metadata.line
+        key = f"{line.metadata.id}:{info.line_type}:{info.angle}"
+        if info.segment_id:
+            key += f":{info.segment_id}"
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        keyed.append((key if count == 0 else f"{key}#{count}", line))
+    return keyed
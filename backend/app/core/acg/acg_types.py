@@ -261,7 +261,16 @@ class ACGLineData:
     geometry: Dict[str, Any]  # GeoJSON geometry
     body_data: ACGBodyData
     metadata: ACGMetadata
-    
+
+
+@dataclass(frozen=True)
+class ACGAngularMatch:
+    """Reverse-query hit: a stored chart with a body angular at a location."""
+    chart_id: str = field(metadata={"description": "Identifier of the stored chart"})
+    body_id: str = field(metadata={"description": "Body identifier (e.g., 'Venus')"})
+    angle: ACGLineType = field(metadata={"description": "Angle the body is on (MC, IC, AC, DC)"})
+    orb: float = field(metadata={"description": "East-west distance from the line in degrees"})
+
 
 class ACGResult(BaseModel):
     """ACG calculation result as GeoJSON FeatureCollection."""
@@ -23,7 +23,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
 from .subject import Subject, SubjectData
-from ..tools.ephemeris import get_planet, get_houses, get_angles, ChartAngles
+from ..tools.ephemeris import get_planet, get_houses, ChartAngles
 from ..classes.serialize import PlanetPosition, HouseSystem
 from ..tools.position import (
     angular_separation, get_closest_aspect_angle, get_position_summary,
@@ -261,18 +261,12 @@ class NatalChart:
                     longitude=houses.longitude
                 )
             
-            angles_dict = get_angles(
-                self.subject_data.julian_day,
-                self.subject_data.latitude,
-                self.subject_data.longitude
-            )
-            
-            # Convert angles dict to ChartAngles object
+            # Angles come from the same house calculation
             angles = ChartAngles(
-                ascendant=angles_dict.get('ASC', 0.0),
-                midheaven=angles_dict.get('MC', 0.0), 
-                descendant=angles_dict.get('DESC', 0.0),
-                imum_coeli=angles_dict.get('IC', 0.0),
+                ascendant=houses.ascendant,
+                midheaven=houses.midheaven,
+                descendant=houses.descendant,
+                imum_coeli=houses.imum_coeli,
                 calculation_time=datetime.now()
             )
             
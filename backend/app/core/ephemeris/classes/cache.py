@@ -2,27 +2,207 @@
 Meridian Ephemeris Engine - Thread-Safe Cache Module
 
 Provides high-performance, thread-safe caching for ephemeris calculations
-with TTL (Time To Live) support and configurable size limits.
+with TTL (Time To Live) support and configurable size limits, in entries and
+optionally in estimated bytes. Admission and eviction are delegated to a
+pluggable policy (see `cache_policy`); LRU is the default. Expiry is indexed
+by a min-heap, so purging expired entries costs O(expired), and
+`ShardedEphemerisCache` splits the key space across independently locked
+segments to reduce lock contention between threads.
+
+Keys built by `make_key` (used by `@cached`/`CacheDecorator`) are tuples of
+the call's argument values, compared exactly rather than through a digest.
 """
 
-import hashlib
+import heapq
+import inspect
+import math
+import random
+import sys
 import threading
 import time
 from collections import OrderedDict
-from typing import Any, Dict, Optional, Tuple, Union
+from itertools import islice
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from .cache_policy import CachePolicy, LRUPolicy, create_policy
+
+# Containers are sized from a sample of their items, recursing this deep
+_SIZE_SAMPLE = 16
+_SIZE_MAX_DEPTH = 6
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimated memory footprint of a cached value in bytes.
+    
+    Exact for bytes-like objects and NumPy arrays; containers, models and
+    other objects are estimated with ``sys.getsizeof`` over a sample of their
+    items, scaled to their length.
+    """
+    return _estimate_size(value, 0)
+
+
+def _estimate_size(value: Any, depth: int) -> int:
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+    
+    size = sys.getsizeof(value)
+    if depth >= _SIZE_MAX_DEPTH or isinstance(value, (str, int, float, bool, type(None))):
+        return size
+    
+    if isinstance(value, dict):
+        items = list(islice(value.items(), _SIZE_SAMPLE))
+        if items:
+            sampled = sum(_estimate_size(k, depth + 1) + _estimate_size(v, depth + 1) for k, v in items)
+            size += sampled * len(value) // len(items)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = list(islice(value, _SIZE_SAMPLE))
+        if items:
+            sampled = sum(_estimate_size(item, depth + 1) for item in items)
+            size += sampled * len(value) // len(items)
+    elif hasattr(value, '__dict__'):
+        size += _estimate_size(vars(value), depth + 1)
+    return size
+
+
+_PRIMITIVE_TYPES = frozenset((str, int, float, bytes, type(None)))
+
+
+def key_part(value: Any) -> Hashable:
+    """
+    Hashable, order-independent form of an argument for a cache key.
+    
+    Primitives are used as they are; dicts and sets are sorted structurally,
+    so insertion order does not matter; lists and tuples become tuples.
+    Unhashable objects fall back to their repr.
+    """
+    value_type = type(value)
+    if value_type in _PRIMITIVE_TYPES:
+        return value
+    if value_type is bool:
+        # Keep True and 1 apart
+        return (bool, value)
+    if isinstance(value, dict):
+        # Primitive checks are inlined: nested dicts make this the hot loop
+        primitives = _PRIMITIVE_TYPES
+        items = [
+            (k if type(k) in primitives else key_part(k), v if type(v) in primitives else key_part(v))
+            for k, v in value.items()
+        ]
+        try:
+            # Keys are unique, so only keys are ever compared
+            items.sort()
+        except TypeError:
+            items.sort(key=_sort_key)
+        return (dict, tuple(items))
+    if isinstance(value, (list, tuple)):
+        return tuple([item if type(item) in _PRIMITIVE_TYPES else key_part(item) for item in value])
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(key_part(item) for item in value))
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def _sort_key(item: Tuple[Hashable, Hashable]) -> Tuple[str, str]:
+    """Sort dict items of mixed key types by key type, then by key."""
+    return (type(item[0]).__name__, repr(item[0]))
+
+
+def quantize_part(value: Any, quantum: float) -> Hashable:
+    """Key part for a number rounded to a multiple of ``quantum`` (other values as `key_part`)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value):
+        return round(value / quantum)
+    return key_part(value)
+
+
+def make_key(
+    args: Sequence[Any],
+    kwargs: Dict[str, Any],
+    quanta: Sequence[Optional[float]] = (),
+    keyword_quanta: Optional[Dict[str, float]] = None
+) -> Tuple[Hashable, ...]:
+    """
+    Build a cache key from call arguments.
+    
+    Args:
+        args: Positional arguments, conventionally led by the function name
+        kwargs: Keyword arguments
+        quanta: Float quantum per positional argument (None or missing for exact)
+        keyword_quanta: Float quantum per keyword argument name
+    
+    Returns:
+        Tuple of argument key parts; keyword arguments are appended sorted by name
+    """
+    if quanta:
+        parts = [
+            quantize_part(arg, quanta[i]) if i < len(quanta) and quanta[i] else key_part(arg)
+            for i, arg in enumerate(args)
+        ]
+    else:
+        parts = [key_part(arg) for arg in args]
+    if kwargs:
+        keyword_quanta = keyword_quanta or {}
+        parts.append(tuple(
+            (name, quantize_part(kwargs[name], keyword_quanta[name]) if name in keyword_quanta
+             else key_part(kwargs[name]))
+            for name in sorted(kwargs)
+        ))
+    return tuple(parts)
+
+
+def should_refresh_early(
+    cost: Optional[float],
+    expires_at: Optional[float],
+    beta: float = 1.0,
+    now: Optional[float] = None
+) -> bool:
+    """
+    Probabilistic early expiration (XFetch).
+    
+    Returns True with a probability that rises as ``expires_at`` approaches,
+    scaled by the recompute cost, so one of many concurrent readers of a hot
+    entry refreshes it shortly before it expires.
+    
+    Args:
+        cost: Seconds the value took to compute
+        expires_at: Unix time the value expires (None for never)
+        beta: Eagerness; values above 1 refresh earlier, 0 disables
+        now: Current Unix time (defaults to time.time())
+    """
+    if not cost or expires_at is None or beta <= 0:
+        return False
+    now = time.time() if now is None else now
+    # 1 - random() lies in (0, 1], so the logarithm is finite
+    return now - cost * beta * math.log(1.0 - random.random()) >= expires_at
 
 
 class CacheEntry:
     """Individual cache entry with TTL support."""
     
-    def __init__(self, value: Any, ttl: Optional[float] = None) -> None:
-        """Initialize cache entry with optional TTL."""
+    def __init__(self, value: Any, ttl: Optional[float] = None, cost: float = 0.0,
+                 size: Optional[int] = None) -> None:
+        """Initialize cache entry with optional TTL, compute cost in seconds and size in bytes."""
         self.value = value
         self.created_at = time.time()
         self.ttl = ttl
+        self.cost = cost
+        self.size = estimate_size(value) if size is None else size
         self.access_count = 1
         self.last_accessed = self.created_at
     
+    @property
+    def expires_at(self) -> Optional[float]:
+        """Unix time the entry expires, or None if it never does."""
+        return None if self.ttl is None else self.created_at + self.ttl
+    
     def is_expired(self) -> bool:
         """Check if the cache entry has expired."""
         if self.ttl is None:
@@ -37,85 +217,166 @@ class CacheEntry:
 
 
 class EphemerisCache:
-    """Thread-safe LRU cache with TTL support for ephemeris calculations."""
+    """Thread-safe cache with TTL support and pluggable eviction for ephemeris calculations."""
     
-    def __init__(self, max_size: int = 1000, default_ttl: Optional[float] = 3600) -> None:
+    def __init__(self, max_size: int = 1000, default_ttl: Optional[float] = 3600,
+                 policy: Optional[CachePolicy] = None, max_bytes: Optional[int] = None,
+                 low_water: float = 0.9) -> None:
         """
         Initialize the cache.
         
         Args:
             max_size: Maximum number of entries to cache
             default_ttl: Default TTL in seconds (None for no expiration)
+            policy: Admission/eviction policy (LRU if None)
+            max_bytes: Budget for the estimated size of all values (None for no limit)
+            low_water: Fraction of max_bytes to evict down to once over budget
         """
+        if not 0 < low_water <= 1:
+            raise ValueError("low_water must be in (0, 1]")
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self.policy = policy if policy is not None else LRUPolicy()
+        self.max_bytes = max_bytes or None
+        self.low_water = low_water
+        self._bytes = 0
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # Min-heap of (expires_at, key); stale items are skipped when popped
+        self._expiry: List[Tuple[float, str]] = []
         self._lock = threading.RLock()
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._rejections = 0
+        # Byte-hit rate: bytes served from hits vs. bytes (re)inserted after misses
+        self._hit_bytes = 0
+        self._miss_bytes = 0
     
-    def _generate_key(self, *args, **kwargs) -> str:
-        """Generate a hash key from arguments."""
-        # Convert all arguments to a string representation
-        key_data = str(args) + str(sorted(kwargs.items()))
-        return hashlib.sha256(key_data.encode()).hexdigest()
+    def _generate_key(self, *args, **kwargs) -> Tuple[Hashable, ...]:
+        """Generate a key from arguments."""
+        return make_key(args, kwargs)
     
     def _evict_expired(self) -> None:
-        """Remove expired entries from cache."""
+        """Remove expired entries from cache, popping them off the expiry heap."""
         current_time = time.time()
-        expired_keys = []
+        expiry = self._expiry
         
-        for key, entry in self._cache.items():
-            if entry.is_expired():
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self._cache[key]
-            self._evictions += 1
+        while expiry and expiry[0][0] < current_time:
+            expires_at, key = heapq.heappop(expiry)
+            entry = self._cache.get(key)
+            # Skip keys removed or re-put with a later expiry since this item was pushed
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                self._evictions += 1
+    
+    def _index_expiry(self, key: str, entry: CacheEntry) -> None:
+        """Add an entry to the expiry heap, dropping stale items when it grows too large."""
+        expires_at = entry.expires_at
+        if expires_at is None:
+            return
+        heapq.heappush(self._expiry, (expires_at, key))
+        if len(self._expiry) > 2 * len(self._cache) + 64:
+            self._expiry = [
+                (entry.expires_at, key) for key, entry in self._cache.items() if entry.ttl is not None
+            ]
+            heapq.heapify(self._expiry)
     
     def _evict_lru(self) -> None:
-        """Evict least recently used entry."""
+        """Evict the policy's victim (the least recently used entry under LRU)."""
         if self._cache:
-            self._cache.popitem(last=False)  # Remove oldest entry
+            victim = self.policy.victim(self._cache)
+            self._bytes -= self._cache.pop(victim).size
+            self.policy.on_evict(victim)
             self._evictions += 1
     
+    def _evict_to_low_water(self) -> None:
+        """Evict victims until the byte total is back under the low-water mark."""
+        target = self.max_bytes * self.low_water
+        while self._cache and self._bytes > target:
+            self._evict_lru()
+    
+    def _remove(self, key: str) -> None:
+        """Remove an entry outside of capacity eviction; caller holds the lock."""
+        self._bytes -= self._cache.pop(key).size
+        self.policy.on_remove(key)
+    
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache by key."""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+    
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get the live entry for a key (counts as an access), with its expiry and cost."""
         with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                if entry.is_expired():
-                    del self._cache[key]
-                    self._misses += 1
-                    return None
-                
-                # Move to end (most recently used)
-                self._cache.move_to_end(key)
-                self._hits += 1
-                return entry.touch()
+            return self._get_entry(key)
+    
+    def get_entries(self, keys: List[str]) -> List[Optional[CacheEntry]]:
+        """Get the live entries for several keys under one lock acquisition (None for misses)."""
+        with self._lock:
+            return [self._get_entry(key) for key in keys]
+    
+    def _get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Look up and account for one key; caller holds the lock."""
+        self.policy.record_access(key)
+        if key in self._cache:
+            entry = self._cache[key]
+            if entry.is_expired():
+                self._remove(key)
+                self._misses += 1
+                return None
             
-            self._misses += 1
-            return None
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            self._hits += 1
+            self._hit_bytes += entry.size
+            entry.touch()
+            self.policy.on_hit(key, entry)
+            return entry
+        
+        self._misses += 1
+        return None
     
-    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
-        """Put value into cache with optional TTL."""
+    def put(self, key: str, value: Any, ttl: Optional[float] = None, cost: float = 0.0) -> None:
+        """Put value into cache with optional TTL and compute cost in seconds."""
         with self._lock:
             # Use default TTL if not specified
             if ttl is None:
                 ttl = self.default_ttl
             
-            # Remove expired entries periodically
-            if len(self._cache) % 100 == 0:  # Every 100th operation
-                self._evict_expired()
+            # Remove expired entries (O(1) when none are due)
+            self._evict_expired()
             
-            # Evict LRU if at capacity
-            if len(self._cache) >= self.max_size and key not in self._cache:
-                self._evict_lru()
+            entry = CacheEntry(value, ttl, cost)
+            if self.max_bytes is not None and entry.size > self.max_bytes:
+                # Would evict everything else and still not fit
+                self._rejections += 1
+                if key in self._cache:
+                    self._remove(key)
+                return
+            
+            previous = self._cache.get(key)
+            if previous is None:
+                self.policy.record_access(key)
+                self._miss_bytes += entry.size
+                
+                # Make room if at capacity, unless the policy rejects the newcomer
+                if len(self._cache) >= self.max_size and self._cache:
+                    if not self.policy.admit(key, self.policy.victim(self._cache)):
+                        self._rejections += 1
+                        return
+                    self._evict_lru()
             
             # Add or update entry
-            self._cache[key] = CacheEntry(value, ttl)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._cache[key] = entry
             self._cache.move_to_end(key)  # Mark as most recently used
+            self._bytes += entry.size
+            self._index_expiry(key, entry)
+            self.policy.on_insert(key, entry)
+            
+            if self.max_bytes is not None and self._bytes > self.max_bytes:
+                self._evict_to_low_water()
     
     def cached_call(self, func, *args, ttl: Optional[float] = None, **kwargs) -> Any:
         """
@@ -138,34 +399,44 @@ class EphemerisCache:
         if cached_result is not None:
             return cached_result
         
-        # Call function and cache result
+        # Call function and cache result with its compute time
+        start = time.perf_counter()
         result = func(*args, **kwargs)
-        self.put(key, result, ttl)
+        self.put(key, result, ttl, cost=time.perf_counter() - start)
         return result
     
     def invalidate(self, key: str) -> bool:
         """Remove specific key from cache."""
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
                 return True
             return False
     
     def invalidate_pattern(self, pattern: str) -> int:
-        """Remove all keys containing the pattern."""
+        """Remove all keys containing the pattern (for tuple keys, in their leading name)."""
         with self._lock:
-            keys_to_remove = [key for key in self._cache.keys() if pattern in key]
+            keys_to_remove = [
+                key for key in self._cache.keys()
+                if pattern in (key[0] if isinstance(key, tuple) and key and isinstance(key[0], str) else key)
+            ]
             for key in keys_to_remove:
-                del self._cache[key]
+                self._remove(key)
             return len(keys_to_remove)
     
     def clear(self) -> None:
         """Clear all cache entries."""
         with self._lock:
             self._cache.clear()
+            self._expiry = []
+            self._bytes = 0
+            self.policy.clear()
             self._hits = 0
             self._misses = 0
             self._evictions = 0
+            self._rejections = 0
+            self._hit_bytes = 0
+            self._miss_bytes = 0
     
     def cleanup(self) -> int:
         """Remove all expired entries and return count."""
@@ -179,6 +450,11 @@ class EphemerisCache:
         with self._lock:
             return len(self._cache)
     
+    def size_bytes(self) -> int:
+        """Get the estimated size of all cached values in bytes."""
+        with self._lock:
+            return self._bytes
+    
     def is_full(self) -> bool:
         """Check if cache is at maximum capacity."""
         with self._lock:
@@ -189,14 +465,23 @@ class EphemerisCache:
         with self._lock:
             total_requests = self._hits + self._misses
             hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+            total_bytes = self._hit_bytes + self._miss_bytes
+            byte_hit_rate = self._hit_bytes / total_bytes if total_bytes > 0 else 0.0
             
             return {
                 'size': len(self._cache),
                 'max_size': self.max_size,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'policy': self.policy.label,
                 'hits': self._hits,
                 'misses': self._misses,
                 'evictions': self._evictions,
+                'admission_rejections': self._rejections,
                 'hit_rate': hit_rate,
+                'hit_bytes': self._hit_bytes,
+                'miss_bytes': self._miss_bytes,
+                'byte_hit_rate': byte_hit_rate,
                 'total_requests': total_requests
             }
     
@@ -205,6 +490,12 @@ class EphemerisCache:
         with self._lock:
             return list(self._cache.keys())
     
+    def hottest(self, limit: int) -> List[Tuple[Hashable, CacheEntry]]:
+        """Live entries by last access, most recent first (does not count as access)."""
+        with self._lock:
+            live = ((key, entry) for key, entry in self._cache.items() if not entry.is_expired())
+            return heapq.nlargest(limit, live, key=lambda item: item[1].last_accessed)
+    
     def __contains__(self, key: str) -> bool:
         """Check if key exists in cache (does not count as access)."""
         with self._lock:
@@ -215,52 +506,220 @@ class EphemerisCache:
         return self.size()
 
 
+class ShardedEphemerisCache:
+    """
+    EphemerisCache split into independently locked segments.
+    
+    Keys are routed to a segment by hash, so threads working on different
+    keys rarely wait on the same lock. Capacity, byte budget and eviction
+    policy apply per segment; statistics are summed across segments.
+    """
+    
+    def __init__(self, max_size: int = 1000, default_ttl: Optional[float] = 3600,
+                 shards: int = 8, policy: str = 'lru', max_bytes: Optional[int] = None,
+                 low_water: float = 0.9) -> None:
+        """
+        Initialize the sharded cache.
+        
+        Args:
+            max_size: Maximum number of entries across all segments
+            default_ttl: Default TTL in seconds (None for no expiration)
+            shards: Number of segments
+            policy: Policy name for every segment (see `create_policy`)
+            max_bytes: Byte budget across all segments (None for no limit)
+            low_water: Fraction of each segment's budget to evict down to
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes or None
+        shard_size = max(1, -(-max_size // shards))
+        shard_bytes = -(-self.max_bytes // shards) if self.max_bytes else None
+        self._shards = [
+            EphemerisCache(max_size=shard_size, default_ttl=default_ttl,
+                           policy=create_policy(policy, shard_size),
+                           max_bytes=shard_bytes, low_water=low_water)
+            for _ in range(shards)
+        ]
+    
+    @property
+    def shards(self) -> int:
+        """Number of segments."""
+        return len(self._shards)
+    
+    def _shard(self, key: str) -> EphemerisCache:
+        return self._shards[hash(key) % len(self._shards)]
+    
+    def _generate_key(self, *args, **kwargs) -> Tuple[Hashable, ...]:
+        """Generate a key from arguments."""
+        return make_key(args, kwargs)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache by key."""
+        return self._shard(key).get(key)
+    
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get the live entry for a key (counts as an access), with its expiry and cost."""
+        return self._shard(key).get_entry(key)
+    
+    def get_entries(self, keys: List[str]) -> List[Optional[CacheEntry]]:
+        """Get the live entries for several keys, taking each segment's lock once."""
+        groups: Dict[int, List[int]] = {}
+        for index, key in enumerate(keys):
+            groups.setdefault(hash(key) % len(self._shards), []).append(index)
+        entries: List[Optional[CacheEntry]] = [None] * len(keys)
+        for shard, indexes in groups.items():
+            for index, entry in zip(indexes, self._shards[shard].get_entries([keys[i] for i in indexes])):
+                entries[index] = entry
+        return entries
+    
+    def put(self, key: str, value: Any, ttl: Optional[float] = None, cost: float = 0.0) -> None:
+        """Put value into cache with optional TTL and compute cost in seconds."""
+        self._shard(key).put(key, value, ttl=ttl, cost=cost)
+    
+    def cached_call(self, func, *args, ttl: Optional[float] = None, **kwargs) -> Any:
+        """Cache the result of a function call."""
+        key = self._generate_key(func.__name__, *args, **kwargs)
+        return self._shard(key).cached_call(func, *args, ttl=ttl, **kwargs)
+    
+    def invalidate(self, key: str) -> bool:
+        """Remove specific key from cache."""
+        return self._shard(key).invalidate(key)
+    
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Remove all keys containing the pattern."""
+        return sum(shard.invalidate_pattern(pattern) for shard in self._shards)
+    
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        for shard in self._shards:
+            shard.clear()
+    
+    def cleanup(self) -> int:
+        """Remove all expired entries and return count."""
+        return sum(shard.cleanup() for shard in self._shards)
+    
+    def size(self) -> int:
+        """Get current cache size."""
+        return sum(shard.size() for shard in self._shards)
+    
+    def size_bytes(self) -> int:
+        """Get the estimated size of all cached values in bytes."""
+        return sum(shard.size_bytes() for shard in self._shards)
+    
+    def is_full(self) -> bool:
+        """Check if cache is at maximum capacity."""
+        return self.size() >= self.max_size
+    
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Get cache statistics summed across segments."""
+        shard_stats = [shard.stats() for shard in self._shards]
+        totals = {
+            name: sum(stats[name] for stats in shard_stats)
+            for name in ('size', 'bytes', 'hits', 'misses', 'evictions', 'admission_rejections',
+                         'hit_bytes', 'miss_bytes', 'total_requests')
+        }
+        total_bytes = totals['hit_bytes'] + totals['miss_bytes']
+        return {
+            **totals,
+            'max_size': self.max_size,
+            'max_bytes': self.max_bytes,
+            'policy': shard_stats[0]['policy'],
+            'shards': len(self._shards),
+            'hit_rate': totals['hits'] / totals['total_requests'] if totals['total_requests'] else 0.0,
+            'byte_hit_rate': totals['hit_bytes'] / total_bytes if total_bytes else 0.0
+        }
+    
+    def keys(self) -> list:
+        """Get all cache keys."""
+        return [key for shard in self._shards for key in shard.keys()]
+    
+    def hottest(self, limit: int) -> List[Tuple[Hashable, CacheEntry]]:
+        """Live entries by last access, most recent first (does not count as access)."""
+        candidates = [item for shard in self._shards for item in shard.hottest(limit)]
+        return heapq.nlargest(limit, candidates, key=lambda item: item[1].last_accessed)
+    
+    def __contains__(self, key: str) -> bool:
+        """Check if key exists in cache (does not count as access)."""
+        return key in self._shard(key)
+    
+    def __len__(self) -> int:
+        """Get cache size."""
+        return self.size()
+
+
 class CacheDecorator:
     """Decorator for automatic function result caching."""
     
-    def __init__(self, cache: Optional[EphemerisCache] = None, ttl: Optional[float] = None):
+    def __init__(self, cache: Optional[EphemerisCache] = None, ttl: Optional[float] = None,
+                 quantize: Optional[Dict[str, float]] = None):
         """
         Initialize cache decorator.
         
         Args:
             cache: Cache instance to use (creates new if None)
             ttl: TTL for cached results
+            quantize: Quantum per parameter name; numbers passed for these
+                parameters share a cache entry when they round to the same
+                multiple of the quantum
         """
         # Important: don't use truthiness here because EphemerisCache defines __len__,
         # which makes empty caches evaluate to False. Use explicit None check.
         self.cache = cache if cache is not None else EphemerisCache()
         self.ttl = ttl
+        self.quantize = dict(quantize or {})
     
     def __call__(self, func):
         """Decorate function with caching."""
+        name = f"{func.__module__}.{func.__qualname__}"
+        quanta: Tuple[Optional[float], ...] = ()
+        if self.quantize:
+            parameters = list(inspect.signature(func).parameters)
+            unknown = set(self.quantize) - set(parameters)
+            if unknown:
+                raise ValueError(f"Cannot quantize unknown parameters of {name}: {', '.join(sorted(unknown))}")
+            quanta = (None,) + tuple(self.quantize.get(parameter) for parameter in parameters)
+        keyword_quanta = self.quantize or None
+        cache = self.cache
+        ttl = self.ttl
+        
         def wrapper(*args, **kwargs):
-            # Build a cache key consistent with EphemerisCache
-            key = self.cache._generate_key(func.__name__, *args, **kwargs)  # type: ignore[attr-defined]
+            # Key on the qualified name and argument values (quanta[0] is the name)
+            key = make_key((name,) + args, kwargs, quanta, keyword_quanta)
 
             # Try cache first
-            cached_value = self.cache.get(key)
+            cached_value = cache.get(key)
             if cached_value is not None:
                 return cached_value
 
-            # Compute and store
+            # Compute and store with the compute time, for cost-aware eviction
+            start = time.perf_counter()
             result = func(*args, **kwargs)
-            self.cache.put(key, result, ttl=self.ttl)
+            cache.put(key, result, ttl=ttl, cost=time.perf_counter() - start)
             return result
         
         # Preserve function metadata
         wrapper.__name__ = func.__name__
         wrapper.__doc__ = func.__doc__
         wrapper.cache = self.cache  # Expose cache for manual management
+        wrapper.cache_clear = lambda: _invalidate_function(cache, name)
         
         return wrapper
 
 
+def _invalidate_function(cache: EphemerisCache, name: str) -> int:
+    """Remove every entry cached for one decorated function."""
+    keys = [key for key in cache.keys() if isinstance(key, tuple) and key and key[0] == name]
+    return sum(cache.invalidate(key) for key in keys)
+
+
 # Global cache instance for the ephemeris engine
-_global_cache: Optional[EphemerisCache] = None
+_global_cache: Optional[Union[EphemerisCache, ShardedEphemerisCache]] = None
 _cache_lock = threading.Lock()
 
 
-def get_global_cache() -> EphemerisCache:
+def get_global_cache() -> Union[EphemerisCache, ShardedEphemerisCache]:
     """Get or create the global cache instance."""
     global _global_cache
     
@@ -272,11 +731,28 @@ def get_global_cache() -> EphemerisCache:
                     from ..settings import settings
                     max_size = settings.cache_size
                     ttl = settings.cache_ttl if settings.enable_cache else None
+                    policy_name = settings.cache_policy
+                    max_bytes = settings.cache_max_bytes
+                    low_water = settings.cache_low_water
+                    shards = settings.cache_shards
                 except ImportError:
                     max_size = 1000
                     ttl = 3600
+                    policy_name = 'lru'
+                    max_bytes = None
+                    low_water = 0.9
+                    shards = 1
                 
-                _global_cache = EphemerisCache(max_size=max_size, default_ttl=ttl)
+                if shards > 1:
+                    _global_cache = ShardedEphemerisCache(
+                        max_size=max_size, default_ttl=ttl, shards=shards, policy=policy_name,
+                        max_bytes=max_bytes, low_water=low_water
+                    )
+                else:
+                    _global_cache = EphemerisCache(
+                        max_size=max_size, default_ttl=ttl, policy=create_policy(policy_name, max_size),
+                        max_bytes=max_bytes, low_water=low_water
+                    )
     
     return _global_cache
 
@@ -289,16 +765,17 @@ def reset_global_cache() -> None:
             _global_cache.clear()
 
 
-def cached(ttl: Optional[float] = None):
+def cached(ttl: Optional[float] = None, quantize: Optional[Dict[str, float]] = None):
     """
     Decorator for caching function results using global cache.
     
     Args:
         ttl: TTL for cached results (uses global setting if None)
+        quantize: Quantum per parameter name for float arguments
     
     Example:
-        @cached(ttl=300)  # Cache for 5 minutes
+        @cached(ttl=300, quantize={'b': 1e-9})  # Cache for 5 minutes
         def expensive_calculation(a, b):
             return a ** b
     """
-    return CacheDecorator(cache=get_global_cache(), ttl=ttl)
\ No newline at end of file
+    return CacheDecorator(cache=get_global_cache(), ttl=ttl, quantize=quantize)
\ No newline at end of file
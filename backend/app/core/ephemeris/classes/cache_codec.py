@@ -0,0 +1,389 @@
+"""
+Meridian Ephemeris Engine - Cache Codecs
+
+Binary encodings for cache entries that leave the process (Redis, disk).
+
+Every entry starts with a fixed header:
+
+    magic 'MC' | format version | codec kind | compressor | cost | expires_at | meta length
+
+followed by a payload, compressed as a whole with the entry class's
+compressor (none, zlib or lzma):
+
+- `BinaryCodec` (the default) stores the value's structure as compact JSON
+  metadata and moves numeric geometry out of it: lists of floats and
+  rectangular lists of float lists (GeoJSON coordinates) become raw
+  little-endian float64 arrays (column-major, so they compress well),
+  addressed through an offset table, as do NumPy arrays and bytes. Only
+  JSON types, tuples, datetimes, arrays and explicitly registered classes
+  can be encoded, and decoding never executes code, so entries from a
+  shared cache are safe to read.
+- `PickleCodec` keeps arbitrary Python objects working where needed; its
+  entries are only decoded when pickle is explicitly allowed.
+
+Entries with a different magic or format version (including the earlier
+pickle formats) raise `CodecError`, which callers treat as a miss.
+"""
+
+import json
+import lzma
+import math
+import pickle
+import struct
+import zlib
+from datetime import date, datetime
+from itertools import chain
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+
+import numpy as np
+
+MAGIC = b'MC'
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('<2sBBBddI')
+
+KIND_BINARY = 0
+KIND_PICKLE = 1
+
+COMPRESSORS = {'none': 0, 'zlib': 1, 'lzma': 2}
+_COMPRESSOR_NAMES = {code: name for name, code in COMPRESSORS.items()}
+
+# Payloads smaller than this are stored uncompressed
+MIN_COMPRESS_SIZE = 1024
+
+# Float lists shorter than this stay in the metadata
+_MIN_ARRAY_LENGTH = 4
+
+_TAG = "$t"
+_FLOAT64 = np.dtype('<f8')
+
+
+class CodecError(ValueError):
+    """An entry cannot be encoded or decoded; stored entries that raise it are misses."""
+
+
+class DecodedEntry(NamedTuple):
+    """A decoded cache entry with its XFetch metadata (None when absent)."""
+    value: Any
+    cost: Optional[float]
+    expires_at: Optional[float]
+
+
+# name -> (class, to_state, from_state)
+_REGISTERED: Dict[str, Tuple[Type, Callable[[Any], Any], Callable[[Any], Any]]] = {}
+_REGISTERED_BY_CLASS: Dict[Type, str] = {}
+
+
+def register_type(cls: Type, name: str, to_state: Callable[[Any], Any],
+                  from_state: Callable[[Any], Any]) -> None:
+    """
+    Make a class encodable by `BinaryCodec`.
+
+    Args:
+        cls: Class to register (exact type, subclasses are not matched)
+        name: Stable name stored in entries
+        to_state: Converts an instance to an encodable value
+        from_state: Rebuilds an instance from that value
+    """
+    _REGISTERED[name] = (cls, to_state, from_state)
+    _REGISTERED_BY_CLASS[cls] = name
+
+
+def register_model(model: Type) -> None:
+    """Make a Pydantic model encodable by `BinaryCodec`, through its JSON-mode dump."""
+    register_type(
+        model, f"{model.__module__}.{model.__qualname__}",
+        lambda instance: instance.model_dump(mode='json'), model.model_validate
+    )
+
+
+def _to_columns(array: np.ndarray) -> bytes:
+    """
+    Column-major float64 bytes: each coordinate axis is stored contiguously.
+
+    ACG lines hold one axis constant or on a shared grid, so columns give the
+    compressor long repeats within and across features.
+    """
+    return np.ascontiguousarray(array.T).tobytes()
+
+
+def _from_columns(blobs: memoryview, offset: int, shape: Tuple[int, ...]) -> np.ndarray:
+    """Array of ``shape`` from `_to_columns` bytes at ``offset``."""
+    count = int(np.prod(shape))
+    return np.frombuffer(blobs, _FLOAT64, count, offset).reshape(shape[::-1]).T
+
+
+def _compress(payload: bytes, compressor: int) -> bytes:
+    if compressor == 1:
+        return zlib.compress(payload, 1)
+    if compressor == 2:
+        return lzma.compress(payload, preset=1)
+    return payload
+
+
+def _decompress(payload: bytes, compressor: int) -> bytes:
+    if compressor == 1:
+        return zlib.decompress(payload)
+    if compressor == 2:
+        return lzma.decompress(payload)
+    if compressor == 0:
+        return payload
+    raise CodecError(f"Unknown compressor {compressor}")
+
+
+class CacheCodec:
+    """Header, compression and entry-class handling shared by all codecs."""
+
+    name = "base"
+    kind = -1
+
+    def __init__(self, compression: Optional[Dict[str, str]] = None,
+                 default_compression: str = 'zlib', min_compress_size: int = MIN_COMPRESS_SIZE):
+        """
+        Args:
+            compression: Compressor name per entry class (e.g. {'acg_results': 'lzma'})
+            default_compression: Compressor for other entry classes
+            min_compress_size: Payloads below this many bytes are not compressed
+
+        Raises:
+            ValueError: If a compressor name is unknown
+        """
+        compression = dict(compression or {})
+        for compressor in list(compression.values()) + [default_compression]:
+            if compressor not in COMPRESSORS:
+                raise ValueError(f"Unknown compressor '{compressor}', expected one of {', '.join(COMPRESSORS)}")
+        self.compression = {entry_class: COMPRESSORS[name] for entry_class, name in compression.items()}
+        self.default_compression = COMPRESSORS[default_compression]
+        self.min_compress_size = min_compress_size
+
+    def compressor_for(self, entry_class: Optional[str]) -> str:
+        """Compressor name used for an entry class."""
+        return _COMPRESSOR_NAMES[self.compression.get(entry_class, self.default_compression)]
+
+    def encode(self, value: Any, entry_class: Optional[str] = None,
+               cost: Optional[float] = None, expires_at: Optional[float] = None) -> bytes:
+        """
+        Encode a value with optional XFetch metadata.
+
+        Args:
+            value: Value to encode
+            entry_class: Entry class (e.g. the Redis key prefix), selects the compressor
+            cost: Seconds the value took to compute
+            expires_at: Unix time the value expires
+
+        Raises:
+            CodecError: If the value cannot be encoded
+        """
+        meta, blobs = self._pack(value)
+        payload = b''.join([meta, *blobs])
+        compressor = self.compression.get(entry_class, self.default_compression)
+        if len(payload) < self.min_compress_size:
+            compressor = 0
+        header = _HEADER.pack(
+            MAGIC, FORMAT_VERSION, self.kind, compressor,
+            math.nan if cost is None else cost,
+            math.nan if expires_at is None else expires_at,
+            len(meta)
+        )
+        return header + _compress(payload, compressor)
+
+    def _pack(self, value: Any) -> Tuple[bytes, List[bytes]]:
+        """Encode a value to (metadata, binary blobs)."""
+        raise NotImplementedError
+
+    @staticmethod
+    def _unpack(payload: bytes, meta_length: int) -> Any:
+        """Decode a value from its decompressed payload."""
+        raise NotImplementedError
+
+
+class BinaryCodec(CacheCodec):
+    """JSON metadata with float geometry, arrays and bytes stored as raw blobs."""
+
+    name = "binary"
+    kind = KIND_BINARY
+
+    def _pack(self, value: Any) -> Tuple[bytes, List[bytes]]:
+        blobs: List[bytes] = []
+        offset = [0]
+
+        def add_blob(data: bytes) -> int:
+            start = offset[0]
+            blobs.append(data)
+            offset[0] += len(data)
+            return start
+
+        def float_array(items: list) -> Optional[np.ndarray]:
+            """Float64 array for a float list or rectangular list of float lists, else None."""
+            first = items[0]
+            if type(first) is float:
+                if len(items) < _MIN_ARRAY_LENGTH:
+                    return None
+                leaves = items
+            elif type(first) is list and first and type(first[0]) is float:
+                if set(map(type, items)) != {list}:
+                    return None
+                leaves = chain.from_iterable(items)
+            else:
+                return None
+            try:
+                array = np.array(items)
+            except ValueError:
+                # Ragged rows
+                return None
+            # float64 also results from ints or bools mixed with floats; keep those exact
+            if array.dtype != _FLOAT64 or set(map(type, leaves)) != {float}:
+                return None
+            return array
+
+        def pack(item: Any) -> Any:
+            item_type = type(item)
+            if item_type in (str, int, float, bool) or item is None:
+                return item
+            if item_type is dict:
+                if all(type(key) is str for key in item) and _TAG not in item:
+                    return {key: pack(child) for key, child in item.items()}
+                return {_TAG: "d", "v": [[pack(key), pack(child)] for key, child in item.items()]}
+            if item_type is list:
+                if item:
+                    array = float_array(item)
+                    if array is not None:
+                        return {_TAG: "l", "o": add_blob(_to_columns(array)), "s": array.shape}
+                return [pack(child) for child in item]
+            if item_type is tuple:
+                return {_TAG: "t", "v": [pack(child) for child in item]}
+            if item_type in (bytes, bytearray, memoryview):
+                data = bytes(item)
+                return {_TAG: "b", "o": add_blob(data), "n": len(data)}
+            if item_type is np.ndarray:
+                array = np.ascontiguousarray(item)
+                if array.dtype.hasobject:
+                    raise CodecError("Object arrays cannot be encoded")
+                dtype = array.dtype.newbyteorder('<') if array.dtype.byteorder == '>' else array.dtype
+                return {_TAG: "n", "o": add_blob(array.astype(dtype, copy=False).tobytes()),
+                        "s": array.shape, "d": dtype.str}
+            if item_type is datetime:
+                return {_TAG: "dt", "v": item.isoformat()}
+            if item_type is date:
+                return {_TAG: "da", "v": item.isoformat()}
+            if isinstance(item, np.generic):
+                return pack(item.item())
+            name = _REGISTERED_BY_CLASS.get(item_type)
+            if name is not None:
+                return {_TAG: "r", "c": name, "v": pack(_REGISTERED[name][1](item))}
+            raise CodecError(f"Cannot encode values of type {item_type.__name__}")
+
+        meta = json.dumps(pack(value), separators=(',', ':'), allow_nan=True).encode()
+        return meta, blobs
+
+    @staticmethod
+    def _unpack(payload: bytes, meta_length: int) -> Any:
+        blobs = memoryview(payload)[meta_length:]
+
+        def hook(obj: Dict[str, Any]) -> Any:
+            tag = obj.get(_TAG)
+            if tag is None:
+                return obj
+            if tag == "l":
+                shape = tuple(obj["s"])
+                return _from_columns(blobs, obj["o"], shape).tolist()
+            if tag == "d":
+                return {key: child for key, child in obj["v"]}
+            if tag == "t":
+                return tuple(obj["v"])
+            if tag == "b":
+                return bytes(blobs[obj["o"]:obj["o"] + obj["n"]])
+            if tag == "n":
+                dtype = np.dtype(obj["d"])
+                shape = tuple(obj["s"])
+                count = int(np.prod(shape))
+                return np.frombuffer(blobs, dtype, count, obj["o"]).reshape(shape).copy()
+            if tag == "dt":
+                return datetime.fromisoformat(obj["v"])
+            if tag == "da":
+                return date.fromisoformat(obj["v"])
+            if tag == "r":
+                registered = _REGISTERED.get(obj["c"])
+                if registered is None:
+                    raise CodecError(f"Unregistered type '{obj['c']}'")
+                return registered[2](obj["v"])
+            raise CodecError(f"Unknown tag '{tag}'")
+
+        return json.loads(bytes(payload[:meta_length]), object_hook=hook)
+
+
+class PickleCodec(CacheCodec):
+    """Pickle for arbitrary objects; only for caches whose writers are trusted."""
+
+    name = "pickle"
+    kind = KIND_PICKLE
+
+    def _pack(self, value: Any) -> Tuple[bytes, List[bytes]]:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), []
+
+    @staticmethod
+    def _unpack(payload: bytes, meta_length: int) -> Any:
+        return pickle.loads(payload)
+
+
+_CODECS: Dict[str, Type[CacheCodec]] = {codec.name: codec for codec in (BinaryCodec, PickleCodec)}
+_CODECS_BY_KIND: Dict[int, Type[CacheCodec]] = {codec.kind: codec for codec in (BinaryCodec, PickleCodec)}
+
+
+def create_codec(name: str, compression: Optional[Dict[str, str]] = None,
+                 default_compression: str = 'zlib') -> CacheCodec:
+    """
+    Build a codec by name ('binary' or 'pickle').
+
+    Raises:
+        ValueError: If the codec or a compressor name is unknown
+    """
+    codec = _CODECS.get(name.lower())
+    if codec is None:
+        raise ValueError(f"Unknown cache codec '{name}', expected one of {', '.join(_CODECS)}")
+    return codec(compression=compression, default_compression=default_compression)
+
+
+def decode_entry(data: bytes, allow_pickle: bool = False) -> DecodedEntry:
+    """
+    Decode an entry written by any codec.
+
+    Args:
+        data: Encoded entry
+        allow_pickle: Whether pickle entries may be decoded
+
+    Raises:
+        CodecError: If the entry is from another format version, was written
+            by a disallowed or unknown codec, or is corrupt
+    """
+    if len(data) < _HEADER.size or data[:2] != MAGIC:
+        raise CodecError("Not a versioned cache entry")
+    _, version, kind, compressor, cost, expires_at, meta_length = _HEADER.unpack_from(data)
+    if version != FORMAT_VERSION:
+        raise CodecError(f"Cache entry format {version} is not {FORMAT_VERSION}")
+    codec = _CODECS_BY_KIND.get(kind)
+    if codec is None or (codec is PickleCodec and not allow_pickle):
+        raise CodecError(f"Cache entries of kind {kind} are not accepted")
+
+    try:
+        payload = _decompress(memoryview(data)[_HEADER.size:], compressor)
+        value = codec._unpack(payload, meta_length)
+    except CodecError:
+        raise
+    except Exception as e:
+        raise CodecError(f"Corrupt cache entry: {e}") from e
+    return DecodedEntry(
+        value,
+        None if math.isnan(cost) else cost,
+        None if math.isnan(expires_at) else expires_at
+    )
+
+
+def parse_compression(spec: str) -> Dict[str, str]:
+    """Parse 'entry_class=compressor,...' settings into a mapping."""
+    compression = {}
+    for item in spec.split(','):
+        if '=' in item:
+            entry_class, compressor = item.split('=', 1)
+            compression[entry_class.strip()] = compressor.strip().lower()
+    return compression
@@ -0,0 +1,230 @@
+"""
+Meridian Ephemeris Engine - Cache Policies
+
+Admission and eviction policies for `EphemerisCache`:
+
+- `LRUPolicy`: evict the least recently used entry (the default)
+- `GDSFPolicy`: GreedyDual-Size-Frequency; evict the entry with the lowest
+  ``clock + frequency * cost / size``, so cheap-to-recompute and large
+  entries go first, and an inflating clock ages out formerly hot entries
+
+Either policy can take a TinyLFU admission filter (`FrequencySketch`): when
+the cache is full, a new entry is only admitted if it has been requested
+more often than the entry it would evict, which keeps one-off batch items
+from pushing out hot entries.
+"""
+
+import heapq
+import itertools
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN64 = 0x9E3779B97F4A7C15
+
+# Counters saturate at 15, as in 4-bit TinyLFU sketches
+_MAX_COUNT = 15
+
+# Floor for measured compute costs, so entries stored without one still rank by size
+MIN_COST = 1e-4
+
+
+class FrequencySketch:
+    """
+    Count-min sketch of access frequencies with periodic halving.
+
+    After ``10 * capacity`` increments every counter is halved, so
+    frequencies reflect recent traffic (the TinyLFU reset).
+    """
+
+    def __init__(self, capacity: int, depth: int = 4):
+        """
+        Args:
+            capacity: Cache capacity in entries (sizes the sketch and sample)
+            depth: Number of hash rows
+        """
+        # Eight counters per row per cached entry keep collisions rare
+        width = 16
+        while width < 8 * capacity:
+            width <<= 1
+        self.depth = depth
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in range(depth)]
+        self.sample_size = 10 * max(capacity, 1)
+        self._additions = 0
+
+    def _indexes(self, key: Hashable):
+        """Row indexes by double hashing."""
+        h1 = hash(key) & _MASK64
+        h2 = (((h1 * _GOLDEN64) & _MASK64) >> 32) | 1
+        return [(h1 + i * h2) & self._mask for i in range(self.depth)]
+
+    def increment(self, key: Hashable) -> None:
+        """Record one access."""
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < _MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._halve()
+
+    def frequency(self, key: Hashable) -> int:
+        """Estimated recent access count (never underestimated before halving)."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def _halve(self) -> None:
+        self._rows = [bytearray(count >> 1 for count in row) for row in self._rows]
+        self._additions //= 2
+
+    def clear(self) -> None:
+        """Reset all counters."""
+        self._rows = [bytearray(len(row)) for row in self._rows]
+        self._additions = 0
+
+
+class CachePolicy:
+    """
+    Base policy: least-recently-used eviction with optional TinyLFU admission.
+
+    The cache calls the hooks with its lock held; entries live in the
+    cache's OrderedDict, ordered from least to most recently used.
+    """
+
+    name = "lru"
+
+    def __init__(self, admission: Optional[FrequencySketch] = None):
+        """
+        Args:
+            admission: Frequency sketch for TinyLFU admission (None admits everything)
+        """
+        self.admission = admission
+
+    @property
+    def label(self) -> str:
+        """Policy name including the admission filter."""
+        return f"tinylfu-{self.name}" if self.admission is not None else self.name
+
+    def record_access(self, key: str) -> None:
+        """Called for every lookup and insertion, hit or miss."""
+        if self.admission is not None:
+            self.admission.increment(key)
+
+    def admit(self, key: str, victim: str) -> bool:
+        """Whether a new entry may replace ``victim`` in a full cache."""
+        if self.admission is None:
+            return True
+        return self.admission.frequency(key) > self.admission.frequency(victim)
+
+    def victim(self, cache: "OrderedDict[str, Any]") -> str:
+        """Key to evict next."""
+        return next(iter(cache))
+
+    def on_insert(self, key: str, entry: Any) -> None:
+        """Called after an entry is stored."""
+
+    def on_hit(self, key: str, entry: Any) -> None:
+        """Called after an entry is read."""
+
+    def on_evict(self, key: str) -> None:
+        """Called when an entry is evicted for capacity."""
+        self.on_remove(key)
+
+    def on_remove(self, key: str) -> None:
+        """Called when an entry leaves the cache for any other reason."""
+
+    def clear(self) -> None:
+        """Forget all per-entry state."""
+        if self.admission is not None:
+            self.admission.clear()
+
+
+class LRUPolicy(CachePolicy):
+    """Least-recently-used eviction."""
+
+    name = "lru"
+
+
+class GDSFPolicy(CachePolicy):
+    """GreedyDual-Size-Frequency eviction weighted by recompute cost and size."""
+
+    name = "gdsf"
+
+    def __init__(self, admission: Optional[FrequencySketch] = None):
+        super().__init__(admission)
+        self.clock = 0.0
+        # key -> (priority, sequence, frequency); heap entries are lazily invalidated
+        self._priorities: Dict[str, Tuple[float, int, int]] = {}
+        self._heap: list = []
+        self._sequence = itertools.count()
+
+    def _push(self, key: str, entry: Any, frequency: int) -> None:
+        priority = self.clock + frequency * max(entry.cost, MIN_COST) / max(entry.size, 1)
+        sequence = next(self._sequence)
+        self._priorities[key] = (priority, sequence, frequency)
+        heapq.heappush(self._heap, (priority, sequence, key))
+        if len(self._heap) > 2 * len(self._priorities) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop stale heap entries."""
+        self._heap = [(priority, sequence, key) for key, (priority, sequence, _) in self._priorities.items()]
+        heapq.heapify(self._heap)
+
+    def on_insert(self, key: str, entry: Any) -> None:
+        previous = self._priorities.get(key)
+        frequency = previous[2] + 1 if previous is not None else 1
+        if self.admission is not None:
+            frequency = max(frequency, self.admission.frequency(key))
+        self._push(key, entry, frequency)
+
+    def on_hit(self, key: str, entry: Any) -> None:
+        previous = self._priorities.get(key)
+        self._push(key, entry, (previous[2] if previous is not None else 0) + 1)
+
+    def victim(self, cache: "OrderedDict[str, Any]") -> str:
+        while self._heap:
+            priority, sequence, key = self._heap[0]
+            current = self._priorities.get(key)
+            if current is not None and current[1] == sequence:
+                return key
+            heapq.heappop(self._heap)
+        return next(iter(cache))
+
+    def on_evict(self, key: str) -> None:
+        current = self._priorities.pop(key, None)
+        if current is not None:
+            # Inflate the clock to the evicted priority (GreedyDual aging)
+            self.clock = max(self.clock, current[0])
+
+    def on_remove(self, key: str) -> None:
+        self._priorities.pop(key, None)
+
+    def clear(self) -> None:
+        super().clear()
+        self.clock = 0.0
+        self._priorities.clear()
+        self._heap = []
+
+
+POLICY_NAMES = ('lru', 'tinylfu', 'gdsf', 'tinylfu-gdsf')
+
+
+def create_policy(name: str, capacity: int) -> CachePolicy:
+    """
+    Build a policy by name.
+
+    Args:
+        name: One of 'lru', 'tinylfu' (LRU with TinyLFU admission), 'gdsf',
+            'tinylfu-gdsf'
+        capacity: Cache capacity in entries (sizes the admission sketch)
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    name = name.lower()
+    if name not in POLICY_NAMES:
+        raise ValueError(f"Unknown cache policy '{name}', expected one of {', '.join(POLICY_NAMES)}")
+    admission = FrequencySketch(capacity) if name.startswith('tinylfu') else None
+    if name.endswith('gdsf'):
+        return GDSFPolicy(admission)
+    return LRUPolicy(admission)
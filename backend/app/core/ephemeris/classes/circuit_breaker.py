@@ -0,0 +1,145 @@
+"""
+Meridian Ephemeris Engine - Circuit Breaker
+
+Stops calling a backend that keeps failing. After ``failure_threshold``
+consecutive failures the breaker opens and callers skip the backend
+entirely (a cache miss instead of a timeout on the request path). While it
+is open a background thread probes the backend every ``probe_interval``
+seconds; during a probe the breaker is half-open, and a successful probe
+closes it again.
+
+States: closed (calls allowed), open (calls skipped), half-open (calls
+skipped while the probe runs).
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+# Gauge values for the states
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a background half-open probe."""
+
+    def __init__(self, name: str, probe: Callable[[], bool], failure_threshold: int = 3,
+                 probe_interval: float = 1.0,
+                 on_state_change: Optional[Callable[[str, str], None]] = None):
+        """
+        Args:
+            name: Backend name (e.g. the Redis node) for logs and metrics
+            probe: Health check run while open; True closes the breaker
+            failure_threshold: Consecutive failures that open the breaker
+            probe_interval: Seconds between probes while open
+            on_state_change: Called with (name, new state) on every transition
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.name = name
+        self.probe = probe
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.on_state_change = on_state_change
+        self._state = CLOSED
+        self._failures = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self.opened = 0
+        self.skipped = 0
+        self.probes = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, half_open or open."""
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go to the backend; counts the call as skipped if not."""
+        if self._state == CLOSED:
+            return True
+        with self._lock:
+            self.skipped += 1
+        return False
+
+    def record_success(self) -> None:
+        """Reset the consecutive failure count."""
+        if self._failures:
+            with self._lock:
+                self._failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failure; opens the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._failures < self.failure_threshold:
+                return
+        self.trip()
+
+    def trip(self) -> None:
+        """Open the breaker now (e.g. for a backend unreachable at startup) and start probing."""
+        with self._lock:
+            if self._state != CLOSED:
+                return
+            self.opened += 1
+            self._stop_event = threading.Event()
+            self._set_state(OPEN)
+        logger.warning(f"Circuit breaker for {self.name} opened, skipping it until a probe succeeds")
+        threading.Thread(
+            target=self._probe_until_closed, args=(self._stop_event,),
+            name=f"breaker-probe-{self.name}", daemon=True
+        ).start()
+
+    def _set_state(self, state: str) -> None:
+        """Transition (lock held) and notify."""
+        self._state = state
+        if self.on_state_change is not None:
+            try:
+                self.on_state_change(self.name, state)
+            except Exception as e:
+                logger.debug(f"Circuit breaker state callback failed: {e}")
+
+    def _probe_until_closed(self, stop_event: threading.Event) -> None:
+        """Probe the backend every interval until a probe succeeds or the breaker is reset."""
+        while not stop_event.wait(self.probe_interval):
+            with self._lock:
+                self.probes += 1
+                self._set_state(HALF_OPEN)
+            try:
+                healthy = bool(self.probe())
+            except Exception:
+                healthy = False
+            with self._lock:
+                if stop_event.is_set():
+                    return
+                if healthy:
+                    self._failures = 0
+                    self._set_state(CLOSED)
+                    logger.info(f"Circuit breaker for {self.name} closed, backend recovered")
+                    return
+                self._set_state(OPEN)
+
+    def reset(self) -> None:
+        """Close the breaker and stop any probe."""
+        with self._lock:
+            self._stop_event.set()
+            self._failures = 0
+            if self._state != CLOSED:
+                self._set_state(CLOSED)
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state and counters."""
+        return {
+            'state': self._state,
+            'consecutive_failures': self._failures,
+            'failure_threshold': self.failure_threshold,
+            'opened': self.opened,
+            'skipped': self.skipped,
+            'probes': self.probes
+        }
@@ -0,0 +1,424 @@
+"""
+Meridian Ephemeris Engine - Disk Cache
+
+Persistent cache tier between the in-memory cache and Redis, so restarts
+and deploys do not start cold and a host keeps a shared tier when Redis is
+unavailable.
+
+Entries live in a SQLite database in WAL mode: readers never block the
+writer, and every worker process on the host opens the same file. Values
+are encoded with the cache codec (see `cache_codec`), so the format,
+compression and safety guarantees match Redis entries.
+
+- Expired entries are misses and are removed lazily and during eviction.
+- Total entry size is kept in a totals row maintained by triggers, so every
+  process enforces the byte budget against the same figure; once over
+  budget, expired and then least recently accessed entries are evicted down
+  to the low-water mark.
+- `snapshot` copies the hottest entries of an in-memory cache to disk (on
+  graceful shutdown) and `warm` loads the hottest disk entries back into
+  one (on startup).
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cache_codec import CacheCodec, CodecError, DecodedEntry, create_codec, decode_entry, parse_compression
+from ..settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Reads refresh an entry's access time at most this often (seconds), to spare writes
+ACCESS_RESOLUTION = 1.0
+
+# Entries considered per eviction round
+_EVICTION_BATCH = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, bytes) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+BEGIN UPDATE totals SET bytes = bytes + NEW.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+BEGIN UPDATE totals SET bytes = bytes - OLD.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries
+BEGIN UPDATE totals SET bytes = bytes - OLD.size + NEW.size WHERE id = 0; END;
+"""
+
+
+class DiskCache:
+    """SQLite-backed persistent cache shared by the worker processes on a host."""
+
+    def __init__(self, path: Optional[str], max_bytes: Optional[int] = 1024 * 1024 * 1024,
+                 low_water: float = 0.9, default_ttl: Optional[float] = 3600,
+                 codec: Optional[CacheCodec] = None, allow_pickle: bool = False,
+                 busy_timeout: float = 5.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: Database file (None or empty disables the cache)
+            max_bytes: Budget for the encoded size of all entries (None for no limit)
+            low_water: Fraction of max_bytes to evict down to once over budget
+            default_ttl: Default TTL in seconds (None for no expiration)
+            codec: Entry codec (the configured codec if None)
+            allow_pickle: Whether pickle-encoded entries may be decoded
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        if not 0 < low_water <= 1:
+            raise ValueError("low_water must be in (0, 1]")
+        self.path = path or None
+        self.max_bytes = max_bytes or None
+        self.low_water = low_water
+        self.default_ttl = default_ttl
+        self.codec = codec if codec is not None else create_codec(
+            settings.cache_codec,
+            compression=parse_compression(settings.cache_codec_compression),
+            default_compression=settings.cache_codec_default_compression
+        )
+        self.allow_pickle = allow_pickle
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        self.enabled = self.path is not None
+
+        if not self.enabled:
+            return
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            with self._connection() as connection:
+                connection.executescript(_SCHEMA)
+            logger.info(f"Disk cache opened at {self.path}")
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Failed to open disk cache at {self.path}: {e}")
+            self.enabled = False
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection, reopened after a fork."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None on a miss."""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[DecodedEntry]:
+        """
+        Get an entry with its compute cost and expiry.
+
+        Expired and unreadable entries (another codec format version) are
+        removed and reported as misses.
+
+        Returns:
+            DecodedEntry (value, cost, expires_at) or None on a miss
+        """
+        if not self.enabled:
+            return None
+        try:
+            connection = self._connection()
+            now = time.time()
+            row = connection.execute(
+                "SELECT value, expires_at, accessed_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count('misses')
+                return None
+            data, expires_at, accessed_at = row
+            if expires_at is not None and expires_at <= now:
+                connection.execute("DELETE FROM entries WHERE key = ? AND expires_at <= ?", (key, now))
+                self._count('misses')
+                return None
+            try:
+                entry = decode_entry(data, allow_pickle=self.allow_pickle)
+            except CodecError:
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._count('misses')
+                return None
+            if now - accessed_at >= ACCESS_RESOLUTION:
+                connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._count('hits')
+            return entry
+        except sqlite3.Error as e:
+            logger.error(f"Disk cache get error for {key}: {e}")
+            self._count('errors')
+            return None
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None, cost: float = 0.0,
+            entry_class: Optional[str] = None, accessed_at: Optional[float] = None) -> bool:
+        """
+        Store a value, evicting down to the low-water mark if over budget.
+
+        Args:
+            key: Cache key
+            value: Value the codec can encode
+            ttl: Time-to-live in seconds (default_ttl if None)
+            cost: Seconds the value took to compute
+            entry_class: Entry class selecting the compressor
+            accessed_at: Access time to record (now if None)
+
+        Returns:
+            True if stored, False if the value cannot be encoded, exceeds the
+            whole budget or the write failed
+        """
+        if not self.enabled:
+            return False
+        now = time.time()
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = now + ttl if ttl is not None else None
+        try:
+            data = self.codec.encode(value, entry_class, cost=cost, expires_at=expires_at)
+        except CodecError as e:
+            logger.debug(f"Disk cache cannot encode {key}: {e}")
+            return False
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            self.invalidate(key)
+            return False
+
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT INTO entries (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                    "expires_at = excluded.expires_at, accessed_at = excluded.accessed_at",
+                    (key, data, len(data), expires_at, accessed_at if accessed_at is not None else now)
+                )
+                if self.max_bytes is not None and self._total_bytes(connection) > self.max_bytes:
+                    self._evict(connection, now)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Disk cache put error for {key}: {e}")
+            self._count('errors')
+            return False
+
+    @staticmethod
+    def _total_bytes(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT bytes FROM totals WHERE id = 0").fetchone()[0]
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """Evict expired, then least recently accessed entries down to the low-water mark."""
+        evicted = connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,)).rowcount
+        target = self.max_bytes * self.low_water
+        total = self._total_bytes(connection)
+        while total > target:
+            rows = connection.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at LIMIT ?", (_EVICTION_BATCH,)
+            ).fetchall()
+            if not rows:
+                break
+            victims = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                victims.append((key,))
+                total -= size
+            connection.executemany("DELETE FROM entries WHERE key = ?", victims)
+            evicted += len(victims)
+            total = self._total_bytes(connection)
+        self._count('evictions', evicted)
+
+    def invalidate(self, key: str) -> bool:
+        """Remove a specific key."""
+        if not self.enabled:
+            return False
+        try:
+            return self._connection().execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+        except sqlite3.Error as e:
+            logger.error(f"Disk cache delete error for {key}: {e}")
+            self._count('errors')
+            return False
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Remove all keys matching a glob pattern (as Redis patterns, e.g. ``acg:*``)."""
+        if not self.enabled:
+            return 0
+        try:
+            return self._connection().execute("DELETE FROM entries WHERE key GLOB ?", (pattern,)).rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Disk cache pattern delete error for {pattern}: {e}")
+            self._count('errors')
+            return 0
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        if self.enabled:
+            self._connection().execute("DELETE FROM entries")
+
+    def cleanup(self) -> int:
+        """Remove all expired entries and return count."""
+        if not self.enabled:
+            return 0
+        return self._connection().execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def hottest(self, limit: int, pattern: str = "*") -> List[Tuple[str, DecodedEntry]]:
+        """
+        Most recently accessed live entries.
+
+        Args:
+            limit: Maximum number of entries
+            pattern: Glob pattern keys must match
+
+        Returns:
+            List of (key, DecodedEntry), most recently accessed first; unreadable
+            entries are skipped
+        """
+        if not self.enabled or limit <= 0:
+            return []
+        rows = self._connection().execute(
+            "SELECT key, value FROM entries WHERE key GLOB ? AND (expires_at IS NULL OR expires_at > ?) "
+            "ORDER BY accessed_at DESC LIMIT ?", (pattern, time.time(), limit)
+        ).fetchall()
+        entries = []
+        for key, data in rows:
+            try:
+                entries.append((key, decode_entry(data, allow_pickle=self.allow_pickle)))
+            except CodecError:
+                continue
+        return entries
+
+    def snapshot(self, cache: Any, limit: int) -> int:
+        """
+        Copy the hottest entries of an in-memory cache to disk.
+
+        Entries keep their remaining TTL, compute cost and last access time.
+        Entries with non-string keys or values the codec cannot encode are
+        skipped.
+
+        Args:
+            cache: EphemerisCache or ShardedEphemerisCache
+            limit: Maximum number of entries to copy
+
+        Returns:
+            Number of entries written
+        """
+        if not self.enabled or limit <= 0:
+            return 0
+        now = time.time()
+        written = 0
+        for key, entry in cache.hottest(limit):
+            if not isinstance(key, str):
+                continue
+            expires_at = entry.expires_at
+            if expires_at is not None and expires_at <= now:
+                continue
+            ttl = expires_at - now if expires_at is not None else None
+            written += self.put(key, entry.value, ttl=ttl, cost=entry.cost, accessed_at=entry.last_accessed)
+        return written
+
+    def warm(self, cache: Any, limit: int, pattern: str = "*") -> int:
+        """
+        Load the hottest disk entries into an in-memory cache.
+
+        Args:
+            cache: EphemerisCache or ShardedEphemerisCache
+            limit: Maximum number of entries to load
+            pattern: Glob pattern keys must match
+
+        Returns:
+            Number of entries loaded
+        """
+        now = time.time()
+        loaded = 0
+        # Insert coldest first, so the hottest end up most recently used
+        for key, entry in reversed(self.hottest(limit, pattern)):
+            ttl = entry.expires_at - now if entry.expires_at is not None else None
+            if ttl is not None and ttl <= 0:
+                continue
+            cache.put(key, entry.value, ttl=ttl, cost=entry.cost or 0.0)
+            loaded += 1
+        return loaded
+
+    def size(self) -> int:
+        """Get the number of stored entries (including expired ones not yet removed)."""
+        if not self.enabled:
+            return 0
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def size_bytes(self) -> int:
+        """Get the encoded size of all stored entries in bytes."""
+        if not self.enabled:
+            return 0
+        return self._total_bytes(self._connection())
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total_requests = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'path': self.path,
+            'size': self.size(),
+            'bytes': self.size_bytes(),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'errors': self.errors,
+            'hit_rate': self.hits / total_requests if total_requests > 0 else 0.0,
+            'total_requests': total_requests
+        }
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+# Global disk cache instance
+_disk_cache: Optional[DiskCache] = None
+_disk_cache_lock = threading.Lock()
+
+
+def get_disk_cache() -> DiskCache:
+    """Get the global disk cache (disabled unless DISK_CACHE_PATH is set)."""
+    global _disk_cache
+    if _disk_cache is None:
+        with _disk_cache_lock:
+            if _disk_cache is None:
+                _disk_cache = DiskCache(
+                    settings.disk_cache_path,
+                    max_bytes=settings.disk_cache_max_bytes,
+                    low_water=settings.cache_low_water,
+                    default_ttl=settings.cache_ttl,
+                    allow_pickle=settings.cache_codec_allow_pickle
+                )
+    return _disk_cache
@@ -0,0 +1,87 @@
+"""
+Meridian Ephemeris Engine - Consistent Hash Ring
+
+Maps cache keys to nodes so that adding or removing a node moves only the
+keys of the ring segments it gains or loses (about 1/N of them) instead of
+rehashing everything. Each node is placed on the ring at many points
+(virtual nodes) to even out the share of keys each node receives.
+"""
+
+import hashlib
+from bisect import bisect
+from typing import Dict, Iterable, List
+
+
+def _point(value: str) -> int:
+    """Position of a value on the ring (64-bit)."""
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes."""
+
+    def __init__(self, nodes: Iterable[str] = (), virtual_nodes: int = 160):
+        """
+        Args:
+            nodes: Node names (e.g. "host:port")
+            virtual_nodes: Ring points per unit of node weight
+        """
+        if virtual_nodes < 1:
+            raise ValueError("virtual_nodes must be at least 1")
+        self.virtual_nodes = virtual_nodes
+        self._weights: Dict[str, int] = {}
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        """Node names in the order they were added."""
+        return list(self._weights)
+
+    def add_node(self, node: str, weight: int = 1) -> None:
+        """
+        Add a node (or change its weight).
+
+        Args:
+            node: Node name
+            weight: Relative share of keys; the node gets weight * virtual_nodes points
+        """
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+        self._weights[node] = weight
+        self._rebuild()
+
+    def remove_node(self, node: str) -> None:
+        """Remove a node; its keys move to the nodes following its points."""
+        if self._weights.pop(node, None) is not None:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Recompute the sorted ring points."""
+        ring = sorted(
+            (_point(f"{node}#{i}"), node)
+            for node, weight in self._weights.items()
+            for i in range(weight * self.virtual_nodes)
+        )
+        self._points = [point for point, _ in ring]
+        self._owners = [node for _, node in ring]
+
+    def get_node(self, key: str) -> str:
+        """
+        Node owning a key: the first ring point clockwise from the key's hash.
+
+        Raises:
+            LookupError: If the ring has no nodes
+        """
+        if not self._points:
+            raise LookupError("hash ring has no nodes")
+        index = bisect(self._points, _point(key))
+        return self._owners[index % len(self._owners)]
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._weights
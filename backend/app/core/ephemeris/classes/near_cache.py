@@ -0,0 +1,412 @@
+"""
+Meridian Ephemeris Engine - Near Cache
+
+Keeps in-process (L1) caches coherent with Redis across workers and nodes.
+L1 entries are registered against the Redis keys they mirror, and
+invalidations - exact keys, glob patterns, Redis keys and Redis patterns -
+are broadcast on an invalidation bus. Every subscribed near cache evicts
+exactly the affected L1 entries, so L1 TTLs can be long without entries
+outliving a purge elsewhere.
+
+Buses:
+
+- `RedisInvalidationBus`: Redis pub/sub on one channel, with a listener
+  thread per process
+- `LocalInvalidationBus`: in-process stand-in with the same delivery, used
+  when Redis is unavailable and in tests
+
+A message is delivered to the publishing process's own subscribers
+synchronously, then broadcast; listeners skip their own process's messages.
+Pub/sub delivers at most once, so after a lost subscription the listener
+tells its subscribers to resync (drop every registered entry).
+"""
+
+import json
+import logging
+import threading
+import uuid
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from ..settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds between reconnection attempts of a listener whose subscription failed
+RECONNECT_DELAY = 1.0
+
+InvalidationHandler = Callable[[Dict[str, Any]], Optional[int]]
+
+
+def evict_matching(cache, pattern: str) -> int:
+    """
+    Remove the entries of an in-process cache whose string key matches a glob pattern.
+
+    Args:
+        cache: EphemerisCache or ShardedEphemerisCache
+        pattern: Glob pattern (``*``, ``?``, ``[...]``)
+
+    Returns:
+        Number of entries removed
+    """
+    matching = [key for key in cache.keys() if isinstance(key, str) and fnmatchcase(key, pattern)]
+    return sum(cache.invalidate(key) for key in matching)
+
+
+class LocalInvalidationBus:
+    """In-process invalidation bus: delivers every message to this process's subscribers."""
+
+    def __init__(self):
+        self.node_id = uuid.uuid4().hex
+        self._subscribers: List[InvalidationHandler] = []
+        self._lock = threading.Lock()
+        self.published = 0
+        self.received = 0
+        self.errors = 0
+
+    def subscribe(self, handler: InvalidationHandler) -> None:
+        """Call ``handler(message)`` for every invalidation; it may return an eviction count."""
+        with self._lock:
+            self._subscribers.append(handler)
+
+    def unsubscribe(self, handler: InvalidationHandler) -> None:
+        """Stop delivering invalidations to ``handler``."""
+        with self._lock:
+            if handler in self._subscribers:
+                self._subscribers.remove(handler)
+
+    def publish(self, keys: Iterable[str] = (), patterns: Iterable[str] = (),
+                remote_keys: Iterable[str] = (), remote_patterns: Iterable[str] = (),
+                **fields: Any) -> int:
+        """
+        Invalidate entries here and in every other subscribed process.
+
+        Args:
+            keys: L1 cache keys
+            patterns: Glob patterns over L1 cache keys
+            remote_keys: Redis keys; the L1 entries registered against them are evicted
+            remote_patterns: Glob patterns over Redis keys
+            **fields: Extra JSON-serializable fields for subscribers (e.g. ``cache_version``)
+
+        Returns:
+            Number of entries evicted in this process
+        """
+        message = {
+            'origin': self.node_id,
+            'keys': list(keys),
+            'patterns': list(patterns),
+            'remote_keys': list(remote_keys),
+            'remote_patterns': list(remote_patterns),
+            **fields
+        }
+        self.published += 1
+        evicted = self._deliver(message)
+        self._broadcast(message)
+        return evicted
+
+    def _deliver(self, message: Dict[str, Any]) -> int:
+        """Hand a message to each subscriber, isolating their failures."""
+        with self._lock:
+            handlers = list(self._subscribers)
+        evicted = 0
+        for handler in handlers:
+            try:
+                evicted += handler(message) or 0
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Cache invalidation handler failed: {e}")
+        return evicted
+
+    def _broadcast(self, message: Dict[str, Any]) -> None:
+        """Send a message to other processes (none for the local bus)."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Bus counters."""
+        with self._lock:
+            subscribers = len(self._subscribers)
+        return {
+            'bus': type(self).__name__,
+            'node_id': self.node_id,
+            'subscribers': subscribers,
+            'published': self.published,
+            'received': self.received,
+            'errors': self.errors
+        }
+
+
+class RedisInvalidationBus(LocalInvalidationBus):
+    """
+    Invalidation bus shared by all workers and nodes through Redis pub/sub.
+
+    The channel lives on the shard node the ring assigns to its name, so
+    every process publishes and subscribes on the same node, through that
+    node's circuit breaker. While the breaker is open publishes are dropped
+    (remote entries fall back to their TTL) and the listener resubscribes
+    once the node is allowed again.
+    """
+
+    def __init__(self, redis_cache, channel: str = "meridian:cache:invalidate"):
+        """
+        Args:
+            redis_cache: Enabled RedisCache whose clients and breakers are used
+            channel: Pub/sub channel shared by every node
+        """
+        super().__init__()
+        self.redis_cache = redis_cache
+        self.channel = channel
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """Whether the listener thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _broadcast(self, message: Dict[str, Any]) -> None:
+        """Publish a message on the channel; failures leave remote entries to their TTL."""
+        node, client = self.redis_cache._route(self.channel, "publish", read=False)
+        if client is None:
+            self.errors += 1
+            logger.warning("Cache invalidation publish skipped, Redis node unavailable")
+            return
+        try:
+            client.publish(self.channel, json.dumps(message))
+            self.redis_cache._node_ok(node)
+        except Exception as e:
+            self.redis_cache._node_failed(node, "publish", e)
+            self.errors += 1
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    def handle(self, data: Any) -> int:
+        """
+        Deliver a message received on the channel to this process's subscribers.
+
+        Args:
+            data: Raw pub/sub payload (JSON)
+
+        Returns:
+            Number of entries evicted
+        """
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError) as e:
+            self.errors += 1
+            logger.warning(f"Ignoring malformed cache invalidation: {e}")
+            return 0
+        if not isinstance(message, dict) or message.get('origin') == self.node_id:
+            return 0
+        self.received += 1
+        return self._deliver(message)
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        if self.running:
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._listen, args=(self._stop_event,), name="cache-invalidation", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Cache invalidation listener subscribed to '{self.channel}'")
+
+    def stop(self) -> None:
+        """Stop the listener thread (it exits within a second)."""
+        self._stop_event.set()
+        self._thread = None
+
+    def _listen(self, stop_event: threading.Event) -> None:
+        """Receive invalidations until stopped, resubscribing after failures."""
+        lost = False
+        while not stop_event.is_set():
+            pubsub = None
+            node, client = self.redis_cache._route(self.channel, "subscribe", read=False)
+            if client is None:
+                lost = True
+                stop_event.wait(RECONNECT_DELAY)
+                continue
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                self.redis_cache._node_ok(node)
+                if lost:
+                    # Messages sent while unsubscribed are gone
+                    self._deliver({'origin': self.node_id, 'resync': True})
+                    lost = False
+                while not stop_event.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None and message.get('type') == 'message':
+                        self.handle(message['data'])
+            except Exception as e:
+                self.redis_cache._node_failed(node, "subscribe", e)
+                self.errors += 1
+                lost = True
+                logger.warning(f"Cache invalidation listener failed, resubscribing: {e}")
+                stop_event.wait(RECONNECT_DELAY)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Bus counters and listener state."""
+        stats = super().stats()
+        stats['channel'] = self.channel
+        stats['running'] = self.running
+        return stats
+
+
+class NearCache:
+    """
+    Evicts L1 entries named by invalidations on a bus.
+
+    Patterns are matched against the string keys of the in-process caches.
+    Host caches (shared memory, disk) have no key listing and receive only
+    exact-key evictions; pattern purges of those tiers are up to their owner.
+    """
+
+    def __init__(self, caches: Iterable[Any], bus: LocalInvalidationBus,
+                 host_caches: Iterable[Any] = (), max_registrations: Optional[int] = None):
+        """
+        Args:
+            caches: In-process caches (EphemerisCache or ShardedEphemerisCache)
+            bus: Invalidation bus to subscribe to
+            host_caches: Further caches sharing the L1 keys (e.g. SharedMemoryCache, DiskCache)
+            max_registrations: Registrations kept before pruning; defaults to the caches' capacity
+        """
+        self.caches = list(caches)
+        self.host_caches = list(host_caches)
+        self.bus = bus
+        self.max_registrations = max_registrations or sum(
+            getattr(cache, 'max_size', 1000) for cache in self.caches
+        )
+        # Redis key -> L1 keys mirroring it
+        self._registry: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.messages = 0
+        bus.subscribe(self.handle)
+
+    def register(self, key: str, remote_key: str) -> None:
+        """Record that the L1 entry ``key`` mirrors the Redis key ``remote_key``."""
+        with self._lock:
+            self._registry.setdefault(remote_key, set()).add(key)
+            if len(self._registry) > 2 * self.max_registrations:
+                self._prune()
+
+    def _prune(self) -> None:
+        """Drop registrations of evicted entries, then the oldest, down to capacity (lock held)."""
+        for remote_key, keys in list(self._registry.items()):
+            keys = {key for key in keys if any(key in cache for cache in self.caches)}
+            if keys:
+                self._registry[remote_key] = keys
+            else:
+                del self._registry[remote_key]
+        excess = len(self._registry) - self.max_registrations
+        for remote_key in list(self._registry)[:max(excess, 0)]:
+            del self._registry[remote_key]
+
+    def invalidate(self, keys: Iterable[str] = (), patterns: Iterable[str] = (),
+                   remote_keys: Iterable[str] = (), remote_patterns: Iterable[str] = (),
+                   **fields: Any) -> int:
+        """
+        Broadcast an invalidation to every near cache on the bus, this one included.
+
+        Returns:
+            Number of entries evicted in this process
+        """
+        return self.bus.publish(keys, patterns, remote_keys, remote_patterns, **fields)
+
+    def handle(self, message: Dict[str, Any]) -> int:
+        """
+        Evict the entries an invalidation message names.
+
+        Args:
+            message: Bus message with ``keys``, ``patterns``, ``remote_keys``,
+                ``remote_patterns`` and optionally ``resync``
+
+        Returns:
+            Number of entries evicted
+        """
+        keys = set(message.get('keys') or ())
+        remote_keys = set(message.get('remote_keys') or ())
+        remote_patterns = message.get('remote_patterns') or ()
+        patterns = message.get('patterns') or ()
+        with self._lock:
+            self.messages += 1
+            if message.get('resync'):
+                remote_keys = set(self._registry)
+            elif remote_patterns:
+                remote_keys.update(
+                    remote_key for remote_key in self._registry
+                    if any(fnmatchcase(remote_key, pattern) for pattern in remote_patterns)
+                )
+            for remote_key in remote_keys:
+                keys.update(self._registry.pop(remote_key, ()))
+
+        evicted = 0
+        for key in keys:
+            evicted += sum(bool(cache.invalidate(key)) for cache in self.caches)
+            for cache in self.host_caches:
+                if cache.enabled:
+                    cache.invalidate(key)
+        for pattern in patterns:
+            evicted += sum(evict_matching(cache, pattern) for cache in self.caches)
+        self.evictions += evicted
+        return evicted
+
+    def close(self) -> None:
+        """Unsubscribe from the bus."""
+        self.bus.unsubscribe(self.handle)
+
+    def stats(self) -> Dict[str, Any]:
+        """Registration and eviction counters."""
+        with self._lock:
+            registrations = len(self._registry)
+        return {
+            'registrations': registrations,
+            'max_registrations': self.max_registrations,
+            'messages': self.messages,
+            'evictions': self.evictions,
+            'bus': self.bus.stats()
+        }
+
+
+# Global invalidation bus
+_invalidation_bus: Optional[LocalInvalidationBus] = None
+_invalidation_bus_lock = threading.Lock()
+
+
+def get_invalidation_bus() -> Optional[LocalInvalidationBus]:
+    """
+    Get the process's invalidation bus from settings: Redis pub/sub, the local stand-in, or none.
+
+    The Redis cache publishes its deletes on the bus, so L1 entries
+    registered against deleted keys are evicted everywhere.
+    """
+    global _invalidation_bus
+    backend = settings.near_cache
+    if backend not in ('redis', 'local'):
+        return None
+    with _invalidation_bus_lock:
+        if _invalidation_bus is None:
+            from .redis_cache import get_redis_cache
+            redis_cache = get_redis_cache()
+            if backend == 'redis' and redis_cache.enabled:
+                bus = RedisInvalidationBus(redis_cache, settings.near_cache_channel)
+                bus.start()
+            else:
+                if backend == 'redis':
+                    logger.warning("Redis unavailable, near cache invalidations stay in this process")
+                bus = LocalInvalidationBus()
+            redis_cache.invalidation_bus = bus
+            _invalidation_bus = bus
+        return _invalidation_bus
+
+
+def stop_invalidation_bus() -> None:
+    """Stop the global bus's listener, if one was started."""
+    bus = _invalidation_bus
+    if isinstance(bus, RedisInvalidationBus):
+        bus.stop()
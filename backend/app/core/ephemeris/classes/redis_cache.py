@@ -3,32 +3,111 @@ Redis-based caching implementation for ephemeris calculations.
 
 This module provides a high-performance Redis cache for storing
 calculation results with intelligent cache warming and invalidation.
+Values are encoded with a versioned codec (see `cache_codec`); entries in
+other formats are treated as misses. Keys can be sharded over several
+Redis nodes by consistent hashing (see `hash_ring`); operations on a node
+are bounded by latency budgets and skipped while its circuit breaker is
+open (see `circuit_breaker`). Deletes are announced on the near-cache
+invalidation bus, when one is attached, so workers drop their in-process
+copies (see `near_cache`). Bulk operations (`get_many`, `set_many`,
+`mget_results`, `mset_results`) take one MGET or pipeline round trip per
+node and chunk of keys.
+
+Async routes use the asyncio API (`aget`, `aget_with_refresh`, `aset`,
+`amget`), which talks to the nodes through `redis.asyncio` clients with
+their own connection pools instead of blocking the event loop on a socket.
+The synchronous API stays for scripts, workers and tests.
 """
 
+import asyncio
 import json
 import hashlib
 import logging
-from typing import Any, Optional, Dict, List, Union
+import time
+from typing import Any, Callable, NamedTuple, Optional, Dict, List, Tuple, Union
 from datetime import datetime, timedelta
-import pickle
-import gzip
 
 try:
     import redis
+    import redis.asyncio as aioredis
     from redis.connection import ConnectionPool
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
     redis = None
+    aioredis = None
 
+from .cache import should_refresh_early
+from .circuit_breaker import CLOSED, STATE_VALUES, CircuitBreaker
+from .hash_ring import HashRing
+from .cache_codec import BinaryCodec, CacheCodec, CodecError, create_codec, decode_entry, parse_compression
 from ..settings import settings
+from ...monitoring.metrics import get_metrics
 
 
 logger = logging.getLogger(__name__)
 
+# Errors that count towards opening a node's circuit breaker (others are per-command):
+# exceeding the latency budget (socket timeout) and losing the connection
+_NODE_ERRORS = (
+    (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError, OSError) if REDIS_AVAILABLE else (OSError,)
+)
+
+
+class CachedEntry(NamedTuple):
+    """A lookup by `get_with_refresh`: the value (None on a miss), whether to refresh it early, and its metadata."""
+    value: Any
+    refresh: bool = False
+    # Compute cost in seconds and Unix expiry, None if the entry does not carry them
+    cost: Optional[float] = None
+    expires_at: Optional[float] = None
+
+
+_MISS = CachedEntry(None)
+
+
+def _report_breaker_state(node: str, state: str) -> None:
+    """Export a node's circuit breaker state."""
+    get_metrics().update_redis_circuit_state(node, STATE_VALUES[state])
+
 
 class RedisCache:
-    """High-performance Redis cache for ephemeris calculations."""
+    """
+    High-performance Redis cache for ephemeris calculations.
+    
+    Keys are spread over one or more Redis nodes with a consistent hash ring,
+    each node with its own connection pools.
+    
+    Every operation has a latency budget. Reads and writes use separate pools
+    whose socket timeouts are the read and write budgets, so a slow or
+    partitioned node costs a request at most one budget before it falls back
+    to computing.
+    
+    Each node has a circuit breaker that opens after consecutive timeouts or
+    connection failures. While it is open, the node's keys miss without
+    touching the network, and a background probe closes it once the node
+    answers again.
+    
+    Pub/sub channels and single-flight lease keys are placed on the ring like
+    cache keys and go through `_route`, so they are skipped while their
+    node's breaker is open. ``client`` is the first node's client, used for
+    health checks and INFO and by instances without a ring.
+    """
+    
+    # Defaults for instances built without __init__; __init__ applies settings
+    codec: CacheCodec = BinaryCodec()
+    allow_pickle: bool = False
+    # Near-cache bus announcing deletes; attached by `get_invalidation_bus`
+    invalidation_bus = None
+    # Without a ring every key goes to ``client``
+    ring: Optional[HashRing] = None
+    # Builds (write, read) asyncio clients per node; without it the asyncio
+    # API runs the synchronous one in a worker thread
+    _async_factory: Optional[Callable[[], Tuple[Dict[str, Any], Dict[str, Any]]]] = None
+    # (event loop, write clients, read clients) of the loop that opened them
+    _async_state: Optional[Tuple[Any, Dict[str, Any], Dict[str, Any]]] = None
+    # Keys per MGET or pipeline in bulk operations
+    batch_chunk_size: int = 50
     
     def __init__(self, 
                  host: str = "localhost",
@@ -38,8 +117,35 @@ class RedisCache:
                  socket_timeout: float = 5.0,
                  socket_connect_timeout: float = 5.0,
                  max_connections: int = 10,
-                 decode_responses: bool = False):
-        
+                 decode_responses: bool = False,
+                 nodes: Optional[List[str]] = None,
+                 virtual_nodes: int = 160,
+                 read_timeout: Optional[float] = None,
+                 failure_threshold: int = 3,
+                 probe_interval: float = 1.0):
+        """
+        Args:
+            host: Redis host when ``nodes`` is not given
+            port: Redis port when ``nodes`` is not given
+            db: Database number on every node
+            password: Password for every node
+            socket_timeout: Latency budget of writes (and of reads without ``read_timeout``) in seconds
+            socket_connect_timeout: Connect timeout in seconds
+            max_connections: Size of each connection pool (two per node)
+            decode_responses: Decode replies to str
+            nodes: Shard nodes as "host:port"; keys are spread over them by consistent hashing
+            virtual_nodes: Ring points per node
+            read_timeout: Latency budget of reads in seconds
+            failure_threshold: Consecutive timeouts or connection failures that open a node's breaker
+            probe_interval: Seconds between probes of a node whose breaker is open
+        """
+        self.codec = create_codec(
+            settings.cache_codec,
+            compression=parse_compression(settings.cache_codec_compression),
+            default_compression=settings.cache_codec_default_compression
+        )
+        self.allow_pickle = settings.cache_codec_allow_pickle
+        self.batch_chunk_size = settings.redis_batch_chunk_size
         self.enabled = REDIS_AVAILABLE and settings.enable_redis_cache
         
         if not self.enabled:
@@ -47,34 +153,213 @@ class RedisCache:
             return
         
         try:
-            # Create connection pool for better performance
-            self.pool = ConnectionPool(
-                host=host,
-                port=port,
-                db=db,
-                password=password,
-                socket_timeout=socket_timeout,
+            clients, read_clients = {}, {}
+            for node in nodes or [f"{host}:{port}"]:
+                node_host, _, node_port = node.rpartition(":")
+                for node_clients, timeout in ((clients, socket_timeout),
+                                              (read_clients, read_timeout or socket_timeout)):
+                    # Create connection pool for better performance; a retry
+                    # would double the latency budget
+                    pool = ConnectionPool(
+                        host=node_host,
+                        port=int(node_port),
+                        db=db,
+                        password=password,
+                        socket_timeout=timeout,
+                        socket_connect_timeout=socket_connect_timeout,
+                        max_connections=max_connections,
+                        decode_responses=decode_responses,
+                        retry_on_timeout=False
+                    )
+                    node_clients[node] = redis.Redis(connection_pool=pool)
+            
+            self._init_nodes(clients, read_clients, virtual_nodes, failure_threshold, probe_interval)
+            self.pool = self.client.connection_pool
+            self._async_factory = lambda: self._connect_async(
+                list(clients), db=db, password=password, write_timeout=socket_timeout,
+                read_timeout=read_timeout or socket_timeout,
                 socket_connect_timeout=socket_connect_timeout,
-                max_connections=max_connections,
-                decode_responses=decode_responses,
-                retry_on_timeout=True
+                max_connections=max_connections, decode_responses=decode_responses
             )
             
-            self.client = redis.Redis(connection_pool=self.pool)
-            
-            # Test connection
-            self.client.ping()
-            logger.info(f"Redis cache connected successfully to {host}:{port}")
-            
-            # Cache statistics
-            self.hits = 0
-            self.misses = 0
-            self.errors = 0
+            # Test connections; unreachable nodes stay on the ring (so their
+            # keys do not move) with their breaker open until they answer
+            reachable = [node for node in clients if self._ping_node(node)]
+            if not reachable:
+                raise ConnectionError(f"no Redis node reachable ({', '.join(clients)})")
+            for node in clients:
+                if node not in reachable:
+                    self.breakers[node].trip()
+            logger.info(f"Redis cache connected successfully to {', '.join(reachable)}")
             
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             self.enabled = False
     
+    @classmethod
+    def from_clients(cls, clients: Dict[str, Any], read_clients: Optional[Dict[str, Any]] = None,
+                     virtual_nodes: int = 160, failure_threshold: int = 3,
+                     probe_interval: float = 1.0,
+                     async_clients: Optional[Dict[str, Any]] = None) -> "RedisCache":
+        """
+        Build a cache over existing clients (one per shard node) without connecting.
+        
+        Args:
+            clients: Node name -> Redis client for writes, in ring order
+            read_clients: Node name -> Redis client for reads (defaults to ``clients``)
+            virtual_nodes: Ring points per node
+            failure_threshold: Consecutive failures that open a node's breaker
+            probe_interval: Seconds between probes of a node whose breaker is open
+            async_clients: Node name -> asyncio Redis client for the asyncio API
+                (without them it runs the synchronous API in a worker thread)
+        """
+        cache = cls.__new__(cls)
+        cache.enabled = bool(clients)
+        cache._init_nodes(clients, read_clients or clients, virtual_nodes, failure_threshold, probe_interval)
+        if async_clients is not None:
+            cache._async_factory = lambda: (async_clients, async_clients)
+        return cache
+    
+    def _init_nodes(self, clients: Dict[str, Any], read_clients: Dict[str, Any], virtual_nodes: int,
+                    failure_threshold: int, probe_interval: float) -> None:
+        """Set up the ring, per-node clients and circuit breakers."""
+        self.clients = dict(clients)
+        self.read_clients = dict(read_clients)
+        self.client = next(iter(self.clients.values()), None)
+        self.ring = HashRing(self.clients, virtual_nodes=virtual_nodes)
+        self.breakers = {
+            node: CircuitBreaker(
+                node,
+                probe=lambda node=node: bool(self.read_clients[node].ping()),
+                failure_threshold=failure_threshold,
+                probe_interval=probe_interval,
+                on_state_change=_report_breaker_state
+            )
+            for node in self.clients
+        }
+        for node in self.clients:
+            _report_breaker_state(node, CLOSED)
+        
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+    
+    @property
+    def nodes(self) -> List[str]:
+        """Shard node names."""
+        return self.ring.nodes if self.ring is not None else []
+    
+    def _route(self, key: str, operation: str, read: bool = True) -> Tuple[Optional[str], Optional[Any]]:
+        """Node owning a key and its client; the client is None while the node's breaker is open."""
+        if self.ring is None:
+            return None, self.client
+        node = self.ring.get_node(key)
+        return node, self._node_client(node, operation, read)
+    
+    def _node_client(self, node: Optional[str], operation: str, read: bool = True) -> Optional[Any]:
+        """A node's read or write client, or None (a skipped operation) while its breaker is open."""
+        if node is None:
+            return self.client
+        if not self.breakers[node].allow():
+            get_metrics().record_redis_skip(node, operation)
+            return None
+        return (self.read_clients if read else self.clients)[node]
+    
+    def _group_by_node(self, keys: List[str]) -> Dict[Optional[str], List[int]]:
+        """Indexes of ``keys`` grouped by owning node."""
+        if self.ring is None:
+            return {None: list(range(len(keys)))}
+        groups: Dict[Optional[str], List[int]] = {}
+        for index, key in enumerate(keys):
+            groups.setdefault(self.ring.get_node(key), []).append(index)
+        return groups
+    
+    def _node_ok(self, node: Optional[str]) -> None:
+        """Record a completed operation (resets the breaker's failure count)."""
+        if node is not None:
+            self.breakers[node].record_success()
+    
+    def _node_failed(self, node: Optional[str], operation: str, error: Exception) -> None:
+        """Count an error; timeouts and connection failures count towards opening the breaker."""
+        self.errors += 1
+        if node is None or not isinstance(error, _NODE_ERRORS):
+            return
+        get_metrics().record_redis_failure(node, operation)
+        self.breakers[node].record_failure()
+    
+    def _ping_node(self, node: str) -> bool:
+        """Ping one node within the read budget, tracking its health."""
+        try:
+            healthy = bool(self.read_clients[node].ping())
+            self._node_ok(node)
+            return healthy
+        except Exception as e:
+            self._node_failed(node, "ping", e)
+            return False
+    
+    def ping(self) -> bool:
+        """Whether at least one node answers."""
+        if not self.enabled:
+            return False
+        if self.ring is None:
+            try:
+                return bool(self.client.ping())
+            except Exception:
+                return False
+        return any([self._ping_node(node) for node in self.clients])
+    
+    def node_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-node circuit breaker state and counters."""
+        return {node: self.breakers[node].stats() for node in self.nodes}
+    
+    @staticmethod
+    def _connect_async(nodes: List[str], write_timeout: float, read_timeout: float,
+                       **pool_kwargs) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Asyncio write and read clients per node, with the budgets of the synchronous pools."""
+        clients, read_clients = {}, {}
+        for node in nodes:
+            node_host, _, node_port = node.rpartition(":")
+            for node_clients, timeout in ((clients, write_timeout), (read_clients, read_timeout)):
+                pool = aioredis.ConnectionPool(
+                    host=node_host,
+                    port=int(node_port),
+                    socket_timeout=timeout,
+                    retry_on_timeout=False,
+                    **pool_kwargs
+                )
+                node_clients[node] = aioredis.Redis(connection_pool=pool)
+        return clients, read_clients
+    
+    def _async_clients(self) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """(write, read) asyncio clients for the running event loop, or None without asyncio support."""
+        if self._async_factory is None or self.ring is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._async_state is None or self._async_state[0] is not loop:
+            # asyncio connections are bound to the loop that opened them
+            self._async_state = (loop, *self._async_factory())
+        return self._async_state[1], self._async_state[2]
+    
+    def _async_node_client(self, node: str, operation: str, read: bool = True) -> Optional[Any]:
+        """A node's asyncio read or write client, or None (a skipped operation) while its breaker is open."""
+        if not self.breakers[node].allow():
+            get_metrics().record_redis_skip(node, operation)
+            return None
+        clients, read_clients = self._async_clients()
+        return (read_clients if read else clients)[node]
+    
+    async def aclose(self) -> None:
+        """Close the asyncio connection pools opened on the running event loop."""
+        state, self._async_state = self._async_state, None
+        if state is None or state[0] is not asyncio.get_running_loop():
+            return
+        for client in {id(client): client for client in (*state[1].values(), *state[2].values())}.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"Closing asyncio Redis client failed: {e}")
+    
     def _generate_cache_key(self, prefix: str, data: Dict[str, Any]) -> str:
         """Generate a consistent cache key from data."""
         # Sort keys for consistent hashing
@@ -82,123 +367,585 @@ class RedisCache:
         key_hash = hashlib.md5(sorted_data.encode()).hexdigest()
         return f"{prefix}:{key_hash}"
     
-    def _serialize_value(self, value: Any) -> bytes:
-        """Serialize value for storage."""
-        try:
-            # Use pickle for Python objects, compress for larger data
-            pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
-            
-            # Compress if data is large
-            if len(pickled) > 1024:  # 1KB threshold
-                compressed = gzip.compress(pickled)
-                # Add marker to indicate compression
-                return b'COMPRESSED:' + compressed
-            else:
-                return b'RAW:' + pickled
-        except Exception as e:
-            logger.error(f"Failed to serialize cache value: {e}")
-            raise
+    def cache_key(self, prefix: str, data: Dict[str, Any]) -> str:
+        """Redis key under which ``data`` is stored (for registering near-cache entries)."""
+        return self._generate_cache_key(prefix, data)
+    
+    def _serialize_value(self, value: Any, prefix: Optional[str] = None) -> bytes:
+        """Encode a value for storage; the key prefix selects the compressor."""
+        return self.codec.encode(value, prefix)
+    
+    def _serialize_entry(self, value: Any, cost: float, expires_at: float,
+                         prefix: Optional[str] = None) -> bytes:
+        """Encode a value with XFetch metadata (compute cost and expiry)."""
+        return self.codec.encode(value, prefix, cost=cost, expires_at=expires_at)
+    
+    def _deserialize_entry(self, data: bytes) -> Tuple[Any, Optional[float], Optional[float]]:
+        """
+        Decode a stored value to (value, cost, expires_at); metadata is None if absent.
+        
+        Raises:
+            CodecError: If the entry is stale (another format version) or unreadable
+        """
+        return decode_entry(data, allow_pickle=self.allow_pickle)
     
     def _deserialize_value(self, data: bytes) -> Any:
-        """Deserialize value from storage."""
-        try:
-            if data.startswith(b'COMPRESSED:'):
-                decompressed = gzip.decompress(data[11:])  # Remove 'COMPRESSED:' prefix
-                return pickle.loads(decompressed)
-            elif data.startswith(b'RAW:'):
-                return pickle.loads(data[4:])  # Remove 'RAW:' prefix
-            else:
-                # Legacy format
-                return pickle.loads(data)
-        except Exception as e:
-            logger.error(f"Failed to deserialize cache value: {e}")
-            raise
+        """Decode a stored value (raises CodecError for stale or unreadable entries)."""
+        return decode_entry(data, allow_pickle=self.allow_pickle).value
     
     def get(self, prefix: str, data: Dict[str, Any]) -> Optional[Any]:
         """Get cached value."""
         if not self.enabled:
             return None
         
+        key = self._generate_cache_key(prefix, data)
+        node, client = self._route(key, "get")
+        if client is None:
+            self.misses += 1
+            return None
+        
         try:
-            key = self._generate_cache_key(prefix, data)
-            cached_data = self.client.get(key)
+            cached_data = client.get(key)
+            self._node_ok(node)
             
             if cached_data is None:
                 self.misses += 1
                 return None
             
+            value = self._deserialize_value(cached_data)
             self.hits += 1
-            return self._deserialize_value(cached_data)
+            return value
             
+        except CodecError as e:
+            self.misses += 1
+            logger.debug(f"Ignoring unreadable Redis cache entry: {e}")
+            return None
         except Exception as e:
-            self.errors += 1
+            self._node_failed(node, "get", e)
             logger.error(f"Redis cache get error: {e}")
             return None
     
+    def get_with_refresh(self, prefix: str, data: Dict[str, Any],
+                         beta: float = 1.0) -> CachedEntry:
+        """
+        Get cached value and whether this caller should refresh it early.
+        
+        Entries stored with a compute cost are subject to probabilistic early
+        expiration (XFetch). A caller whose draw fires must also win a short
+        refresh claim, so exactly one requester refreshes while the others
+        keep receiving the still-valid value.
+        
+        Args:
+            prefix: Key prefix
+            data: Key data
+            beta: XFetch eagerness (0 disables early refresh)
+            
+        Returns:
+            CachedEntry with the value (None on a miss), refresh, and the
+            entry's cost and expiry, so callers can copy it to memory for
+            no longer than it lives in Redis
+        """
+        if not self.enabled:
+            return _MISS
+        
+        key = self._generate_cache_key(prefix, data)
+        node, client = self._route(key, "get")
+        if client is None:
+            self.misses += 1
+            return _MISS
+        
+        try:
+            cached_data = client.get(key)
+            self._node_ok(node)
+            
+            if cached_data is None:
+                self.misses += 1
+                return _MISS
+            
+            value, cost, expires_at = self._deserialize_entry(cached_data)
+            self.hits += 1
+            refresh = (
+                should_refresh_early(cost, expires_at, beta)
+                and self._claim_key(f"{key}:refresh", max(1.0, 2 * cost))
+            )
+            return CachedEntry(value, refresh, cost, expires_at)
+            
+        except CodecError as e:
+            self.misses += 1
+            logger.debug(f"Ignoring unreadable Redis cache entry: {e}")
+            return _MISS
+        except Exception as e:
+            self._node_failed(node, "get", e)
+            logger.error(f"Redis cache get error: {e}")
+            return _MISS
+    
+    def claim_refresh(self, prefix: str, data: Dict[str, Any], hold: float) -> bool:
+        """Claim the right to refresh an entry for ``hold`` seconds (one claimant across workers)."""
+        if not self.enabled:
+            return False
+        return self._claim_key(f"{self._generate_cache_key(prefix, data)}:refresh", hold)
+    
+    def _claim_key(self, claim_key: str, hold: float) -> bool:
+        """SET NX PX a claim key; True if this caller took it."""
+        node, client = self._route(claim_key, "claim", read=False)
+        if client is None:
+            return False
+        try:
+            claimed = bool(client.set(claim_key, b'1', nx=True, px=int(hold * 1000)))
+            self._node_ok(node)
+            return claimed
+        except Exception as e:
+            self._node_failed(node, "claim", e)
+            logger.error(f"Redis cache claim error: {e}")
+            return False
+    
     def set(self, prefix: str, data: Dict[str, Any], value: Any, 
-            ttl: Optional[int] = None) -> bool:
-        """Set cached value with optional TTL."""
+            ttl: Optional[int] = None, cost: Optional[float] = None) -> bool:
+        """
+        Set cached value with optional TTL.
+        
+        With a TTL the entry carries its expiry, and its compute cost
+        (seconds) if given, for `get_with_refresh` (XFetch and promotion to
+        memory with the remaining TTL).
+        """
         if not self.enabled:
             return False
         
+        key = self._generate_cache_key(prefix, data)
+        node, client = self._route(key, "set", read=False)
+        if client is None:
+            return False
+        
         try:
-            key = self._generate_cache_key(prefix, data)
-            serialized_value = self._serialize_value(value)
+            if ttl:
+                serialized_value = self._serialize_entry(value, cost, time.time() + ttl, prefix)
+            else:
+                serialized_value = self._serialize_value(value, prefix)
             
             if ttl:
-                result = self.client.setex(key, ttl, serialized_value)
+                result = client.setex(key, ttl, serialized_value)
             else:
-                result = self.client.set(key, serialized_value)
+                result = client.set(key, serialized_value)
+            self._node_ok(node)
             
             return bool(result)
             
+        except Exception as e:
+            self._node_failed(node, "set", e)
+            logger.error(f"Redis cache set error: {e}")
+            return False
+    
+    def get_many(self, prefix: str, data_list: List[Dict[str, Any]],
+                 chunk_size: Optional[int] = None) -> List[Optional[Any]]:
+        """Get several cached values with one MGET round trip per node and chunk of keys.
+        
+        Returns values in the order of ``data_list``, None for misses.
+        """
+        if not self.enabled or not data_list:
+            return [None] * len(data_list)
+        
+        keys = [self._generate_cache_key(prefix, data) for data in data_list]
+        return self._decode_many(self._mget(keys, "get_many", chunk_size))
+    
+    def _chunks(self, indexes: List[int], chunk_size: Optional[int]) -> List[List[int]]:
+        """Split indexes into chunks of ``chunk_size`` (default ``batch_chunk_size``)."""
+        size = max(1, chunk_size or self.batch_chunk_size)
+        return [indexes[start:start + size] for start in range(0, len(indexes), size)]
+    
+    def _mget(self, keys: List[str], operation: str, chunk_size: Optional[int] = None) -> List[Optional[bytes]]:
+        """Raw values of ``keys`` with one MGET per node and chunk; None for misses and skipped nodes."""
+        cached: List[Optional[bytes]] = [None] * len(keys)
+        for node, indexes in self._group_by_node(keys).items():
+            client = self._node_client(node, operation)
+            if client is None:
+                continue
+            for chunk in self._chunks(indexes, chunk_size):
+                try:
+                    for index, cached_data in zip(chunk, client.mget([keys[i] for i in chunk])):
+                        cached[index] = cached_data
+                    self._node_ok(node)
+                except Exception as e:
+                    # The node's remaining chunks would most likely fail the same way
+                    self._node_failed(node, operation, e)
+                    logger.error(f"Redis cache {operation} error: {e}")
+                    break
+        return cached
+    
+    def _decode_many(self, cached: List[Optional[bytes]]) -> List[Optional[Any]]:
+        """Decode MGET replies, counting hits and misses (unreadable entries miss)."""
+        values = []
+        for cached_data in cached:
+            value = None
+            if cached_data is not None:
+                try:
+                    value = self._deserialize_value(cached_data)
+                except CodecError as e:
+                    logger.debug(f"Ignoring unreadable Redis cache entry: {e}")
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            values.append(value)
+        return values
+    
+    def mget_results(self, prefix: str, data_list: List[Dict[str, Any]], beta: float = 1.0,
+                     chunk_size: Optional[int] = None) -> List[CachedEntry]:
+        """
+        Bulk `get_with_refresh`: one MGET per node and chunk of keys.
+        
+        The refresh claims of entries due for early refresh are pipelined,
+        one round trip per node, so each is still handed to a single caller.
+        
+        Args:
+            prefix: Key prefix
+            data_list: Key data per item
+            beta: XFetch eagerness (0 disables early refresh)
+            chunk_size: Keys per MGET (default ``batch_chunk_size``)
+            
+        Returns:
+            CachedEntry per item, in the order of ``data_list``
+        """
+        if not self.enabled or not data_list:
+            return [_MISS] * len(data_list)
+        
+        keys = [self._generate_cache_key(prefix, data) for data in data_list]
+        results: List[CachedEntry] = []
+        due: List[Tuple[int, str, float]] = []
+        for index, cached_data in enumerate(self._mget(keys, "mget_results", chunk_size)):
+            entry = None
+            if cached_data is not None:
+                try:
+                    entry = self._deserialize_entry(cached_data)
+                except CodecError as e:
+                    logger.debug(f"Ignoring unreadable Redis cache entry: {e}")
+            if entry is None:
+                self.misses += 1
+                results.append(_MISS)
+                continue
+            
+            value, cost, expires_at = entry
+            self.hits += 1
+            results.append(CachedEntry(value, False, cost, expires_at))
+            if should_refresh_early(cost, expires_at, beta):
+                due.append((index, f"{keys[index]}:refresh", max(1.0, 2 * cost)))
+        
+        claims = self._claim_keys([(claim_key, hold) for _, claim_key, hold in due])
+        for (index, _, _), claimed in zip(due, claims):
+            results[index] = results[index]._replace(refresh=claimed)
+        return results
+    
+    def _claim_keys(self, claims: List[Tuple[str, float]]) -> List[bool]:
+        """`_claim_key` for several (claim key, hold) pairs with one pipeline per node."""
+        claimed = [False] * len(claims)
+        if not claims:
+            return claimed
+        for node, indexes in self._group_by_node([claim_key for claim_key, _ in claims]).items():
+            client = self._node_client(node, "claim", read=False)
+            if client is None:
+                continue
+            try:
+                pipe = client.pipeline(transaction=False)
+                for index in indexes:
+                    claim_key, hold = claims[index]
+                    pipe.set(claim_key, b'1', nx=True, px=int(hold * 1000))
+                for index, reply in zip(indexes, pipe.execute()):
+                    claimed[index] = bool(reply)
+                self._node_ok(node)
+            except Exception as e:
+                self._node_failed(node, "claim", e)
+                logger.error(f"Redis cache claim error: {e}")
+        return claimed
+    
+    def set_many(self, prefix: str, items: List[tuple], ttl: Optional[int] = None,
+                 chunk_size: Optional[int] = None) -> bool:
+        """Set several (data, value) pairs with one pipelined round trip per node and chunk."""
+        if not self.enabled or not items:
+            return False
+        
+        try:
+            payloads = [self._serialize_value(value, prefix) for _, value in items]
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Redis cache set_many error: {e}")
+            return False
+        keys = [self._generate_cache_key(prefix, data) for data, _ in items]
+        return self._pipeline_set(keys, payloads, ttl, "set_many", chunk_size)
+    
+    def mset_results(self, prefix: str, items: List[Tuple[Dict[str, Any], Any, Optional[float]]],
+                     ttl: Optional[int] = None, chunk_size: Optional[int] = None) -> bool:
+        """
+        Bulk `set`: (data, value, compute cost) triples written with one
+        pipelined round trip per node and chunk of keys.
+        
+        With a TTL, entries carry their expiry and cost for `mget_results`.
+        
+        Returns:
+            True if every item was stored
+        """
+        if not self.enabled or not items:
+            return False
+        
+        try:
+            expires_at = time.time() + ttl if ttl else None
+            payloads = [
+                self._serialize_entry(value, cost, expires_at, prefix) if ttl
+                else self._serialize_value(value, prefix)
+                for _, value, cost in items
+            ]
         except Exception as e:
             self.errors += 1
+            logger.error(f"Redis cache mset_results error: {e}")
+            return False
+        keys = [self._generate_cache_key(prefix, data) for data, _, _ in items]
+        return self._pipeline_set(keys, payloads, ttl, "mset_results", chunk_size)
+    
+    def _pipeline_set(self, keys: List[str], payloads: List[bytes], ttl: Optional[int],
+                      operation: str, chunk_size: Optional[int] = None) -> bool:
+        """SET (or SETEX with a TTL) encoded values with one pipeline per node and chunk."""
+        stored = True
+        for node, indexes in self._group_by_node(keys).items():
+            client = self._node_client(node, operation, read=False)
+            if client is None:
+                stored = False
+                continue
+            for chunk in self._chunks(indexes, chunk_size):
+                try:
+                    pipe = client.pipeline(transaction=False)
+                    for index in chunk:
+                        if ttl:
+                            pipe.setex(keys[index], ttl, payloads[index])
+                        else:
+                            pipe.set(keys[index], payloads[index])
+                    
+                    stored = all(pipe.execute()) and stored
+                    self._node_ok(node)
+                    
+                except Exception as e:
+                    self._node_failed(node, operation, e)
+                    logger.error(f"Redis cache {operation} error: {e}")
+                    stored = False
+                    break
+        return stored
+    
+    async def aget(self, prefix: str, data: Dict[str, Any]) -> Optional[Any]:
+        """Asyncio version of `get`."""
+        if not self.enabled:
+            return None
+        if self._async_clients() is None:
+            return await asyncio.to_thread(self.get, prefix, data)
+        
+        key = self._generate_cache_key(prefix, data)
+        node = self.ring.get_node(key)
+        client = self._async_node_client(node, "get")
+        if client is None:
+            self.misses += 1
+            return None
+        
+        try:
+            cached_data = await client.get(key)
+            self._node_ok(node)
+            
+            if cached_data is None:
+                self.misses += 1
+                return None
+            
+            value = self._deserialize_value(cached_data)
+            self.hits += 1
+            return value
+            
+        except CodecError as e:
+            self.misses += 1
+            logger.debug(f"Ignoring unreadable Redis cache entry: {e}")
+            return None
+        except Exception as e:
+            self._node_failed(node, "get", e)
+            logger.error(f"Redis cache get error: {e}")
+            return None
+    
+    async def aget_with_refresh(self, prefix: str, data: Dict[str, Any],
+                                beta: float = 1.0) -> CachedEntry:
+        """Asyncio version of `get_with_refresh`."""
+        if not self.enabled:
+            return _MISS
+        if self._async_clients() is None:
+            return await asyncio.to_thread(self.get_with_refresh, prefix, data, beta)
+        
+        key = self._generate_cache_key(prefix, data)
+        node = self.ring.get_node(key)
+        client = self._async_node_client(node, "get")
+        if client is None:
+            self.misses += 1
+            return _MISS
+        
+        try:
+            cached_data = await client.get(key)
+            self._node_ok(node)
+            
+            if cached_data is None:
+                self.misses += 1
+                return _MISS
+            
+            value, cost, expires_at = self._deserialize_entry(cached_data)
+            self.hits += 1
+            refresh = (
+                should_refresh_early(cost, expires_at, beta)
+                and await self._aclaim_key(f"{key}:refresh", max(1.0, 2 * cost))
+            )
+            return CachedEntry(value, refresh, cost, expires_at)
+            
+        except CodecError as e:
+            self.misses += 1
+            logger.debug(f"Ignoring unreadable Redis cache entry: {e}")
+            return _MISS
+        except Exception as e:
+            self._node_failed(node, "get", e)
+            logger.error(f"Redis cache get error: {e}")
+            return _MISS
+    
+    async def _aclaim_key(self, claim_key: str, hold: float) -> bool:
+        """Asyncio version of `_claim_key`."""
+        node = self.ring.get_node(claim_key)
+        client = self._async_node_client(node, "claim", read=False)
+        if client is None:
+            return False
+        try:
+            claimed = bool(await client.set(claim_key, b'1', nx=True, px=int(hold * 1000)))
+            self._node_ok(node)
+            return claimed
+        except Exception as e:
+            self._node_failed(node, "claim", e)
+            logger.error(f"Redis cache claim error: {e}")
+            return False
+    
+    async def aset(self, prefix: str, data: Dict[str, Any], value: Any,
+                   ttl: Optional[int] = None, cost: Optional[float] = None) -> bool:
+        """Asyncio version of `set`."""
+        if not self.enabled:
+            return False
+        if self._async_clients() is None:
+            return await asyncio.to_thread(self.set, prefix, data, value, ttl, cost)
+        
+        key = self._generate_cache_key(prefix, data)
+        node = self.ring.get_node(key)
+        client = self._async_node_client(node, "set", read=False)
+        if client is None:
+            return False
+        
+        try:
+            if ttl:
+                serialized_value = self._serialize_entry(value, cost, time.time() + ttl, prefix)
+            else:
+                serialized_value = self._serialize_value(value, prefix)
+            
+            if ttl:
+                result = await client.setex(key, ttl, serialized_value)
+            else:
+                result = await client.set(key, serialized_value)
+            self._node_ok(node)
+            
+            return bool(result)
+            
+        except Exception as e:
+            self._node_failed(node, "set", e)
             logger.error(f"Redis cache set error: {e}")
             return False
     
+    async def amget(self, prefix: str, data_list: List[Dict[str, Any]],
+                    chunk_size: Optional[int] = None) -> List[Optional[Any]]:
+        """Asyncio version of `get_many`; the nodes are read concurrently."""
+        if not self.enabled or not data_list:
+            return [None] * len(data_list)
+        if self._async_clients() is None:
+            return await asyncio.to_thread(self.get_many, prefix, data_list, chunk_size)
+        
+        keys = [self._generate_cache_key(prefix, data) for data in data_list]
+        cached: List[Optional[bytes]] = [None] * len(keys)
+        
+        async def mget(node: str, indexes: List[int]) -> None:
+            client = self._async_node_client(node, "get_many")
+            if client is None:
+                return
+            for chunk in self._chunks(indexes, chunk_size):
+                try:
+                    for index, cached_data in zip(chunk, await client.mget([keys[i] for i in chunk])):
+                        cached[index] = cached_data
+                    self._node_ok(node)
+                except Exception as e:
+                    self._node_failed(node, "get_many", e)
+                    logger.error(f"Redis cache get_many error: {e}")
+                    break
+        
+        await asyncio.gather(*(mget(node, indexes) for node, indexes in self._group_by_node(keys).items()))
+        return self._decode_many(cached)
+    
     def delete(self, prefix: str, data: Dict[str, Any]) -> bool:
-        """Delete cached value."""
+        """Delete cached value (and every worker's near-cache copy of it)."""
+        key = self._generate_cache_key(prefix, data)
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(remote_keys=[key])
+        
         if not self.enabled:
             return False
         
+        node, client = self._route(key, "delete", read=False)
+        if client is None:
+            return False
+        
         try:
-            key = self._generate_cache_key(prefix, data)
-            result = self.client.delete(key)
+            result = client.delete(key)
+            self._node_ok(node)
             return bool(result)
             
         except Exception as e:
-            self.errors += 1
+            self._node_failed(node, "delete", e)
             logger.error(f"Redis cache delete error: {e}")
             return False
     
     def delete_pattern(self, pattern: str) -> int:
-        """Delete all keys matching pattern."""
+        """Delete all keys matching pattern on every node (and every worker's near-cache copies)."""
+        if self.invalidation_bus is not None:
+            self.invalidation_bus.publish(remote_patterns=[pattern])
+        
         if not self.enabled:
             return 0
         
-        try:
-            keys = self.client.keys(pattern)
-            if keys:
-                return self.client.delete(*keys)
-            return 0
-            
-        except Exception as e:
-            self.errors += 1
-            logger.error(f"Redis cache delete pattern error: {e}")
-            return 0
+        deleted = 0
+        for node, client in self._node_clients("delete_pattern"):
+            try:
+                keys = client.keys(pattern)
+                if keys:
+                    deleted += client.delete(*keys)
+                self._node_ok(node)
+                
+            except Exception as e:
+                self._node_failed(node, "delete_pattern", e)
+                logger.error(f"Redis cache delete pattern error: {e}")
+        return deleted
+    
+    def _node_clients(self, operation: str) -> List[Tuple[Optional[str], Any]]:
+        """(node, write client) for every node whose breaker is closed."""
+        if self.ring is None:
+            return [(None, self.client)]
+        return [(node, client) for node in self.clients
+                if (client := self._node_client(node, operation, read=False)) is not None]
     
     def exists(self, prefix: str, data: Dict[str, Any]) -> bool:
         """Check if key exists in cache."""
         if not self.enabled:
             return False
         
+        key = self._generate_cache_key(prefix, data)
+        node, client = self._route(key, "exists")
+        if client is None:
+            return False
+        
         try:
-            key = self._generate_cache_key(prefix, data)
-            return bool(self.client.exists(key))
+            found = bool(client.exists(key))
+            self._node_ok(node)
+            return found
             
         except Exception as e:
-            self.errors += 1
+            self._node_failed(node, "exists", e)
             logger.error(f"Redis cache exists error: {e}")
             return False
     
@@ -207,30 +954,39 @@ class RedisCache:
         if not self.enabled:
             return None
         
+        key = self._generate_cache_key(prefix, data)
+        node, client = self._route(key, "ttl")
+        if client is None:
+            return None
+        
         try:
-            key = self._generate_cache_key(prefix, data)
-            ttl = self.client.ttl(key)
+            ttl = client.ttl(key)
+            self._node_ok(node)
             return ttl if ttl >= 0 else None
             
         except Exception as e:
-            self.errors += 1
+            self._node_failed(node, "ttl", e)
             logger.error(f"Redis cache TTL error: {e}")
             return None
     
     def clear_all(self) -> bool:
-        """Clear all cached data (use with caution)."""
+        """Clear all cached data on every node (use with caution)."""
         if not self.enabled:
             return False
         
-        try:
-            self.client.flushdb()
+        cleared = True
+        for node, client in self._node_clients("clear_all"):
+            try:
+                client.flushdb()
+                self._node_ok(node)
+                
+            except Exception as e:
+                self._node_failed(node, "clear_all", e)
+                logger.error(f"Redis cache clear error: {e}")
+                cleared = False
+        if cleared:
             logger.info("Redis cache cleared successfully")
-            return True
-            
-        except Exception as e:
-            self.errors += 1
-            logger.error(f"Redis cache clear error: {e}")
-            return False
+        return cleared
     
     def get_info(self) -> Dict[str, Any]:
         """Get cache information and statistics."""
@@ -253,14 +1009,15 @@ class RedisCache:
                     "keyspace_misses": redis_info.get("keyspace_misses"),
                     "total_commands_processed": redis_info.get("total_commands_processed"),
                     "instantaneous_ops_per_sec": redis_info.get("instantaneous_ops_per_sec")
-                }
+                },
+                "nodes": self.node_stats()
             }
             return cache_stats
             
         except Exception as e:
-            self.errors += 1
+            self._node_failed(self.nodes[0] if self.nodes else None, "info", e)
             logger.error(f"Redis cache info error: {e}")
-            return {"enabled": True, "error": str(e)}
+            return {"enabled": True, "error": str(e), "nodes": self.node_stats()}
 
 
 class CacheWarmer:
@@ -399,6 +1156,14 @@ def get_redis_cache() -> RedisCache:
             port=getattr(settings, 'redis_port', 6379),
             db=getattr(settings, 'redis_db', 0),
             password=getattr(settings, 'redis_password', None),
+            socket_timeout=settings.redis_write_timeout,
+            socket_connect_timeout=settings.redis_connect_timeout,
+            max_connections=settings.redis_max_connections,
+            nodes=[node.strip() for node in settings.redis_nodes.split(',') if node.strip()] or None,
+            virtual_nodes=settings.redis_virtual_nodes,
+            read_timeout=settings.redis_read_timeout,
+            failure_threshold=settings.redis_breaker_failure_threshold,
+            probe_interval=settings.redis_breaker_probe_interval
         )
     return _redis_cache
 
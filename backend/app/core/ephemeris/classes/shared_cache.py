@@ -0,0 +1,659 @@
+"""
+Meridian Ephemeris Engine - Shared Memory Cache
+
+Cache tier shared by all worker processes on a host, so a result computed
+by one uvicorn worker is a hit for the others and is stored once per host
+instead of once per worker.
+
+The cache lives in a memory-mapped file (on tmpfs, e.g. ``/dev/shm``, it
+is plain shared memory) laid out as:
+
+    header | size-class table | page owners | slot table | arena of pages
+
+- The slot table is an open-addressing hash table (linear probing, keys
+  hashed with BLAKE2b so every process agrees). Each slot holds the key
+  hash, expiry, lengths and the offset of the chunk holding key and value.
+- The arena is split into fixed-size pages. A slab allocator hands pages to
+  size classes (chunk sizes growing by ``GROWTH_FACTOR``) on demand and
+  keeps a free list per class. When a class has no free chunk and no page
+  is left, a CLOCK hand over the class's chunks evicts an expired or not
+  recently read entry; a class left without any page takes one (emptied)
+  from the class owning the most.
+- Readers take no lock. Every slot has a sequence counter (a seqlock):
+  writers make it odd while changing the slot or its chunk and even again
+  afterwards; readers copy the slot and chunk bytes and retry if the
+  counter was odd or changed meanwhile. Freeing a chunk always updates its
+  slot's counter, so a reader racing with chunk reuse also retries.
+- Writers serialize on a thread lock plus an ``flock`` on the file.
+
+Values are stored encoded with the cache codec (see `cache_codec`), so a
+hit costs one copy of the entry's bytes and a decode, with no calculation.
+"""
+
+import fcntl
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Tuple
+
+from .cache_codec import CacheCodec, CodecError, DecodedEntry, create_codec, decode_entry, parse_compression
+from ..settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'MSHC'
+LAYOUT_VERSION = 1
+
+# Smallest chunk and the ratio between consecutive size classes
+MIN_CHUNK_SIZE = 256
+GROWTH_FACTOR = 1.25
+
+# Slots probed before giving up on a lookup or displacing an entry
+MAX_PROBE = 32
+
+# Times a reader retries a slot being written before reporting a miss
+MAX_READ_RETRIES = 16
+
+# magic, version, classes, slots, page size, pages, next free page, arena offset, entries, used bytes
+_HEADER = struct.Struct('<4sHHIIIIQQQ')
+_HEADER_SIZE = 64
+_COUNTS_OFFSET = 32  # entries and used bytes
+_COUNTS = struct.Struct('<QQ')
+_NEXT_PAGE_OFFSET = 20
+_NEXT_PAGE = struct.Struct('<I')
+
+# chunk size, pages owned, free list head (offset + 1, 0 when empty), clock hand (page, chunk)
+_CLASS = struct.Struct('<IIQII')
+
+# seq, hash, chunk offset, expires_at (NaN when none), key length, value length, state, referenced
+_SLOT = struct.Struct('<QQQdIIBB')
+_SLOT_SIZE = 64
+_SEQ = struct.Struct('<Q')
+_STATE_OFFSET = 40
+_REFERENCED_OFFSET = 41
+
+# owning slot (FREE when unallocated), next free chunk (offset + 1)
+_CHUNK = struct.Struct('<IxxxxQ')
+_CHUNK_HEADER_SIZE = _CHUNK.size
+
+EMPTY = 0
+FULL = 1
+TOMBSTONE = 2
+
+FREE = 0xFFFFFFFF
+_UNOWNED = 0xFF
+
+
+def _align(value: int, alignment: int) -> int:
+    return (value + alignment - 1) // alignment * alignment
+
+
+def _chunk_sizes(page_size: int) -> list:
+    """Size classes from MIN_CHUNK_SIZE up to a whole page."""
+    sizes = []
+    size = MIN_CHUNK_SIZE
+    while size < page_size and len(sizes) < _UNOWNED - 1:
+        sizes.append(size)
+        size = _align(int(size * GROWTH_FACTOR), 8)
+    sizes.append(page_size)
+    return sizes
+
+
+def key_hash(key: str) -> int:
+    """64-bit key hash, identical in every process (unlike ``hash``)."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little')
+
+
+class SharedMemoryCache:
+    """Memory-mapped cache shared by the worker processes on a host."""
+
+    def __init__(self, path: Optional[str], size_bytes: int = 256 * 1024 * 1024, slots: int = 65536,
+                 page_size: int = 4 * 1024 * 1024, default_ttl: Optional[float] = 3600,
+                 codec: Optional[CacheCodec] = None, allow_pickle: bool = False) -> None:
+        """
+        Open or create the cache.
+
+        The first process creates and formats the file; later processes
+        attach to it and use its geometry, even if their arguments differ.
+
+        Args:
+            path: Backing file, ideally on tmpfs (None or empty disables the cache)
+            size_bytes: Arena size for entries (rounded down to whole pages)
+            slots: Hash table slots (rounded up to a power of two)
+            page_size: Slab page size, which is also the largest storable entry
+            default_ttl: Default TTL in seconds (None for no expiration)
+            codec: Entry codec (the configured codec if None)
+            allow_pickle: Whether pickle-encoded entries may be decoded
+        """
+        self.path = path or None
+        self.default_ttl = default_ttl
+        self.codec = codec if codec is not None else create_codec(
+            settings.cache_codec,
+            compression=parse_compression(settings.cache_codec_compression),
+            default_compression=settings.cache_codec_default_compression
+        )
+        self.allow_pickle = allow_pickle
+        self._thread_lock = threading.Lock()
+        self._lock_file = None
+        self._lock_pid = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+        self.enabled = self.path is not None
+        if not self.enabled:
+            return
+
+        try:
+            self._open(size_bytes, slots, page_size)
+            logger.info(f"Shared memory cache attached at {self.path} ({self._slots} slots, {self._pages} pages)")
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to open shared memory cache at {self.path}: {e}")
+            self.enabled = False
+
+    # Layout
+
+    def _open(self, size_bytes: int, slots: int, page_size: int) -> None:
+        if page_size < MIN_CHUNK_SIZE:
+            raise ValueError(f"page_size must be at least {MIN_CHUNK_SIZE}")
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._write_lock():
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                file_size = os.fstat(fd).st_size
+                header = os.pread(fd, _HEADER.size, 0) if file_size >= _HEADER_SIZE else b''
+                if header[:4] == MAGIC and _HEADER.unpack(header)[1] == LAYOUT_VERSION:
+                    _, _, _, slots, page_size, pages, _, _, _, _ = _HEADER.unpack(header)
+                    self._map(fd, slots, page_size, pages, file_size)
+                else:
+                    slots = 1 << max(slots - 1, 1).bit_length()
+                    pages = max(size_bytes // page_size, 1)
+                    length = self._layout(slots, page_size, pages)
+                    os.ftruncate(fd, 0)
+                    os.ftruncate(fd, length)
+                    self._map(fd, slots, page_size, pages, length)
+                    self._format()
+            finally:
+                os.close(fd)
+
+    def _layout(self, slots: int, page_size: int, pages: int) -> int:
+        """Compute region offsets; returns the total file length."""
+        self._slots = slots
+        self._mask = slots - 1
+        self._page_size = page_size
+        self._pages = pages
+        self._chunk_sizes = _chunk_sizes(page_size)
+        self._classes_offset = _HEADER_SIZE
+        self._owners_offset = self._classes_offset + len(self._chunk_sizes) * _CLASS.size
+        self._slots_offset = _align(self._owners_offset + pages, _SLOT_SIZE)
+        self._arena_offset = _align(self._slots_offset + slots * _SLOT_SIZE, mmap.PAGESIZE)
+        return self._arena_offset + pages * page_size
+
+    def _map(self, fd: int, slots: int, page_size: int, pages: int, file_size: int) -> None:
+        length = self._layout(slots, page_size, pages)
+        if file_size < length:
+            raise ValueError(f"Shared cache file {self.path} is truncated")
+        self._mm = mmap.mmap(fd, length)
+
+    def _format(self) -> None:
+        """Write an empty cache (caller holds the write lock)."""
+        mm = self._mm
+        mm[:self._arena_offset] = bytes(self._arena_offset)
+        _HEADER.pack_into(
+            mm, 0, MAGIC, LAYOUT_VERSION, len(self._chunk_sizes), self._slots, self._page_size,
+            self._pages, 0, self._arena_offset, 0, 0
+        )
+        for index, chunk_size in enumerate(self._chunk_sizes):
+            _CLASS.pack_into(mm, self._classes_offset + index * _CLASS.size, chunk_size, 0, 0, 0, 0)
+        mm[self._owners_offset:self._owners_offset + self._pages] = bytes([_UNOWNED]) * self._pages
+
+    # Locking
+
+    @contextmanager
+    def _write_lock(self):
+        """Thread lock plus an exclusive flock, reopened after a fork."""
+        with self._thread_lock:
+            if self._lock_file is None or self._lock_pid != os.getpid():
+                self._lock_file = open(self.path + ".lock", "a+b")
+                self._lock_pid = os.getpid()
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    # Slots
+
+    def _slot_offset(self, index: int) -> int:
+        return self._slots_offset + index * _SLOT_SIZE
+
+    def _read_slot(self, index: int) -> Tuple[int, int, int, float, int, int, int, int]:
+        return _SLOT.unpack_from(self._mm, self._slot_offset(index))
+
+    def _bump(self, index: int) -> None:
+        offset = self._slot_offset(index)
+        _SEQ.pack_into(self._mm, offset, _SEQ.unpack_from(self._mm, offset)[0] + 1)
+
+    def _write_slot(self, index: int, hashed: int, chunk: int, expires_at: float,
+                    key_length: int, value_length: int, state: int) -> None:
+        offset = self._slot_offset(index)
+        seq = _SEQ.unpack_from(self._mm, offset)[0]
+        _SLOT.pack_into(self._mm, offset, seq, hashed, chunk, expires_at, key_length, value_length, state, 0)
+
+    def _find(self, key_bytes: bytes, hashed: int) -> Optional[int]:
+        """Slot index holding a key (caller holds the write lock)."""
+        mm = self._mm
+        for probe in range(MAX_PROBE):
+            index = (hashed + probe) & self._mask
+            _, slot_hash, chunk, _, key_length, _, state, _ = self._read_slot(index)
+            if state == EMPTY:
+                return None
+            if state == FULL and slot_hash == hashed:
+                start = chunk + _CHUNK_HEADER_SIZE
+                if mm[start:start + key_length] == key_bytes:
+                    return index
+        return None
+
+    def _remove_slot(self, index: int) -> None:
+        """Tombstone a slot and free its chunk (caller holds the write lock)."""
+        _, _, chunk, _, key_length, value_length, state, _ = self._read_slot(index)
+        if state != FULL:
+            return
+        self._bump(index)
+        self._mm[self._slot_offset(index) + _STATE_OFFSET] = TOMBSTONE
+        self._bump(index)
+        self._free_chunk(chunk)
+        self._add_counts(-1, -(key_length + value_length))
+
+    def _add_counts(self, entries: int, used: int) -> None:
+        count, used_bytes = _COUNTS.unpack_from(self._mm, _COUNTS_OFFSET)
+        _COUNTS.pack_into(self._mm, _COUNTS_OFFSET, count + entries, used_bytes + used)
+
+    # Slab allocator
+
+    def _class_for(self, length: int) -> Optional[int]:
+        for index, chunk_size in enumerate(self._chunk_sizes):
+            if chunk_size - _CHUNK_HEADER_SIZE >= length:
+                return index
+        return None
+
+    def _class_offset(self, class_index: int) -> int:
+        return self._classes_offset + class_index * _CLASS.size
+
+    def _chunk_class(self, chunk: int) -> int:
+        page = (chunk - self._arena_offset) // self._page_size
+        return self._mm[self._owners_offset + page]
+
+    def _free_chunk(self, chunk: int) -> None:
+        class_index = self._chunk_class(chunk)
+        offset = self._class_offset(class_index)
+        chunk_size, owned, free_head, hand_page, hand_chunk = _CLASS.unpack_from(self._mm, offset)
+        _CHUNK.pack_into(self._mm, chunk, FREE, free_head)
+        _CLASS.pack_into(self._mm, offset, chunk_size, owned, chunk + 1, hand_page, hand_chunk)
+
+    def _allocate(self, class_index: int) -> Optional[int]:
+        """Chunk offset from the class's free list, a new page, or by eviction."""
+        offset = self._class_offset(class_index)
+        chunk_size, owned, free_head, hand_page, hand_chunk = _CLASS.unpack_from(self._mm, offset)
+        if not free_head:
+            next_page = _NEXT_PAGE.unpack_from(self._mm, _NEXT_PAGE_OFFSET)[0]
+            if next_page < self._pages:
+                self._assign_page(class_index, next_page)
+                _NEXT_PAGE.pack_into(self._mm, _NEXT_PAGE_OFFSET, next_page + 1)
+            elif owned:
+                self._evict_one(class_index)
+            elif not self._reassign_page(class_index):
+                return None
+            chunk_size, owned, free_head, hand_page, hand_chunk = _CLASS.unpack_from(self._mm, offset)
+            if not free_head:
+                return None
+        chunk = free_head - 1
+        next_free = _CHUNK.unpack_from(self._mm, chunk)[1]
+        _CLASS.pack_into(self._mm, offset, chunk_size, owned, next_free, hand_page, hand_chunk)
+        return chunk
+
+    def _assign_page(self, class_index: int, page: int) -> None:
+        """Carve a page into chunks on the class's free list."""
+        offset = self._class_offset(class_index)
+        chunk_size, owned, free_head, hand_page, hand_chunk = _CLASS.unpack_from(self._mm, offset)
+        self._mm[self._owners_offset + page] = class_index
+        page_start = self._arena_offset + page * self._page_size
+        for index in reversed(range(self._page_size // chunk_size)):
+            chunk = page_start + index * chunk_size
+            _CHUNK.pack_into(self._mm, chunk, FREE, free_head)
+            free_head = chunk + 1
+        _CLASS.pack_into(self._mm, offset, chunk_size, owned + 1, free_head, hand_page, hand_chunk)
+
+    def _reassign_page(self, class_index: int) -> bool:
+        """
+        Move a page to a class that owns none, from the class owning the most.
+
+        The page's entries are evicted and its chunks unlinked from the
+        donor's free list.
+        """
+        owned_by = [_CLASS.unpack_from(self._mm, self._class_offset(index))[1]
+                    for index in range(len(self._chunk_sizes))]
+        donor = max(range(len(owned_by)), key=owned_by.__getitem__)
+        if not owned_by[donor]:
+            return False
+        donor_offset = self._class_offset(donor)
+        chunk_size = _CLASS.unpack_from(self._mm, donor_offset)[0]
+        # Start at a different page each time so no page is always the one taken
+        start = int(time.monotonic() * 1000) % self._pages
+        page = next(
+            (start + step) % self._pages for step in range(self._pages)
+            if self._mm[self._owners_offset + (start + step) % self._pages] == donor
+        )
+        page_start = self._arena_offset + page * self._page_size
+        page_end = page_start + self._page_size
+        for chunk in range(page_start, page_start + self._page_size // chunk_size * chunk_size, chunk_size):
+            slot = _CHUNK.unpack_from(self._mm, chunk)[0]
+            if slot != FREE:
+                self._remove_slot(slot)
+                self.evictions += 1
+
+        # Unlink the page's chunks from the donor's free list
+        chunk_size, owned, free_head, hand_page, hand_chunk = _CLASS.unpack_from(self._mm, donor_offset)
+        head, tail = 0, None
+        link = free_head
+        while link:
+            chunk = link - 1
+            link = _CHUNK.unpack_from(self._mm, chunk)[1]
+            if page_start <= chunk < page_end:
+                continue
+            if tail is None:
+                head = chunk + 1
+            else:
+                _CHUNK.pack_into(self._mm, tail, FREE, chunk + 1)
+            tail = chunk
+        if tail is not None:
+            _CHUNK.pack_into(self._mm, tail, FREE, 0)
+        _CLASS.pack_into(self._mm, donor_offset, chunk_size, owned - 1, head, hand_page, hand_chunk)
+        self._mm[self._owners_offset + page] = _UNOWNED
+        self._assign_page(class_index, page)
+        return True
+
+    def _evict_one(self, class_index: int) -> None:
+        """Advance the class's CLOCK hand to an expired or unreferenced entry and evict it."""
+        offset = self._class_offset(class_index)
+        chunk_size, owned, _, hand_page, hand_chunk = _CLASS.unpack_from(self._mm, offset)
+        per_page = self._page_size // chunk_size
+        now = time.time()
+        # Two sweeps: the first clears reference bits, the second must find a victim
+        for _ in range(2 * (self._pages + owned * per_page) + 1):
+            if hand_chunk >= per_page:
+                hand_page, hand_chunk = (hand_page + 1) % self._pages, 0
+            if self._mm[self._owners_offset + hand_page] != class_index:
+                hand_page, hand_chunk = (hand_page + 1) % self._pages, 0
+                continue
+            chunk = self._arena_offset + hand_page * self._page_size + hand_chunk * chunk_size
+            hand_chunk += 1
+            slot = _CHUNK.unpack_from(self._mm, chunk)[0]
+            if slot == FREE:
+                continue
+            _, _, _, expires_at, _, _, _, referenced = self._read_slot(slot)
+            if referenced and not expires_at <= now:
+                self._mm[self._slot_offset(slot) + _REFERENCED_OFFSET] = 0
+                continue
+            self._remove_slot(slot)
+            self.evictions += 1
+            break
+        chunk_size, owned, free_head, _, _ = _CLASS.unpack_from(self._mm, offset)
+        _CLASS.pack_into(self._mm, offset, chunk_size, owned, free_head, hand_page, hand_chunk)
+
+    # Public API
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None on a miss."""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[DecodedEntry]:
+        """
+        Get an entry with its compute cost and expiry, without locking.
+
+        Unreadable entries (another codec format version) are misses.
+
+        Returns:
+            DecodedEntry (value, cost, expires_at) or None on a miss
+        """
+        data = self._read(key)
+        if data is not None:
+            try:
+                entry = decode_entry(data, allow_pickle=self.allow_pickle)
+                self.hits += 1
+                return entry
+            except CodecError:
+                pass
+        self.misses += 1
+        return None
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """Get an entry's encoded bytes (one consistent copy), or None on a miss."""
+        data = self._read(key)
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    def _read(self, key: str) -> Optional[bytes]:
+        """Seqlock read of a live entry's encoded bytes."""
+        if not self.enabled:
+            return None
+        key_bytes = key.encode()
+        hashed = key_hash(key)
+        mm = self._mm
+        for probe in range(MAX_PROBE):
+            index = (hashed + probe) & self._mask
+            offset = self._slot_offset(index)
+            for _ in range(MAX_READ_RETRIES):
+                seq, slot_hash, chunk, expires_at, key_length, value_length, state, _ = _SLOT.unpack_from(mm, offset)
+                if seq & 1:
+                    # Let the writer finish
+                    time.sleep(0)
+                    continue
+                stored_key = data = None
+                if state == FULL and slot_hash == hashed:
+                    start = chunk + _CHUNK_HEADER_SIZE
+                    stored_key = mm[start:start + key_length]
+                    if stored_key == key_bytes:
+                        data = mm[start + key_length:start + key_length + value_length]
+                if _SEQ.unpack_from(mm, offset)[0] == seq:
+                    break
+            else:
+                # Kept busy by writers: report a miss rather than spin
+                return None
+            if state == EMPTY:
+                return None
+            if data is None:
+                continue
+            if expires_at <= time.time():
+                return None
+            mm[offset + _REFERENCED_OFFSET] = 1
+            return data
+        return None
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None, cost: float = 0.0,
+            entry_class: Optional[str] = None) -> bool:
+        """
+        Store a value, replacing any entry for the key.
+
+        Args:
+            key: Cache key
+            value: Value the codec can encode
+            ttl: Time-to-live in seconds (default_ttl if None)
+            cost: Seconds the value took to compute
+            entry_class: Entry class selecting the compressor
+
+        Returns:
+            True if stored, False if the value cannot be encoded or no chunk is
+            large enough (or available) for it
+        """
+        if not self.enabled:
+            return False
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+        try:
+            data = self.codec.encode(value, entry_class, cost=cost, expires_at=expires_at)
+        except CodecError as e:
+            logger.debug(f"Shared cache cannot encode {key}: {e}")
+            return False
+        return self.put_bytes(key, data, expires_at)
+
+    def put_bytes(self, key: str, data: bytes, expires_at: Optional[float] = None) -> bool:
+        """Store an already encoded entry (see `put`)."""
+        if not self.enabled:
+            return False
+        key_bytes = key.encode()
+        hashed = key_hash(key)
+        length = len(key_bytes) + len(data)
+        class_index = self._class_for(length)
+
+        with self._write_lock():
+            chunk = self._allocate(class_index) if class_index is not None else None
+            # Found after allocating, which may have evicted the key's current entry
+            existing = self._find(key_bytes, hashed)
+            if chunk is None:
+                if existing is not None:
+                    self._remove_slot(existing)
+                self.rejections += 1
+                return False
+
+            start = chunk + _CHUNK_HEADER_SIZE
+            self._mm[start:start + length] = key_bytes + data
+            if existing is not None:
+                # Swap the chunk in place, so readers see the old or the new value
+                index = existing
+                _, _, old_chunk, _, old_key_length, old_value_length, _, _ = self._read_slot(index)
+            else:
+                index = self._insert_slot(hashed)
+            self._bump(index)
+            _CHUNK.pack_into(self._mm, chunk, index, 0)
+            self._write_slot(
+                index, hashed, chunk, expires_at if expires_at is not None else math.nan,
+                len(key_bytes), len(data), FULL
+            )
+            self._bump(index)
+            if existing is not None:
+                self._free_chunk(old_chunk)
+                self._add_counts(0, length - old_key_length - old_value_length)
+            else:
+                self._add_counts(1, length)
+            return True
+
+    def _insert_slot(self, hashed: int) -> int:
+        """Free slot on the key's probe sequence, displacing an entry if none is free."""
+        for probe in range(MAX_PROBE):
+            index = (hashed + probe) & self._mask
+            if self._mm[self._slot_offset(index) + _STATE_OFFSET] != FULL:
+                return index
+        index = hashed & self._mask
+        self._remove_slot(index)
+        self.evictions += 1
+        return index
+
+    def invalidate(self, key: str) -> bool:
+        """Remove a specific key."""
+        if not self.enabled:
+            return False
+        with self._write_lock():
+            index = self._find(key.encode(), key_hash(key))
+            if index is None:
+                return False
+            self._remove_slot(index)
+            return True
+
+    def clear(self) -> None:
+        """Remove all entries (for every process)."""
+        if not self.enabled:
+            return
+        with self._write_lock():
+            for index in range(self._slots):
+                state_offset = self._slot_offset(index) + _STATE_OFFSET
+                if self._mm[state_offset] == FULL:
+                    # Sequence counters survive, so racing readers see the change
+                    self._bump(index)
+                    self._mm[state_offset] = EMPTY
+                    self._bump(index)
+                else:
+                    self._mm[state_offset] = EMPTY
+            _COUNTS.pack_into(self._mm, _COUNTS_OFFSET, 0, 0)
+            _NEXT_PAGE.pack_into(self._mm, _NEXT_PAGE_OFFSET, 0)
+            for index, chunk_size in enumerate(self._chunk_sizes):
+                _CLASS.pack_into(self._mm, self._class_offset(index), chunk_size, 0, 0, 0, 0)
+            self._mm[self._owners_offset:self._owners_offset + self._pages] = bytes([_UNOWNED]) * self._pages
+
+    def size(self) -> int:
+        """Get the number of entries (including expired ones not yet evicted)."""
+        if not self.enabled:
+            return 0
+        return _COUNTS.unpack_from(self._mm, _COUNTS_OFFSET)[0]
+
+    def size_bytes(self) -> int:
+        """Get the stored size of all keys and encoded values in bytes."""
+        if not self.enabled:
+            return 0
+        return _COUNTS.unpack_from(self._mm, _COUNTS_OFFSET)[1]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics (hits and misses are this process's)."""
+        total_requests = self.hits + self.misses
+        stats = {
+            'enabled': self.enabled,
+            'path': self.path,
+            'size': self.size(),
+            'bytes': self.size_bytes(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'rejections': self.rejections,
+            'hit_rate': self.hits / total_requests if total_requests > 0 else 0.0,
+            'total_requests': total_requests
+        }
+        if self.enabled:
+            stats.update({
+                'slots': self._slots,
+                'capacity_bytes': self._pages * self._page_size,
+                'pages_assigned': _NEXT_PAGE.unpack_from(self._mm, _NEXT_PAGE_OFFSET)[0],
+                'max_entry_bytes': self._page_size - _CHUNK_HEADER_SIZE
+            })
+        return stats
+
+    def close(self) -> None:
+        """Unmap the cache (the file and other processes' mappings remain)."""
+        if self.enabled:
+            self._mm.close()
+            self.enabled = False
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+# Global shared memory cache instance
+_shared_cache: Optional[SharedMemoryCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> SharedMemoryCache:
+    """Get this process's view of the host's shared cache (disabled unless SHARED_CACHE_PATH is set)."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = SharedMemoryCache(
+                    settings.shared_cache_path,
+                    size_bytes=settings.shared_cache_bytes,
+                    slots=settings.shared_cache_slots,
+                    page_size=settings.shared_cache_page_bytes,
+                    default_ttl=settings.cache_ttl,
+                    allow_pickle=settings.cache_codec_allow_pickle
+                )
+    return _shared_cache
@@ -0,0 +1,383 @@
+"""
+Meridian Ephemeris Engine - Request Coalescing
+
+Single-flight execution for expensive calculations: concurrent calls with the
+same key share one in-progress computation instead of each running it.
+
+Within a process the first caller for a key (the leader) computes, and later
+callers block until its result or exception is available. Across workers an
+optional lease extends this: the leader holds a short-lived lease on the key
+and publishes its result under it, and callers in other workers that find the
+lease held poll for the published result instead of recomputing. If the lease
+is released or expires without a result (the leader failed), a waiter takes
+over; if the wait exceeds its timeout, the waiter computes itself.
+
+Lease backends:
+
+- `RedisLease`: ``SET NX PX`` with a compare-and-delete release, results
+  stored next to the lease with the same TTL
+- `LocalLease`: in-process stand-in with the same semantics, used when Redis
+  is unavailable and in tests
+"""
+
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from ..settings import settings
+
+T = TypeVar('T')
+
+# Upper bound for the backoff while polling for another worker's result
+MAX_POLL_INTERVAL = 0.5
+
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class LocalLease:
+    """In-process lease backend with expiring leases and published results."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._leases: Dict[str, Tuple[str, float]] = {}
+        self._results: Dict[str, Tuple[Any, float]] = {}
+
+    def acquire(self, key: str, token: str, ttl: float) -> bool:
+        """Take the lease on ``key`` unless another token holds it."""
+        now = time.monotonic()
+        with self._lock:
+            holder = self._leases.get(key)
+            if holder is not None and holder[1] > now:
+                return False
+            self._leases[key] = (token, now + ttl)
+            return True
+
+    def release(self, key: str, token: str) -> None:
+        """Release the lease if ``token`` still holds it."""
+        with self._lock:
+            holder = self._leases.get(key)
+            if holder is not None and holder[0] == token:
+                del self._leases[key]
+
+    def held(self, key: str) -> bool:
+        """Whether an unexpired lease exists on ``key``."""
+        with self._lock:
+            holder = self._leases.get(key)
+            return holder is not None and holder[1] > time.monotonic()
+
+    def publish(self, key: str, value: Any, ttl: float) -> None:
+        """Store a result for waiters."""
+        with self._lock:
+            self._results[key] = (value, time.monotonic() + ttl)
+
+    def result(self, key: str) -> Optional[Any]:
+        """Published result for ``key``, or None."""
+        now = time.monotonic()
+        with self._lock:
+            # Drop expired results while we hold the lock
+            for expired in [k for k, (_, expires) in self._results.items() if expires <= now]:
+                del self._results[expired]
+            entry = self._results.get(key)
+            return entry[0] if entry is not None else None
+
+
+class RedisLease:
+    """
+    Lease backend shared by all workers through Redis.
+
+    A key's lease and result live on the shard node owning the lease key,
+    and every command goes through that node's circuit breaker. While the
+    breaker is open the lease counts as not held and is granted without
+    Redis, so callers compute locally instead of waiting on a failed node.
+    """
+
+    def __init__(self, redis_cache, prefix: str = "single_flight"):
+        """
+        Args:
+            redis_cache: Enabled RedisCache whose clients, breakers and serializer are used
+            prefix: Key prefix for leases and results
+        """
+        self.redis_cache = redis_cache
+        self.prefix = prefix
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _lease_key(self, key: str) -> str:
+        return f"{self.prefix}:lease:{key}"
+
+    def _result_key(self, key: str) -> str:
+        return f"{self.prefix}:result:{key}"
+
+    def _call(self, key: str, operation: str, command: Callable[[Any], Any], skipped: Any,
+              read: bool = False) -> Any:
+        """
+        Run a command on the node owning ``key``'s lease, tracking the node's health.
+
+        Returns:
+            The command's result, or ``skipped`` while the node's breaker is open
+
+        Raises:
+            Exception: Redis errors, after they are counted against the node
+        """
+        node, client = self.redis_cache._route(self._lease_key(key), operation, read=read)
+        if client is None:
+            return skipped
+        try:
+            result = command(client)
+        except Exception as e:
+            self.redis_cache._node_failed(node, operation, e)
+            raise
+        self.redis_cache._node_ok(node)
+        return result
+
+    def acquire(self, key: str, token: str, ttl: float) -> bool:
+        """Take the lease on ``key``; fails open (computes locally) on Redis errors or an open breaker."""
+        try:
+            return bool(self._call(
+                key, "lease_acquire",
+                lambda client: client.set(self._lease_key(key), token, nx=True, px=int(ttl * 1000)),
+                skipped=True
+            ))
+        except Exception as e:
+            self.logger.warning(f"Lease acquire failed, computing locally: {e}")
+            return True
+
+    def release(self, key: str, token: str) -> None:
+        """Release the lease if ``token`` still holds it."""
+        try:
+            self._call(
+                key, "lease_release",
+                lambda client: client.eval(_RELEASE_SCRIPT, 1, self._lease_key(key), token),
+                skipped=None
+            )
+        except Exception as e:
+            self.logger.warning(f"Lease release failed: {e}")
+
+    def held(self, key: str) -> bool:
+        """Whether a lease exists on ``key``."""
+        try:
+            return bool(self._call(
+                key, "lease_held", lambda client: client.exists(self._lease_key(key)), skipped=False
+            ))
+        except Exception as e:
+            self.logger.warning(f"Lease check failed: {e}")
+            return False
+
+    def publish(self, key: str, value: Any, ttl: float) -> None:
+        """Store a result for waiters in other workers."""
+        try:
+            payload = self.redis_cache._serialize_value(value)
+            self._call(
+                key, "lease_publish",
+                lambda client: client.set(self._result_key(key), payload, px=int(ttl * 1000)),
+                skipped=None
+            )
+        except Exception as e:
+            self.logger.warning(f"Result publish failed: {e}")
+
+    def result(self, key: str) -> Optional[Any]:
+        """Published result for ``key``, or None."""
+        try:
+            data = self._call(
+                key, "lease_result", lambda client: client.get(self._result_key(key)), skipped=None
+            )
+            return self.redis_cache._deserialize_value(data) if data is not None else None
+        except Exception as e:
+            self.logger.warning(f"Result fetch failed: {e}")
+            return None
+
+
+class _Call:
+    """In-progress computation shared by a leader and its followers."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent computations of the same key.
+
+    Results must not be None (None is treated as "no published result").
+    """
+
+    def __init__(
+        self,
+        name: str,
+        lease=None,
+        lease_ttl: float = 30.0,
+        wait_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+        enabled: bool = True
+    ):
+        """
+        Args:
+            name: Namespace for keys (one per calculation type)
+            lease: Optional cross-worker lease backend (RedisLease or LocalLease)
+            lease_ttl: Lease and published result lifetime in seconds
+            wait_timeout: Longest wait for another worker before computing locally
+            poll_interval: Initial poll interval for another worker's result
+            enabled: Run every call directly when False
+        """
+        self.name = name
+        self.lease = lease
+        self.lease_ttl = lease_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._stats = {
+            'leaders': 0,
+            'coalesced': 0,
+            'lease_waits': 0,
+            'lease_hits': 0,
+            'lease_timeouts': 0
+        }
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def do(self, key: str, compute: Callable[[], T]) -> T:
+        """
+        Return ``compute()``, sharing one call among concurrent callers of ``key``.
+
+        Args:
+            key: Canonical key of the computation
+            compute: Zero-argument callable performing it
+
+        Returns:
+            The leader's result
+
+        Raises:
+            Whatever the leader's computation raised
+        """
+        if not self.enabled:
+            return compute()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats['leaders'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._run(key, compute)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def _run(self, key: str, compute: Callable[[], T]) -> T:
+        """Compute as the process leader, coordinating with other workers if leased."""
+        if self.lease is None:
+            return compute()
+
+        lease_key = f"{self.name}:{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.wait_timeout
+
+        while True:
+            if self.lease.acquire(lease_key, token, self.lease_ttl):
+                try:
+                    result = compute()
+                    self.lease.publish(lease_key, result, self.lease_ttl)
+                    return result
+                finally:
+                    self.lease.release(lease_key, token)
+
+            # Another worker holds the lease: wait for its result
+            self._count('lease_waits')
+            interval = self.poll_interval
+            while True:
+                result = self.lease.result(lease_key)
+                if result is not None:
+                    self._count('lease_hits')
+                    return result
+                if not self.lease.held(lease_key):
+                    # Released or expired without a result; try to take over
+                    break
+                if time.monotonic() >= deadline:
+                    self._count('lease_timeouts')
+                    self.logger.warning(f"Timed out waiting for {lease_key}, computing locally")
+                    return compute()
+                time.sleep(interval)
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def in_flight(self) -> int:
+        """Number of keys currently being computed in this process."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """Coalescing statistics."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._calls)
+        stats['enabled'] = self.enabled
+        stats['lease'] = type(self.lease).__name__ if self.lease is not None else None
+        return stats
+
+
+# Global coalescers, one per calculation type, sharing one lease backend
+_single_flights: Dict[str, SingleFlight] = {}
+_lease_backend = None
+_single_flight_lock = threading.Lock()
+
+
+def _create_lease_backend():
+    """Lease backend from settings: Redis, the local stand-in, or none."""
+    backend = settings.single_flight_lease
+    if backend == 'redis':
+        from .redis_cache import get_redis_cache
+        redis_cache = get_redis_cache()
+        if redis_cache.enabled:
+            return RedisLease(redis_cache)
+        logging.getLogger(__name__).warning("Redis unavailable, using local single-flight lease")
+        return LocalLease()
+    if backend == 'local':
+        return LocalLease()
+    return None
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Get the global coalescer for a calculation type."""
+    global _lease_backend
+    with _single_flight_lock:
+        single_flight = _single_flights.get(name)
+        if single_flight is None:
+            if _lease_backend is None:
+                _lease_backend = _create_lease_backend()
+            single_flight = _single_flights[name] = SingleFlight(
+                name,
+                lease=_lease_backend,
+                lease_ttl=settings.single_flight_lease_ttl,
+                wait_timeout=settings.single_flight_wait_timeout,
+                enabled=settings.enable_single_flight
+            )
+        return single_flight
@@ -37,6 +37,26 @@ class EphemerisSettings:
         self.enable_cache: bool = True
         self.cache_size: int = 1000
         self.cache_ttl: int = 3600  # seconds
+        # Global cache policy: lru, tinylfu, gdsf or tinylfu-gdsf
+        self.cache_policy: str = os.environ.get('CACHE_POLICY', 'lru').lower()
+        # Budget for the estimated size of globally cached values (0 = entry count only);
+        # once exceeded, entries are evicted down to cache_low_water of the budget
+        self.cache_max_bytes: int = int(os.environ.get('CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+        self.cache_low_water: float = float(os.environ.get('CACHE_LOW_WATER', '0.9'))
+        # Independently locked segments for the global cache (1 = a single lock)
+        self.cache_shards: int = int(os.environ.get('CACHE_SHARDS', '1'))
+        
+        # House cusp cache settings
+        self.house_cache_size: int = int(os.environ.get('HOUSE_CACHE_SIZE', '10000'))
+        self.house_cache_quantum: float = float(os.environ.get('HOUSE_CACHE_QUANTUM', '1e-6'))  # degrees
+        # Comma-separated quadrant systems (P, K) served from interpolation tables
+        self.house_interpolation_systems: List[str] = [
+            code.strip().upper() for code in os.environ.get('HOUSE_INTERPOLATION_SYSTEMS', '').split(',') if code.strip()
+        ]
+        self.house_interpolation_step: float = float(os.environ.get('HOUSE_INTERPOLATION_STEP', '0.25'))  # degrees
+        # Obliquity range of the tables (degrees); the default covers roughly 1650-2300
+        self.house_interpolation_obliquity_min: float = float(os.environ.get('HOUSE_INTERPOLATION_OBLIQUITY_MIN', '23.40'))
+        self.house_interpolation_obliquity_max: float = float(os.environ.get('HOUSE_INTERPOLATION_OBLIQUITY_MAX', '23.48'))
         
         # Redis cache settings
         self.enable_redis_cache: bool = True
@@ -44,8 +64,87 @@ class EphemerisSettings:
         self.redis_port: int = int(os.environ.get('REDIS_PORT', '6379'))
         self.redis_db: int = int(os.environ.get('REDIS_DB', '0'))
         self.redis_password: Optional[str] = os.environ.get('REDIS_PASSWORD')
-        self.redis_socket_timeout: float = 5.0
-        self.redis_max_connections: int = 10
+        self.redis_max_connections: int = 10  # per node
+        # Shard nodes as "host:port,host:port"; keys are spread over them by
+        # consistent hashing (empty uses REDIS_HOST:REDIS_PORT alone). Every
+        # worker must list the same nodes.
+        self.redis_nodes: str = os.environ.get('REDIS_NODES', '')
+        self.redis_virtual_nodes: int = int(os.environ.get('REDIS_VIRTUAL_NODES', '160'))
+        # Latency budgets of cache operations: a slower node is treated as a miss
+        # rather than stalling the request. Consecutive timeouts or connection
+        # failures open the node's circuit breaker; it is skipped until a
+        # background probe gets an answer.
+        self.redis_read_timeout: float = float(os.environ.get('REDIS_READ_TIMEOUT', '0.005'))  # seconds
+        self.redis_write_timeout: float = float(os.environ.get('REDIS_WRITE_TIMEOUT', '0.05'))  # seconds
+        self.redis_connect_timeout: float = float(os.environ.get('REDIS_CONNECT_TIMEOUT', '0.05'))  # seconds
+        self.redis_breaker_failure_threshold: int = int(os.environ.get('REDIS_BREAKER_FAILURE_THRESHOLD', '3'))
+        self.redis_breaker_probe_interval: float = float(os.environ.get('REDIS_BREAKER_PROBE_INTERVAL', '1'))  # seconds
+        # Keys per MGET or pipeline in bulk operations; each chunk must arrive
+        # within the read budget, so large values call for smaller chunks
+        self.redis_batch_chunk_size: int = int(os.environ.get('REDIS_BATCH_CHUNK_SIZE', '50'))
+        # Codec for Redis and disk entries: 'binary' or 'pickle' (trusted writers only).
+        # Compression is chosen per entry class (key prefix), e.g. "acg_results=lzma".
+        self.cache_codec: str = os.environ.get('CACHE_CODEC', 'binary').lower()
+        self.cache_codec_default_compression: str = os.environ.get('CACHE_CODEC_COMPRESSION_DEFAULT', 'zlib').lower()
+        self.cache_codec_compression: str = os.environ.get('CACHE_CODEC_COMPRESSION', '')
+        self.cache_codec_allow_pickle: bool = os.environ.get('CACHE_CODEC_ALLOW_PICKLE', 'false').lower() == 'true'
+        
+        # Persistent disk cache (SQLite, shared by the worker processes on a host);
+        # an empty path disables it. On shutdown the hottest in-memory entries are
+        # snapshotted to it and on startup loaded back.
+        self.disk_cache_path: str = os.environ.get('DISK_CACHE_PATH', '')
+        self.disk_cache_max_bytes: int = int(os.environ.get('DISK_CACHE_MAX_BYTES', str(1024 * 1024 * 1024)))
+        self.disk_cache_snapshot_entries: int = int(os.environ.get('DISK_CACHE_SNAPSHOT_ENTRIES', '1000'))
+        
+        # Shared memory cache used by every worker process on a host (a file on tmpfs,
+        # e.g. /dev/shm/meridian-cache); an empty path disables it. Entries larger
+        # than a page are not stored.
+        self.shared_cache_path: str = os.environ.get('SHARED_CACHE_PATH', '')
+        self.shared_cache_bytes: int = int(os.environ.get('SHARED_CACHE_BYTES', str(256 * 1024 * 1024)))
+        self.shared_cache_slots: int = int(os.environ.get('SHARED_CACHE_SLOTS', '65536'))
+        self.shared_cache_page_bytes: int = int(os.environ.get('SHARED_CACHE_PAGE_BYTES', str(4 * 1024 * 1024)))
+        
+        # Near cache: in-process entries mirroring Redis are evicted on invalidations
+        # broadcast by every worker ('redis' pub/sub or 'local' to this process; empty
+        # disables it), so they can be kept for the long L1 TTL.
+        self.near_cache: str = os.environ.get('NEAR_CACHE', '').lower()
+        self.near_cache_channel: str = os.environ.get('NEAR_CACHE_CHANNEL', 'meridian:cache:invalidate')
+        self.near_cache_l1_ttl: float = float(os.environ.get('NEAR_CACHE_L1_TTL', '86400'))  # seconds
+        
+        # Probabilistic early expiration (XFetch) eagerness; 0 disables it
+        self.cache_xfetch_beta: float = float(os.environ.get('CACHE_XFETCH_BETA', '1.0'))
+        
+        # ACG refresh-ahead: recompute results with at least min_hits recent
+        # hits when they are within window seconds of expiring
+        self.acg_refresh_ahead_enabled: bool = os.environ.get('ACG_REFRESH_AHEAD_ENABLED', 'true').lower() == 'true'
+        self.acg_refresh_ahead_min_hits: int = int(os.environ.get('ACG_REFRESH_AHEAD_MIN_HITS', '10'))
+        self.acg_refresh_ahead_interval: float = float(os.environ.get('ACG_REFRESH_AHEAD_INTERVAL', '30'))  # seconds
+        self.acg_refresh_ahead_window: float = float(os.environ.get('ACG_REFRESH_AHEAD_WINDOW', '120'))  # seconds
+        
+        # Request coalescing: concurrent identical calculations share one computation.
+        # The optional lease ('redis' or 'local') coalesces across workers as well.
+        self.enable_single_flight: bool = os.environ.get('SINGLE_FLIGHT_ENABLED', 'true').lower() == 'true'
+        self.single_flight_lease: str = os.environ.get('SINGLE_FLIGHT_LEASE', '').lower()
+        self.single_flight_lease_ttl: float = float(os.environ.get('SINGLE_FLIGHT_LEASE_TTL', '30'))  # seconds
+        self.single_flight_wait_timeout: float = float(os.environ.get('SINGLE_FLIGHT_WAIT_TIMEOUT', '30'))  # seconds
+        
+        # ACG line component cache (entries, not results) and its byte budget (0 = entry count only)
+        self.acg_line_cache_size: int = int(os.environ.get('ACG_LINE_CACHE_SIZE', '20000'))
+        self.acg_line_cache_max_bytes: int = int(os.environ.get('ACG_LINE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+        
+        # Round ACG request epochs to this many seconds for caching and calculation (0 = exact)
+        self.acg_epoch_quantum_seconds: float = float(os.environ.get('ACG_EPOCH_QUANTUM_SECONDS', '0'))
+        
+        # Pre-serialized ACG response cache (entries, each an encoded body plus gzip variant)
+        # and its byte budget (0 = entry count only); bodies of large results run to megabytes
+        self.acg_response_cache_size: int = int(os.environ.get('ACG_RESPONSE_CACHE_SIZE', '500'))
+        self.acg_response_cache_max_bytes: int = int(
+            os.environ.get('ACG_RESPONSE_CACHE_MAX_BYTES', str(256 * 1024 * 1024))
+        )
+        
+        # Live ACG ("current sky") settings; with Redis one worker computes each snapshot for all
+        self.acg_live_enabled: bool = os.environ.get('ACG_LIVE_ENABLED', 'true').lower() == 'true'
+        self.acg_live_interval: int = int(os.environ.get('ACG_LIVE_INTERVAL', '60'))  # seconds
         
         # Coordinate systems
         self.coordinate_system: str = 'tropical'  # tropical or sidereal
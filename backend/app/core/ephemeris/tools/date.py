@@ -233,7 +233,7 @@ def localize_datetime(
         return None
 
 
-@cached(ttl=3600)  # Cache timezone lookups for 1 hour
+@cached(ttl=3600, quantize={'latitude': 1e-5, 'longitude': 1e-5})  # Cache timezone lookups for 1 hour
 def get_timezone_info(
     latitude: Optional[float],
     longitude: Optional[float], 
@@ -273,7 +273,7 @@ def get_timezone_info(
         return None
 
 
-@cached(ttl=86400)  # Cache coordinate lookups for 24 hours
+@cached(ttl=86400, quantize={'latitude': 1e-5, 'longitude': 1e-5})  # Cache coordinate lookups for 24 hours (~1 m grid)
 def lookup_timezone_by_coordinates(latitude: float, longitude: float) -> Optional[str]:
     """
     Look up timezone name by coordinates.
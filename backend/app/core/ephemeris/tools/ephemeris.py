@@ -25,6 +25,7 @@ from ..const import (
 from ..settings import settings
 from ..classes.cache import cached
 from ..classes.serialize import PlanetPosition, HouseSystem
+from .houses import get_house_cache
 
 
 @dataclass(frozen=True)
@@ -153,8 +154,8 @@ def get_houses(
         if house_system not in ['P', 'K', 'O', 'R', 'C', 'E', 'W', 'B', 'M', 'U', 'G', 'H', 'T', 'D', 'V', 'X', 'N', 'I']:
             house_system = settings.get_house_system_code(house_system)
         
-        # Calculate houses
-        house_cusps, ascmc = swe.houses(julian_day, latitude, longitude, house_system.encode('utf-8'))
+        # Calculate houses (shared ARMC-keyed cache, equivalent to swe.houses)
+        house_cusps, ascmc = get_house_cache().houses(julian_day, latitude, longitude, house_system)
 
         # Swiss Ephemeris returns 12 cusps (1..12). Some consumers/tests expect 13 with index 0 unused.
         cusps_list = list(house_cusps)
@@ -204,7 +205,8 @@ def get_angles(
     }
 
 
-@cached(ttl=3600)
+# Julian days and coordinates closer than ~0.1 ms / 1e-9 degrees share an entry
+@cached(ttl=3600, quantize={'julian_day': 1e-9, 'latitude': 1e-9, 'longitude': 1e-9})
 def get_point(
     point_type: str,
     julian_day: float,
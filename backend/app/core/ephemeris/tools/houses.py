@@ -0,0 +1,349 @@
+"""
+Meridian Ephemeris Engine - House Cusp Cache
+
+House cusps depend only on the ARMC, the geographic latitude, the obliquity
+and the house system, not on the date or longitude as such. This module
+computes houses through `swe.houses_armc` keyed on a quantized
+(ARMC, latitude, obliquity, system) tuple, so charts that share a sidereal
+time and latitude share one calculation.
+
+Two layers back the computation:
+
+- A bounded LRU cache of exact results (`HouseCuspCache`)
+- Optional precomputed interpolation tables for the iterative quadrant
+  systems (Placidus, Koch) on an ARMC x latitude grid, which also serve
+  vectorized lookups for relocation grids
+
+Tables span a range of obliquities (cusps are linear in the obliquity to
+well under the grid's interpolation error), so charts from any year in the
+range use them. They take seconds to build and are built off the request
+path, by `start_interpolation_table_build` at startup.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from ..settings import settings
+from ..classes.cache import EphemerisCache
+
+logger = logging.getLogger(__name__)
+
+INTERPOLATED_HOUSE_SYSTEMS = ('P', 'K')
+
+# Cusp i of an equal house system on the equator lies at ARMC + 90 + 30 * i
+_EQUAL_OFFSETS = 90.0 + 30.0 * np.arange(12)
+
+HouseResult = Tuple[Tuple[float, ...], Tuple[float, ...]]
+
+
+def armc_from_julian_day(julian_day: float, longitude: float) -> float:
+    """ARMC in degrees: apparent sidereal time at Greenwich plus east longitude."""
+    return (swe.sidtime(julian_day) * 15.0 + longitude) % 360.0
+
+
+def true_obliquity(julian_day: float) -> float:
+    """True obliquity of the ecliptic in degrees."""
+    return swe.calc_ut(julian_day, swe.ECL_NUT)[0][0]
+
+
+class HouseInterpolationTable:
+    """
+    Precomputed cusps for one house system on a regular grid.
+
+    Cusps are stored as ``float32`` offsets from their position in an equal
+    house system on the equator (ARMC + 90 + 30 * i), which keeps them small
+    and smooth across the 0/360 boundary. They are bilinearly interpolated
+    in ARMC and latitude and, for tables built for an obliquity range,
+    linearly between the range's ends.
+    """
+
+    def __init__(
+        self,
+        house_system: str,
+        obliquity: float,
+        armc_step: float = 0.25,
+        latitude_step: float = 0.25,
+        max_latitude: float = 60.0,
+        obliquity_max: Optional[float] = None
+    ):
+        """
+        Build the table.
+
+        Args:
+            house_system: Swiss Ephemeris house system code ('P' or 'K')
+            obliquity: True obliquity the table is valid for (the low end of
+                its range with ``obliquity_max``), in degrees
+            armc_step: Grid spacing in ARMC, in degrees
+            latitude_step: Grid spacing in latitude, in degrees
+            max_latitude: Table covers latitudes in [-max_latitude, max_latitude]
+            obliquity_max: High end of the obliquity range (defaults to ``obliquity``)
+
+        Raises:
+            ValueError: If the system, latitude range or obliquity range is unsupported
+        """
+        house_system = house_system.upper()
+        obliquity_max = obliquity if obliquity_max is None else obliquity_max
+        if house_system not in INTERPOLATED_HOUSE_SYSTEMS:
+            raise ValueError(f"Interpolation tables support {INTERPOLATED_HOUSE_SYSTEMS}, not {house_system}")
+        if obliquity_max < obliquity:
+            raise ValueError("obliquity_max must not be below obliquity")
+        if not 0 < max_latitude < 90.0 - obliquity_max:
+            raise ValueError("max_latitude must lie outside the polar circles")
+
+        self.house_system = house_system
+        self.obliquity = obliquity
+        self.obliquity_max = obliquity_max
+        self.armc_step = armc_step
+        self.latitude_step = latitude_step
+        self.max_latitude = max_latitude
+
+        armc_values = np.arange(0.0, 360.0 + armc_step, armc_step)
+        latitude_values = np.arange(-max_latitude, max_latitude + latitude_step / 2, latitude_step)
+        planes = [obliquity] if obliquity_max == obliquity else [obliquity, obliquity_max]
+        hsys = house_system.encode('utf-8')
+
+        offsets = np.empty((len(planes), len(armc_values), len(latitude_values), 12), dtype=np.float32)
+        for k, plane in enumerate(planes):
+            for i, armc in enumerate(armc_values.tolist()):
+                for j, latitude in enumerate(latitude_values.tolist()):
+                    cusps = np.asarray(swe.houses_armc(armc, latitude, plane, hsys)[0][:12])
+                    offsets[k, i, j] = (cusps - armc - _EQUAL_OFFSETS + 540.0) % 360.0 - 180.0
+
+        self._offsets = offsets
+
+    def covers(self, latitude: float, obliquity: float, tolerance: float = 1e-3) -> bool:
+        """Whether a lookup at this latitude and obliquity is valid."""
+        return (
+            abs(latitude) <= self.max_latitude
+            and self.obliquity - tolerance <= obliquity <= self.obliquity_max + tolerance
+        )
+
+    def lookup(self, armc: np.ndarray, latitude: np.ndarray, obliquity: Optional[float] = None) -> np.ndarray:
+        """
+        Interpolate cusps for arrays of ARMC and latitude.
+
+        Args:
+            armc: ARMC values in degrees
+            latitude: Latitudes in degrees, within ``max_latitude``
+            obliquity: True obliquity in degrees, within the table's range
+                (defaults to its low end)
+
+        Returns:
+            (n, 12) array of cusp longitudes in degrees
+        """
+        armc = np.asarray(armc, dtype=np.float64) % 360.0
+        latitude = np.asarray(latitude, dtype=np.float64)
+
+        x = armc / self.armc_step
+        y = (latitude + self.max_latitude) / self.latitude_step
+        i = np.clip(np.floor(x).astype(int), 0, self._offsets.shape[1] - 2)
+        j = np.clip(np.floor(y).astype(int), 0, self._offsets.shape[2] - 2)
+        fx = (x - i)[:, None]
+        fy = (y - j)[:, None]
+
+        def plane_offsets(o: np.ndarray) -> np.ndarray:
+            return (
+                o[i, j] * (1 - fx) * (1 - fy) + o[i + 1, j] * fx * (1 - fy)
+                + o[i, j + 1] * (1 - fx) * fy + o[i + 1, j + 1] * fx * fy
+            )
+
+        offsets = plane_offsets(self._offsets[0])
+        if len(self._offsets) > 1 and obliquity is not None:
+            t = min(max((obliquity - self.obliquity) / (self.obliquity_max - self.obliquity), 0.0), 1.0)
+            if t > 0.0:
+                offsets = offsets * (1 - t) + plane_offsets(self._offsets[1]) * t
+        return (offsets + armc[:, None] + _EQUAL_OFFSETS) % 360.0
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the table."""
+        return self._offsets.nbytes
+
+
+class HouseCuspCache:
+    """
+    Quantized, bounded cache of `swe.houses_armc` results.
+
+    Inputs are rounded to ``quantum`` degrees and houses are calculated at
+    the rounded values, so a key always maps to the same result.
+
+    Examples:
+        >>> cache = HouseCuspCache()
+        >>> cusps, ascmc = cache.houses(2451545.0, 40.7128, -74.0060, 'P')
+    """
+
+    def __init__(self, max_size: int = 10000, quantum: float = 1e-6):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached house results
+            quantum: Rounding step for ARMC, latitude and obliquity in degrees
+        """
+        self.quantum = quantum
+        self._cache = EphemerisCache(max_size=max_size, default_ttl=None)
+        self._tables: Dict[str, HouseInterpolationTable] = {}
+        self._lock = threading.Lock()
+        self._interpolated = 0
+
+    def key(self, armc: float, latitude: float, obliquity: float, house_system: str) -> Tuple[int, int, int, str]:
+        """Quantized cache key."""
+        q = self.quantum
+        return (
+            int(round((armc % 360.0) / q)) % int(round(360.0 / q)),
+            int(round(latitude / q)),
+            int(round(obliquity / q)),
+            house_system
+        )
+
+    def houses_armc(self, armc: float, latitude: float, obliquity: float, house_system: str = 'P') -> HouseResult:
+        """
+        Houses for an ARMC, latitude and obliquity.
+
+        Args:
+            armc: ARMC in degrees
+            latitude: Geographic latitude in degrees
+            obliquity: True obliquity in degrees
+            house_system: Swiss Ephemeris house system code
+
+        Returns:
+            Tuple of (cusps, ascmc) as returned by `swe.houses_armc`
+
+        Raises:
+            swe.Error: If the system is undefined at this latitude
+        """
+        key = self.key(armc, latitude, obliquity, house_system)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        q = self.quantum
+        armc_q, latitude_q, obliquity_q = key[0] * q, key[1] * q, key[2] * q
+        hsys = house_system.encode('utf-8')
+
+        table = self._tables.get(house_system)
+        if table is not None and table.covers(latitude_q, obliquity_q):
+            cusps = tuple(table.lookup(np.array([armc_q]), np.array([latitude_q]), obliquity_q)[0].tolist())
+            # Angles do not depend on the house system; Porphyry is the cheapest way to get them
+            ascmc = swe.houses_armc(armc_q, latitude_q, obliquity_q, b'O')[1]
+            result = (cusps, ascmc)
+            with self._lock:
+                self._interpolated += 1
+        else:
+            result = swe.houses_armc(armc_q, latitude_q, obliquity_q, hsys)
+
+        self._cache.put(key, result)
+        return result
+
+    def houses(self, julian_day: float, latitude: float, longitude: float, house_system: str = 'P') -> HouseResult:
+        """
+        Houses for a moment and place, equivalent to `swe.houses`.
+
+        Args:
+            julian_day: Julian Day Number (UT)
+            latitude: Geographic latitude in degrees
+            longitude: Geographic east longitude in degrees
+            house_system: Swiss Ephemeris house system code
+
+        Returns:
+            Tuple of (cusps, ascmc)
+        """
+        return self.houses_armc(
+            armc_from_julian_day(julian_day, longitude),
+            latitude,
+            true_obliquity(julian_day),
+            house_system
+        )
+
+    def add_interpolation_table(self, table: HouseInterpolationTable) -> None:
+        """Serve cache misses for the table's system from the table."""
+        with self._lock:
+            self._tables[table.house_system] = table
+        self._cache.clear()
+
+    def get_interpolation_table(self, house_system: str) -> Optional[HouseInterpolationTable]:
+        """Registered interpolation table for a system, if any."""
+        return self._tables.get(house_system)
+
+    def clear(self) -> None:
+        """Clear cached results (tables are kept)."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """Cache statistics."""
+        stats = dict(self._cache.stats())
+        stats['quantum'] = self.quantum
+        stats['interpolated'] = self._interpolated
+        stats['interpolation_tables'] = sorted(self._tables)
+        return stats
+
+
+_house_cache: Optional[HouseCuspCache] = None
+_house_cache_lock = threading.Lock()
+
+
+def get_house_cache() -> HouseCuspCache:
+    """Get the global house cusp cache (interpolation tables are added by `build_interpolation_tables`)."""
+    global _house_cache
+    if _house_cache is None:
+        with _house_cache_lock:
+            if _house_cache is None:
+                _house_cache = HouseCuspCache(
+                    max_size=settings.house_cache_size,
+                    quantum=settings.house_cache_quantum
+                )
+    return _house_cache
+
+
+def reset_house_cache() -> None:
+    """Reset the global house cusp cache."""
+    global _house_cache
+    with _house_cache_lock:
+        _house_cache = None
+
+
+def build_interpolation_tables(cache: Optional[HouseCuspCache] = None,
+                               systems: Optional[List[str]] = None) -> HouseCuspCache:
+    """
+    Build the configured interpolation tables and register them with a cache.
+
+    Each system's table serves lookups as soon as it is registered; until
+    then the cache calculates exactly.
+
+    Args:
+        cache: Cache to register the tables with (defaults to the global cache)
+        systems: House systems (defaults to ``HOUSE_INTERPOLATION_SYSTEMS``)
+
+    Returns:
+        The cache
+    """
+    cache = cache or get_house_cache()
+    for system in settings.house_interpolation_systems if systems is None else systems:
+        cache.add_interpolation_table(HouseInterpolationTable(
+            system, settings.house_interpolation_obliquity_min,
+            armc_step=settings.house_interpolation_step,
+            latitude_step=settings.house_interpolation_step,
+            obliquity_max=settings.house_interpolation_obliquity_max
+        ))
+        logger.info(f"House interpolation table for '{system}' ready")
+    return cache
+
+
+def start_interpolation_table_build() -> Optional[threading.Thread]:
+    """Build the configured interpolation tables on a background thread (None if none are configured)."""
+    if not settings.house_interpolation_systems:
+        return None
+
+    def build() -> None:
+        try:
+            build_interpolation_tables()
+        except Exception as e:
+            logger.error(f"House interpolation table build failed: {e}")
+
+    thread = threading.Thread(target=build, name="house-interpolation-tables", daemon=True)
+    thread.start()
+    return thread
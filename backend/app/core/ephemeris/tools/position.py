@@ -7,18 +7,16 @@ Maintains full compatibility with Immanuel reference while adding enhanced featu
 
 Features:
 - Zodiac sign analysis (sign, decan, element, modality)
-- House position calculations with caching
+- House position calculations
 - Opposite sign/house calculations
 - Aspect and angular relationships
 - Position-based astrological classifications
 """
 
-import json
 from typing import Union, Dict, List, Optional, Tuple
 import swisseph as swe
 
 from ..const import SIGN_NAMES, SIGN_SYMBOLS, get_sign_from_longitude
-from ..classes.cache import cached
 
 
 # Type aliases
@@ -76,9 +74,6 @@ MODALITY_SIGNS = {
     Modality.MUTABLE: [3, 6, 9, 12]    # Gemini, Virgo, Sagittarius, Pisces
 }
 
-# House position cache
-_house_cache = {}
-
 
 def get_longitude(position_input: PositionInput) -> float:
     """
@@ -195,11 +190,13 @@ def modality(position_input: PositionInput) -> int:
     return ((sign_num - 1) % 3) + 1
 
 
-@cached(ttl=300)  # Cache house calculations for 5 minutes
 def house_position(position_input: PositionInput, houses: Dict) -> Optional[HouseData]:
     """
     Calculate which house a position falls into.
     
+    Not cached: scanning twelve cusps is cheaper than building a cache key
+    from the nested ``houses`` dict.
+    
     Args:
         position_input: Position as dict or longitude
         houses: House system data from ephemeris calculation
@@ -213,12 +210,6 @@ def house_position(position_input: PositionInput, houses: Dict) -> Optional[Hous
     """
     longitude = get_longitude(position_input)
     
-    # Create cache key
-    cache_key = json.dumps([longitude, sorted(houses.items()) if isinstance(houses, dict) else houses])
-    
-    if cache_key in _house_cache:
-        return _house_cache[cache_key]
-    
     # Find the house containing this longitude
     for house_id, house_data in houses.items():
         if not isinstance(house_data, dict):
@@ -237,7 +228,6 @@ def house_position(position_input: PositionInput, houses: Dict) -> Optional[Hous
         
         # Check if position falls within this house
         if 0 <= lon_diff < next_cusp_diff:
-            _house_cache[cache_key] = house_data
             return house_data
     
     return None
@@ -496,9 +486,7 @@ def get_closest_aspect_angle(pos1: PositionInput, pos2: PositionInput) -> Dict:
 
 
 def clear_house_cache():
-    """Clear the house position cache."""
-    global _house_cache
-    _house_cache.clear()
+    """Kept for callers of the former house position cache; house positions are no longer cached."""
 
 
 # Convenience functions
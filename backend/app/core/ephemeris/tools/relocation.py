@@ -0,0 +1,264 @@
+"""
+Meridian Ephemeris Engine - Relocation Grid
+
+Calculates angles and house cusps of one moment for many locations at once,
+for relocation maps and heatmaps.
+
+Everything a location changes follows from the ARMC (apparent sidereal time
+plus east longitude), the latitude and the true obliquity:
+
+- ARMC, MC, ASC and Vertex are evaluated analytically with NumPy over the
+  whole location array, using the same quadrant rules as Swiss Ephemeris
+- Equal and whole-sign cusps follow directly from the ASC
+- Placidus and Koch are read from the shared interpolation table when one
+  is configured (see `houses.HouseInterpolationTable`)
+- Other systems, and locations outside a table, call `swe.houses_armc` per
+  location, split into chunks across a process pool for large grids
+
+Results are columnar arrays, one row per location.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from ..settings import settings
+from .houses import get_house_cache
+
+DEG_TO_RAD = math.pi / 180.0
+RAD_TO_DEG = 180.0 / math.pi
+
+# Below this many locations a process pool costs more than it saves
+PARALLEL_THRESHOLD = 20000
+
+ANALYTIC_HOUSE_SYSTEMS = ('E', 'W')
+
+_VERY_SMALL = 1e-10
+
+
+@dataclass
+class RelocationGrid:
+    """Angles and cusps for an array of locations at one moment."""
+    julian_day: float
+    house_system: str
+    obliquity: float
+    latitude: np.ndarray
+    longitude: np.ndarray
+    armc: np.ndarray
+    mc: np.ndarray
+    ascendant: np.ndarray
+    vertex: np.ndarray
+    cusps: np.ndarray  # (n_locations, 12); NaN where the system is undefined
+
+    def __len__(self) -> int:
+        return len(self.latitude)
+
+    @property
+    def descendant(self) -> np.ndarray:
+        """Descendant longitudes."""
+        return (self.ascendant + 180.0) % 360.0
+
+    @property
+    def imum_coeli(self) -> np.ndarray:
+        """IC longitudes."""
+        return (self.mc + 180.0) % 360.0
+
+
+def calculate_relocation_grid(
+    julian_day: float,
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    house_system: str = 'P',
+    processes: Optional[int] = None
+) -> RelocationGrid:
+    """
+    Calculate angles and house cusps for many locations at one moment.
+
+    Args:
+        julian_day: Julian Day Number (UT)
+        latitudes: Observer latitudes in degrees
+        longitudes: Observer east longitudes in degrees (same length)
+        house_system: House system code or name (e.g. 'P', 'whole_sign')
+        processes: Worker processes for non-analytic systems
+            (defaults to the CPU count; 1 disables the pool)
+
+    Returns:
+        RelocationGrid with one row per location
+
+    Raises:
+        ValueError: If inputs are malformed
+    """
+    latitude = np.asarray(latitudes, dtype=np.float64).ravel()
+    longitude = np.asarray(longitudes, dtype=np.float64).ravel()
+    if latitude.shape != longitude.shape:
+        raise ValueError("latitudes and longitudes must have the same length")
+    if np.any(np.abs(latitude) > 90.0):
+        raise ValueError("Latitude must be between -90 and 90 degrees")
+
+    if len(house_system) != 1:
+        house_system = settings.get_house_system_code(house_system)
+    house_system = house_system.upper()
+
+    obliquity = swe.calc_ut(julian_day, swe.ECL_NUT)[0][0]
+    armc = (swe.sidtime(julian_day) * 15.0 + longitude) % 360.0
+    mc, ascendant, vertex = calculate_angles_from_armc(armc, latitude, obliquity)
+
+    if house_system == 'E':
+        cusps = (ascendant[:, None] + 30.0 * np.arange(12)) % 360.0
+    elif house_system == 'W':
+        cusps = (np.floor(ascendant / 30.0)[:, None] * 30.0 + 30.0 * np.arange(12)) % 360.0
+    else:
+        cusps = _quadrant_cusps(armc, latitude, obliquity, house_system, processes)
+
+    return RelocationGrid(
+        julian_day=julian_day,
+        house_system=house_system,
+        obliquity=obliquity,
+        latitude=latitude,
+        longitude=longitude,
+        armc=armc,
+        mc=mc,
+        ascendant=ascendant,
+        vertex=vertex,
+        cusps=cusps
+    )
+
+
+def calculate_angles_from_armc(
+    armc: np.ndarray,
+    latitude: np.ndarray,
+    obliquity: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized MC, ASC and Vertex from ARMC, latitude and obliquity.
+
+    Follows the Swiss Ephemeris conventions, including the polar-circle
+    ASC correction and the tropical Vertex correction.
+
+    Returns:
+        Tuple of (mc, ascendant, vertex) longitude arrays in degrees
+    """
+    armc = np.asarray(armc, dtype=np.float64)
+    latitude = np.asarray(latitude, dtype=np.float64)
+    sin_eps = math.sin(obliquity * DEG_TO_RAD)
+    cos_eps = math.cos(obliquity * DEG_TO_RAD)
+
+    th = armc * DEG_TO_RAD
+    mc = (np.arctan2(np.sin(th), np.cos(th) * cos_eps) * RAD_TO_DEG) % 360.0
+
+    ascendant = _asc1(armc + 90.0, latitude, sin_eps, cos_eps)
+    # Inside the polar circles the ASC can fall west of the MC; flip it
+    polar = np.abs(latitude) >= 90.0 - obliquity
+    ascendant = np.where(polar & (_difdeg2n(ascendant, mc) < 0), (ascendant + 180.0) % 360.0, ascendant)
+
+    colatitude = np.where(latitude >= 0, 90.0 - latitude, -90.0 - latitude)
+    vertex = _asc1(armc - 90.0, colatitude, sin_eps, cos_eps)
+    # In the tropics the Vertex can fall east of the MC; flip it
+    tropical = np.abs(latitude) <= obliquity
+    vertex = np.where(tropical & (_difdeg2n(vertex, mc) > 0), (vertex + 180.0) % 360.0, vertex)
+
+    return mc, ascendant, vertex
+
+
+def world_grid(step_deg: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flattened latitude/longitude arrays covering the globe.
+
+    Args:
+        step_deg: Grid spacing in degrees
+
+    Returns:
+        Tuple of (latitudes, longitudes), latitude-major
+    """
+    lats = np.arange(-90.0, 90.0 + step_deg / 2, step_deg)
+    lons = np.arange(-180.0, 180.0, step_deg)
+    lat_grid, lon_grid = np.meshgrid(lats, lons, indexing='ij')
+    return lat_grid.ravel(), lon_grid.ravel()
+
+
+def _asc1(x1: np.ndarray, f: np.ndarray, sin_eps: float, cos_eps: float) -> np.ndarray:
+    """
+    Ecliptic longitude rising at pole height ``f`` for equator point ``x1``.
+
+    Vectorized form of the Swiss Ephemeris ``Asc1``: the result lies in
+    [0, 180] when ``x1`` is in [0, 180) and in [180, 360] otherwise.
+    """
+    x1 = x1 % 360.0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        denominator = cos_eps * np.cos(x1 * DEG_TO_RAD) - np.tan(f * DEG_TO_RAD) * sin_eps
+    half = (np.arctan2(np.sin(x1 * DEG_TO_RAD), denominator) * RAD_TO_DEG) % 180.0
+    result = np.where(x1 >= 180.0, half + 180.0, half)
+    result = np.where(np.abs(90.0 - f) < _VERY_SMALL, 180.0, result)
+    result = np.where(np.abs(90.0 + f) < _VERY_SMALL, 0.0, result)
+    return result % 360.0
+
+
+def _difdeg2n(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Signed difference a - b normalized to [-180, 180)."""
+    return (a - b + 540.0) % 360.0 - 180.0
+
+
+def _quadrant_cusps(
+    armc: np.ndarray,
+    latitude: np.ndarray,
+    obliquity: float,
+    house_system: str,
+    processes: Optional[int]
+) -> np.ndarray:
+    """Cusps for systems without a closed form, optionally in parallel."""
+    table = get_house_cache().get_interpolation_table(house_system)
+    if table is not None and table.covers(0.0, obliquity):
+        cusps = np.full((len(armc), 12), np.nan)
+        inside = np.abs(latitude) <= table.max_latitude
+        cusps[inside] = table.lookup(armc[inside], latitude[inside], obliquity)
+        outside = ~inside
+        if np.any(outside):
+            cusps[outside] = _quadrant_cusps_exact(
+                armc[outside], latitude[outside], obliquity, house_system, processes
+            )
+        return cusps
+    return _quadrant_cusps_exact(armc, latitude, obliquity, house_system, processes)
+
+
+def _quadrant_cusps_exact(
+    armc: np.ndarray,
+    latitude: np.ndarray,
+    obliquity: float,
+    house_system: str,
+    processes: Optional[int]
+) -> np.ndarray:
+    """`swe.houses_armc` for every location, across a process pool if large."""
+    processes = processes or os.cpu_count() or 1
+    if processes <= 1 or len(armc) < PARALLEL_THRESHOLD:
+        return _houses_armc_chunk(armc, latitude, obliquity, house_system)
+
+    chunks = np.array_split(np.arange(len(armc)), processes)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(_houses_armc_chunk, armc[idx], latitude[idx], obliquity, house_system)
+            for idx in chunks
+        ]
+        return np.concatenate([future.result() for future in futures])
+
+
+def _houses_armc_chunk(
+    armc: np.ndarray,
+    latitude: np.ndarray,
+    obliquity: float,
+    house_system: str
+) -> np.ndarray:
+    """`swe.houses_armc` over a chunk of locations; process pool worker."""
+    hsys = house_system.encode('utf-8')
+    cusps = np.full((len(armc), 12), np.nan)
+    for i, (th, lat) in enumerate(zip(armc.tolist(), latitude.tolist())):
+        try:
+            cusps[i] = swe.houses_armc(th, lat, obliquity, hsys)[0][:12]
+        except swe.Error:
+            # Undefined for this system here (e.g. Placidus inside the polar circles)
+            pass
+    return cusps
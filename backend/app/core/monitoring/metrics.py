@@ -103,6 +103,30 @@ class MeridianMetrics:
             ['cache_type']
         )
         
+        self.cache_bytes = Gauge(
+            'meridian_cache_size_bytes',
+            'Estimated size of cached values in bytes',
+            ['cache_type']
+        )
+        
+        self.redis_circuit_state = Gauge(
+            'meridian_redis_circuit_state',
+            'Redis circuit breaker state (0=closed, 1=half-open, 2=open)',
+            ['node']
+        )
+        
+        self.redis_skipped_operations_total = Counter(
+            'meridian_redis_skipped_operations_total',
+            'Redis operations skipped while the node\'s circuit breaker was open',
+            ['node', 'operation']
+        )
+        
+        self.redis_failures_total = Counter(
+            'meridian_redis_failures_total',
+            'Redis operations that exceeded their latency budget or lost the connection',
+            ['node', 'operation']
+        )
+        
         # Swiss Ephemeris Metrics
         self.swiss_ephemeris_calls = Counter(
             'meridian_swiss_ephemeris_calls_total',
@@ -220,6 +244,42 @@ class MeridianMetrics:
         
         self.cache_size.labels(cache_type=cache_type).set(size)
     
+    def update_cache_bytes(self, cache_type: str, size_bytes: int):
+        """Update cache byte size metrics."""
+        if not self.enabled:
+            return
+        
+        self.cache_bytes.labels(cache_type=cache_type).set(size_bytes)
+    
+    def track_cache(self, cache_type: str, cache):
+        """Report a cache's entry count and byte size live, read at scrape time."""
+        if not self.enabled:
+            return
+        
+        self.cache_size.labels(cache_type=cache_type).set_function(cache.size)
+        self.cache_bytes.labels(cache_type=cache_type).set_function(cache.size_bytes)
+    
+    def update_redis_circuit_state(self, node: str, state: int):
+        """Update a Redis node's circuit breaker state (0=closed, 1=half-open, 2=open)."""
+        if not self.enabled:
+            return
+        
+        self.redis_circuit_state.labels(node=node).set(state)
+    
+    def record_redis_skip(self, node: str, operation: str):
+        """Record a Redis operation skipped by an open circuit breaker."""
+        if not self.enabled:
+            return
+        
+        self.redis_skipped_operations_total.labels(node=node, operation=operation).inc()
+    
+    def record_redis_failure(self, node: str, operation: str):
+        """Record a Redis operation that timed out or lost its connection."""
+        if not self.enabled:
+            return
+        
+        self.redis_failures_total.labels(node=node, operation=operation).inc()
+    
     def record_swiss_ephemeris_call(self, function_name: str, 
                                    duration: float, success: bool):
         """Record Swiss Ephemeris function call metrics."""
@@ -462,6 +522,23 @@ def update_health_metrics():
             metrics.update_system_health("swiss_ephemeris", False)
         
         # Update cache statistics
+        from ..ephemeris.classes.cache import get_global_cache
+        memory_cache = get_global_cache()
+        metrics.track_cache("memory", memory_cache)
+        metrics.update_cache_hit_rate("memory", memory_cache.stats()['hit_rate'])
+        
+        from ..ephemeris.classes.disk_cache import get_disk_cache
+        from ..ephemeris.classes.shared_cache import get_shared_cache
+        for cache_type, tier_cache in (("shared", get_shared_cache()), ("disk", get_disk_cache())):
+            if tier_cache.enabled:
+                metrics.track_cache(cache_type, tier_cache)
+                metrics.update_cache_hit_rate(cache_type, tier_cache.stats()['hit_rate'])
+        
+        from ..acg.acg_cache import get_acg_cache_manager
+        acg_cache = get_acg_cache_manager()
+        metrics.track_cache("acg_lines", acg_cache.line_cache)
+        metrics.track_cache("acg_responses", acg_cache.response_cache)
+        
         if redis_healthy:
             cache_info = redis_cache.get_info()
             if 'hit_rate' in cache_info:
@@ -60,6 +60,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️  Redis cache initialization failed: {e}")
     
+    # Warm the in-memory cache from the disk cache
+    try:
+        from .core.ephemeris.classes.cache import get_global_cache
+        from .core.ephemeris.classes.disk_cache import get_disk_cache
+        disk_cache = get_disk_cache()
+        if disk_cache.enabled:
+            loaded = disk_cache.warm(get_global_cache(), settings.disk_cache_snapshot_entries)
+            logger.info(f"💾 Disk cache initialized, {loaded} entries loaded into memory")
+    except Exception as e:
+        logger.warning(f"⚠️  Disk cache warm-up failed: {e}")
+    
     # Validate ephemeris files on startup
     try:
         from .core.ephemeris.tools.ephemeris import validate_ephemeris_files
@@ -89,10 +100,65 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"⚠️  Metrics initialization failed: {e}")
     
+    # Build house interpolation tables off the request path
+    if settings.house_interpolation_systems:
+        from .core.ephemeris.tools.houses import start_interpolation_table_build
+        start_interpolation_table_build()
+        logger.info("🏠 House interpolation tables building in the background")
+    
+    # Start the live current-sky ACG scheduler
+    if settings.acg_live_enabled:
+        try:
+            from .api.routes.acg import live_sky
+            live_sky.start()
+            logger.info("🌍 ACG live sky scheduler started")
+        except Exception as e:
+            logger.warning(f"⚠️  ACG live sky scheduler failed to start: {e}")
+    
+    # Start the refresh-ahead worker for popular ACG results
+    if settings.acg_refresh_ahead_enabled:
+        try:
+            from .api.routes.acg import refresh_ahead
+            refresh_ahead.start()
+            logger.info("🔁 ACG refresh-ahead worker started")
+        except Exception as e:
+            logger.warning(f"⚠️  ACG refresh-ahead worker failed to start: {e}")
+    
     yield
     
     # Shutdown
     logger.info("🛑 Shutting down Meridian Ephemeris API")
+    try:
+        from .api.routes.acg import live_sky
+        live_sky.stop()
+    except Exception as e:
+        logger.warning(f"⚠️  ACG live sky scheduler failed to stop: {e}")
+    try:
+        from .api.routes.acg import refresh_ahead
+        refresh_ahead.stop()
+    except Exception as e:
+        logger.warning(f"⚠️  ACG refresh-ahead worker failed to stop: {e}")
+    try:
+        from .core.ephemeris.classes.near_cache import stop_invalidation_bus
+        stop_invalidation_bus()
+    except Exception as e:
+        logger.warning(f"⚠️  Cache invalidation listener failed to stop: {e}")
+    try:
+        from .core.ephemeris.classes.redis_cache import get_redis_cache
+        await get_redis_cache().aclose()
+    except Exception as e:
+        logger.warning(f"⚠️  Async Redis connections failed to close: {e}")
+
+    # Snapshot the hottest in-memory entries so the next start comes up warm
+    try:
+        from .core.ephemeris.classes.cache import get_global_cache
+        from .core.ephemeris.classes.disk_cache import get_disk_cache
+        disk_cache = get_disk_cache()
+        if disk_cache.enabled:
+            written = disk_cache.snapshot(get_global_cache(), settings.disk_cache_snapshot_entries)
+            logger.info(f"💾 Snapshotted {written} cache entries to disk")
+    except Exception as e:
+        logger.warning(f"⚠️  Disk cache snapshot failed: {e}")
 
 
 # Create FastAPI application
@@ -241,7 +307,10 @@ async def root():
                 "batch": "/acg/batch",
                 "animate": "/acg/animate",
                 "features": "/acg/features",
-                "schema": "/acg/schema"
+                "schema": "/acg/schema",
+                "live": "/acg/live",
+                "live_stream": "/acg/live/stream",
+                "scrub": "/acg/scrub"
             },
             "schemas": {
                 "natal_request": "/ephemeris/schemas/natal-request",
@@ -5,6 +5,8 @@ Provides high-level service functions for the ephemeris API endpoints.
 Handles input validation, data transformation, and chart calculation orchestration.
 """
 
+import hashlib
+import json
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional, Union, List
@@ -19,6 +21,11 @@ from ..core.ephemeris.charts.subject import Subject
 from ..core.ephemeris.charts.natal import NatalChart
 from ..core.ephemeris.const import PLANET_NAMES
 from ..core.ephemeris.tools.ephemeris import validate_ephemeris_files
+from ..core.ephemeris.classes.cache_codec import register_model
+from ..core.ephemeris.classes.single_flight import get_single_flight
+
+# Coalesced results are shared with other workers through Redis
+register_model(NatalChartResponse)
 
 
 class EphemerisServiceError(Exception):
@@ -50,6 +57,7 @@ class EphemerisService:
         self._ephemeris_validation_cache: Optional[Dict[str, bool]] = None
         self._last_validation_check: Optional[float] = None
         self._validation_cache_ttl = 300  # 5 minutes
+        self.single_flight = get_single_flight("natal_chart")
     
     def get_health_status(self) -> HealthResponse:
         """
@@ -334,6 +342,14 @@ class EphemerisService:
             InputValidationError: If input validation fails
             CalculationError: If chart calculation fails
         """
+        # Concurrent identical requests share one calculation
+        key = hashlib.sha256(
+            json.dumps(request.model_dump(mode="json"), sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+        return self.single_flight.do(key, lambda: self._calculate_natal_chart(request))
+    
+    def _calculate_natal_chart(self, request: NatalChartRequest) -> NatalChartResponse:
+        """Calculate a natal chart without coalescing."""
         calculation_start = datetime.now()
         
         try:
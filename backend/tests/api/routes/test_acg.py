@@ -19,9 +19,16 @@ from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 
 from app.main import app
+from app.api.routes.acg import acg_engine
 from app.core.acg.acg_types import ACGResult, ACGBody, ACGBodyType, ACGOptions
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep encoded responses of mocked calculations from leaking between tests."""
+    acg_engine.cache_manager.response_cache.clear()
+
+
 class TestACGAPIEndpoints:
     """Test ACG API endpoints basic functionality."""
     
@@ -179,7 +186,7 @@ class TestACGAPIEndpoints:
         assert data["detail"]["error"] == "calculation_error"
         assert "calculation failed" in data["detail"]["message"].lower()
     
-    @patch('app.api.routes.acg.acg_engine.calculate_acg_lines')
+    @patch('app.api.routes.acg.acg_engine.calculate_acg_batch')
     def test_acg_batch_endpoint_success(self, mock_calculate, client, valid_acg_request):
         """Test successful ACG batch calculation."""
         # Mock successful calculation
@@ -193,7 +200,7 @@ class TestACGAPIEndpoints:
                 }
             ]
         )
-        mock_calculate.return_value = mock_result
+        mock_calculate.side_effect = lambda requests: [mock_result] * len(requests)
         
         batch_request = {
             "requests": [
@@ -218,11 +225,11 @@ class TestACGAPIEndpoints:
             assert "response" in result
             assert "error" not in result
     
-    @patch('app.api.routes.acg.acg_engine.calculate_acg_lines')
+    @patch('app.api.routes.acg.acg_engine.calculate_acg_batch')
     def test_acg_batch_endpoint_mixed_results(self, mock_calculate, client, valid_acg_request):
         """Test ACG batch with some successful and some failed calculations."""
-        # First call succeeds, second fails
-        mock_calculate.side_effect = [
+        # First item succeeds, second fails
+        mock_calculate.return_value = [
             ACGResult(type="FeatureCollection", features=[]),
             RuntimeError("Second calculation failed")
         ]
@@ -251,11 +258,11 @@ class TestACGAPIEndpoints:
         assert "error" in error_result
         assert "response" not in error_result
     
-    @patch('app.api.routes.acg.acg_engine.calculate_acg_lines')
+    @patch('app.api.routes.acg.acg_engine.calculate_acg_batch')
     def test_acg_animate_endpoint_success(self, mock_calculate, client, valid_acg_request):
         """Test successful ACG animation calculation."""
         mock_result = ACGResult(type="FeatureCollection", features=[])
-        mock_calculate.return_value = mock_result
+        mock_calculate.side_effect = lambda requests: [mock_result] * len(requests)
         
         animate_request = {
             "epoch_start": "2000-01-01T12:00:00Z",
@@ -538,10 +545,10 @@ class TestACGAPIPerformance:
         assert calc_time.endswith("ms")
         assert float(calc_time[:-2]) >= 0  # Should be positive number
     
-    @patch('app.api.routes.acg.acg_engine.calculate_acg_lines')
+    @patch('app.api.routes.acg.acg_engine.calculate_acg_batch')
     def test_acg_batch_performance_headers(self, mock_calculate, client):
         """Test that batch performance headers are present."""
-        mock_calculate.return_value = ACGResult(type="FeatureCollection", features=[])
+        mock_calculate.side_effect = lambda requests: [ACGResult(type="FeatureCollection", features=[])] * len(requests)
         
         batch_request = {
             "requests": [
@@ -559,10 +566,10 @@ class TestACGAPIPerformance:
         assert response.headers["X-Batch-Size"] == "2"
         assert response.headers["X-Success-Count"] == "2"
     
-    @patch('app.api.routes.acg.acg_engine.calculate_acg_lines')
+    @patch('app.api.routes.acg.acg_engine.calculate_acg_batch')
     def test_acg_animate_performance_headers(self, mock_calculate, client):
         """Test that animate performance headers are present."""
-        mock_calculate.return_value = ACGResult(type="FeatureCollection", features=[])
+        mock_calculate.side_effect = lambda requests: [ACGResult(type="FeatureCollection", features=[])] * len(requests)
         
         animate_request = {
             "epoch_start": "2000-01-01T12:00:00Z",
@@ -579,5 +586,226 @@ class TestACGAPIPerformance:
         assert frame_count >= 2  # At least start and end frames
 
 
+class TestACGResponseCache:
+    """Test pre-serialized response caching on /acg/lines."""
+    
+    @pytest.fixture
+    def client(self):
+        """Test client for ACG API."""
+        return TestClient(app)
+    
+    @pytest.fixture
+    def large_result(self):
+        """Result large enough to get a gzip variant."""
+        return ACGResult(
+            type="FeatureCollection",
+            features=[
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [[lon, lat] for lat in range(-80, 81, 10) for lon in (0.5, 1.5)]
+                    },
+                    "properties": {"id": "Sun", "type": "body", "line": {"line_type": "MC"}}
+                }
+            ] * 5
+        )
+    
+    @patch('app.api.routes.acg.acg_engine.calculate_acg_lines')
+    def test_hit_skips_calculation_and_validation(self, mock_calculate, client, large_result):
+        """Test a repeated request is served from stored bytes."""
+        mock_calculate.return_value = large_result
+        request_data = {"epoch": "2000-01-01T12:00:00Z", "bodies": [{"id": "Sun", "type": "planet"}]}
+        
+        first = client.post("/acg/lines", json=request_data)
+        with patch.object(ACGResult, 'model_validate') as validate:
+            second = client.post("/acg/lines", json=request_data)
+        
+        assert mock_calculate.call_count == 1
+        validate.assert_not_called()
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.headers["X-Features-Count"] == "5"
+        assert second.json() == first.json() == json.loads(large_result.model_dump_json())
+    
+    @patch('app.api.routes.acg.acg_engine.calculate_acg_lines')
+    def test_variant_follows_accept_encoding(self, mock_calculate, client, large_result):
+        """Test gzip and identity variants are chosen per request."""
+        mock_calculate.return_value = large_result
+        request_data = {"epoch": "2000-01-01T12:00:00Z", "bodies": [{"id": "Moon", "type": "planet"}]}
+        
+        gzipped = client.post("/acg/lines", json=request_data, headers={"Accept-Encoding": "gzip"})
+        identity = client.post("/acg/lines", json=request_data, headers={"Accept-Encoding": "identity"})
+        
+        assert gzipped.headers["Content-Encoding"] == "gzip"
+        assert "content-encoding" not in identity.headers
+        assert gzipped.headers["Vary"] == "Accept-Encoding"
+        assert gzipped.json() == identity.json()
+
+
+class TestACGConditionalRequests:
+    """Test ETags, 304 responses and the GET variant of /acg/lines."""
+    
+    @pytest.fixture
+    def client(self):
+        """Test client for ACG API."""
+        return TestClient(app)
+    
+    @pytest.fixture
+    def mock_result(self):
+        """Small calculation result."""
+        return ACGResult(type="FeatureCollection", features=[])
+    
+    @patch('app.api.routes.acg.acg_engine.calculate_acg_lines')
+    def test_not_modified_before_calculation(self, mock_calculate, client, mock_result):
+        """Test a matching If-None-Match is answered without calculating."""
+        mock_calculate.return_value = mock_result
+        request_data = {"epoch": "2000-01-01T12:00:00Z", "bodies": [{"id": "Venus", "type": "planet"}]}
+        
+        first = client.post("/acg/lines", json=request_data)
+        etag = first.headers["ETag"]
+        acg_engine.cache_manager.response_cache.clear()
+        second = client.post("/acg/lines", json=request_data, headers={"If-None-Match": etag})
+        
+        assert first.status_code == 200
+        assert "max-age" in first.headers["Cache-Control"]
+        assert second.status_code == 304
+        assert second.headers["ETag"] == etag
+        assert mock_calculate.call_count == 1
+    
+    @patch('app.api.routes.acg.acg_engine.calculate_acg_lines')
+    def test_get_variant_matches_post(self, mock_calculate, client, mock_result):
+        """Test GET and POST of the same request share the result and ETag."""
+        mock_calculate.return_value = mock_result
+        request_data = {
+            "epoch": "2000-01-01T12:00:00Z",
+            "bodies": [{"id": "Sun", "type": "planet"}, {"id": "Mars", "type": "planet"}],
+            "options": {"line_types": ["MC", "IC"], "include_parans": False}
+        }
+        
+        post = client.post("/acg/lines", json=request_data)
+        get = client.get(
+            "/acg/lines",
+            params={"epoch": "2000-01-01T12:00:00Z", "bodies": "Sun,Mars", "line_types": "MC,IC", "include_parans": "false"}
+        )
+        
+        assert get.status_code == 200
+        assert get.headers["ETag"] == post.headers["ETag"]
+        assert get.json() == post.json()
+        assert mock_calculate.call_count == 1
+        assert mock_calculate.call_args[0][0].options.include_parans is False
+    
+    def test_get_variant_rejects_unknown_bodies(self, client):
+        """Test unknown body IDs in the query are a validation error."""
+        response = client.get("/acg/lines", params={"epoch": "2000-01-01T12:00:00Z", "bodies": "Sun,Vulcan"})
+        
+        assert response.status_code == 422
+        assert "Vulcan" in response.json()["detail"]["message"]
+    
+    def test_static_endpoints_are_cacheable(self, client):
+        """Test features and schema are served with a long max-age and revalidate to 304."""
+        for path in ("/acg/features", "/acg/schema"):
+            first = client.get(path)
+            second = client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+            
+            assert first.status_code == 200
+            assert first.headers["Cache-Control"] == "public, max-age=86400"
+            assert second.status_code == 304
+
+
+class TestACGLiveEndpoints:
+    """Test the live current-sky endpoint."""
+    
+    @pytest.fixture
+    def client(self):
+        """Test client for ACG API."""
+        return TestClient(app)
+    
+    @pytest.fixture
+    def live_sky(self):
+        """Live sky backed by a stub engine."""
+        from app.core.acg.acg_live import ACGLiveSky
+        engine = MagicMock()
+        engine.calculate_acg_lines.return_value = ACGResult(type="FeatureCollection", features=[])
+        with patch('app.api.routes.acg.live_sky', ACGLiveSky(engine, interval_seconds=3600)) as live_sky:
+            yield live_sky
+    
+    def test_live_snapshot(self, client, live_sky):
+        """Test the live endpoint serves the snapshot with cache headers."""
+        response = client.get("/acg/live")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/geo+json"
+        assert response.headers["ETag"] == live_sky.snapshot.etag
+        assert response.headers["Cache-Control"].startswith("public, max-age=")
+        assert response.headers["X-Epoch"] == live_sky.snapshot.epoch
+        assert response.json()["type"] == "FeatureCollection"
+    
+    def test_live_not_modified(self, client, live_sky):
+        """Test a matching If-None-Match returns 304 without a body."""
+        etag = client.get("/acg/live").headers["ETag"]
+        
+        response = client.get("/acg/live", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert live_sky.engine.calculate_acg_lines.call_count == 1
+
+
+class TestACGScrubWebSocket:
+    """Test the time-scrubbing WebSocket session."""
+    
+    @pytest.fixture
+    def client(self):
+        """Test client for ACG API."""
+        return TestClient(app)
+    
+    def test_scrub_session(self, client):
+        """Test a session resolves once and answers epoch updates."""
+        with client.websocket_connect("/acg/scrub") as websocket:
+            websocket.send_json({
+                "type": "init",
+                "request": {
+                    "epoch": "2000-01-01T12:00:00Z",
+                    "bodies": [{"id": "Sun", "type": "planet"}],
+                    "options": {"include_parans": False}
+                }
+            })
+            assert websocket.receive_json() == {"type": "ready", "bodies": ["Sun"]}
+            
+            websocket.send_json({"type": "epoch", "epoch": "2000-01-01T12:00:00Z", "seq": 1})
+            update = websocket.receive_json()
+            assert update["type"] == "update"
+            assert update["seq"] == 1
+            assert "Sun:MC:MC" in update["added"]
+            
+            websocket.send_json({"type": "epoch", "epoch": "invalid", "seq": 2})
+            error = websocket.receive_json()
+            assert error["type"] == "error"
+            assert error["seq"] == 2
+    
+    def test_non_object_messages_rejected(self, client):
+        """Test JSON frames that are not objects get an error frame and the session goes on."""
+        with client.websocket_connect("/acg/scrub") as websocket:
+            websocket.send_json({
+                "type": "init",
+                "request": {"epoch": "2000-01-01T12:00:00Z", "bodies": [{"id": "Sun", "type": "planet"}]}
+            })
+            assert websocket.receive_json()["type"] == "ready"
+            
+            for frame in ([1, 2], 42):
+                websocket.send_json(frame)
+                assert websocket.receive_json() == {"type": "error", "message": "Messages must be JSON objects"}
+            
+            websocket.send_json({"type": "epoch", "epoch": "2000-01-01T12:00:00Z", "seq": 1})
+            assert websocket.receive_json()["seq"] == 1
+    
+    def test_scrub_requires_init(self, client):
+        """Test sessions must start with an init message."""
+        with client.websocket_connect("/acg/scrub") as websocket:
+            websocket.send_json({"type": "epoch", "epoch": "2000-01-01T12:00:00Z"})
+            assert websocket.receive_json()["type"] == "error"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
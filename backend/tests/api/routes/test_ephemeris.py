@@ -468,6 +468,63 @@ class TestErrorHandling:
         assert data["error"] == "internal_error"
 
 
+class TestConditionalRequests:
+    """Test ETags, 304 responses and cacheable GET variants."""
+    
+    request_data = {
+        "subject": {
+            "name": "ETag Test",
+            "datetime": {"iso_string": "2000-01-01T12:00:00"},
+            "latitude": {"decimal": 40.7128},
+            "longitude": {"decimal": -74.0060}
+        }
+    }
+    
+    def test_natal_etag_and_not_modified(self):
+        """Test a matching If-None-Match is answered without calculating."""
+        first = client.post("/ephemeris/natal", json=self.request_data)
+        etag = first.headers["ETag"]
+        
+        with patch('app.services.ephemeris_service.ephemeris_service.calculate_natal_chart') as mock_calculate:
+            second = client.post("/ephemeris/natal", json=self.request_data, headers={"If-None-Match": etag})
+        
+        assert first.status_code == 200
+        assert second.status_code == 304
+        mock_calculate.assert_not_called()
+    
+    def test_natal_get_variant_matches_post(self):
+        """Test the GET variant returns the same chart and ETag as POST."""
+        post = client.post("/ephemeris/natal", json=self.request_data)
+        get = client.get("/ephemeris/natal", params={
+            "name": "ETag Test", "datetime": "2000-01-01T12:00:00",
+            "latitude": 40.7128, "longitude": -74.0060
+        })
+        
+        assert get.status_code == 200
+        assert get.headers["ETag"] == post.headers["ETag"]
+        assert get.json()["planets"] == post.json()["planets"]
+    
+    def test_natal_get_variant_validation(self):
+        """Test invalid query parameters are rejected."""
+        response = client.get("/ephemeris/natal", params={
+            "datetime": "2000-01-01T12:00:00", "latitude": 0.0, "longitude": 0.0, "house_system": "Z"
+        })
+        
+        assert response.status_code == 422
+        assert response.json()["success"] is False
+    
+    def test_static_endpoints_are_cacheable(self):
+        """Test schema and reference endpoints revalidate to 304."""
+        for path in ("/ephemeris/schemas/natal-request", "/ephemeris/schemas/natal-response",
+                     "/ephemeris/house-systems", "/ephemeris/supported-objects"):
+            first = client.get(path)
+            second = client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+            
+            assert first.status_code == 200
+            assert first.headers["Cache-Control"] == "public, max-age=86400"
+            assert second.status_code == 304
+
+
 class TestResponseFormat:
     """Test API response formatting."""
     
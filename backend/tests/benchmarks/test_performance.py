@@ -7,6 +7,7 @@ including ephemeris calculations, batch processing, and caching.
 
 import pytest
 import time
+import threading
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any
 import statistics
@@ -21,8 +22,14 @@ except ImportError:
 
 from app.core.ephemeris.tools.ephemeris import get_planet, julian_day_from_datetime, get_houses
 from app.core.ephemeris.tools.batch import BatchCalculator, BatchRequest, create_batch_from_data
+from app.core.ephemeris.tools.relocation import calculate_relocation_grid, world_grid
 from app.core.ephemeris.const import SwePlanets
-from app.core.ephemeris.classes.cache import get_global_cache
+from app.core.ephemeris.classes.cache import (
+    EphemerisCache, ShardedEphemerisCache, get_global_cache, make_key
+)
+from app.core.ephemeris.classes.cache_codec import BinaryCodec, decode_entry
+from app.core.ephemeris.tools.ephemeris import get_point
+from app.core.ephemeris.tools.convert import string_to_decimal
 from app.core.ephemeris.classes.redis_cache import get_redis_cache
 
 
@@ -88,6 +95,18 @@ class TestEphemerisBenchmarks:
         # HouseSystem has 13 cusps (index 0 unused) and ascmc angles
         assert hasattr(result, 'house_cusps') and len(result.house_cusps) == 13
     
+    @pytest.mark.benchmark(group="house_calculations")
+    def test_relocation_grid_performance(self, benchmark, sample_julian_day):
+        """Benchmark angles and whole-sign cusps over a 1x1 degree world grid."""
+        if not pytest_benchmark_available:
+            pytest.skip("pytest-benchmark not available")
+        
+        latitudes, longitudes = world_grid(1.0)
+        result = benchmark(calculate_relocation_grid, sample_julian_day, latitudes, longitudes, 'W')
+        
+        assert len(result) == 181 * 360
+        assert result.cusps.shape == (181 * 360, 12)
+    
     @pytest.mark.benchmark(group="batch_calculations")
     def test_batch_calculation_performance(self, benchmark):
         """Benchmark batch processing performance."""
@@ -377,6 +396,195 @@ class TestPerformanceTargets:
         assert p95_time < 100.0    # 95th percentile under 100ms
 
 
+class TestCacheConcurrencyBenchmarks:
+    """Throughput of the memory cache under concurrent threads."""
+    
+    @staticmethod
+    def _throughput(cache, threads: int, operations: int = 20000) -> float:
+        """Mixed get/put operations per second across the given number of threads."""
+        keys = [f"key_{i}" for i in range(1000)]
+        for key in keys:
+            cache.put(key, key)
+        per_thread = operations // threads
+        barrier = threading.Barrier(threads + 1)
+        
+        def worker(offset):
+            barrier.wait()
+            for i in range(per_thread):
+                key = keys[(offset + i * 7) % len(keys)]
+                if i % 10 == 0:
+                    cache.put(key, key)
+                else:
+                    cache.get(key)
+        
+        workers = [threading.Thread(target=worker, args=(n * 131,)) for n in range(threads)]
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        start_time = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        return per_thread * threads / (time.perf_counter() - start_time)
+    
+    def test_thread_scaling(self):
+        """Compare single-lock and sharded throughput as threads are added."""
+        results = {}
+        for threads in (1, 2, 4, 8):
+            single = self._throughput(EphemerisCache(max_size=2000), threads)
+            sharded = self._throughput(ShardedEphemerisCache(max_size=2000, shards=8), threads)
+            results[threads] = (single, sharded)
+            print(f"Threads: {threads}, single lock: {single:,.0f} ops/s, "
+                  f"8 shards: {sharded:,.0f} ops/s")
+        
+        # Under the GIL the gain is reduced contention, not parallelism: throughput
+        # should hold up as threads are added rather than collapse
+        single_1, sharded_1 = results[1]
+        single_8, sharded_8 = results[8]
+        assert sharded_8 > 0.5 * sharded_1
+        assert single_8 > 0.25 * single_1
+
+
+class TestCacheKeyBenchmarks:
+    """Per-call overhead of @cached hits."""
+    
+    @staticmethod
+    def _per_call_us(func, *args, iterations: int = 5000) -> float:
+        func(*args)  # Warm the cache
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            func(*args)
+        return (time.perf_counter() - start_time) / iterations * 1e6
+    
+    def test_cached_hit_overhead(self):
+        """Report hit latency per decorated function and the cost of key building."""
+        timings = {
+            'get_point': self._per_call_us(get_point, 'north_node', 2451545.0),
+            'string_to_decimal': self._per_call_us(string_to_decimal, "45°30'15.5\""),
+        }
+        
+        args = ('app.core.ephemeris.tools.ephemeris.get_point', 'north_node', 2451545.0, 40.7, -74.0, 'P')
+        iterations = 20000
+        start_time = time.perf_counter()
+        for _ in range(iterations):
+            make_key(args, {})
+        timings['make_key'] = (time.perf_counter() - start_time) / iterations * 1e6
+        
+        for name, micros in timings.items():
+            print(f"{name}: {micros:.2f} us per cached call")
+        
+        assert timings['make_key'] < 10.0
+        assert timings['get_point'] < 50.0
+
+
+class TestCacheCodecBenchmarks:
+    """Redis/disk entry codec against the former pickle+gzip encoding."""
+    
+    def test_codec_vs_pickle_gzip(self):
+        """Compare encode/decode time and size for an ACG-shaped result."""
+        import gzip
+        import pickle
+        
+        # MC/IC-style lines: a constant longitude sampled over a latitude grid
+        value = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "LineString",
+                                 "coordinates": [[line * 1.9876543 - 180.0, i * 0.2497222 - 89.9]
+                                                 for i in range(721)]},
+                    "properties": {"id": f"Body{line % 10}", "line_type": ["MC", "IC", "AC", "DC"][line % 4],
+                                   "body_type": "planet", "epoch": "2000-01-01T12:00:00Z", "flags": 258}
+                }
+                for line in range(180)
+            ]
+        }
+        
+        def timed(func, iterations=5):
+            start_time = time.perf_counter()
+            for _ in range(iterations):
+                output = func()
+            return (time.perf_counter() - start_time) / iterations * 1000, output
+        
+        pickle_encode, pickled = timed(lambda: gzip.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+        pickle_decode, _ = timed(lambda: pickle.loads(gzip.decompress(pickled)))
+        print(f"pickle+gzip: encode {pickle_encode:.1f} ms, decode {pickle_decode:.1f} ms, {len(pickled)} bytes")
+        
+        for compressor in ('zlib', 'lzma', 'none'):
+            codec = BinaryCodec(default_compression=compressor)
+            encode_ms, encoded = timed(lambda: codec.encode(value))
+            decode_ms, decoded = timed(lambda: decode_entry(encoded))
+            assert decoded.value == value
+            print(f"binary/{compressor}: encode {encode_ms:.1f} ms, decode {decode_ms:.1f} ms, {len(encoded)} bytes")
+            if compressor == 'zlib':
+                assert encode_ms < pickle_encode
+                assert len(encoded) <= len(pickled) * 1.1
+
+
+class TestPackedResultBenchmarks:
+    """Memory footprint of ACG results in the in-memory tier."""
+    
+    def test_packed_result_density(self):
+        """Compare the dict tree with the packed form and time materialization."""
+        import sys
+        from app.core.acg.acg_core import ACGCalculationEngine
+        from app.core.acg.acg_packed import PackedACGResult
+        from app.core.acg.acg_types import ACGRequest
+        
+        def deep_size(value, seen):
+            if id(value) in seen:
+                return 0
+            seen.add(id(value))
+            size = sys.getsizeof(value)
+            if isinstance(value, dict):
+                size += sum(deep_size(key, seen) + deep_size(item, seen) for key, item in value.items())
+            elif isinstance(value, (list, tuple)):
+                size += sum(deep_size(item, seen) for item in value)
+            return size
+        
+        data = ACGCalculationEngine().calculate_acg_lines(ACGRequest(epoch="2000-01-01T12:00:00Z")).model_dump()
+        
+        start_time = time.perf_counter()
+        packed = PackedACGResult.pack(data)
+        pack_ms = (time.perf_counter() - start_time) * 1000
+        start_time = time.perf_counter()
+        packed.to_result()
+        materialize_ms = (time.perf_counter() - start_time) * 1000
+        
+        dict_bytes = deep_size(data, set())
+        print(f"dict tree: {dict_bytes} bytes, packed: {packed.nbytes} bytes "
+              f"({dict_bytes / packed.nbytes:.1f}x); pack {pack_ms:.1f} ms, materialize {materialize_ms:.1f} ms")
+        assert packed.nbytes * 4 < dict_bytes
+
+
+class TestSharedCacheBenchmarks:
+    """Cross-process shared memory cache lookups."""
+    
+    def test_shared_cache_hit_latency(self, tmp_path):
+        """Time lock-free hits for small entries and response-sized bodies."""
+        import os
+        from app.core.ephemeris.classes.shared_cache import SharedMemoryCache
+        
+        cache = SharedMemoryCache(str(tmp_path / "shared"), size_bytes=64 * 1024 * 1024, slots=4096)
+        cache.put("small", {"ra": 281.27, "dec": -23.03})
+        cache.put_bytes("response", os.urandom(1024 * 1024))
+        
+        for key, read in (("small", cache.get), ("response", cache.get_bytes)):
+            iterations = 2000
+            start_time = time.perf_counter()
+            for _ in range(iterations):
+                assert read(key) is not None
+            hit_us = (time.perf_counter() - start_time) / iterations * 1e6
+            print(f"shared cache hit ({key}): {hit_us:.1f} us")
+        
+        iterations = 2000
+        start_time = time.perf_counter()
+        for i in range(iterations):
+            cache.put(f"key:{i}", {"index": i})
+        print(f"shared cache put: {(time.perf_counter() - start_time) / iterations * 1e6:.1f} us")
+        cache.close()
+
+
 class TestCacheHitRateTarget:
     """Test cache hit rate targets."""
     
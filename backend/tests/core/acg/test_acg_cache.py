@@ -15,7 +15,14 @@ import time
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
-from app.core.acg.acg_cache import ACGCacheManager, get_acg_cache_manager, ACGPerformanceOptimizer
+import gzip
+
+from app.core.acg.acg_cache import (
+    ACGCacheManager, get_acg_cache_manager, ACGPerformanceOptimizer, CachedResponse, accepts_gzip
+)
+from app.core.acg.acg_refresh import ACGRefreshAhead
+from app.core.ephemeris.classes.cache import EphemerisCache
+from app.core.ephemeris.classes.redis_cache import CachedEntry, RedisCache
 from app.core.acg.acg_types import (
     ACGRequest, ACGResult, ACGBody, ACGBodyType, ACGOptions
 )
@@ -164,6 +171,33 @@ class TestACGCacheManager:
         assert result is None
         assert cache_manager.stats['errors'] >= 1
 
+    def test_redis_read_last_and_promoted(self, cache_manager, sample_request, sample_result):
+        """Test Redis is only asked on a memory miss and its hits are promoted to memory."""
+        cache_manager.memory_cache = EphemerisCache(max_size=100)
+        cache_manager.redis_cache = MagicMock(enabled=True)
+        cache_manager.redis_cache.get_with_refresh.return_value = CachedEntry(sample_result.model_dump())
+
+        assert cache_manager.get_cached_result(sample_request) == sample_result
+        assert cache_manager.get_cached_result(sample_request) == sample_result
+
+        cache_manager.redis_cache.get_with_refresh.assert_called_once()
+        assert cache_manager.stats['hits'] == 2
+
+    def test_redis_hits_promoted_with_remaining_ttl(self, cache_manager, sample_request, sample_result):
+        """Test a Redis hit is kept in memory no longer than Redis keeps it, with its stored cost."""
+        cache_manager.memory_cache = EphemerisCache(max_size=100)
+        cache_manager.redis_cache = MagicMock(enabled=True)
+        expires_at = time.time() + 30
+        cache_manager.redis_cache.get_with_refresh.return_value = CachedEntry(
+            sample_result.model_dump(), False, 2.5, expires_at
+        )
+
+        assert cache_manager.get_cached_result(sample_request) == sample_result
+
+        entry = cache_manager.memory_cache.get_entry(cache_manager.generate_cache_key(sample_request, "result"))
+        assert entry.cost == 2.5
+        assert entry.expires_at == pytest.approx(expires_at, abs=1)
+
 
 class TestCacheStatisticsAndManagement:
     """Test cache statistics and management functions."""
@@ -287,6 +321,55 @@ class TestBatchOptimization:
         assert cached_index == 0  # First request was cached
         assert isinstance(cached_result, ACGResult)
     
+    def test_bulk_results_one_redis_call_each_way(self, cache_manager, batch_requests):
+        """Test bulk lookups read memory first and Redis once for the rest, and bulk stores write Redis once."""
+        cache_manager.memory_cache = EphemerisCache(max_size=100)
+        cache_manager.redis_cache = MagicMock(enabled=True)
+        sample_result = ACGResult(type="FeatureCollection", features=[])
+        
+        assert cache_manager.mset_results([(request, sample_result, 0.1) for request in batch_requests[:2]])
+        cache_manager.redis_cache.mset_results.assert_called_once()
+        assert len(cache_manager.redis_cache.mset_results.call_args[0][1]) == 2
+        
+        cache_manager.memory_cache.invalidate(cache_manager.generate_cache_key(batch_requests[1], "result"))
+        cache_manager.redis_cache.mget_results.return_value = [CachedEntry(sample_result.model_dump()), CachedEntry(None)]
+        results = cache_manager.mget_results(batch_requests)
+        
+        assert [result is not None for result in results] == [True, True, False]
+        assert all(isinstance(result, ACGResult) for result in results[:2])
+        cache_manager.redis_cache.mget_results.assert_called_once()
+        assert cache_manager.redis_cache.mget_results.call_args[0][1] == [
+            cache_manager._redis_key_data(request) for request in batch_requests[1:]
+        ]
+        assert cache_manager.stats['hits'] == 2 and cache_manager.stats['misses'] == 1
+    
+    def test_engine_batch_uses_bulk_cache_calls(self, cache_manager, batch_requests):
+        """Test engine batches calculate misses once per canonical request and report errors per item."""
+        from app.core.acg.acg_core import ACGCalculationEngine
+        engine = ACGCalculationEngine()
+        engine.cache_manager = cache_manager
+        sample_result = ACGResult(type="FeatureCollection", features=[])
+        calculated = []
+        
+        def calculate(request, calc_start_time):
+            calculated.append(request)
+            if request.epoch.startswith("2000-01-01T13"):
+                raise RuntimeError("boom")
+            return sample_result
+        
+        requests = batch_requests + [batch_requests[1].model_copy(update={"correlation_id": "again"})]
+        with patch.object(cache_manager, 'mget_results', return_value=[sample_result, None, None, None]) as mget, \
+                patch.object(cache_manager, 'mset_results') as mset, \
+                patch.object(engine, '_calculate', side_effect=calculate):
+            results = engine.calculate_acg_batch(requests)
+        
+        assert results[0] is sample_result and results[1] is sample_result and results[3] is sample_result
+        assert isinstance(results[2], RuntimeError)
+        assert calculated == batch_requests[1:]
+        mget.assert_called_once_with(requests)
+        mset.assert_called_once()
+        assert [item[0] for item in mset.call_args[0][0]] == [batch_requests[1]]
+    
     def test_batch_optimization_disabled(self, cache_manager, batch_requests):
         """Test batch optimization when disabled."""
         cache_manager.enable_batch_optimization = False
@@ -353,6 +436,299 @@ class TestPositionCaching:
         # Should now return cached positions
         # Note: This test may pass even if caching doesn't work,
         # depending on implementation details
+    
+    def test_position_redis_round_trips_are_batched(self, cache_manager):
+        """Test memory misses are fetched with one multi-get and stored with one pipeline."""
+        redis_cache = MagicMock(enabled=True)
+        redis_cache.get_many.return_value = [(1.0, 2.0, 3.0, 4.0, 5.0, 6.0), None]
+        cache_manager.redis_cache = redis_cache
+        cache_manager.set_cached_body_positions({"Sun": (0.0,) * 6}, 2460000.5)
+        
+        cached = cache_manager.get_cached_body_positions(["Sun", "Moon", "Mars"], 2460000.5)
+        
+        assert set(cached) == {"Sun", "Moon"}
+        redis_cache.get_many.assert_called_once()
+        assert [d['body_id'] for d in redis_cache.get_many.call_args[0][1]] == ["Moon", "Mars"]
+        redis_cache.set_many.assert_called_once()
+        # Redis hits are promoted to memory
+        assert cache_manager.get_cached_body_positions(["Moon"], 2460000.5)["Moon"][0] == 1.0
+    
+    def test_engine_reuses_cached_positions(self, cache_manager):
+        """Test the engine only calculates bodies missing from the position cache."""
+        from app.core.acg.acg_core import ACGCalculationEngine
+        engine = ACGCalculationEngine()
+        engine.cache_manager = cache_manager
+        bodies = [ACGBody(id=name, type=ACGBodyType.PLANET) for name in ("Sun", "Moon")]
+        
+        first = engine.calculate_body_positions(bodies[:1], 2460001.5)
+        with patch.object(engine, 'calculate_body_position', wraps=engine.calculate_body_position) as calc:
+            second = engine.calculate_body_positions(bodies, 2460001.5)
+        
+        assert [call.args[0].id for call in calc.call_args_list] == ["Moon"]
+        assert second["Sun"][0] == first["Sun"][0]
+        assert isinstance(cache_manager.get_cached_body_positions(["Sun"], 2460001.5)["Sun"], tuple)
+
+
+class TestLineCaching:
+    """Test line-granular component caching."""
+    
+    JD = 2451545.0
+    EPOCH = "2000-01-01T12:00:00Z"
+    
+    @pytest.fixture
+    def engine(self):
+        """Engine with a fresh cache manager and its own memory cache."""
+        from app.core.acg.acg_core import ACGCalculationEngine
+        engine = ACGCalculationEngine()
+        engine.cache_manager = ACGCacheManager()
+        # Keep positions cached by other tests in the global cache out of these runs
+        engine.cache_manager.memory_cache = EphemerisCache(max_size=1000)
+        return engine
+    
+    @staticmethod
+    def _bodies(*names):
+        return [ACGBody(id=name, type=ACGBodyType.PLANET) for name in names]
+    
+    @staticmethod
+    def _summary(lines):
+        return [
+            (line.line_type, line.metadata.id, line.metadata.line.angle, line.geometry)
+            for line in lines
+        ]
+    
+    def test_line_cache_key_components(self):
+        """Test line keys separate body, line type, aspect and resolution."""
+        cache_manager = ACGCacheManager()
+        key = cache_manager.generate_line_cache_key(self.JD, None, "Sun", "MC", None, 721)
+        
+        assert key.startswith("line:v1.0.0:")
+        assert key != cache_manager.generate_line_cache_key(self.JD, None, "Moon", "MC", None, 721)
+        assert key != cache_manager.generate_line_cache_key(self.JD, None, "Sun", "MC_ASPECT", 90, 721)
+        assert key != cache_manager.generate_line_cache_key(self.JD, None, "Sun", "MC", None, 1441)
+    
+    def test_added_body_reuses_cached_lines(self, engine):
+        """Test adding a body only computes the new body's lines."""
+        options = ACGOptions(line_types=["MC", "IC", "AC", "DC"], include_parans=False)
+        engine.calculate_epoch_lines(self._bodies("Sun"), options, self.JD, self.EPOCH)
+        stats = engine.cache_manager.stats
+        assert stats['line_hits'] == 0
+        
+        engine.calculate_epoch_lines(self._bodies("Sun", "Moon"), options, self.JD, self.EPOCH)
+        assert stats['line_hits'] == 2  # Sun MC/IC and AC/DC groups
+        assert stats['line_misses'] == 4
+    
+    def test_assembled_lines_match_uncached(self, engine):
+        """Test lines assembled from components equal freshly computed lines."""
+        options = ACGOptions(aspects=["square", "trine"], include_parans=True)
+        bodies = self._bodies("Sun", "Moon")
+        # AC aspect lines are a full-globe contour search; too slow for a unit test
+        engine.calculate_ac_aspect_lines = lambda *args: []
+        
+        fresh = engine.calculate_epoch_lines(bodies, options, self.JD, self.EPOCH, use_line_cache=False)
+        engine.calculate_epoch_lines(bodies, options, self.JD, self.EPOCH)
+        assembled = engine.calculate_epoch_lines(bodies, options, self.JD, self.EPOCH)
+        
+        assert engine.cache_manager.stats['line_hits'] > 0
+        assert self._summary(assembled) == self._summary(fresh)
+    
+    def test_metadata_follows_request(self, engine):
+        """Test cached components take epoch metadata from the current request."""
+        options = ACGOptions(line_types=["MC"])
+        engine.calculate_epoch_lines(self._bodies("Sun"), options, self.JD, self.EPOCH)
+        lines = engine.calculate_epoch_lines(self._bodies("Sun"), options, self.JD, "2000-01-01T12:00:00.000Z")
+        
+        assert engine.cache_manager.stats['line_hits'] == 1
+        assert all(line.metadata.epoch == "2000-01-01T12:00:00.000Z" for line in lines)
+    
+    def test_line_caching_disabled(self, engine):
+        """Test disabling line caching bypasses the component cache."""
+        engine.cache_manager.enable_line_caching = False
+        options = ACGOptions(line_types=["MC"])
+        engine.calculate_epoch_lines(self._bodies("Sun"), options, self.JD, self.EPOCH)
+        engine.calculate_epoch_lines(self._bodies("Sun"), options, self.JD, self.EPOCH)
+        
+        assert engine.cache_manager.line_cache.size() == 0
+        assert engine.cache_manager.stats['line_hits'] == 0
+        assert engine.cache_manager.get_cached_lines(["any"]) is None
+    
+    def test_line_cache_statistics_and_clear(self, engine):
+        """Test statistics report the line cache and clearing empties it."""
+        engine.calculate_epoch_lines(self._bodies("Sun"), ACGOptions(), self.JD, self.EPOCH)
+        line_stats = engine.cache_manager.get_cache_statistics()['line_cache']
+        
+        assert line_stats['size'] > 0
+        assert line_stats['misses'] == 2
+        
+        engine.cache_manager.clear_cache()
+        assert engine.cache_manager.line_cache.size() == 0
+
+
+class TestResponseCaching:
+    """Test pre-serialized response caching."""
+    
+    @pytest.fixture
+    def request_data(self):
+        """Sample ACG request."""
+        return ACGRequest(epoch="2000-01-01T12:00:00Z", bodies=[ACGBody(id="Sun", type=ACGBodyType.PLANET)])
+    
+    @pytest.fixture
+    def result(self):
+        """Result large enough to get a gzip variant."""
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": [[0.5, lat] for lat in range(-89, 90)]},
+            "properties": {"id": "Sun", "type": "body"}
+        }
+        return ACGResult(type="FeatureCollection", features=[feature])
+    
+    def test_encoded_variants(self, result):
+        """Test both variants decode to the serialized result."""
+        encoded = CachedResponse.encode(result)
+        
+        assert encoded.body == result.model_dump_json().encode()
+        assert gzip.decompress(encoded.gzip_body) == encoded.body
+        assert encoded.features_count == 1
+        assert CachedResponse.encode(ACGResult(type="FeatureCollection", features=[])).gzip_body is None
+    
+    def test_accepts_gzip(self):
+        """Test Accept-Encoding parsing."""
+        assert accepts_gzip("gzip, deflate, br")
+        assert accepts_gzip("br;q=1.0, gzip;q=0.5")
+        assert accepts_gzip("*")
+        assert not accepts_gzip("gzip;q=0")
+        assert not accepts_gzip("identity")
+        assert not accepts_gzip(None)
+    
+    def test_set_and_get_response(self, request_data, result):
+        """Test stored responses are returned as is and counted in statistics."""
+        cache_manager = ACGCacheManager()
+        assert cache_manager.get_cached_response(request_data) is None
+        
+        encoded = cache_manager.set_cached_response(request_data, result)
+        
+        assert cache_manager.get_cached_response(request_data) is encoded
+        stats = cache_manager.get_cache_statistics()['response_cache']
+        assert stats['hits'] == 1 and stats['misses'] == 1 and stats['size'] == 1
+        
+        cache_manager.clear_cache()
+        assert cache_manager.get_cached_response(request_data) is None
+
+    def test_response_cache_byte_budget(self, result):
+        """Test the response cache evicts by encoded size, not only by entry count."""
+        body_bytes = len(CachedResponse.encode(result).body)
+        with patch('app.core.acg.acg_cache.settings.acg_response_cache_max_bytes', 3 * body_bytes):
+            cache_manager = ACGCacheManager()
+        
+        for hour in range(10):
+            request = ACGRequest(epoch=f"2000-01-01T{hour:02d}:00:00Z", bodies=[ACGBody(id="Sun", type=ACGBodyType.PLANET)])
+            cache_manager.set_cached_response(request, result)
+        
+        stats = cache_manager.get_cache_statistics()['response_cache']
+        assert 0 < stats['size'] < 3
+        assert stats['size_bytes'] <= 3 * body_bytes
+
+    def test_response_callers_skip_result_store(self, request_data, result):
+        """Test calculations for a stored response are not also stored as results."""
+        from app.core.acg.acg_core import ACGCalculationEngine
+        engine = ACGCalculationEngine()
+        engine.cache_manager = ACGCacheManager()
+        engine.cache_manager.memory_cache = EphemerisCache(max_size=100)
+
+        with patch.object(engine, '_calculate', return_value=result), \
+                patch.object(engine.cache_manager, 'set_cached_result') as set_result:
+            assert engine.calculate_acg_lines(request_data, store_result=False) is result
+            set_result.assert_not_called()
+            engine.calculate_acg_lines(request_data)
+            set_result.assert_called_once()
+
+
+class TestEarlyRefresh:
+    """Test probabilistic early expiration and refresh-ahead."""
+    
+    @staticmethod
+    def _request(epoch):
+        """Sun-only request at a test-specific epoch."""
+        return ACGRequest(epoch=epoch, bodies=[ACGBody(id="Sun", type=ACGBodyType.PLANET)])
+    
+    @staticmethod
+    def _result():
+        """Minimal result."""
+        return ACGResult(type="FeatureCollection", features=[
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0.0, 0.0]}, "properties": {"id": "Sun"}}
+        ])
+    
+    def test_one_reader_refreshes_early(self):
+        """Test a firing XFetch draw turns exactly one hit into a miss."""
+        cache_manager = ACGCacheManager()
+        request = self._request("2011-11-11T11:11:11Z")
+        cache_manager.set_cached_result(request, self._result(), ttl=60, compute_time=30.0)
+        
+        with patch('app.core.ephemeris.classes.cache.random.random', return_value=0.999999):
+            assert cache_manager.get_cached_result(request) is None
+            # The refresh is claimed; everyone else keeps the valid value
+            assert cache_manager.get_cached_result(request) is not None
+        
+        assert cache_manager.stats['early_refreshes'] == 1
+        
+        # Re-caching releases the claim
+        cache_manager.set_cached_result(request, self._result(), ttl=60, compute_time=0.01)
+        assert cache_manager.get_cached_result(request) is not None
+    
+    def test_entries_without_cost_expire_normally(self):
+        """Test results cached without a compute cost are never refreshed early."""
+        cache_manager = ACGCacheManager()
+        request = self._request("2011-11-12T11:11:11Z")
+        cache_manager.set_cached_result(request, self._result(), ttl=60)
+        
+        with patch('app.core.ephemeris.classes.cache.random.random', return_value=0.999999):
+            assert cache_manager.get_cached_result(request) is not None
+        assert cache_manager.stats['early_refreshes'] == 0
+    
+    def test_redis_entries_carry_metadata(self):
+        """Test Redis entries round-trip with cost and expiry and claim refreshes once."""
+        store = {}
+        client = MagicMock()
+        client.get.side_effect = store.get
+        client.set.side_effect = lambda key, value, nx=False, px=None: (
+            False if nx and key in store else store.__setitem__(key, value) or True
+        )
+        client.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value) or True
+        redis_cache = RedisCache.__new__(RedisCache)
+        redis_cache.enabled, redis_cache.client = True, client
+        redis_cache.hits = redis_cache.misses = redis_cache.errors = 0
+        
+        redis_cache.set("test", {"k": 1}, {"value": 1}, ttl=60, cost=30.0)
+        assert redis_cache.get("test", {"k": 1}) == {"value": 1}
+        
+        with patch('app.core.ephemeris.classes.cache.random.random', return_value=0.999999):
+            assert redis_cache.get_with_refresh("test", {"k": 1})[:3] == ({"value": 1}, True, 30.0)
+            assert redis_cache.get_with_refresh("test", {"k": 1})[:2] == ({"value": 1}, False)
+        with patch('app.core.ephemeris.classes.cache.random.random', return_value=0.0):
+            redis_cache.set("test", {"k": 2}, {"value": 2}, ttl=60, cost=30.0)
+            assert redis_cache.get_with_refresh("test", {"k": 2})[:2] == ({"value": 2}, False)
+    
+    def test_refresh_ahead_recalculates_popular_results(self):
+        """Test popular results near expiry are recalculated once per claim."""
+        cache_manager = ACGCacheManager()
+        popular = self._request("2011-11-13T11:11:11Z")
+        unpopular = self._request("2011-11-14T11:11:11Z")
+        result = self._result()
+        for request in (popular, unpopular):
+            cache_manager.set_cached_result(request, result, ttl=60, compute_time=0.01)
+        for _ in range(4):
+            cache_manager.get_cached_result(popular)
+        
+        engine = MagicMock(cache_manager=cache_manager)
+        engine.refresh_acg_lines.return_value = result
+        worker = ACGRefreshAhead(engine, interval_seconds=30, min_hits=3, window_seconds=120)
+        
+        assert worker.run_once() == 1
+        engine.refresh_acg_lines.assert_called_once_with(popular)
+        assert cache_manager.get_cached_response(popular) is not None
+        
+        # Claimed for the interval, and hit counts have decayed below the threshold
+        assert worker.run_once() == 0
+        assert worker.stats()['refreshed'] == 1
 
 
 class TestPerformanceOptimizer:
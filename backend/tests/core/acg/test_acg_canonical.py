@@ -0,0 +1,130 @@
+"""
+Test Suite for ACG Canonical Requests
+
+Tests for the canonical request form shared by the cache tiers including:
+- Epoch resolution across formats and offsets
+- Set ordering and default removal
+- Epoch quantization
+- Cache keys derived from the canonical form
+"""
+
+import pytest
+
+from app.core.acg.acg_cache import ACGCacheManager
+from app.core.acg.acg_canonical import (
+    canonical_request, canonical_request_hash, quantize_jd, resolve_epoch_jd, resolve_request_epoch,
+    resolve_request_jd
+)
+from app.core.acg.acg_types import ACGBody, ACGBodyType, ACGNatalData, ACGOptions, ACGRequest
+
+
+def _request(epoch="2000-01-01T12:00:00Z", bodies=("Sun", "Moon"), **kwargs):
+    """ACG request for planets."""
+    return ACGRequest(
+        epoch=epoch,
+        bodies=[ACGBody(id=body_id, type=ACGBodyType.PLANET) for body_id in bodies],
+        **kwargs
+    )
+
+
+class TestCanonicalRequest:
+    """Test requests for the same calculation share a canonical form."""
+
+    def test_epoch_formats_agree(self):
+        """Test Z, +00:00, other offsets and jd of one instant agree."""
+        hashes = {
+            canonical_request_hash(_request("2000-01-01T12:00:00Z")),
+            canonical_request_hash(_request("2000-01-01T12:00:00+00:00")),
+            canonical_request_hash(_request("2000-01-01T14:00:00+02:00")),
+            canonical_request_hash(_request("2000-01-01T12:00:00Z", jd=2451545.0)),
+        }
+
+        assert len(hashes) == 1
+        assert resolve_epoch_jd("2000-01-01T12:00:00Z") == 2451545.0
+
+    def test_sets_are_sorted(self):
+        """Test body, line type and aspect order does not matter."""
+        first = _request(
+            bodies=("Sun", "Moon"),
+            options=ACGOptions(line_types=["MC", "IC"], aspects=["trine", "square"])
+        )
+        second = _request(
+            bodies=("Moon", "Sun"),
+            options=ACGOptions(line_types=["IC", "MC"], aspects=["square", "trine"])
+        )
+
+        assert canonical_request(first) == canonical_request(second)
+
+    def test_defaults_are_dropped(self):
+        """Test explicit defaults equal omitted values."""
+        implicit = _request()
+        explicit = _request(
+            options=ACGOptions(line_types=["AC", "DC", "IC", "MC"], aspects=[], include_parans=True, orb_deg=1.0),
+            natal=ACGNatalData(houses_system="placidus")
+        )
+
+        assert canonical_request(explicit) == canonical_request(implicit)
+        assert set(canonical_request(implicit)) == {'jd', 'bodies'}
+
+    def test_differences_are_kept(self):
+        """Test requests for different calculations stay distinct."""
+        base = canonical_request_hash(_request())
+
+        assert canonical_request_hash(_request(bodies=("Sun",))) != base
+        assert canonical_request_hash(_request(options=ACGOptions(include_parans=False))) != base
+        assert canonical_request_hash(_request("2000-01-01T12:00:01Z")) != base
+        assert canonical_request_hash(
+            _request(natal=ACGNatalData(birthplace_lat=40.7, birthplace_lon=-74.0))
+        ) != base
+
+
+class TestEpochQuantization:
+    """Test optional epoch quantization."""
+
+    def test_quantize_jd(self):
+        """Test Julian Days round to the quantum."""
+        minute = 60.0 / 86400.0
+
+        assert quantize_jd(2451545.0 + 0.4 * minute, 60) == pytest.approx(2451545.0)
+        assert quantize_jd(2451545.0 + 0.6 * minute, 60) == pytest.approx(2451545.0 + minute)
+        assert quantize_jd(2451545.0 + 0.4 * minute, None) == 2451545.0 + 0.4 * minute
+
+    def test_quantized_requests_share_key(self):
+        """Test epochs within one quantum share a key and calculation instant."""
+        first = _request("2000-01-01T12:00:10Z")
+        second = _request("2000-01-01T11:59:50Z")
+
+        assert canonical_request_hash(first, 60) == canonical_request_hash(second, 60)
+        assert canonical_request_hash(first) != canonical_request_hash(second)
+        assert resolve_request_jd(first, 60) == resolve_request_jd(second, 60)
+
+    def test_quantized_requests_share_epoch_label(self):
+        """Test results are labelled with the rounded instant, not the first requester's epoch."""
+        first = _request("2000-01-01T12:00:10Z")
+        second = _request("2000-01-01T11:59:50+00:00")
+
+        assert resolve_request_epoch(first, 60) == "2000-01-01T12:00:00Z"
+        assert resolve_request_epoch(second, 60) == "2000-01-01T12:00:00Z"
+        assert resolve_request_epoch(_request("2000-01-01T12:00:00.270Z"), 0.1) == "2000-01-01T12:00:00.300Z"
+        assert resolve_request_epoch(first, 0) == "2000-01-01T12:00:10Z"
+
+    def test_natal_epoch_is_not_quantized(self):
+        """Test natal context keeps the exact epoch."""
+        natal = ACGNatalData(birthplace_lat=40.7, birthplace_lon=-74.0)
+        first = _request("2000-01-01T12:00:10Z", natal=natal)
+        second = _request("2000-01-01T11:59:50Z", natal=natal)
+
+        assert canonical_request_hash(first, 60) != canonical_request_hash(second, 60)
+
+
+class TestCanonicalCacheKeys:
+    """Test cache tiers key on the canonical form."""
+
+    def test_memory_and_redis_keys_agree(self):
+        """Test equivalent requests map to the same memory and Redis keys."""
+        cache_manager = ACGCacheManager()
+        first = _request("2000-01-01T12:00:00Z", bodies=("Sun", "Moon"))
+        second = _request("2000-01-01T12:00:00+00:00", bodies=("Moon", "Sun"), correlation_id="req_1")
+
+        assert cache_manager.generate_cache_key(first) == cache_manager.generate_cache_key(second)
+        assert cache_manager._redis_key_data(first) == cache_manager._redis_key_data(second)
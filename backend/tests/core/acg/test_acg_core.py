@@ -15,6 +15,7 @@ from datetime import datetime
 from unittest.mock import patch, MagicMock
 
 from app.core.acg.acg_core import ACGCalculationEngine
+from app.core.acg.acg_cache import ACGCacheManager
 from app.core.acg.acg_types import (
     ACGRequest, ACGBody, ACGBodyType, ACGOptions, ACGNatalData,
     ACGCoordinates, ACGBodyData, ACGLineType
@@ -316,6 +317,9 @@ class TestACGRequestProcessing:
             )
         
         engine.calculate_body_position = mock_calc_body_position
+        # Keep mocked positions and lines out of the shared caches
+        engine.cache_manager = ACGCacheManager()
+        engine.cache_manager.enable_position_caching = False
         
         try:
             result = engine.calculate_acg_lines(valid_request)
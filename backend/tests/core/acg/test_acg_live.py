@@ -0,0 +1,202 @@
+"""
+Test Suite for ACG Live Sky
+
+Tests for the current-sky ACG product including:
+- Interval-aligned epochs and snapshot serialization
+- Snapshot reuse within an interval
+- Subscriber fan-out for the SSE stream
+- Sharing snapshots between workers through Redis
+- ETag matching and SSE framing
+"""
+
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import MagicMock
+
+from app.core.acg.acg_live import ACGLiveSky, etag_matches, format_sse
+from app.core.acg.acg_types import ACGResult
+from app.core.ephemeris.classes.redis_cache import RedisCache
+
+
+@pytest.fixture
+def engine():
+    """Engine stub returning a one-feature FeatureCollection."""
+    engine = MagicMock()
+    engine.calculate_acg_lines.return_value = ACGResult(
+        type="FeatureCollection",
+        features=[{
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": [[0, 0], [0, 1]]},
+            "properties": {"id": "Sun", "source": "Meridian-ACG"}
+        }]
+    )
+    return engine
+
+
+class TestACGLiveSky:
+    """Test live sky snapshot scheduling and publishing."""
+
+    def test_epoch_alignment(self, engine):
+        """Test epochs snap to the start of the interval."""
+        live_sky = ACGLiveSky(engine, interval_seconds=60)
+        assert live_sky.current_epoch(946728059.5) == 946728000.0
+
+    def test_compute_snapshot(self, engine):
+        """Test snapshots hold the serialized result and a strong ETag."""
+        live_sky = ACGLiveSky(engine, interval_seconds=60)
+        snapshot = live_sky.compute_snapshot(946728000.0)
+
+        assert snapshot.epoch == "2000-01-01T12:00:00Z"
+        assert json.loads(snapshot.body)["type"] == "FeatureCollection"
+        assert snapshot.features_count == 1
+        assert snapshot.etag.startswith('"') and snapshot.etag.endswith('"')
+
+        request = engine.calculate_acg_lines.call_args[0][0]
+        assert request.epoch == "2000-01-01T12:00:00Z"
+        assert request.bodies is None
+
+    def test_snapshot_reused_within_interval(self, engine):
+        """Test repeated reads in one interval compute only once."""
+        live_sky = ACGLiveSky(engine, interval_seconds=3600)
+
+        first = live_sky.get_snapshot()
+        second = live_sky.get_snapshot()
+
+        assert first is second
+        assert engine.calculate_acg_lines.call_count == 1
+
+    def test_max_age_counts_down_to_next_refresh(self, engine):
+        """Test max-age is the time left in the snapshot's interval."""
+        live_sky = ACGLiveSky(engine, interval_seconds=60)
+        snapshot = live_sky.compute_snapshot(1000.0 * 60)
+
+        assert live_sky.max_age(snapshot, now=1000.0 * 60 + 15) == 45
+        assert live_sky.max_age(snapshot, now=1000.0 * 60 + 90) == 0
+
+    def test_subscribers_receive_refreshes(self, engine):
+        """Test a subscriber gets the current snapshot and later updates."""
+        live_sky = ACGLiveSky(engine, interval_seconds=60)
+        initial = live_sky.refresh(60.0)
+
+        async def consume():
+            received = []
+            stream = live_sky.subscribe(keepalive_seconds=5)
+            received.append(await stream.__anext__())
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, live_sky.refresh, 120.0)
+            received.append(await stream.__anext__())
+            await stream.aclose()
+            return received
+
+        received = asyncio.run(consume())
+
+        assert received[0] is initial
+        assert received[1].epoch_ts == 120.0
+        assert live_sky.subscriber_count() == 0
+
+    def test_subscriber_keepalive(self, engine):
+        """Test idle subscribers receive keep-alive markers."""
+        live_sky = ACGLiveSky(engine, interval_seconds=60)
+
+        async def consume():
+            stream = live_sky.subscribe(keepalive_seconds=0.01)
+            item = await stream.__anext__()
+            await stream.aclose()
+            return item
+
+        assert asyncio.run(consume()) is None
+
+    def test_start_and_stop(self, engine):
+        """Test the scheduler thread produces a snapshot and stops."""
+        live_sky = ACGLiveSky(engine, interval_seconds=3600)
+        live_sky.start()
+        try:
+            for _ in range(100):
+                if live_sky.snapshot is not None:
+                    break
+                time.sleep(0.01)
+            assert live_sky.snapshot is not None
+            assert live_sky.running
+        finally:
+            live_sky.stop()
+        assert not live_sky.running
+
+
+class _DictRedis:
+    """Redis stand-in with the commands snapshots and leases use."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        return True
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+class TestSharedLiveSky:
+    """Test workers share one snapshot computation per interval."""
+
+    def test_second_worker_adopts_snapshot(self, engine):
+        """Test a worker refreshing after another adopts its snapshot instead of computing."""
+        redis_cache = RedisCache.from_clients({"redis-0:6379": _DictRedis()})
+        workers = [ACGLiveSky(engine, interval_seconds=60, redis_cache=redis_cache) for _ in range(2)]
+
+        first = workers[0].refresh(120.0)
+        second = workers[1].refresh(120.0)
+
+        assert engine.calculate_acg_lines.call_count == 1
+        assert second == first
+        workers[1].refresh(180.0)
+        assert engine.calculate_acg_lines.call_count == 2
+
+    def test_without_redis_each_worker_computes(self, engine):
+        """Test workers without an enabled Redis cache compute their own snapshots."""
+        redis_cache = RedisCache.from_clients({})
+        workers = [ACGLiveSky(engine, interval_seconds=60, redis_cache=redis_cache) for _ in range(2)]
+
+        for worker in workers:
+            worker.refresh(120.0)
+
+        assert engine.calculate_acg_lines.call_count == 2
+
+
+class TestLiveHelpers:
+    """Test ETag matching and SSE framing helpers."""
+
+    def test_etag_matches(self):
+        """Test If-None-Match comparison rules."""
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches('"x", "abc"', '"abc"')
+        assert etag_matches('*', '"abc"')
+        assert not etag_matches('"abd"', '"abc"')
+        assert not etag_matches(None, '"abc"')
+
+    def test_format_sse(self, engine):
+        """Test snapshots are framed as one SSE message."""
+        snapshot = ACGLiveSky(engine).compute_snapshot(0.0)
+        message = format_sse(snapshot)
+
+        assert message.startswith(b"id: ")
+        assert b"\nevent: acg-live\ndata: {" in message
+        assert message.endswith(b"}\n\n")
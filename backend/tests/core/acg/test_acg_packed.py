@@ -0,0 +1,129 @@
+"""
+Test Suite for ACG Packed Results
+
+Tests for the memory-compact in-memory form of ACG results including:
+- Exact round trips of dumped results and edge-case values
+- Geometry held as read-only float arrays, strings and key tuples shared
+- Packed footprint against the dict tree
+- Packed storage in the ACG cache manager's memory tier
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+from app.core.acg.acg_cache import ACGCacheManager
+from app.core.acg.acg_core import ACGCalculationEngine
+from app.core.acg.acg_packed import PackedACGResult
+from app.core.acg.acg_types import ACGBody, ACGBodyType, ACGOptions, ACGRequest, ACGResult
+from app.core.ephemeris.classes.cache import estimate_size
+
+
+def _request(epoch="2000-01-01T12:00:00Z"):
+    """ACG request for Sun and Moon angle lines."""
+    return ACGRequest(
+        epoch=epoch,
+        bodies=[ACGBody(id=body_id, type=ACGBodyType.PLANET) for body_id in ("Sun", "Moon")],
+        options=ACGOptions(line_types=["MC", "IC", "AC", "DC"], include_parans=False)
+    )
+
+
+def _deep_size(value, seen=None):
+    """Memory held by a dict/list tree, counting shared objects once."""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(key, seen) + _deep_size(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_deep_size(item, seen) for item in value)
+    return size
+
+
+@pytest.fixture(scope="module")
+def result():
+    """Calculated ACG result."""
+    return ACGCalculationEngine().calculate_acg_lines(_request())
+
+
+class TestPackedResult:
+    """Test packing and materializing results."""
+
+    def test_round_trip(self, result):
+        """Test a calculated result materializes to the same dump and model."""
+        data = result.model_dump()
+        packed = PackedACGResult.pack(data)
+
+        assert packed.to_dict() == data
+        assert packed.to_result() == result
+        assert packed.features_count == len(result.features)
+
+    def test_edge_case_values(self):
+        """Test only rectangular float lists become arrays and types survive."""
+        data = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "polygon": [[[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]], [[6.0, 7.0], [8.0, 9.0]]],
+                    "ints": [1, 2, 3, 4, 5],
+                    "mixed": [1.0, 2, 3.0, 4.0],
+                    "short": [1.0, 2.0],
+                    "empty": [],
+                    "pair": (1.0, 2.0, 3.0, 4.0),
+                    "gmst": np.float64(280.5),
+                    "nothing": None,
+                }
+            ]
+        }
+        materialized = PackedACGResult.pack(data).to_dict()
+        feature = materialized["features"][0]
+
+        assert materialized == data
+        assert [type(item) for item in feature["mixed"]] == [float, int, float, float]
+        assert type(feature["pair"]) is tuple
+        assert type(feature["gmst"]) is np.float64
+
+    def test_geometry_is_packed(self, result):
+        """Test coordinates become read-only float64 arrays and keys are shared."""
+        packed = PackedACGResult.from_result(result)
+        features = packed._data.values[packed._data.keys.index("features")]
+        geometry = features[0].values[features[0].keys.index("geometry")]
+        coordinates = geometry.values[geometry.keys.index("coordinates")]
+
+        assert isinstance(coordinates, np.ndarray) and coordinates.dtype == np.float64
+        assert not coordinates.flags.writeable
+        assert features[0].keys is features[-1].keys
+
+    def test_immutable(self, result):
+        """Test packed results cannot be modified."""
+        packed = PackedACGResult.from_result(result)
+        with pytest.raises(AttributeError):
+            packed.nbytes = 0
+
+    def test_compact(self, result):
+        """Test the packed footprint is a fraction of the dict tree and sized exactly."""
+        data = result.model_dump()
+        packed = PackedACGResult.pack(data)
+
+        assert packed.nbytes * 4 < _deep_size(data)
+        assert estimate_size(packed) == packed.nbytes
+
+
+class TestMemoryTier:
+    """Test the cache manager holds results packed in memory."""
+
+    def test_memory_tier_stores_packed_results(self, result):
+        """Test results are packed on store and materialized on hit."""
+        manager = ACGCacheManager()
+        request = _request("1999-04-04T04:04:04Z")
+
+        assert manager.set_cached_result(request, result, compute_time=0.5)
+        entry = manager.memory_cache.get_entry(manager.generate_cache_key(request, "result"))
+        assert isinstance(entry.value, PackedACGResult)
+
+        cached = manager.get_cached_result(request)
+        assert isinstance(cached, ACGResult)
+        assert cached == result
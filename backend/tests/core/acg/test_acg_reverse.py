@@ -0,0 +1,122 @@
+"""
+Test Suite for ACG Reverse Query
+
+Tests for the reverse astrocartography lookup including:
+- Position store construction and persistence
+- Agreement with the forward MC/IC and AC/DC line formulas
+- Ranking, filtering and validation
+"""
+
+import pytest
+import numpy as np
+
+from app.core.acg.acg_core import ACGCalculationEngine
+from app.core.acg.acg_reverse import ACGPositionStore, ACGReverseQuery
+from app.core.acg.acg_types import ACGBody, ACGBodyType, ACGLineType
+from app.core.acg.acg_utils import ac_dc_line, mc_ic_longitudes
+
+
+CHARTS = [
+    ("chart-a", 2451545.0),
+    ("chart-b", 2447892.5),
+    ("chart-c", 2455197.75),
+]
+
+
+@pytest.fixture(scope="module")
+def store():
+    """Position store for a handful of charts."""
+    bodies = [
+        ACGBody(id="Sun", type=ACGBodyType.PLANET),
+        ACGBody(id="Venus", type=ACGBodyType.PLANET),
+        ACGBody(id="Jupiter", type=ACGBodyType.PLANET),
+    ]
+    return ACGPositionStore.build(CHARTS, bodies=bodies, engine=ACGCalculationEngine())
+
+
+class TestACGPositionStore:
+    """Test position store construction and persistence."""
+
+    def test_store_shape(self, store):
+        """Test store holds one row per chart and one column per body."""
+        assert len(store) == 3
+        assert store.body_ids == ["Sun", "Venus", "Jupiter"]
+        assert store.ra.shape == (3, 3)
+        assert store.ra.dtype == np.float32
+        assert np.all(np.isfinite(store.ra))
+
+    def test_store_round_trip(self, store, tmp_path):
+        """Test saving and loading preserves the store."""
+        path = tmp_path / "positions.npz"
+        store.save(str(path))
+        loaded = ACGPositionStore.load(str(path))
+
+        assert list(loaded.chart_ids) == list(store.chart_ids)
+        assert loaded.body_ids == store.body_ids
+        np.testing.assert_array_equal(loaded.ra, store.ra)
+        np.testing.assert_array_equal(loaded.gmst, store.gmst)
+
+    def test_store_shape_validation(self):
+        """Test mismatched column shapes are rejected."""
+        with pytest.raises(ValueError):
+            ACGPositionStore(["a"], ["Sun"], np.zeros(1), np.zeros(1), np.zeros((2, 1)), np.zeros((1, 1)))
+
+
+class TestACGReverseQuery:
+    """Test reverse angularity queries."""
+
+    def test_mc_line_matches_forward_formula(self, store):
+        """Test a point on a forward MC line is found with near-zero orb."""
+        lam_mc, _ = mc_ic_longitudes(float(store.ra[0, 1]), float(store.gmst[0]))
+        lon = ((lam_mc + 540) % 360) - 180
+
+        matches = ACGReverseQuery(store).find_angular(35.0, lon, bodies=["Venus"], orb_deg=0.5)
+
+        assert matches[0].chart_id == "chart-a"
+        assert matches[0].body_id == "Venus"
+        assert matches[0].angle == ACGLineType.MC
+        assert matches[0].orb < 1e-3
+
+    def test_ac_line_matches_forward_formula(self, store):
+        """Test a point on a forward AC line is found with near-zero orb."""
+        coords = ac_dc_line(float(store.ra[1, 2]), float(store.dec[1, 2]), float(store.gmst[1]), kind='AC')
+        lon, lat = coords[len(coords) // 2]
+
+        offsets = ACGReverseQuery(store).angular_offsets(lat, lon, ["Jupiter"])
+
+        assert abs(offsets[ACGLineType.AC][1, 0]) < 1e-3
+
+    def test_results_ranked_by_orb(self, store):
+        """Test matches come back in ascending orb order and within orb."""
+        matches = ACGReverseQuery(store).find_angular(51.5, -0.1, orb_deg=60.0)
+
+        orbs = [match.orb for match in matches]
+        assert orbs == sorted(orbs)
+        assert all(orb <= 60.0 for orb in orbs)
+
+    def test_limit_and_angle_filter(self, store):
+        """Test limit and angle filtering."""
+        matches = ACGReverseQuery(store).find_angular(
+            51.5, -0.1, angles=[ACGLineType.IC], orb_deg=180.0, limit=4
+        )
+
+        assert len(matches) == 4
+        assert all(match.angle == ACGLineType.IC for match in matches)
+
+    def test_circumpolar_bodies_have_no_horizon_offset(self, store):
+        """Test AC/DC offsets are NaN where a body never rises or sets."""
+        offsets = ACGReverseQuery(store).angular_offsets(89.0, 0.0)
+
+        sun_dec = store.dec[:, 0]
+        never_sets = np.abs(np.tan(np.radians(89.0)) * np.tan(np.radians(sun_dec))) > 1.0
+        assert np.all(np.isnan(offsets[ACGLineType.AC][never_sets, 0]))
+
+    def test_invalid_location_rejected(self, store):
+        """Test invalid query coordinates raise ValueError."""
+        with pytest.raises(ValueError):
+            ACGReverseQuery(store).find_angular(95.0, 0.0)
+
+    def test_unknown_body_rejected(self, store):
+        """Test querying a body that was not stored raises ValueError."""
+        with pytest.raises(ValueError):
+            ACGReverseQuery(store).find_angular(0.0, 0.0, bodies=["Pluto"])
@@ -0,0 +1,118 @@
+"""
+Test Suite for ACG Time-Scrubbing Sessions
+
+Tests for the scrub session and latest-wins mailbox including:
+- Agreement with the one-shot line calculation
+- Delta updates (added, changed and removed lines)
+- Epoch and Julian Day resolution
+- Dropping intermediate epochs
+"""
+
+import asyncio
+import pytest
+
+from app.core.acg.acg_core import ACGCalculationEngine
+from app.core.acg.acg_scrub import ACGScrubSession, LatestSlot
+from app.core.acg.acg_types import ACGBody, ACGBodyType, ACGOptions, ACGRequest
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """ACG calculation engine."""
+    return ACGCalculationEngine()
+
+
+@pytest.fixture
+def request_data():
+    """Session request for two bodies without parans."""
+    return ACGRequest(
+        epoch="2000-01-01T12:00:00Z",
+        bodies=[
+            ACGBody(id="Sun", type=ACGBodyType.PLANET),
+            ACGBody(id="Moon", type=ACGBodyType.PLANET)
+        ],
+        options=ACGOptions(include_parans=False)
+    )
+
+
+class TestACGScrubSession:
+    """Test scrub session updates."""
+
+    def test_first_update_matches_full_calculation(self, engine, request_data):
+        """Test the first update carries every line of the one-shot result."""
+        session = ACGScrubSession(engine, request_data)
+        update = session.update(epoch="2000-01-01T12:00:00Z")
+        result = engine.calculate_acg_lines(request_data)
+
+        assert update["type"] == "update"
+        assert len(update["lines"]) == len(result.features)
+        assert set(update["added"]) == set(update["lines"])
+        assert sorted(g["coordinates"][0] for g in update["lines"].values()) == \
+            sorted(f["geometry"]["coordinates"][0] for f in result.features)
+        assert set(update["bodies"]) == {"Sun", "Moon"}
+
+    def test_added_properties_omit_epoch_fields(self, engine, request_data):
+        """Test static line properties exclude per-epoch values."""
+        session = ACGScrubSession(engine, request_data)
+        properties = session.update(epoch="2000-01-01T12:00:00Z")["added"]["Sun:MC:MC"]
+
+        assert properties["id"] == "Sun"
+        assert properties["line"]["line_type"] == "MC"
+        assert "jd" not in properties and "coords" not in properties
+
+    def test_subsequent_updates_are_deltas(self, engine, request_data):
+        """Test repeated and new epochs only send what changed."""
+        session = ACGScrubSession(engine, request_data)
+        first = session.update(epoch="2000-01-01T12:00:00Z")
+
+        same = session.update(epoch="2000-01-01T12:00:00Z")
+        assert same["lines"] == {}
+        assert same["added"] == {} and same["removed"] == []
+
+        later = session.update(epoch="2000-01-01T18:00:00Z")
+        assert later["added"] == {}
+        assert set(later["lines"]) <= set(first["lines"])
+        assert "Sun:MC:MC" in later["lines"]
+        assert later["gmst"] != first["gmst"]
+
+    def test_julian_day_update(self, engine, request_data):
+        """Test updates by Julian Day derive the epoch."""
+        session = ACGScrubSession(engine, request_data)
+        update = session.update(jd=2451545.25)
+
+        assert update["jd"] == 2451545.25
+        assert update["epoch"] == "2000-01-01T18:00:00Z"
+
+    def test_invalid_epoch_rejected(self, engine, request_data):
+        """Test invalid epochs raise ValueError."""
+        session = ACGScrubSession(engine, request_data)
+        with pytest.raises(ValueError):
+            session.update(epoch="not-a-date")
+        with pytest.raises(ValueError):
+            session.update()
+
+
+class TestLatestSlot:
+    """Test the latest-wins mailbox."""
+
+    def test_keeps_newest_value(self):
+        """Test unconsumed values are replaced and counted as dropped."""
+        async def run():
+            slot = LatestSlot()
+            for i in range(5):
+                slot.put(i)
+            return await slot.get(), slot.dropped
+
+        assert asyncio.run(run()) == (4, 4)
+
+    def test_get_waits_and_close_ends(self):
+        """Test get waits for a value and returns None after close."""
+        async def run():
+            slot = LatestSlot()
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.01, slot.put, "epoch")
+            first = await slot.get()
+            loop.call_later(0.01, slot.close)
+            return first, await slot.get()
+
+        assert asyncio.run(run()) == ("epoch", None)
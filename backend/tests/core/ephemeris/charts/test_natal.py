@@ -179,22 +179,16 @@ class TestHouseAndAngleCalculation:
     """Test house and angle calculation."""
     
     @patch('app.core.ephemeris.charts.natal.get_houses')
-    @patch('app.core.ephemeris.charts.natal.get_angles')
-    def test_successful_houses_and_angles(self, mock_get_angles, mock_get_houses):
-        """Test successful houses and angles calculation."""
-        # Mock houses
+    def test_successful_houses_and_angles(self, mock_get_houses):
+        """Test houses and angles come from a single house calculation."""
+        # Mock houses with angles
         mock_houses = MagicMock()
+        mock_houses.ascendant = 90.0
+        mock_houses.midheaven = 180.0
+        mock_houses.descendant = 270.0
+        mock_houses.imum_coeli = 0.0
         mock_get_houses.return_value = mock_houses
         
-        # Mock angles dictionary
-        mock_angles_dict = {
-            'ASC': 90.0,
-            'MC': 180.0,
-            'DESC': 270.0,
-            'IC': 0.0
-        }
-        mock_get_angles.return_value = mock_angles_dict
-        
         subject = Subject("Test", "2000-01-01T12:00:00", 40.0, -74.0)
         chart = NatalChart(subject, house_system=HouseSystems.KOCH)
         
@@ -213,12 +207,6 @@ class TestHouseAndAngleCalculation:
             -74.0,
             house_system=HouseSystems.KOCH
         )
-        
-        mock_get_angles.assert_called_once_with(
-            chart.subject_data.julian_day,
-            40.0,
-            -74.0
-        )
     
     @patch('app.core.ephemeris.charts.natal.get_houses')
     def test_failed_houses_calculation(self, mock_get_houses):
@@ -5,11 +5,11 @@ Unit tests for the Meridian Ephemeris Engine cache module.
 import time
 import threading
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from app.core.ephemeris.classes.cache import (
-    CacheEntry, EphemerisCache, CacheDecorator, cached,
-    get_global_cache, reset_global_cache
+    CacheEntry, EphemerisCache, CacheDecorator, ShardedEphemerisCache, cached,
+    get_global_cache, make_key, reset_global_cache, should_refresh_early
 )
 
 
@@ -55,6 +55,33 @@ class TestCacheEntry:
         assert entry.last_accessed > original_last_accessed
 
 
+class TestEarlyExpiration:
+    """Test probabilistic early expiration (XFetch)."""
+    
+    def test_should_refresh_early(self):
+        """Test the draw depends on cost, time to expiry and beta."""
+        with patch('app.core.ephemeris.classes.cache.random.random', return_value=0.5):
+            # -ln(0.5) * cost = 0.69 s of lookahead per second of cost
+            assert should_refresh_early(10.0, 1005.0, now=1000.0)
+            assert not should_refresh_early(1.0, 1005.0, now=1000.0)
+            assert should_refresh_early(1.0, 1005.0, beta=10.0, now=1000.0)
+            assert not should_refresh_early(10.0, 1005.0, beta=0.0, now=1000.0)
+            assert not should_refresh_early(None, 1005.0, now=1000.0)
+            assert not should_refresh_early(10.0, None, now=1000.0)
+    
+    def test_entries_expose_cost_and_expiry(self):
+        """Test get_entry returns the stored cost and expiry."""
+        cache = EphemerisCache()
+        cache.put("key", "value", ttl=10.0, cost=0.25)
+        
+        entry = cache.get_entry("key")
+        assert entry.value == "value"
+        assert entry.cost == 0.25
+        assert entry.expires_at == pytest.approx(entry.created_at + 10.0)
+        assert cache.get_entry("missing") is None
+        assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
 class TestEphemerisCache:
     """Test the EphemerisCache class."""
     
@@ -287,6 +314,225 @@ class TestEphemerisCache:
         assert len(errors) == 0, f"Thread safety errors: {errors}"
 
 
+class TestByteBudget:
+    """Test byte-budgeted eviction."""
+    
+    def test_bytes_tracked(self):
+        """Test inserts, updates and removals keep the byte total exact."""
+        cache = EphemerisCache(max_size=10)
+        cache.put("a", b"x" * 100)
+        cache.put("b", b"x" * 200)
+        cache.put("a", b"x" * 50)
+        assert cache.size_bytes() == 250
+        
+        cache.invalidate("b")
+        assert cache.stats()['bytes'] == 50
+        cache.clear()
+        assert cache.size_bytes() == 0
+    
+    def test_evicts_to_low_water(self):
+        """Test exceeding the budget evicts least recently used entries to the low-water mark."""
+        cache = EphemerisCache(max_size=100, max_bytes=1000, low_water=0.5)
+        for i in range(9):
+            cache.put(f"key{i}", b"x" * 100)
+        assert cache.size_bytes() == 900
+        
+        cache.put("key9", b"x" * 200)
+        
+        assert cache.size_bytes() <= 500
+        assert "key9" in cache and "key8" in cache
+        assert "key0" not in cache
+        assert cache.stats()['evictions'] == 6
+    
+    def test_oversized_value_rejected(self):
+        """Test a value larger than the whole budget is not cached."""
+        cache = EphemerisCache(max_size=10, max_bytes=1000)
+        cache.put("small", b"x" * 100)
+        cache.put("huge", b"x" * 5000)
+        
+        assert "huge" not in cache
+        assert "small" in cache
+        assert cache.stats()['admission_rejections'] == 1
+    
+    def test_invalid_low_water(self):
+        """Test the low-water mark must be a fraction of the budget."""
+        with pytest.raises(ValueError):
+            EphemerisCache(max_bytes=1000, low_water=1.5)
+
+
+class TestExpiryIndex:
+    """Test heap-indexed expiry."""
+    
+    def test_put_purges_only_due_entries(self):
+        """Test each put removes entries whose TTL has passed."""
+        cache = EphemerisCache(max_size=100)
+        cache.put("short", "value", ttl=10.0)
+        cache.put("long", "value", ttl=1000.0)
+        
+        with patch('time.time', return_value=time.time() + 20.0):
+            cache.put("new", "value")
+        
+        assert cache.keys() == ["long", "new"]
+        assert cache.stats()['evictions'] == 1
+    
+    def test_reput_keeps_later_expiry(self):
+        """Test a stale heap item does not evict a key re-put with a longer TTL."""
+        cache = EphemerisCache(max_size=100)
+        cache.put("key", "old", ttl=10.0)
+        cache.put("key", "new", ttl=1000.0)
+        
+        with patch('time.time', return_value=time.time() + 20.0):
+            cache.cleanup()
+            assert cache.get("key") == "new"
+    
+    def test_heap_compacted(self):
+        """Test repeated updates do not grow the index without bound."""
+        cache = EphemerisCache(max_size=10)
+        for i in range(1000):
+            cache.put("key", i)
+        
+        assert len(cache._expiry) <= 2 * cache.size() + 65
+
+
+class TestShardedCache:
+    """Test the lock-striped cache."""
+    
+    def test_routes_keys_to_segments(self):
+        """Test operations and statistics span all segments."""
+        cache = ShardedEphemerisCache(max_size=100, shards=4)
+        for i in range(40):
+            cache.put(f"key{i}", i)
+        
+        assert cache.get("key7") == 7
+        assert cache.get("missing") is None
+        assert "key8" in cache and len(cache) == 40
+        assert sorted(cache.keys()) == sorted(f"key{i}" for i in range(40))
+        
+        stats = cache.stats()
+        assert stats['shards'] == 4
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert cache.invalidate_pattern("key1") == 11
+    
+    def test_get_entries_takes_each_lock_once(self):
+        """Test bulk lookups keep the key order and lock each segment once."""
+        cache = ShardedEphemerisCache(max_size=100, shards=4)
+        for i in range(0, 20, 2):
+            cache.put(f"key{i}", i)
+        
+        acquisitions = []
+        for segment in cache._shards:
+            lock = segment._lock
+            segment._lock = MagicMock(
+                __enter__=lambda _, lock=lock: acquisitions.append(lock) or lock.__enter__(),
+                __exit__=lambda _, *exc, lock=lock: lock.__exit__(*exc)
+            )
+        entries = cache.get_entries([f"key{i}" for i in range(20)])
+        
+        assert [entry.value if entry else None for entry in entries] == [
+            i if i % 2 == 0 else None for i in range(20)
+        ]
+        assert len(acquisitions) == len(set(map(id, acquisitions))) <= 4
+        stats = cache.stats()
+        assert stats['hits'] == 10 and stats['misses'] == 10
+    
+    def test_works_with_decorator(self):
+        """Test the sharded cache can back @cached-style decorators."""
+        calls = []
+        
+        @CacheDecorator(cache=ShardedEphemerisCache(shards=2))
+        def square(x):
+            calls.append(x)
+            return x * x
+        
+        assert square(3) == 9 and square(3) == 9
+        assert calls == [3]
+    
+    def test_concurrent_access(self):
+        """Test concurrent readers and writers across segments."""
+        cache = ShardedEphemerisCache(max_size=8000, shards=8)
+        errors = []
+        
+        def worker(worker_id):
+            try:
+                for i in range(200):
+                    key = f"{worker_id}:{i}"
+                    cache.put(key, i)
+                    assert cache.get(key) == i
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert not errors
+        assert cache.size() == 800
+    
+    def test_invalid_shard_count(self):
+        """Test at least one segment is required."""
+        with pytest.raises(ValueError):
+            ShardedEphemerisCache(shards=0)
+
+
+class TestCacheKeys:
+    """Test typed cache keys."""
+    
+    def test_dict_order_ignored(self):
+        """Test dicts with the same items give the same key."""
+        first = make_key(("f", {"a": 1, "b": [1.5, 2.5]}), {})
+        second = make_key(("f", {"b": [1.5, 2.5], "a": 1}), {})
+        
+        assert first == second
+        assert make_key(("f",), {"x": 1, "y": 2}) == make_key(("f",), {"y": 2, "x": 1})
+    
+    def test_values_distinguished(self):
+        """Test different argument values and types give different keys."""
+        assert make_key(("f", 1.0), {}) != make_key(("f", 1.5), {})
+        assert make_key(("f", True), {}) != make_key(("f", 1), {})
+        assert make_key(("f", "1"), {}) != make_key(("f", 1), {})
+        assert make_key(("f", {"a": 1}), {}) != make_key(("f", [("a", 1)]), {})
+    
+    def test_quantized_parameters(self):
+        """Test declared parameters share entries within their quantum."""
+        calls = []
+        
+        @CacheDecorator(quantize={'jd': 1e-6})
+        def position(body, jd):
+            calls.append(jd)
+            return jd
+        
+        position("sun", 2451545.0)
+        position("sun", 2451545.0 + 1e-9)
+        position("sun", jd=2451545.0 + 1e-9)
+        position("sun", 2451545.01)
+        
+        assert len(calls) == 3
+    
+    def test_unknown_quantized_parameter(self):
+        """Test quantizing a parameter the function does not have is rejected."""
+        with pytest.raises(ValueError):
+            CacheDecorator(quantize={'missing': 1e-6})(lambda x: x)
+    
+    def test_cache_clear_is_per_function(self):
+        """Test clearing one decorated function leaves others cached."""
+        cache = EphemerisCache()
+        
+        @CacheDecorator(cache=cache)
+        def f(x):
+            return x
+        
+        @CacheDecorator(cache=cache)
+        def f_other(x):
+            return x
+        
+        f(1)
+        f_other(1)
+        assert f.cache_clear() == 1
+        assert cache.size() == 1
+
+
 class TestCacheDecorator:
     """Test the CacheDecorator class."""
     
@@ -330,6 +576,20 @@ class TestCacheDecorator:
         # Check custom cache was used
         assert custom_cache.size() == 2
     
+    def test_decorator_records_compute_cost(self):
+        """Test cached results carry the time their computation took."""
+        cache = EphemerisCache()
+        
+        @CacheDecorator(cache=cache)
+        def slow_function(x):
+            time.sleep(0.02)
+            return x
+        
+        slow_function(1)
+        
+        (key,) = cache.keys()
+        assert cache.get_entry(key).cost >= 0.02
+    
     def test_decorator_ttl(self):
         """Test decorator with TTL."""
         call_count = 0
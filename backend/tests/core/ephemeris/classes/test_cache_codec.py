@@ -0,0 +1,153 @@
+"""
+Unit tests for the versioned cache entry codecs.
+"""
+
+import gzip
+import pickle
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.core.ephemeris.classes.cache_codec import (
+    FORMAT_VERSION, BinaryCodec, CodecError, PickleCodec, create_codec, decode_entry,
+    parse_compression, register_type
+)
+from app.core.ephemeris.classes.redis_cache import RedisCache
+
+
+class _Point:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+
+register_type(_Point, "tests.Point", lambda p: [p.x, p.y], lambda state: _Point(*state))
+
+
+def _geojson(lines=3, points=50):
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[float(i), float(i) / 2 + line] for i in range(points)]
+                },
+                "properties": {"id": f"Sun-{line}", "line_type": "MC", "count": line}
+            }
+            for line in range(lines)
+        ]
+    }
+
+
+class TestBinaryCodec:
+    """Test the array-native binary codec."""
+
+    def test_round_trip(self):
+        """Test supported types decode to equal values of the same types."""
+        value = {
+            "geojson": _geojson(),
+            "tuple": (1.0, 2.0, 3.0),
+            "ints": [1, 2, 3, 4, 5],
+            "mixed": [1.0, 2, 3.0, 4.0],
+            "ragged": [[1.0, 2.0], [3.0]],
+            "bytes": b"\x00\x01binary",
+            "when": datetime(2000, 1, 1, 12, tzinfo=timezone.utc),
+            "array": np.arange(6, dtype=np.int32).reshape(2, 3),
+            "int_keys": {1: "one", 2: "two"},
+            "tag_key": {"$t": "not a tag"},
+            "nothing": None,
+            "flag": True,
+        }
+        decoded = decode_entry(BinaryCodec().encode(value)).value
+
+        array = decoded.pop("array")
+        assert array.dtype == np.int32 and array.tolist() == [[0, 1, 2], [3, 4, 5]]
+        value.pop("array")
+        assert decoded == value
+        assert type(decoded["tuple"]) is tuple
+        assert [type(item) for item in decoded["mixed"]] == [float, int, float, float]
+
+    def test_geometry_stored_as_float_arrays(self):
+        """Test coordinates leave the metadata as raw float64 blobs."""
+        value = _geojson(lines=10, points=200)
+        encoded = BinaryCodec(default_compression='none').encode(value)
+
+        # 10 lines of 200 [lon, lat] pairs, 8 bytes each, plus small metadata
+        assert len(encoded) < 10 * 200 * 2 * 8 + 2000
+        assert len(encoded) < len(pickle.dumps(value))
+
+    def test_registered_types(self):
+        """Test registered classes round-trip and others are refused."""
+        decoded = decode_entry(BinaryCodec().encode({"p": _Point(1.5, 2.5)})).value
+        assert (decoded["p"].x, decoded["p"].y) == (1.5, 2.5)
+
+        with pytest.raises(CodecError):
+            BinaryCodec().encode(object())
+
+    def test_metadata_in_header(self):
+        """Test compute cost and expiry travel with the entry."""
+        entry = decode_entry(BinaryCodec().encode("value", cost=0.25, expires_at=1000.0))
+        assert entry == ("value", 0.25, 1000.0)
+        assert decode_entry(BinaryCodec().encode("value")) == ("value", None, None)
+
+
+class TestCompression:
+    """Test per-entry-class compression."""
+
+    def test_compressor_per_entry_class(self):
+        """Test entry classes select their compressor and all decode."""
+        codec = create_codec('binary', compression={'big': 'lzma', 'raw': 'none'})
+        value = {"text": "abc" * 2000}
+
+        sizes = {entry_class: len(codec.encode(value, entry_class)) for entry_class in ('big', 'raw', 'other')}
+        assert codec.compressor_for('other') == 'zlib'
+        assert sizes['raw'] > sizes['other']
+        assert sizes['big'] < sizes['raw']
+        for entry_class in sizes:
+            assert decode_entry(codec.encode(value, entry_class)).value == value
+
+    def test_parse_compression(self):
+        """Test the settings format and unknown compressors."""
+        assert parse_compression("acg_results=lzma, acg_responses = none") == {
+            'acg_results': 'lzma', 'acg_responses': 'none'
+        }
+        with pytest.raises(ValueError):
+            BinaryCodec(compression={'x': 'brotli'})
+
+
+class TestVersioning:
+    """Test stale and untrusted entries are refused."""
+
+    def test_legacy_and_other_versions_refused(self):
+        """Test earlier pickle formats and other format versions raise CodecError."""
+        legacy = b'COMPRESSED:' + gzip.compress(pickle.dumps({"a": 1}))
+        with pytest.raises(CodecError):
+            decode_entry(legacy)
+
+        encoded = bytearray(BinaryCodec().encode({"a": 1}))
+        encoded[2] = FORMAT_VERSION + 1
+        with pytest.raises(CodecError):
+            decode_entry(bytes(encoded))
+
+    def test_pickle_entries_need_opt_in(self):
+        """Test pickle entries only decode when allowed."""
+        encoded = PickleCodec().encode(_Point(1.0, 2.0))
+        with pytest.raises(CodecError):
+            decode_entry(encoded)
+        assert decode_entry(encoded, allow_pickle=True).value.x == 1.0
+
+    def test_redis_treats_unreadable_entries_as_misses(self):
+        """Test RedisCache reports stale entries as misses, not errors."""
+        client = MagicMock()
+        client.get.return_value = b'RAW:' + pickle.dumps("old")
+        client.mget.return_value = [b'RAW:' + pickle.dumps("old"), BinaryCodec().encode("new")]
+        redis_cache = RedisCache.__new__(RedisCache)
+        redis_cache.enabled, redis_cache.client = True, client
+        redis_cache.hits = redis_cache.misses = redis_cache.errors = 0
+
+        assert redis_cache.get("test", {"k": 1}) is None
+        assert redis_cache.get_many("test", [{"k": 1}, {"k": 2}]) == [None, "new"]
+        assert (redis_cache.hits, redis_cache.misses, redis_cache.errors) == (1, 2, 0)
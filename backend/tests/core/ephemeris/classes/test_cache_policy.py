@@ -0,0 +1,171 @@
+"""
+Unit tests for EphemerisCache admission and eviction policies.
+"""
+
+import numpy as np
+import pytest
+
+from app.core.ephemeris.classes.cache import EphemerisCache, estimate_size
+from app.core.ephemeris.classes.cache_policy import (
+    FrequencySketch, GDSFPolicy, LRUPolicy, create_policy
+)
+
+
+def _access(cache, key, value="value", cost=0.0):
+    """Look a key up, inserting it on a miss (read-through)."""
+    if cache.get(key) is None:
+        cache.put(key, value, cost=cost)
+
+
+class TestFrequencySketch:
+    """Test the TinyLFU frequency sketch."""
+
+    def test_counts_accesses(self):
+        """Test frequencies track increments and saturate."""
+        sketch = FrequencySketch(capacity=64)
+        for _ in range(3):
+            sketch.increment("hot")
+        sketch.increment("warm")
+
+        assert sketch.frequency("hot") >= 3
+        assert sketch.frequency("warm") >= 1
+        assert sketch.frequency("hot") > sketch.frequency("cold")
+
+        for _ in range(100):
+            sketch.increment("hot")
+        assert sketch.frequency("hot") == 15
+
+    def test_periodic_halving(self):
+        """Test counters are halved after the sample size is reached."""
+        sketch = FrequencySketch(capacity=1)
+        for _ in range(8):
+            sketch.increment("key")
+        sketch.increment("other")
+        sketch.increment("other")
+
+        # Sample size is 10: the tenth increment halves every counter
+        assert sketch.frequency("key") == 4
+
+
+class TestAdmission:
+    """Test TinyLFU admission."""
+
+    def test_scan_does_not_flush_hot_entries(self):
+        """Test one-off keys cannot displace frequently used ones."""
+        caches = {
+            name: EphemerisCache(max_size=10, policy=create_policy(name, 10))
+            for name in ("lru", "tinylfu")
+        }
+        hot_hits = {}
+
+        # Integer keys hash the same in every process, so sketch collisions
+        # do not depend on string hash randomization
+        for name, cache in caches.items():
+            for _ in range(5):
+                for i in range(10):
+                    _access(cache, i)
+            # A batch of one-off keys interleaved with ongoing hot traffic
+            hot_hits[name] = 0
+            for i in range(100):
+                _access(cache, 1000 + i)
+                hot_hits[name] += cache.get(i % 10) is not None
+                _access(cache, i % 10)
+
+        # The sketch is approximate: leave room for a collision admitting a scan key
+        assert hot_hits["tinylfu"] >= 90
+        assert hot_hits["lru"] < 50
+        assert caches["tinylfu"].stats()['admission_rejections'] >= 90
+
+    def test_updates_bypass_admission(self):
+        """Test re-putting a cached key is never rejected."""
+        cache = EphemerisCache(max_size=1, policy=create_policy("tinylfu", 1))
+        cache.put("key", 1)
+        cache.put("key", 2)
+
+        assert cache.get("key") == 2
+
+
+class TestGDSFEviction:
+    """Test GreedyDual-Size-Frequency eviction."""
+
+    def test_large_entries_evicted_first(self):
+        """Test the largest entry of equal cost is evicted."""
+        cache = EphemerisCache(max_size=2, policy=GDSFPolicy())
+        cache.put("large", b"x" * 100000, cost=0.01)
+        cache.put("small", b"x" * 100, cost=0.01)
+        cache.put("new", b"x" * 100, cost=0.01)
+
+        assert "large" not in cache
+        assert "small" in cache and "new" in cache
+
+    def test_expensive_entries_kept(self):
+        """Test the cheapest entry of equal size is evicted."""
+        cache = EphemerisCache(max_size=2, policy=GDSFPolicy())
+        cache.put("expensive", b"x" * 1000, cost=2.0)
+        cache.put("cheap", b"x" * 1000, cost=0.001)
+        cache.put("new", b"x" * 1000, cost=0.5)
+
+        assert "cheap" not in cache
+        assert "expensive" in cache
+
+    def test_frequency_protects_entries(self):
+        """Test frequently hit entries outrank otherwise equal ones."""
+        cache = EphemerisCache(max_size=2, policy=GDSFPolicy())
+        cache.put("popular", "value", cost=0.01)
+        cache.put("unpopular", "value", cost=0.01)
+        for _ in range(5):
+            cache.get("popular")
+        cache.put("new", "value", cost=0.01)
+
+        assert "popular" in cache
+        assert "unpopular" not in cache
+
+    def test_removed_entries_are_not_victims(self):
+        """Test invalidated and cleared entries leave the policy."""
+        policy = GDSFPolicy()
+        cache = EphemerisCache(max_size=2, policy=policy)
+        cache.put("a", "value")
+        cache.put("b", "value")
+        cache.invalidate("a")
+        cache.put("c", "value")
+
+        assert "b" in cache and "c" in cache
+        cache.clear()
+        assert policy.clock == 0.0 and cache.size() == 0
+
+
+class TestPolicyStatistics:
+    """Test per-policy statistics and configuration."""
+
+    def test_byte_hit_rate(self):
+        """Test hits and misses are also counted in bytes."""
+        cache = EphemerisCache(max_size=10)
+        cache.put("large", b"x" * 900)
+        cache.put("small", b"x" * 100)
+        cache.get("large")
+
+        stats = cache.stats()
+        assert stats['policy'] == "lru"
+        assert stats['hit_bytes'] == 900
+        assert stats['miss_bytes'] == 1000
+        assert stats['byte_hit_rate'] == pytest.approx(900 / 1900)
+
+    def test_policy_labels(self):
+        """Test policies are reported with their admission filter."""
+        assert create_policy("lru", 10).label == "lru"
+        assert create_policy("TinyLFU", 10).label == "tinylfu-lru"
+        assert create_policy("gdsf", 10).label == "gdsf"
+        assert create_policy("tinylfu-gdsf", 10).label == "tinylfu-gdsf"
+        assert isinstance(EphemerisCache().policy, LRUPolicy)
+
+        with pytest.raises(ValueError):
+            create_policy("arc", 10)
+
+    def test_estimate_size(self):
+        """Test sizes are exact for bytes and arrays and scale with containers."""
+        assert estimate_size(b"x" * 1234) == 1234
+        assert estimate_size(np.zeros(1000)) == 8000
+
+        small = {"coordinates": [[float(i), float(i)] for i in range(10)]}
+        large = {"coordinates": [[float(i), float(i)] for i in range(1000)]}
+        assert 50 < estimate_size(large) / estimate_size(small) < 150
@@ -0,0 +1,151 @@
+"""
+Unit tests for the circuit breaker and deadline-bounded Redis access.
+"""
+
+import socket
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from app.core.ephemeris.classes.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from app.core.ephemeris.classes.redis_cache import RedisCache
+from app.core.monitoring.metrics import get_metrics
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until a condition holds or the timeout passes."""
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+@pytest.fixture
+def silent_server():
+    """A TCP server that accepts connections and never replies (a hung Redis)."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(16)
+    connections = []
+    stop = threading.Event()
+
+    def accept():
+        server.settimeout(0.05)
+        while not stop.is_set():
+            try:
+                connections.append(server.accept()[0])
+            except OSError:
+                continue
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield server.getsockname()
+    stop.set()
+    thread.join()
+    for connection in connections:
+        connection.close()
+    server.close()
+
+
+class TestCircuitBreaker:
+    """Test breaker transitions."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test only consecutive failures open the breaker and open breakers skip calls."""
+        breaker = CircuitBreaker("node", probe=lambda: False, failure_threshold=3, probe_interval=60)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CLOSED and breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+        assert breaker.stats()['skipped'] == 1
+        breaker.reset()
+
+    def test_probe_closes_breaker(self):
+        """Test the background probe goes half-open and closes once the backend answers."""
+        healthy = threading.Event()
+        states = []
+        breaker = CircuitBreaker(
+            "node", probe=healthy.is_set, failure_threshold=1, probe_interval=0.01,
+            on_state_change=lambda name, state: states.append(state)
+        )
+        breaker.record_failure()
+        assert _wait_for(lambda: breaker.stats()['probes'] >= 2)
+        assert breaker.state in (OPEN, HALF_OPEN)
+
+        healthy.set()
+        assert _wait_for(lambda: breaker.state == CLOSED)
+        assert states[0] == OPEN and HALF_OPEN in states and states[-1] == CLOSED
+        assert breaker.allow()
+
+    def test_failing_probe_keeps_breaker_open(self):
+        """Test a probe that raises counts as unhealthy."""
+        def probe():
+            raise ConnectionError("refused")
+
+        breaker = CircuitBreaker("node", probe=probe, failure_threshold=1, probe_interval=0.01)
+        breaker.trip()
+        assert _wait_for(lambda: breaker.stats()['probes'] >= 3)
+        assert breaker.state != CLOSED
+        breaker.reset()
+        assert breaker.state == CLOSED
+
+    def test_invalid_threshold(self):
+        """Test a threshold below one is rejected."""
+        with pytest.raises(ValueError):
+            CircuitBreaker("node", probe=lambda: True, failure_threshold=0)
+
+
+class TestDeadlineBoundedRedis:
+    """Test Redis operations against a node that never answers."""
+
+    def test_reads_bounded_by_budget_then_skipped(self, silent_server):
+        """Test reads give up within their budget and an open breaker skips the node."""
+        host, port = silent_server
+        client = redis.Redis(host=host, port=port, socket_timeout=0.01, socket_connect_timeout=0.1)
+        cache = RedisCache.from_clients({f"{host}:{port}": client}, failure_threshold=2, probe_interval=60)
+        try:
+            start = time.perf_counter()
+            assert cache.get("test", {"k": 1}) is None
+            assert cache.get_many("test", [{"k": 1}, {"k": 2}]) == [None, None]
+            assert time.perf_counter() - start < 1.0
+
+            node_stats = cache.node_stats()[f"{host}:{port}"]
+            assert node_stats['state'] == OPEN and node_stats['opened'] == 1
+
+            start = time.perf_counter()
+            for i in range(100):
+                assert cache.get("test", {"k": i}) is None
+            assert time.perf_counter() - start < 0.1
+            assert cache.node_stats()[f"{host}:{port}"]['skipped'] == 100
+        finally:
+            cache.breakers[f"{host}:{port}"].reset()
+
+    def test_breaker_state_and_skips_exported(self):
+        """Test breaker state, failures and skipped operations are exported as metrics."""
+        if not get_metrics().enabled:
+            pytest.skip("Prometheus not available")
+        from prometheus_client import REGISTRY
+
+        client = MagicMock()
+        client.get.side_effect = redis.exceptions.TimeoutError("Timeout reading from socket")
+        cache = RedisCache.from_clients({"metrics-node:6379": client}, failure_threshold=1, probe_interval=60)
+        labels = {'node': "metrics-node:6379", 'operation': "get"}
+        try:
+            assert REGISTRY.get_sample_value('meridian_redis_circuit_state', {'node': "metrics-node:6379"}) == 0
+            cache.get("test", {"k": 1})
+            cache.get("test", {"k": 1})
+
+            assert REGISTRY.get_sample_value('meridian_redis_circuit_state', {'node': "metrics-node:6379"}) == 2
+            assert REGISTRY.get_sample_value('meridian_redis_failures_total', labels) == 1
+            assert REGISTRY.get_sample_value('meridian_redis_skipped_operations_total', labels) == 1
+        finally:
+            cache.breakers["metrics-node:6379"].reset()
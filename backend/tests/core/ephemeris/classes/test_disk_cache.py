@@ -0,0 +1,211 @@
+"""
+Unit tests for the persistent SQLite disk cache tier.
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import time
+
+import pytest
+
+from app.core.acg.acg_cache import ACGCacheManager
+from app.core.acg.acg_core import ACGCalculationEngine
+from app.core.acg.acg_packed import PackedACGResult
+from app.core.acg.acg_types import ACGBody, ACGBodyType, ACGOptions, ACGRequest
+from app.core.ephemeris.classes.cache import EphemerisCache, ShardedEphemerisCache
+from app.core.ephemeris.classes.disk_cache import DiskCache
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Disk cache in a temporary directory."""
+    cache = DiskCache(str(tmp_path / "cache" / "l2.sqlite3"))
+    yield cache
+    cache.close()
+
+
+def _stored_bytes(cache):
+    """Sum of entry sizes, independent of the totals row."""
+    return sqlite3.connect(cache.path).execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+
+def _write_entries(path, prefix, count):
+    """Write entries from another process."""
+    cache = DiskCache(path, max_bytes=None)
+    for i in range(count):
+        cache.put(f"{prefix}:{i}", {"worker": prefix, "values": [float(i)] * 10})
+
+
+class TestDiskCache:
+    """Test storage, expiry and invalidation."""
+
+    def test_round_trip(self, disk_cache):
+        """Test values come back with their compute cost and expiry."""
+        value = {"coordinates": [[float(i), float(i) / 2] for i in range(100)], "id": "Sun"}
+        assert disk_cache.put("acg:1", value, ttl=60, cost=0.25)
+
+        entry = disk_cache.get_entry("acg:1")
+        assert entry.value == value
+        assert entry.cost == 0.25
+        assert entry.expires_at == pytest.approx(time.time() + 60, abs=5)
+        assert disk_cache.get("missing") is None
+        assert (disk_cache.hits, disk_cache.misses) == (1, 1)
+
+    def test_survives_reopen(self, disk_cache):
+        """Test entries persist across cache instances (restarts)."""
+        disk_cache.put("key", "value")
+        reopened = DiskCache(disk_cache.path)
+
+        assert reopened.get("key") == "value"
+
+    def test_expired_entries_are_misses(self, disk_cache):
+        """Test expired entries are not returned and are removed."""
+        disk_cache.put("short", "value", ttl=0.05)
+        disk_cache.put("long", "value", ttl=60)
+        time.sleep(0.1)
+
+        assert disk_cache.get("short") is None
+        assert disk_cache.get("long") == "value"
+        assert disk_cache.size() == 1
+
+    def test_unreadable_entries_are_misses(self, disk_cache):
+        """Test entries in another format are removed and reported as misses."""
+        disk_cache.put("key", "value")
+        sqlite3.connect(disk_cache.path, isolation_level=None).execute(
+            "UPDATE entries SET value = ? WHERE key = 'key'", (b"RAW:legacy",)
+        )
+
+        assert disk_cache.get("key") is None
+        assert disk_cache.size() == 0
+
+    def test_invalidate_pattern(self, disk_cache):
+        """Test glob patterns remove matching keys only."""
+        for key in ("acg:1:result", "acg:2:result", "position:1"):
+            disk_cache.put(key, "value")
+
+        assert disk_cache.invalidate_pattern("acg:*") == 2
+        assert disk_cache.get("position:1") == "value"
+
+    def test_disabled_without_path(self):
+        """Test a cache without a path stores nothing."""
+        cache = DiskCache(None)
+
+        assert not cache.enabled
+        assert cache.put("key", "value") is False
+        assert cache.get("key") is None
+
+
+class TestDiskByteBudget:
+    """Test byte-budgeted eviction."""
+
+    def test_least_recently_accessed_evicted(self, tmp_path):
+        """Test the budget is enforced by evicting the oldest entries to the low-water mark."""
+        cache = DiskCache(str(tmp_path / "l2.sqlite3"), max_bytes=20000, low_water=0.5)
+        for i in range(9):
+            cache.put(f"key:{i}", os.urandom(2000), accessed_at=1000.0 + i)
+        # The tenth entry takes the total over budget
+        cache.put("key:new", os.urandom(2000))
+
+        assert cache.size_bytes() <= 20000 * 0.5
+        assert cache.size_bytes() == _stored_bytes(cache)
+        assert cache.get("key:new") is not None
+        assert cache.get("key:8") is not None
+        assert cache.get("key:0") is None
+        assert cache.evictions > 0
+
+    def test_oversized_values_rejected(self, tmp_path):
+        """Test a value larger than the whole budget is not stored."""
+        cache = DiskCache(str(tmp_path / "l2.sqlite3"), max_bytes=1000)
+        cache.put("key", "small")
+
+        assert cache.put("key", os.urandom(5000)) is False
+        assert cache.get("key") is None
+
+    def test_totals_track_updates_and_deletes(self, disk_cache):
+        """Test the shared byte total follows inserts, replacements and deletes."""
+        disk_cache.put("a", os.urandom(1000))
+        disk_cache.put("b", os.urandom(3000))
+        disk_cache.put("a", os.urandom(2000))
+        disk_cache.invalidate("b")
+
+        assert disk_cache.size_bytes() == _stored_bytes(disk_cache) > 2000
+
+
+class TestMultiProcess:
+    """Test worker processes share one database."""
+
+    def test_concurrent_writers(self, disk_cache):
+        """Test entries written concurrently by several processes are all visible."""
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_write_entries, args=(disk_cache.path, f"worker{n}", 50))
+            for n in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        _write_entries(disk_cache.path, "parent", 50)
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert disk_cache.size() == 200
+        assert disk_cache.get("worker2:49")["worker"] == "worker2"
+        assert disk_cache.size_bytes() == _stored_bytes(disk_cache)
+
+
+class TestSnapshot:
+    """Test snapshotting and warming in-memory caches."""
+
+    def test_snapshot_and_warm(self, disk_cache):
+        """Test the hottest memory entries are written and loaded back with their TTL."""
+        memory = EphemerisCache(max_size=10)
+        for i in range(5):
+            memory.put(f"key:{i}", {"value": i}, ttl=600, cost=0.5)
+        memory.put(("tuple", "key"), "skipped")
+        time.sleep(0.01)
+        memory.get("key:1")
+        memory.get("key:3")
+
+        assert disk_cache.snapshot(memory, limit=2) == 2
+        assert disk_cache.get_entry("key:3").cost == 0.5
+
+        warmed = ShardedEphemerisCache(max_size=10, shards=2)
+        assert disk_cache.warm(warmed, limit=10) == 2
+        entry = warmed.get_entry("key:1")
+        assert entry.value == {"value": 1}
+        assert 590 < entry.ttl <= 600
+        assert "key:0" not in warmed
+
+    def test_hottest_order(self):
+        """Test memory caches report entries by last access."""
+        memory = EphemerisCache(max_size=10)
+        for key in ("a", "b", "c"):
+            memory.put(key, key)
+            time.sleep(0.01)
+        memory.get("a")
+
+        assert [key for key, _ in memory.hottest(2)] == ["a", "c"]
+
+
+class TestACGDiskTier:
+    """Test the ACG cache manager uses the disk tier."""
+
+    def test_results_served_from_disk(self, disk_cache):
+        """Test results are written through and promoted to memory on a disk hit."""
+        manager = ACGCacheManager()
+        manager.disk_cache = disk_cache
+        request = ACGRequest(
+            epoch="1998-02-02T02:02:02Z",
+            bodies=[ACGBody(id="Sun", type=ACGBodyType.PLANET)],
+            options=ACGOptions(line_types=["MC", "IC"], include_parans=False)
+        )
+        result = ACGCalculationEngine().calculate_acg_lines(request)
+
+        manager.set_cached_result(request, result, compute_time=0.5)
+        cache_key = manager.generate_cache_key(request, "result")
+        manager.memory_cache.invalidate(cache_key)
+
+        assert manager.get_cached_result(request) == result
+        assert isinstance(manager.memory_cache.get(cache_key), PackedACGResult)
+        assert disk_cache.hits == 1
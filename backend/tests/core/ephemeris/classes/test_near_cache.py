@@ -0,0 +1,274 @@
+"""
+Unit tests for near-cache invalidation of in-process caches.
+"""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from app.core.acg.acg_cache import ACGCacheManager
+from app.core.acg.acg_types import ACGBody, ACGBodyType, ACGOptions, ACGRequest, ACGResult
+from app.core.ephemeris.classes.cache import EphemerisCache
+from app.core.ephemeris.classes.near_cache import (
+    LocalInvalidationBus,
+    NearCache,
+    RedisInvalidationBus,
+    evict_matching,
+)
+from app.core.ephemeris.classes.redis_cache import RedisCache
+
+
+@pytest.fixture
+def bus():
+    """Invalidation bus standing in for Redis pub/sub."""
+    return LocalInvalidationBus()
+
+
+@pytest.fixture
+def nodes(bus):
+    """Two near caches, one per simulated worker, on the same bus."""
+    return [NearCache([EphemerisCache(max_size=100)], bus) for _ in range(2)]
+
+
+def _request(epoch):
+    """ACG request for the Sun's MC line."""
+    return ACGRequest(
+        epoch=epoch,
+        bodies=[ACGBody(id="Sun", type=ACGBodyType.PLANET)],
+        options=ACGOptions(line_types=["MC"], include_parans=False)
+    )
+
+
+def _manager(bus):
+    """ACG cache manager with its own memory cache, as in a separate worker."""
+    manager = ACGCacheManager()
+    manager.memory_cache = EphemerisCache(max_size=100)
+    manager.redis_cache = RedisCache.__new__(RedisCache)
+    manager.redis_cache.enabled = False
+    manager.use_near_cache(bus)
+    return manager
+
+
+def _redis_cache(client, failure_threshold=3):
+    """Single-node Redis cache over a stub client; open breakers wait a minute before probing."""
+    return RedisCache.from_clients({"redis-0:6379": client}, failure_threshold=failure_threshold, probe_interval=60)
+
+
+class TestNearCache:
+    """Test evictions across near caches."""
+
+    def test_keys_evicted_everywhere(self, nodes):
+        """Test a key invalidated by one worker is evicted from every worker's cache."""
+        for node in nodes:
+            node.caches[0].put("acg:1", "value")
+            node.caches[0].put("acg:2", "value")
+
+        assert nodes[0].invalidate(keys=["acg:1"]) == 2
+        assert all("acg:1" not in node.caches[0] for node in nodes)
+        assert all(node.caches[0].get("acg:2") == "value" for node in nodes)
+
+    def test_patterns_are_globs(self, nodes):
+        """Test patterns match whole keys with glob syntax."""
+        cache = nodes[1].caches[0]
+        for key in ("acg:v1:a:result", "acg:v1:b:response", "acg:v2:a:result", "xacg:v1:c"):
+            cache.put(key, "value")
+        cache.put(("position", 1.0), "value")
+
+        nodes[0].invalidate(patterns=["acg:v1:*"])
+
+        assert sorted(cache.keys(), key=str) == [("position", 1.0), "acg:v2:a:result", "xacg:v1:c"]
+
+    def test_remote_keys_evict_registered_entries(self, nodes):
+        """Test deleting a Redis key evicts the entries registered against it."""
+        for node in nodes:
+            node.caches[0].put("acg:1:result", "value")
+            node.register("acg:1:result", "acg_results:abc")
+        nodes[1].caches[0].put("acg:2:result", "value")
+        nodes[1].register("acg:2:result", "acg_results:def")
+
+        nodes[0].invalidate(remote_keys=["acg_results:abc"])
+        assert all("acg:1:result" not in node.caches[0] for node in nodes)
+        assert nodes[1].stats()['registrations'] == 1
+
+        nodes[0].invalidate(remote_patterns=["acg_results:*"])
+        assert "acg:2:result" not in nodes[1].caches[0]
+
+    def test_resync_drops_registered_entries(self, nodes):
+        """Test a resync evicts every registered entry and nothing else."""
+        cache = nodes[0].caches[0]
+        cache.put("registered", "value")
+        cache.put("local", "value")
+        nodes[0].register("registered", "remote")
+
+        nodes[0].handle({'resync': True})
+
+        assert cache.keys() == ["local"]
+
+    def test_host_caches_receive_exact_keys(self, bus):
+        """Test exact-key evictions reach host caches without key listings."""
+        host_cache = MagicMock(enabled=True)
+        near_cache = NearCache([EphemerisCache()], bus, host_caches=[host_cache])
+        near_cache.register("acg:1", "acg_results:abc")
+
+        bus.publish(remote_keys=["acg_results:abc"])
+
+        host_cache.invalidate.assert_called_once_with("acg:1")
+
+    def test_registry_pruned_to_live_entries(self, bus):
+        """Test registrations of evicted entries are dropped once the registry overflows."""
+        cache = EphemerisCache(max_size=4)
+        near_cache = NearCache([cache], bus)
+        for i in range(9):
+            cache.put(f"key:{i}", i)
+            near_cache.register(f"key:{i}", f"remote:{i}")
+
+        assert near_cache.stats()['registrations'] == 4
+        near_cache.invalidate(remote_keys=["remote:8"])
+        assert "key:8" not in cache
+
+    def test_evict_matching_skips_tuple_keys(self):
+        """Test only string keys are matched."""
+        cache = EphemerisCache()
+        cache.put(("acg", 1), "value")
+        cache.put("acg:1", "value")
+
+        assert evict_matching(cache, "*") == 1
+        assert cache.size() == 1
+
+    def test_failing_subscriber_isolated(self, bus, nodes):
+        """Test one subscriber's failure does not stop delivery to the others."""
+        bus.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+        nodes[1].caches[0].put("key", "value")
+
+        nodes[0].invalidate(keys=["key"])
+
+        assert "key" not in nodes[1].caches[0]
+        assert bus.stats()['errors'] == 1
+
+
+class TestRedisInvalidationBus:
+    """Test the pub/sub transport."""
+
+    def test_publish_broadcasts_json(self):
+        """Test publishing delivers locally and sends the message on the channel."""
+        client = MagicMock()
+        bus = RedisInvalidationBus(_redis_cache(client), "invalidate")
+        near_cache = NearCache([EphemerisCache()], bus)
+        near_cache.caches[0].put("key", "value")
+
+        assert bus.publish(keys=["key"], cache_version="2.0.0") == 1
+        channel, payload = client.publish.call_args[0]
+        assert channel == "invalidate"
+        assert json.loads(payload)['cache_version'] == "2.0.0"
+
+    def test_handle_ignores_own_messages(self):
+        """Test messages from this process are not applied twice."""
+        bus = RedisInvalidationBus(_redis_cache(MagicMock()))
+        handler = MagicMock(return_value=0)
+        bus.subscribe(handler)
+
+        bus.handle(json.dumps({'origin': bus.node_id, 'keys': ["key"]}))
+        bus.handle(json.dumps({'origin': "other", 'keys': ["key"]}))
+        bus.handle(b"not json")
+
+        handler.assert_called_once()
+        assert bus.stats()['received'] == 1
+        assert bus.stats()['errors'] == 1
+
+    def test_listener_delivers_messages(self):
+        """Test the listener thread applies messages from other nodes."""
+        client = MagicMock()
+        pubsub = client.pubsub.return_value
+        message = {'type': 'message', 'data': json.dumps({'origin': "other", 'keys': ["key"]})}
+        pubsub.get_message.side_effect = lambda timeout: message if pubsub.get_message.call_count == 1 else time.sleep(0.01)
+        bus = RedisInvalidationBus(_redis_cache(client))
+        near_cache = NearCache([EphemerisCache()], bus)
+        near_cache.caches[0].put("key", "value")
+
+        bus.start()
+        deadline = time.time() + 5
+        while "key" in near_cache.caches[0] and time.time() < deadline:
+            time.sleep(0.01)
+        bus.stop()
+
+        assert "key" not in near_cache.caches[0]
+        pubsub.subscribe.assert_called_once_with("meridian:cache:invalidate")
+
+    def test_publish_skipped_while_breaker_open(self):
+        """Test publishes go through the channel node's breaker and are dropped while it is open."""
+        client = MagicMock()
+        client.publish.side_effect = redis.exceptions.TimeoutError("Timeout writing to socket")
+        redis_cache = _redis_cache(client, failure_threshold=1)
+        bus = RedisInvalidationBus(redis_cache, "invalidate")
+
+        bus.publish(keys=["key"])
+        bus.publish(keys=["key"])
+
+        assert client.publish.call_count == 1
+        assert redis_cache.node_stats()["redis-0:6379"]['state'] == "open"
+        assert bus.stats()['errors'] == 2
+        redis_cache.breakers["redis-0:6379"].reset()
+
+    def test_redis_deletes_are_announced(self, bus, nodes):
+        """Test RedisCache deletes evict the entries registered against the deleted keys."""
+        redis_cache = RedisCache.__new__(RedisCache)
+        redis_cache.enabled = False
+        redis_cache.invalidation_bus = bus
+        key = redis_cache.cache_key("acg_results", {"request": 1})
+        nodes[1].caches[0].put("acg:1:result", "value")
+        nodes[1].register("acg:1:result", key)
+
+        redis_cache.delete("acg_results", {"request": 1})
+
+        assert "acg:1:result" not in nodes[1].caches[0]
+
+
+class TestACGNearCache:
+    """Test the ACG cache manager keeps workers coherent."""
+
+    def test_clear_cache_evicts_other_workers(self, bus):
+        """Test a purge in one worker evicts results and responses in another."""
+        writer, reader = _manager(bus), _manager(bus)
+        request = _request("1996-06-06T06:06:06Z")
+        result = ACGResult(type="FeatureCollection", features=[])
+        reader.set_cached_result(request, result)
+        reader.set_cached_response(request, result)
+
+        assert writer.clear_cache() >= 2
+        assert reader.get_cached_result(request) is None
+        assert reader.get_cached_response(request) is None
+
+    def test_redis_delete_evicts_registered_results(self, bus):
+        """Test deleting the Redis entry evicts the memory entry mirroring it."""
+        manager = _manager(bus)
+        manager.redis_cache.invalidation_bus = bus
+        request = _request("1996-07-07T07:07:07Z")
+        manager.set_cached_result(request, ACGResult(type="FeatureCollection", features=[]))
+
+        manager.redis_cache.delete("acg_results", manager._redis_key_data(request))
+
+        assert manager.get_cached_result(request) is None
+
+    def test_memory_entries_use_long_ttl(self, bus):
+        """Test near-cache memory entries outlive the Redis TTL."""
+        manager = _manager(bus)
+        request = _request("1996-08-08T08:08:08Z")
+        manager.set_cached_result(request, ACGResult(type="FeatureCollection", features=[]), ttl=60)
+
+        entry = manager.memory_cache.get_entry(manager.generate_cache_key(request, "result"))
+        assert entry.ttl > 60
+
+    def test_version_bump_propagates(self, bus):
+        """Test a version bump is adopted by every worker and evicts old entries."""
+        writer, reader = _manager(bus), _manager(bus)
+        request = _request("1996-09-09T09:09:09Z")
+        reader.set_cached_result(request, ACGResult(type="FeatureCollection", features=[]))
+        reader.memory_cache.put("acg:v0.9:other", "kept")
+
+        assert writer.bump_cache_version("2.0.0") == 1
+
+        assert reader.cache_version == writer.cache_version == "2.0.0"
+        assert reader.memory_cache.keys() == ["acg:v0.9:other"]
@@ -0,0 +1,219 @@
+"""
+Unit tests for the asyncio Redis cache API.
+"""
+
+import asyncio
+import threading
+from collections import Counter
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from app.core.acg.acg_cache import ACGCacheManager
+from app.core.acg.acg_types import ACGBody, ACGBodyType, ACGRequest, ACGResult
+from app.core.ephemeris.classes.redis_cache import RedisCache
+
+
+class _AsyncStubRedis:
+    """Asyncio Redis stand-in over a shared dict (the node's data)."""
+
+    def __init__(self, data):
+        self.data = data
+        self.calls = Counter()
+        self.down = False
+        self.closed = False
+
+    async def _call(self, command):
+        self.calls[command] += 1
+        await asyncio.sleep(0)
+        if self.down:
+            raise redis.exceptions.TimeoutError("Timeout reading from socket")
+
+    async def get(self, key):
+        await self._call("get")
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, px=None):
+        await self._call("set")
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def setex(self, key, ttl, value):
+        await self._call("setex")
+        self.data[key] = value
+        return True
+
+    async def mget(self, keys):
+        await self._call("mget")
+        return [self.data.get(key) for key in keys]
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _sync_stub(data):
+    """Synchronous client over the same dict."""
+    client = MagicMock()
+    client.get.side_effect = lambda key: data.get(key)
+    client.mget.side_effect = lambda keys: [data.get(key) for key in keys]
+    client.ping.return_value = True
+    return client
+
+
+@pytest.fixture
+def nodes():
+    """Data of three shard nodes."""
+    return {f"redis-{n}:6379": {} for n in range(3)}
+
+
+@pytest.fixture
+def async_stubs(nodes):
+    """Asyncio stand-ins, one per node."""
+    return {node: _AsyncStubRedis(data) for node, data in nodes.items()}
+
+
+@pytest.fixture
+def cache(nodes, async_stubs):
+    """Sharded cache with synchronous and asyncio clients over the same data."""
+    cache = RedisCache.from_clients(
+        {node: _sync_stub(data) for node, data in nodes.items()},
+        failure_threshold=1, probe_interval=60, async_clients=async_stubs
+    )
+    yield cache
+    for breaker in cache.breakers.values():
+        breaker.reset()
+
+
+class TestAsyncRedisCache:
+    """Test aget, aset and amget over the asyncio clients."""
+
+    def test_set_and_get_routed_by_ring(self, cache, nodes, async_stubs):
+        """Test values written asynchronously land on their ring node and read back both ways."""
+        async def roundtrip():
+            for i in range(30):
+                assert await cache.aset("test", {"i": i}, {"value": i}, ttl=60)
+            return [await cache.aget("test", {"i": i}) for i in range(30)]
+
+        assert asyncio.run(roundtrip()) == [{"value": i} for i in range(30)]
+        for i in range(30):
+            key = cache.cache_key("test", {"i": i})
+            assert key in nodes[cache.ring.get_node(key)]
+        assert cache.get("test", {"i": 0}) == {"value": 0}
+        assert sum(stub.calls["setex"] for stub in async_stubs.values()) == 30
+
+    def test_amget_one_mget_per_node(self, cache, async_stubs):
+        """Test multi-gets issue one concurrent MGET per node and keep the request order."""
+        async def fetch():
+            for i in range(0, 30, 2):
+                await cache.aset("test", {"i": i}, i)
+            return await cache.amget("test", [{"i": i} for i in range(30)])
+
+        assert asyncio.run(fetch()) == [i if i % 2 == 0 else None for i in range(30)]
+        assert all(stub.calls["mget"] == 1 for stub in async_stubs.values())
+        assert (cache.hits, cache.misses) == (15, 15)
+
+    def test_refresh_claim_taken_once(self, cache):
+        """Test an entry due for early refresh is handed to one asynchronous caller."""
+        async def read_twice():
+            await cache.aset("test", {"i": 0}, "value", ttl=1, cost=1000.0)
+            return [(await cache.aget_with_refresh("test", {"i": 0}))[:2] for _ in range(2)]
+
+        assert asyncio.run(read_twice()) == [("value", True), ("value", False)]
+
+    def test_timeouts_open_the_shared_breaker(self, cache, async_stubs):
+        """Test asyncio timeouts open the node's breaker, which then skips both APIs."""
+        key = cache.cache_key("test", {"i": 0})
+        node = cache.ring.get_node(key)
+        async_stubs[node].down = True
+
+        assert asyncio.run(cache.aget("test", {"i": 0})) is None
+        assert cache.node_stats()[node]['state'] == "open"
+        assert asyncio.run(cache.aget("test", {"i": 0})) is None
+        assert cache.get("test", {"i": 0}) is None
+        assert async_stubs[node].calls["get"] == 1
+        assert cache.node_stats()[node]['skipped'] == 2
+
+    def test_clients_follow_the_event_loop(self, nodes):
+        """Test each event loop gets its own clients and aclose closes the current loop's."""
+        opened = []
+
+        def connect():
+            clients = {node: _AsyncStubRedis(data) for node, data in nodes.items()}
+            opened.append(clients)
+            return clients, clients
+
+        cache = RedisCache.from_clients({node: _sync_stub(data) for node, data in nodes.items()})
+        cache._async_factory = connect
+
+        async def use_and_close():
+            await cache.aset("test", {"i": 0}, 0)
+            assert await cache.aget("test", {"i": 0}) == 0
+            await cache.aclose()
+
+        asyncio.run(use_and_close())
+        asyncio.run(use_and_close())
+        assert len(opened) == 2
+        assert all(stub.closed for clients in opened for stub in clients.values())
+
+    def test_without_async_clients_runs_sync_api_in_thread(self, nodes):
+        """Test caches without asyncio clients still serve the asyncio API."""
+        cache = RedisCache.from_clients({node: _sync_stub(data) for node, data in nodes.items()})
+        key = cache.cache_key("test", {"i": 0})
+        nodes[cache.ring.get_node(key)][key] = cache._serialize_value("value")
+
+        assert asyncio.run(cache.aget("test", {"i": 0})) == "value"
+        assert asyncio.run(cache.amget("test", [{"i": 0}, {"i": 1}])) == ["value", None]
+
+
+class TestAsyncResponseCache:
+    """Test the ACG response cache from async code."""
+
+    def test_response_shared_through_async_redis(self, cache, async_stubs):
+        """Test a response stored asynchronously is served to another worker from Redis."""
+        request = ACGRequest(epoch="2000-01-01T12:00:00Z", bodies=[ACGBody(id="Sun", type=ACGBodyType.PLANET)])
+        result = ACGResult(type="FeatureCollection", features=[])
+        writer, reader = ACGCacheManager(), ACGCacheManager()
+        writer.redis_cache = reader.redis_cache = cache
+
+        async def share():
+            assert await reader.aget_cached_response(request) is None
+            encoded = await writer.aset_cached_response(request, result)
+            return encoded, await reader.aget_cached_response(request)
+
+        encoded, served = asyncio.run(share())
+
+        assert served.body == encoded.body
+        assert reader.stats['response_misses'] == 1 and reader.stats['response_hits'] == 1
+        assert sum(stub.calls["get"] for stub in async_stubs.values()) == 2
+
+    def test_encoding_and_shared_memory_off_the_event_loop(self, cache):
+        """Test encoding and shared-memory reads and writes run in worker threads."""
+        request = ACGRequest(epoch="2000-01-01T12:00:00Z", bodies=[ACGBody(id="Moon", type=ACGBodyType.PLANET)])
+        result = ACGResult(type="FeatureCollection", features=[])
+        manager = ACGCacheManager()
+        manager.redis_cache = cache
+        manager.shared_cache = MagicMock(enabled=True)
+        threads = {}
+
+        def record(operation, value=None):
+            def call(*args, **kwargs):
+                threads[operation] = threading.get_ident()
+                return value
+            return call
+
+        manager.shared_cache.get_entry.side_effect = record("get")
+        manager.shared_cache.put.side_effect = record("put", True)
+
+        async def miss_then_store():
+            assert await manager.aget_cached_response(request) is None
+            await manager.aset_cached_response(request, result)
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(miss_then_store())
+
+        assert set(threads) == {"get", "put"}
+        assert loop_thread not in threads.values()
+
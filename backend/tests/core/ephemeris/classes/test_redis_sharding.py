@@ -0,0 +1,270 @@
+"""
+Unit tests for consistent-hash sharding of the Redis cache.
+"""
+
+import time
+from collections import Counter
+from fnmatch import fnmatchcase
+
+import pytest
+import redis
+
+from app.core.ephemeris.classes.hash_ring import HashRing
+from app.core.ephemeris.classes.redis_cache import RedisCache
+
+
+class _StubRedis:
+    """Local Redis stand-in: a dict with the commands RedisCache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = Counter()
+        self.down = False
+
+    def _call(self, command):
+        self.calls[command] += 1
+        if self.down:
+            raise redis.exceptions.ConnectionError("connection refused")
+
+    def ping(self):
+        self._call("ping")
+        return True
+
+    def get(self, key):
+        self._call("get")
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, px=None):
+        self._call("set")
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def setex(self, key, ttl, value):
+        self._call("setex")
+        self.data[key] = value
+        return True
+
+    def mget(self, keys):
+        self._call("mget")
+        return [self.data.get(key) for key in keys]
+
+    def delete(self, *keys):
+        self._call("delete")
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def keys(self, pattern):
+        self._call("keys")
+        return [key for key in self.data if fnmatchcase(key, pattern)]
+
+    def exists(self, key):
+        self._call("exists")
+        return int(key in self.data)
+
+    def flushdb(self):
+        self._call("flushdb")
+        self.data.clear()
+
+    def pipeline(self, transaction=True):
+        self._call("pipeline")
+        return _StubPipeline(self)
+
+
+class _StubPipeline:
+    """Buffers commands until execute, like a redis-py pipeline."""
+
+    def __init__(self, stub):
+        self.stub = stub
+        self.commands = []
+
+    def set(self, *args, nx=False, px=None):
+        self.commands.append(("set", args, nx))
+
+    def setex(self, *args):
+        self.commands.append(("setex", args, False))
+
+    def execute(self):
+        if self.stub.down:
+            raise redis.exceptions.ConnectionError("connection refused")
+        replies = []
+        for _, args, nx in self.commands:
+            if nx and args[0] in self.stub.data:
+                replies.append(None)
+                continue
+            self.stub.data[args[0]] = args[-1]
+            replies.append(True)
+        return replies
+
+
+@pytest.fixture
+def stubs():
+    """Three Redis stand-ins."""
+    return {f"redis-{n}:6379": _StubRedis() for n in range(3)}
+
+
+@pytest.fixture
+def sharded(stubs):
+    """Redis cache sharded over the stand-ins."""
+    cache = RedisCache.from_clients(stubs, failure_threshold=1, probe_interval=0.05)
+    yield cache
+    for breaker in cache.breakers.values():
+        breaker.reset()
+
+
+class TestHashRing:
+    """Test key placement on the consistent hash ring."""
+
+    def test_keys_spread_over_nodes(self):
+        """Test virtual nodes give every node a similar share of keys."""
+        ring = HashRing(["a", "b", "c", "d"])
+        shares = Counter(ring.get_node(f"key:{i}") for i in range(20000))
+
+        assert set(shares) == {"a", "b", "c", "d"}
+        assert all(3500 < count < 6500 for count in shares.values())
+
+    def test_adding_a_node_moves_a_fraction_of_keys(self):
+        """Test a new node takes about 1/N of the keys, all from the existing nodes."""
+        ring = HashRing(["a", "b", "c", "d"])
+        keys = [f"key:{i}" for i in range(20000)]
+        before = {key: ring.get_node(key) for key in keys}
+
+        ring.add_node("e")
+        moved = [key for key in keys if ring.get_node(key) != before[key]]
+
+        assert 0.1 < len(moved) / len(keys) < 0.3
+        assert all(ring.get_node(key) == "e" for key in moved)
+
+    def test_removing_a_node_moves_only_its_keys(self):
+        """Test keys of the remaining nodes stay where they are."""
+        ring = HashRing(["a", "b", "c"])
+        keys = [f"key:{i}" for i in range(5000)]
+        before = {key: ring.get_node(key) for key in keys}
+
+        ring.remove_node("b")
+
+        assert all(ring.get_node(key) == node for key, node in before.items() if node != "b")
+        assert "b" not in ring and len(ring) == 2
+
+    def test_weights(self):
+        """Test a node with twice the weight receives about twice the keys."""
+        ring = HashRing(["a"])
+        ring.add_node("b", weight=2)
+        shares = Counter(ring.get_node(f"key:{i}") for i in range(20000))
+
+        assert 1.6 < shares["b"] / shares["a"] < 2.4
+
+    def test_invalid_rings(self):
+        """Test empty rings and bad parameters are rejected."""
+        with pytest.raises(LookupError):
+            HashRing().get_node("key")
+        with pytest.raises(ValueError):
+            HashRing(virtual_nodes=0)
+        with pytest.raises(ValueError):
+            HashRing().add_node("a", weight=0)
+
+
+class TestShardedRedisCache:
+    """Test the Redis cache over several nodes."""
+
+    def test_keys_routed_by_ring(self, sharded, stubs):
+        """Test each key lives on the node the ring assigns and reads back."""
+        for i in range(60):
+            assert sharded.set("test", {"i": i}, {"value": i}, ttl=60)
+
+        assert all(stub.data for stub in stubs.values())
+        for i in range(60):
+            key = sharded.cache_key("test", {"i": i})
+            assert key in stubs[sharded.ring.get_node(key)].data
+            assert sharded.get("test", {"i": i}) == {"value": i}
+
+    def test_get_many_fans_out_one_mget_per_node(self, sharded, stubs):
+        """Test multi-gets issue one MGET per node and keep the request order."""
+        assert sharded.set_many("test", [({"i": i}, i) for i in range(0, 30, 2)], ttl=60)
+
+        values = sharded.get_many("test", [{"i": i} for i in range(30)])
+
+        assert values == [i if i % 2 == 0 else None for i in range(30)]
+        assert all(stub.calls["mget"] == 1 and stub.calls["pipeline"] == 1 for stub in stubs.values())
+        assert (sharded.hits, sharded.misses) == (15, 15)
+
+    def test_bulk_results_chunked_per_node(self, sharded, stubs):
+        """Test bulk result writes and reads take one round trip per node and chunk of keys."""
+        items = [({"i": i}, {"value": i}, 0.5) for i in range(40)]
+        assert sharded.mset_results("acg_results", items, ttl=60, chunk_size=5)
+        per_node = {node: sum(sharded.ring.get_node(sharded.cache_key("acg_results", data)) == node
+                              for data, _, _ in items) for node in stubs}
+        assert all(stubs[node].calls["pipeline"] == -(-count // 5) for node, count in per_node.items())
+
+        results = sharded.mget_results("acg_results", [{"i": i} for i in range(40)], chunk_size=5)
+
+        assert [(result.value, result.refresh, result.cost) for result in results] == [
+            ({"value": i}, False, 0.5) for i in range(40)
+        ]
+        assert all(result.expires_at > time.time() for result in results)
+        assert all(stubs[node].calls["mget"] == -(-count // 5) for node, count in per_node.items())
+        assert sharded.mget_results("acg_results", [{"i": 40}]) == [(None, False, None, None)]
+        assert (sharded.hits, sharded.misses) == (40, 1)
+
+    def test_bulk_results_claim_due_refreshes_once(self, sharded, stubs):
+        """Test entries due for early refresh are claimed by one bulk reader only."""
+        items = [({"i": i}, i, 1000.0) for i in range(6)]
+        assert sharded.mset_results("acg_results", items, ttl=10)
+
+        first = sharded.mget_results("acg_results", [{"i": i} for i in range(6)])
+        second = sharded.mget_results("acg_results", [{"i": i} for i in range(6)])
+
+        assert [result[:2] for result in first] == [(i, True) for i in range(6)]
+        assert [result[:2] for result in second] == [(i, False) for i in range(6)]
+
+    def test_delete_pattern_covers_every_node(self, sharded, stubs):
+        """Test pattern deletes reach every node."""
+        for i in range(30):
+            sharded.set("acg_results", {"i": i}, i)
+        sharded.set("other", {"i": 0}, 0)
+
+        assert sharded.delete_pattern("acg_results:*") == 30
+        assert sum(len(stub.data) for stub in stubs.values()) == 1
+
+    def test_failed_node_skipped_until_it_recovers(self, sharded, stubs):
+        """Test a node failing with a connection error misses fast until a probe finds it back."""
+        key_data = next({"i": i} for i in range(100)
+                        if sharded.ring.get_node(sharded.cache_key("test", {"i": i})) == "redis-1:6379")
+        other = next({"i": i} for i in range(100)
+                     if sharded.ring.get_node(sharded.cache_key("test", {"i": i})) != "redis-1:6379")
+        sharded.set("test", key_data, "value")
+        sharded.set("test", other, "other")
+        stubs["redis-1:6379"].down = True
+
+        assert sharded.get("test", key_data) is None
+        assert sharded.get("test", key_data) is None
+        assert stubs["redis-1:6379"].calls["get"] == 1
+        assert sharded.get("test", other) == "other"
+        assert sharded.node_stats()["redis-1:6379"]['state'] != "closed"
+        assert sharded.get_many("test", [key_data, other]) == [None, "other"]
+
+        stubs["redis-1:6379"].down = False
+        deadline = time.time() + 5
+        while sharded.breakers["redis-1:6379"].state != "closed" and time.time() < deadline:
+            time.sleep(0.01)
+        assert sharded.get("test", key_data) == "value"
+
+    def test_command_errors_keep_the_node(self, sharded, stubs):
+        """Test errors other than connection failures do not take a node out."""
+        sharded.set("test", {"i": 0}, "value")
+        node = sharded.ring.get_node(sharded.cache_key("test", {"i": 0}))
+        stubs[node].get = lambda key: (_ for _ in ()).throw(redis.exceptions.ResponseError("WRONGTYPE"))
+
+        assert sharded.get("test", {"i": 0}) is None
+        assert sharded.errors == 1
+        assert sharded.node_stats()[node]['state'] == "closed"
+
+    def test_ping_and_clear_all(self, sharded, stubs):
+        """Test ping succeeds while any node answers and clears reach every node."""
+        for i in range(20):
+            sharded.set("test", {"i": i}, i)
+        stubs["redis-0:6379"].down = True
+
+        assert sharded.ping()
+        assert sharded.clear_all()
+        assert all(not stub.data for name, stub in stubs.items() if name != "redis-0:6379")
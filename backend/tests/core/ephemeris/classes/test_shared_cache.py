@@ -0,0 +1,235 @@
+"""
+Unit tests for the cross-process shared memory cache.
+"""
+
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from app.core.acg.acg_cache import ACGCacheManager, CachedResponse
+from app.core.acg.acg_packed import PackedACGResult
+from app.core.acg.acg_types import ACGBody, ACGBodyType, ACGOptions, ACGRequest, ACGResult
+from app.core.ephemeris.classes.cache import EphemerisCache
+from app.core.ephemeris.classes.shared_cache import SharedMemoryCache, key_hash
+
+KIB = 1024
+
+
+@pytest.fixture
+def shared_cache(tmp_path):
+    """Shared cache with a 1 MiB arena in a temporary directory."""
+    cache = SharedMemoryCache(str(tmp_path / "shared"), size_bytes=1024 * KIB, slots=1024, page_size=256 * KIB)
+    yield cache
+    cache.close()
+
+
+def _write_entries(path, prefix, count):
+    """Write entries from another process."""
+    cache = SharedMemoryCache(path)
+    for i in range(count):
+        cache.put(f"{prefix}:{i}", {"worker": prefix, "index": i})
+
+
+def _overwrite(path, key, rounds):
+    """Keep replacing a key with uniform byte strings of varying length."""
+    cache = SharedMemoryCache(path)
+    for i in range(rounds):
+        cache.put_bytes(key, bytes([65 + i % 26]) * (100 + (i * 37) % 3000))
+
+
+class TestSharedMemoryCache:
+    """Test storage, expiry and invalidation."""
+
+    def test_round_trip(self, shared_cache):
+        """Test values come back with their compute cost and expiry."""
+        assert shared_cache.put("acg:1", {"coordinates": [[1.0, 2.0]] * 50}, ttl=60, cost=0.25)
+
+        entry = shared_cache.get_entry("acg:1")
+        assert entry.value == {"coordinates": [[1.0, 2.0]] * 50}
+        assert entry.cost == 0.25
+        assert entry.expires_at == pytest.approx(time.time() + 60, abs=5)
+        assert shared_cache.get("missing") is None
+        assert (shared_cache.hits, shared_cache.misses) == (1, 1)
+
+    def test_replace_and_invalidate(self, shared_cache):
+        """Test puts replace earlier values and invalidation removes them."""
+        shared_cache.put("key", "first")
+        shared_cache.put("key", "second" * 100)
+
+        assert shared_cache.get("key") == "second" * 100
+        assert shared_cache.size() == 1
+        assert shared_cache.invalidate("key")
+        assert shared_cache.get("key") is None
+        assert shared_cache.size() == shared_cache.size_bytes() == 0
+
+    def test_expired_entries_are_misses(self, shared_cache):
+        """Test expired entries are not returned."""
+        shared_cache.put("short", "value", ttl=0.05)
+        time.sleep(0.1)
+
+        assert shared_cache.get("short") is None
+
+    def test_attach_uses_existing_geometry(self, shared_cache):
+        """Test later processes attach to the existing table whatever their arguments."""
+        shared_cache.put("key", "value")
+        attached = SharedMemoryCache(shared_cache.path, size_bytes=KIB, slots=8, page_size=4 * KIB)
+
+        assert attached.get("key") == "value"
+        assert attached.stats()['slots'] == 1024
+        attached.close()
+
+    def test_clear(self, shared_cache):
+        """Test clearing empties the table and the allocator."""
+        for i in range(20):
+            shared_cache.put(f"key:{i}", os.urandom(5000))
+        shared_cache.clear()
+
+        assert shared_cache.size() == 0
+        assert shared_cache.stats()['pages_assigned'] == 0
+        assert shared_cache.get("key:1") is None
+        assert shared_cache.put("key:1", "value") and shared_cache.get("key:1") == "value"
+
+    def test_disabled_without_path(self):
+        """Test a cache without a path stores nothing."""
+        cache = SharedMemoryCache(None)
+
+        assert not cache.enabled
+        assert cache.put("key", "value") is False
+        assert cache.get("key") is None
+
+
+class TestSlabAllocator:
+    """Test size classes and eviction."""
+
+    def test_oversized_values_rejected(self, shared_cache):
+        """Test entries larger than a page are not stored."""
+        assert shared_cache.put("key", os.urandom(300 * KIB)) is False
+        assert shared_cache.rejections == 1
+
+    def test_capacity_enforced_by_eviction(self, shared_cache):
+        """Test filling past the arena evicts entries and keeps read ones (CLOCK)."""
+        shared_cache.put("hot", os.urandom(10 * KIB))
+        for i in range(300):
+            shared_cache.put(f"cold:{i}", os.urandom(10 * KIB))
+            assert shared_cache.get_bytes("hot") is not None
+
+        assert shared_cache.evictions > 0
+        assert shared_cache.size_bytes() <= 1024 * KIB
+        assert shared_cache.get("cold:0") is None
+        assert shared_cache.get("cold:299") is not None
+
+    def test_mixed_sizes_share_the_arena(self, shared_cache):
+        """Test small and large entries are placed in separate size classes."""
+        shared_cache.put("small", "x")
+        shared_cache.put("large", os.urandom(100 * KIB))
+
+        assert shared_cache.get("small") == "x"
+        assert len(shared_cache.get("large")) == 100 * KIB
+        assert shared_cache.stats()['pages_assigned'] == 2
+
+    def test_pages_move_to_classes_without_one(self, shared_cache):
+        """Test a size class with no page takes one once every page is assigned."""
+        for kib in (1, 2, 4, 8):
+            shared_cache.put(f"entry:{kib}", os.urandom(kib * KIB))
+        assert shared_cache.stats()['pages_assigned'] == 4
+
+        assert shared_cache.put("entry:16", os.urandom(16 * KIB))
+        assert len(shared_cache.get("entry:16")) == 16 * KIB
+        assert sum(shared_cache.get(f"entry:{kib}") is not None for kib in (1, 2, 4, 8)) == 3
+
+
+class TestSeqlock:
+    """Test lock-free readers never see partial writes."""
+
+    def test_slot_being_written_is_a_miss(self, shared_cache):
+        """Test a slot with an odd sequence counter is not read."""
+        shared_cache.put("key", "value")
+        index = next(
+            (key_hash("key") + probe) & shared_cache._mask for probe in range(8)
+            if shared_cache._read_slot((key_hash("key") + probe) & shared_cache._mask)[6] == 1
+        )
+        shared_cache._bump(index)
+        assert shared_cache.get("key") is None
+
+        shared_cache._bump(index)
+        assert shared_cache.get("key") == "value"
+
+    def test_reads_during_concurrent_writes(self, shared_cache):
+        """Test reads racing a writer in another process are never torn."""
+        context = multiprocessing.get_context("fork")
+        writer = context.Process(target=_overwrite, args=(shared_cache.path, "hot", 3000))
+        writer.start()
+        reads = 0
+        while writer.is_alive():
+            data = shared_cache.get_bytes("hot")
+            if data is not None:
+                assert len(set(data)) == 1
+                reads += 1
+        writer.join()
+
+        assert writer.exitcode == 0
+        assert reads > 0
+        assert shared_cache.get_bytes("hot") == bytes([65 + 2999 % 26]) * (100 + (2999 * 37) % 3000)
+
+
+class TestMultiProcess:
+    """Test worker processes share one table."""
+
+    def test_entries_visible_across_processes(self, shared_cache):
+        """Test entries written concurrently by several processes are all readable."""
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_write_entries, args=(shared_cache.path, f"worker{n}", 100))
+            for n in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert shared_cache.size() == 300
+        assert shared_cache.get("worker1:99") == {"worker": "worker1", "index": 99}
+
+
+class TestACGSharedTier:
+    """Test the ACG cache manager uses the shared tier."""
+
+    def test_responses_served_from_shared_memory(self, shared_cache):
+        """Test an encoded response cached by one worker is a hit for another, without a per-worker copy."""
+        request = ACGRequest(
+            epoch="1997-03-03T03:03:03Z",
+            bodies=[ACGBody(id="Sun", type=ACGBodyType.PLANET)],
+            options=ACGOptions(line_types=["MC"], include_parans=False)
+        )
+        writer, reader = ACGCacheManager(), ACGCacheManager()
+        writer.shared_cache = reader.shared_cache = shared_cache
+        cache_key = writer.generate_cache_key(request, "response")
+        encoded = CachedResponse.from_body(b'{"type": "FeatureCollection"}' * 100, features_count=1)
+
+        assert shared_cache.put(cache_key, encoded, entry_class="acg_responses")
+        reader.response_cache.invalidate(cache_key)
+
+        assert reader.get_cached_response(request) == encoded
+        assert reader.response_cache.get(cache_key) is None
+
+    def test_results_not_copied_into_worker_memory(self, shared_cache):
+        """Test shared-memory result hits are served without a copy in the worker's memory cache."""
+        request = ACGRequest(
+            epoch="1997-04-04T04:04:04Z",
+            bodies=[ACGBody(id="Sun", type=ACGBodyType.PLANET)],
+            options=ACGOptions(line_types=["MC"], include_parans=False)
+        )
+        result = ACGResult(type="FeatureCollection", features=[])
+        reader = ACGCacheManager()
+        reader.shared_cache = shared_cache
+        reader.memory_cache = EphemerisCache(max_size=100)
+        cache_key = reader.generate_cache_key(request, "result")
+
+        assert shared_cache.put(cache_key, PackedACGResult.pack(result.model_dump()), entry_class="acg_results")
+
+        assert reader.get_cached_result(request) == result
+        assert reader.memory_cache.get(cache_key) is None
+        assert reader.stats['hits'] == 1
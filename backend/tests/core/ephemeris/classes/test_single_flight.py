@@ -0,0 +1,245 @@
+"""
+Test Suite for Request Coalescing
+
+Tests for single-flight execution including:
+- Sharing one computation among concurrent callers
+- Exception propagation to followers
+- Cross-worker coordination through the local lease stand-in
+- Engine and service integration
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from app.api.models.schemas import NatalChartRequest
+from app.core.acg.acg_cache import ACGCacheManager
+from app.core.acg.acg_core import ACGCalculationEngine
+from app.core.acg.acg_types import ACGBody, ACGBodyType, ACGOptions, ACGRequest
+from app.core.ephemeris.classes.redis_cache import RedisCache
+from app.core.ephemeris.classes.single_flight import LocalLease, RedisLease, SingleFlight
+from app.services.ephemeris_service import EphemerisService
+
+
+def _slow(result, calls, delay=0.1):
+    """Computation that records its calls and takes ``delay`` seconds."""
+    def compute():
+        calls.append(threading.get_ident())
+        time.sleep(delay)
+        return result
+    return compute
+
+
+class TestSingleFlight:
+    """Test in-process coalescing."""
+
+    def test_concurrent_calls_share_computation(self):
+        """Test concurrent callers of one key run the computation once."""
+        single_flight = SingleFlight("test")
+        calls = []
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(single_flight.do, "key", _slow({"value": 1}, calls)) for _ in range(8)]
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        stats = single_flight.stats()
+        assert stats['leaders'] == 1
+        assert stats['coalesced'] == 7
+        assert stats['in_flight'] == 0
+
+    def test_distinct_keys_run_separately(self):
+        """Test different keys are not coalesced."""
+        single_flight = SingleFlight("test")
+        calls = []
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(single_flight.do, "a", _slow("a", calls))
+            second = executor.submit(single_flight.do, "b", _slow("b", calls))
+
+        assert (first.result(), second.result()) == ("a", "b")
+        assert len(calls) == 2
+
+    def test_sequential_calls_recompute(self):
+        """Test finished calls are not cached."""
+        single_flight = SingleFlight("test")
+        calls = []
+
+        single_flight.do("key", _slow(1, calls, delay=0))
+        single_flight.do("key", _slow(1, calls, delay=0))
+
+        assert len(calls) == 2
+
+    def test_errors_reach_followers(self):
+        """Test followers see the leader's exception."""
+        single_flight = SingleFlight("test")
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("bad request")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, "key", fail)
+            started.wait()
+            follower = executor.submit(single_flight.do, "key", fail)
+
+            with pytest.raises(ValueError):
+                leader.result()
+            with pytest.raises(ValueError):
+                follower.result()
+
+        assert single_flight.stats()['in_flight'] == 0
+
+    def test_disabled_runs_every_call(self):
+        """Test disabled coalescers call through."""
+        single_flight = SingleFlight("test", enabled=False)
+        calls = []
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(single_flight.do, "key", _slow(1, calls)) for _ in range(4)]:
+                future.result()
+
+        assert len(calls) == 4
+
+
+class TestLeasedSingleFlight:
+    """Test cross-worker coalescing through a shared lease."""
+
+    def test_worker_waits_for_lease_holder(self):
+        """Test a second worker receives the lease holder's published result."""
+        lease = LocalLease()
+        # Two coalescers sharing a lease stand in for two worker processes
+        worker_a = SingleFlight("test", lease=lease, poll_interval=0.01)
+        worker_b = SingleFlight("test", lease=lease, poll_interval=0.01)
+        calls = []
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(worker_a.do, "key", _slow("result", calls, delay=0.2))
+            time.sleep(0.05)
+            second = executor.submit(worker_b.do, "key", _slow("other", calls))
+
+        assert first.result() == second.result() == "result"
+        assert len(calls) == 1
+        assert worker_b.stats()['lease_waits'] == 1
+        assert worker_b.stats()['lease_hits'] == 1
+        assert not lease.held("test:key")
+
+    def test_waiter_takes_over_after_failure(self):
+        """Test a waiter computes when the lease holder fails."""
+        lease = LocalLease()
+        worker_a = SingleFlight("test", lease=lease, poll_interval=0.01)
+        worker_b = SingleFlight("test", lease=lease, poll_interval=0.01)
+
+        def fail():
+            time.sleep(0.1)
+            raise RuntimeError("worker crashed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(worker_a.do, "key", fail)
+            time.sleep(0.03)
+            second = executor.submit(worker_b.do, "key", lambda: "recovered")
+
+            with pytest.raises(RuntimeError):
+                first.result()
+            assert second.result() == "recovered"
+
+    def test_wait_timeout_computes_locally(self):
+        """Test waiters stop waiting after the timeout."""
+        lease = LocalLease()
+        lease.acquire("test:key", "stuck-worker", ttl=60.0)
+        single_flight = SingleFlight("test", lease=lease, wait_timeout=0.05, poll_interval=0.01)
+
+        assert single_flight.do("key", lambda: "local") == "local"
+        assert single_flight.stats()['lease_timeouts'] == 1
+
+    def test_local_lease_expiry(self):
+        """Test expired leases can be taken over."""
+        lease = LocalLease()
+
+        assert lease.acquire("key", "a", ttl=0.01)
+        assert not lease.acquire("key", "b", ttl=1.0)
+        time.sleep(0.02)
+        assert lease.acquire("key", "b", ttl=1.0)
+        lease.release("key", "a")
+        assert lease.held("key")
+
+    def test_redis_lease_follows_breaker(self):
+        """Test Redis lease commands count against the node's breaker and are skipped while it is open."""
+        client = MagicMock()
+        client.set.side_effect = redis.exceptions.TimeoutError("Timeout writing to socket")
+        redis_cache = RedisCache.from_clients({"redis-0:6379": client}, failure_threshold=1, probe_interval=60)
+        lease = RedisLease(redis_cache)
+        single_flight = SingleFlight("test", lease=lease, poll_interval=0.01)
+
+        assert lease.acquire("key", "a", ttl=1.0)
+        assert redis_cache.node_stats()["redis-0:6379"]['state'] == "open"
+        # No lease while the node is skipped: compute locally without waiting
+        assert single_flight.do("key", lambda: "local") == "local"
+        assert not lease.held("key") and lease.result("key") is None
+        assert client.set.call_count == 1
+        assert single_flight.stats()['lease_waits'] == 0
+        redis_cache.breakers["redis-0:6379"].reset()
+
+
+class TestEngineCoalescing:
+    """Test ACG and natal calculations coalesce concurrent identical requests."""
+
+    def test_concurrent_acg_requests_calculate_once(self):
+        """Test concurrent identical ACG requests run one calculation."""
+        engine = ACGCalculationEngine()
+        engine.cache_manager = ACGCacheManager()
+        engine.single_flight = SingleFlight("acg_test")
+        calls = []
+        original = engine.calculate_epoch_lines
+
+        def counted(*args, **kwargs):
+            calls.append(1)
+            time.sleep(0.1)
+            return original(*args, **kwargs)
+
+        engine.calculate_epoch_lines = counted
+        request = ACGRequest(
+            epoch="2024-03-03T03:03:03Z",
+            bodies=[ACGBody(id="Sun", type=ACGBodyType.PLANET)],
+            options=ACGOptions(line_types=["MC", "IC"], include_parans=False)
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(engine.calculate_acg_lines, [request] * 4))
+
+        assert len(calls) == 1
+        assert all(len(result.features) == len(results[0].features) > 0 for result in results)
+
+    def test_concurrent_natal_requests_calculate_once(self):
+        """Test concurrent identical natal chart requests run one calculation."""
+        service = EphemerisService()
+        service.single_flight = SingleFlight("natal_test")
+        calls = []
+        original = service._calculate_natal_chart
+
+        def counted(request):
+            calls.append(1)
+            time.sleep(0.1)
+            return original(request)
+
+        service._calculate_natal_chart = counted
+        request = NatalChartRequest(subject={
+            "name": "Test Subject",
+            "datetime": {"iso_string": "2000-01-01T12:00:00"},
+            "latitude": {"decimal": 40.7128},
+            "longitude": {"decimal": -74.0060},
+            "timezone": {"name": "America/New_York"}
+        })
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(service.calculate_natal_chart, [request] * 4))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
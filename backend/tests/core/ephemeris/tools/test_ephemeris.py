@@ -11,6 +11,7 @@ from app.core.ephemeris.tools.ephemeris import (
     get_planet, get_houses, get_angles, get_point, get_fixed_star,
     calculate_planetary_chart, validate_ephemeris_files
 )
+from app.core.ephemeris.tools.houses import reset_house_cache
 from app.core.ephemeris.const import SwePlanets
 from app.core.ephemeris.classes.serialize import PlanetPosition, HouseSystem
 
@@ -103,7 +104,14 @@ class TestGetPlanet:
 class TestGetHouses:
     """Test house system calculation."""
     
-    @patch('swisseph.houses')
+    @pytest.fixture(autouse=True)
+    def fresh_house_cache(self):
+        """Keep mocked results out of the shared house cache."""
+        reset_house_cache()
+        yield
+        reset_house_cache()
+    
+    @patch('swisseph.houses_armc')
     def test_get_houses_basic(self, mock_houses):
         """Test basic house calculation."""
         # Mock Swiss Ephemeris response
@@ -122,7 +130,7 @@ class TestGetHouses:
         assert houses.latitude == 51.5074
         assert houses.longitude == -0.1278
     
-    @patch('swisseph.houses')
+    @patch('swisseph.houses_armc')
     def test_get_houses_error_handling(self, mock_houses):
         """Test error handling in house calculation."""
         mock_houses.side_effect = Exception("House calculation error")
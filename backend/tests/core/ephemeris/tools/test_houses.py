@@ -0,0 +1,158 @@
+"""
+Test Suite for the House Cusp Cache
+
+Tests for ARMC-keyed house calculations including:
+- Agreement with swe.houses
+- Cache reuse across charts sharing ARMC and latitude
+- Interpolation tables and their use by the relocation grid
+- Tables spanning an obliquity range, built off the request path
+"""
+
+import pytest
+import numpy as np
+import swisseph as swe
+
+from app.core.ephemeris.settings import settings
+from app.core.ephemeris.tools import relocation
+from app.core.ephemeris.tools.houses import (
+    HouseCuspCache, HouseInterpolationTable, armc_from_julian_day, build_interpolation_tables, get_house_cache,
+    reset_house_cache, true_obliquity
+)
+
+
+JD = 2451545.0
+
+
+def _angle_error(a, b):
+    """Largest absolute angular difference in degrees."""
+    return np.max(np.abs((np.asarray(a) - np.asarray(b) + 540.0) % 360.0 - 180.0))
+
+
+@pytest.fixture(scope="module")
+def table():
+    """Coarse Placidus table for fast tests."""
+    return HouseInterpolationTable('P', true_obliquity(JD), armc_step=0.5, latitude_step=0.5, max_latitude=30.0)
+
+
+class TestHouseCuspCache:
+    """Test cached house calculations."""
+
+    @pytest.mark.parametrize("house_system", ["P", "K", "R", "W"])
+    def test_matches_swisseph(self, house_system):
+        """Test results agree with swe.houses."""
+        cache = HouseCuspCache()
+        cusps, ascmc = cache.houses(JD, 40.7128, -74.0060, house_system)
+        ref_cusps, ref_ascmc = swe.houses(JD, 40.7128, -74.0060, house_system.encode())
+
+        assert _angle_error(cusps[:12], ref_cusps[:12]) < 1e-5
+        assert _angle_error(ascmc[:4], ref_ascmc[:4]) < 1e-5
+
+    def test_shared_armc_and_latitude_hit(self):
+        """Test charts with the same ARMC and latitude share one calculation."""
+        cache = HouseCuspCache()
+        obliquity = true_obliquity(JD)
+        armc = armc_from_julian_day(JD, 10.0)
+
+        first = cache.houses(JD, 45.0, 10.0, 'P')
+        second = cache.houses_armc(armc, 45.0, obliquity, 'P')
+
+        assert first is second
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_quantized_keys(self):
+        """Test inputs within one quantum map to the same key."""
+        cache = HouseCuspCache(quantum=1e-3)
+
+        assert cache.key(100.0001, 45.0, 23.4, 'P') == cache.key(100.0002, 45.0, 23.4, 'P')
+        assert cache.key(359.9999, 45.0, 23.4, 'P') == cache.key(0.0, 45.0, 23.4, 'P')
+        assert cache.key(100.0, 45.0, 23.4, 'P') != cache.key(100.0, 45.0, 23.4, 'K')
+
+    def test_polar_placidus_raises(self):
+        """Test undefined systems surface the Swiss Ephemeris error."""
+        cache = HouseCuspCache()
+        with pytest.raises(swe.Error):
+            cache.houses_armc(100.0, 75.0, true_obliquity(JD), 'P')
+
+    def test_interpolation_table_serves_misses(self, table):
+        """Test registered tables serve covered latitudes."""
+        cache = HouseCuspCache()
+        cache.add_interpolation_table(table)
+
+        cusps, ascmc = cache.houses(JD, 20.0, 5.0, 'P')
+        ref_cusps, ref_ascmc = swe.houses(JD, 20.0, 5.0, b'P')
+
+        assert cache.stats()['interpolated'] == 1
+        assert _angle_error(cusps, ref_cusps[:12]) < 0.02
+        assert _angle_error(ascmc[:4], ref_ascmc[:4]) < 1e-5
+
+        cache.houses(JD, 50.0, 5.0, 'P')
+        assert cache.stats()['interpolated'] == 1
+
+
+class TestHouseInterpolationTable:
+    """Test interpolation table accuracy and validation."""
+
+    def test_lookup_accuracy(self, table):
+        """Test bilinear lookups stay close to exact cusps, including at 0/360."""
+        rng = np.random.default_rng(7)
+        armc = np.concatenate([rng.uniform(0.0, 360.0, 200), [0.0, 359.9, 180.0]])
+        latitude = np.concatenate([rng.uniform(-30.0, 30.0, 200), [0.0, 10.0, -30.0]])
+
+        cusps = table.lookup(armc, latitude)
+        exact = np.array([
+            swe.houses_armc(a, lat, table.obliquity, b'P')[0][:12] for a, lat in zip(armc, latitude)
+        ])
+
+        assert _angle_error(cusps, exact) < 0.02
+
+    def test_invalid_tables_rejected(self):
+        """Test unsupported systems and polar ranges raise ValueError."""
+        with pytest.raises(ValueError):
+            HouseInterpolationTable('W', 23.44)
+        with pytest.raises(ValueError):
+            HouseInterpolationTable('P', 23.44, max_latitude=70.0)
+
+    def test_obliquity_range_serves_other_years(self):
+        """Test a table built for an obliquity range serves charts decades apart."""
+        table = HouseInterpolationTable(
+            'P', 23.40, armc_step=1.0, latitude_step=1.0, max_latitude=30.0, obliquity_max=23.48
+        )
+        cache = HouseCuspCache()
+        cache.add_interpolation_table(table)
+
+        for julian_day in (swe.julday(1950, 6, 1, 0.0), swe.julday(2060, 1, 1, 12.0)):
+            assert table.covers(20.0, true_obliquity(julian_day))
+            cusps, _ = cache.houses(julian_day, 20.0, 5.0, 'P')
+            ref_cusps, _ = swe.houses(julian_day, 20.0, 5.0, b'P')
+            assert _angle_error(cusps, ref_cusps[:12]) < 0.05
+        assert cache.stats()['interpolated'] == 2
+        assert not table.covers(20.0, 23.30)
+
+    def test_global_cache_built_without_tables(self, monkeypatch):
+        """Test the global cache never builds tables on first use; they are registered separately."""
+        monkeypatch.setattr(settings, "house_interpolation_systems", ['P'])
+        monkeypatch.setattr(settings, "house_interpolation_step", 2.0)
+        reset_house_cache()
+        try:
+            assert get_house_cache().get_interpolation_table('P') is None
+            build_interpolation_tables()
+            table = get_house_cache().get_interpolation_table('P')
+            assert table.covers(0.0, true_obliquity(JD))
+        finally:
+            reset_house_cache()
+
+    def test_relocation_grid_uses_table(self, table, monkeypatch):
+        """Test relocation grids read covered rows from the table."""
+        cache = HouseCuspCache()
+        cache.add_interpolation_table(table)
+        monkeypatch.setattr(relocation, "get_house_cache", lambda: cache)
+
+        lats = np.array([0.0, 25.0, 50.0])
+        lons = np.array([0.0, 60.0, 120.0])
+        grid = relocation.calculate_relocation_grid(JD, lats, lons, 'P', processes=1)
+
+        for i, (lat, lon) in enumerate(zip(lats, lons)):
+            ref_cusps, _ = swe.houses(JD, lat, lon, b'P')
+            tolerance = 0.02 if abs(lat) <= table.max_latitude else 1e-8
+            assert _angle_error(grid.cusps[i], ref_cusps[:12]) < tolerance
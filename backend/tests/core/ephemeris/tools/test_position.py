@@ -183,25 +183,16 @@ class TestHousePositions:
         # Clear cache for clean test
         clear_house_cache()
     
-    def test_house_position_caching(self):
-        """Test that house positions are cached."""
+    def test_house_position_not_cached(self):
+        """Test house positions are recomputed, so changed cusps are seen at once."""
         houses = {
             'house1': {'number': 1, 'lon': 0.0, 'size': 30.0}
         }
         
-        with patch('swisseph.difdeg2n', side_effect=[15.0, 30.0]) as mock_swe:
-            # First call should use Swiss Ephemeris
-            result1 = house_position(15.0, houses)
-            assert result1['number'] == 1
-            
-            # Second call should use cache
-            result2 = house_position(15.0, houses)
-            assert result2['number'] == 1
-            
-            # Should only have called Swiss Ephemeris once
-            assert mock_swe.call_count == 2  # Called twice for the first calculation
+        assert house_position(15.0, houses)['number'] == 1
         
-        clear_house_cache()
+        houses['house1'] = {'number': 2, 'lon': 0.0, 'size': 30.0}
+        assert house_position(15.0, houses)['number'] == 2
     
     def test_opposite_house_position(self):
         """Test opposite house position calculation."""
@@ -0,0 +1,97 @@
+"""
+Test Suite for the Relocation Grid
+
+Tests for many-location house and angle calculations including:
+- Agreement of the analytic angles and cusps with swe.houses
+- Quadrant systems, serial and across a process pool
+- Input validation and grid helpers
+"""
+
+import pytest
+import numpy as np
+import swisseph as swe
+
+from app.core.ephemeris.tools import relocation
+from app.core.ephemeris.tools.relocation import calculate_relocation_grid, world_grid
+
+
+JD = 2451545.3
+
+
+def _angle_error(a, b):
+    """Largest absolute angular difference in degrees."""
+    return np.max(np.abs((np.asarray(a) - np.asarray(b) + 540.0) % 360.0 - 180.0))
+
+
+@pytest.fixture(scope="module")
+def locations():
+    """Sample locations including tropical, polar-circle and equator points."""
+    lats = np.array([0.0, 10.0, -20.0, 40.7128, -33.8688, 51.5074, 60.0, 70.0, -75.0, 23.0])
+    lons = np.array([0.0, 100.0, -60.0, -74.006, 151.2093, -0.1278, 10.0, 20.0, 120.0, -170.0])
+    return lats, lons
+
+
+class TestRelocationGrid:
+    """Test relocation grid calculations against Swiss Ephemeris."""
+
+    @pytest.mark.parametrize("house_system", ["E", "W"])
+    def test_analytic_systems_match_swisseph(self, locations, house_system):
+        """Test analytic angles and cusps agree with swe.houses."""
+        lats, lons = locations
+        grid = calculate_relocation_grid(JD, lats, lons, house_system)
+
+        for i, (lat, lon) in enumerate(zip(lats, lons)):
+            cusps, ascmc = swe.houses(JD, lat, lon, house_system.encode())
+            assert _angle_error(cusps[:12], grid.cusps[i]) < 1e-8
+            assert _angle_error(ascmc[0], grid.ascendant[i]) < 1e-8
+            assert _angle_error(ascmc[1], grid.mc[i]) < 1e-8
+            assert _angle_error(ascmc[2], grid.armc[i]) < 1e-8
+            assert _angle_error(ascmc[3], grid.vertex[i]) < 1e-8
+
+    def test_placidus_matches_swisseph(self, locations):
+        """Test quadrant cusps agree with swe.houses where defined."""
+        lats, lons = locations
+        grid = calculate_relocation_grid(JD, lats, lons, "placidus", processes=1)
+
+        assert grid.house_system == "P"
+        for i, (lat, lon) in enumerate(zip(lats, lons)):
+            try:
+                cusps, _ = swe.houses(JD, lat, lon, b"P")
+            except swe.Error:
+                assert np.all(np.isnan(grid.cusps[i]))
+                continue
+            assert _angle_error(cusps[:12], grid.cusps[i]) < 1e-8
+
+    def test_process_pool_matches_serial(self, monkeypatch):
+        """Test chunked process pool results equal the serial path."""
+        lats, lons = world_grid(15.0)
+        serial = calculate_relocation_grid(JD, lats, lons, "K", processes=1)
+
+        monkeypatch.setattr(relocation, "PARALLEL_THRESHOLD", 10)
+        parallel = calculate_relocation_grid(JD, lats, lons, "K", processes=2)
+
+        np.testing.assert_array_equal(np.isnan(serial.cusps), np.isnan(parallel.cusps))
+        np.testing.assert_allclose(np.nan_to_num(serial.cusps), np.nan_to_num(parallel.cusps))
+
+    def test_derived_angles(self, locations):
+        """Test descendant and IC are opposite ASC and MC."""
+        lats, lons = locations
+        grid = calculate_relocation_grid(JD, lats, lons, "E")
+
+        assert _angle_error(grid.descendant, grid.ascendant + 180.0) < 1e-12
+        assert _angle_error(grid.imum_coeli, grid.mc + 180.0) < 1e-12
+
+    def test_world_grid(self):
+        """Test the world grid covers every 1 degree location once."""
+        lats, lons = world_grid(1.0)
+
+        assert len(lats) == len(lons) == 181 * 360
+        assert lats.min() == -90.0 and lats.max() == 90.0
+        assert lons.min() == -180.0 and lons.max() == 179.0
+
+    def test_invalid_input(self):
+        """Test malformed inputs raise ValueError."""
+        with pytest.raises(ValueError):
+            calculate_relocation_grid(JD, [0.0, 1.0], [0.0])
+        with pytest.raises(ValueError):
+            calculate_relocation_grid(JD, [95.0], [0.0])